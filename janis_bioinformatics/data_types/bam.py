@@ -24,3 +24,25 @@ class BamBai(Bam):
 
     def doc(self):
         return "A Bam and bai as the secondary"
+
+
+class BamCsi(Bam):
+    @staticmethod
+    def name():
+        return "CsiIndexedBam"
+
+    @staticmethod
+    def secondary_files():
+        return [".csi"]
+
+    def can_receive_from(self, other, source_has_default=False):
+        # a BamBai is also a Bam, but a BAI can't be read in place of the CSI
+        if not super().can_receive_from(other, source_has_default):
+            return False
+        return ".csi" in (other.secondary_files() or [])
+
+    def doc(self):
+        return (
+            "A Bam and csi as the secondary, unlike the bai the CSI index supports "
+            "contigs longer than 512 Mbp (2^29)"
+        )
@@ -21,3 +21,21 @@ class BedTabix(File):
     @staticmethod
     def secondary_files():
         return [".tbi"]
+
+
+class BedCsi(File):
+    def __init__(self, optional=False):
+        super().__init__(optional=optional, extension=".bed.gz")
+
+    @staticmethod
+    def name():
+        return "BedCSI"
+
+    @staticmethod
+    def secondary_files():
+        return [".csi"]
+
+    def can_receive_from(self, other, source_has_default=False):
+        if not super().can_receive_from(other, source_has_default):
+            return False
+        return ".csi" in (other.secondary_files() or [])
@@ -54,7 +54,26 @@ class FastaDict(Fasta):
         return ["^.dict"]
 
 
+class FastaWithDict(FastaFai):
+    """
+    The fai and the sequence dictionary, which is all GATK (and picard) tools need.
+    """
+
+    @staticmethod
+    def name():
+        return "FastaWithDict"
+
+    @staticmethod
+    def secondary_files():
+        return [*FastaFai.secondary_files(), *FastaDict.secondary_files()]
+
+
 class FastaWithIndexes(Fasta):
+    """
+    The full reference bundle (fai, bwa index and dict), only tools that align (bwa) need the bwa
+    index. It can be given to any of the smaller Fasta types.
+    """
+
     @staticmethod
     def name():
         return "FastaWithIndexes"
@@ -68,9 +87,6 @@ class FastaWithIndexes(Fasta):
         ]
 
 
-FastaWithDict = FastaWithIndexes
-
-
 class FastaGz(File):
     def __init__(self, optional=False):
         super().__init__(optional, extension=".fa.gz")
@@ -1,6 +1,7 @@
 from typing import Any, Dict
 
 from janis_core import File, Array, Logger
+from janis_core.types import get_instantiated_type
 
 
 class Fastq(File):
@@ -33,6 +34,34 @@ class FastqGz(File):
         )
 
 
+class FastqOrFastqGz(File):
+    """
+    Janis has no union types, so this is a File that receives either a Fastq or a FastqGz,
+    for tools (eg: kallisto) that read both.
+    """
+
+    def __init__(self, optional=False):
+        super().__init__(optional=optional)
+
+    @staticmethod
+    def name():
+        return "FastqOrFastqGz"
+
+    def doc(self):
+        return (
+            "A Fastq or FastqGz file, for tools that detect the compression themselves"
+        )
+
+    def can_receive_from(self, other, source_has_default=False):
+        other = get_instantiated_type(other).received_type()
+        if other.optional and not self.optional and not source_has_default:
+            return False
+        if isinstance(other, (Fastq, FastqGz, FastqOrFastqGz)):
+            return True
+        # eg: the Files in a FastqPair
+        return type(other) == File and other.extension in (".fastq", ".fastq.gz")
+
+
 class FastqGzPairedEnd(Array):
     def __init__(self, optional=False):
         super().__init__(FastqGz, optional=optional)
@@ -57,13 +57,84 @@ class VcfTabix(CompressedVcf):
         return ".vcf.gz with .vcf.gz.tbi file"
 
 
-# class GVCF(Vcf):
-#     @staticmethod
-#     def name():
-#         return "gVCF"
-#
-#     def doc(self):
-#         return """
-# Section 5.5: Representing unspecified alleles and REF only blocks (gVCF)
-# Documentation: https://samtools.github.io/hts-specs/VCFv4.3.pdf
-#         """
+class VcfCsi(CompressedVcf):
+    @staticmethod
+    def name():
+        return "CompressedCsiIndexedVCF"
+
+    @staticmethod
+    def secondary_files():
+        return [".csi"]
+
+    def can_receive_from(self, other, source_has_default=False):
+        # a VcfTabix is also a CompressedVcf, but the tbi can't be read in place of the CSI
+        if not super().can_receive_from(other, source_has_default):
+            return False
+        return ".csi" in (other.secondary_files() or [])
+
+    def doc(self):
+        return (
+            ".vcf.gz with .vcf.gz.csi file, unlike the tbi the CSI index supports "
+            "contigs longer than 512 Mbp (2^29)"
+        )
+
+
+class Gvcf(Vcf):
+    def __init__(self, optional=False):
+        File.__init__(self, optional=optional, extension=".g.vcf")
+
+    @staticmethod
+    def name():
+        return "gVCF"
+
+    def doc(self):
+        return """
+    Genomic VCF, a VCF with the REF only blocks (between the variants) for joint genotyping.
+
+    Section 5.5: Representing unspecified alleles and REF only blocks (gVCF)
+    Documentation: https://samtools.github.io/hts-specs/VCFv4.3.pdf
+    """.strip()
+
+
+class GvcfTabix(VcfTabix):
+    def __init__(self, optional=False):
+        File.__init__(self, optional=optional, extension=".g.vcf.gz")
+
+    @staticmethod
+    def name():
+        return "CompressedIndexedGVCF"
+
+    def doc(self):
+        return ".g.vcf.gz with .g.vcf.gz.tbi file"
+
+
+class Bcf(File):
+    def __init__(self, optional=False):
+        super().__init__(optional=optional, extension=".bcf")
+
+    @staticmethod
+    def name():
+        return "BCF"
+
+    def doc(self):
+        return """
+    Binary Call Format:
+
+    The binary (BGZF compressed) equivalent of the VCF, it's much quicker to read and write
+    as the records don't need to be parsed from text.
+
+    Documentation: https://samtools.github.io/hts-specs/BCFv2_qref.pdf
+    """.strip()
+
+
+class BcfCsi(Bcf):
+    @staticmethod
+    def name():
+        return "IndexedBCF"
+
+    @staticmethod
+    def secondary_files():
+        return [".csi"]
+
+    def doc(self):
+        return ".bcf with .bcf.csi file"
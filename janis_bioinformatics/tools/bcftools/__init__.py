@@ -2,9 +2,46 @@ from .annotate.versions import (
     BcfToolsAnnotate_1_5,
     BcfToolsAnnotate_1_9,
     BcfToolsAnnotateLatest,
+    BcfToolsAnnotateBcf_1_9,
+    BcfToolsAnnotateBcfLatest,
+)
+from .concat.versions import (
+    BcfToolsConcat_1_9,
+    BcfToolsConcatLatest,
+    BcfToolsConcatBcf_1_9,
+    BcfToolsConcatBcfLatest,
+)
+from .index.versions import (
+    BcfToolsIndex_1_9,
+    BcfToolsIndexLatest,
+    BcfToolsIndexCsi_1_9,
+    BcfToolsIndexCsiLatest,
+    BcfToolsIndexBcf_1_9,
+    BcfToolsIndexBcfLatest,
+)
+from .norm.versions import (
+    BcfToolsNorm_1_5,
+    BcfToolsNorm_1_9,
+    BcfToolsNormLatest,
+    BcfToolsNormBcf_1_9,
+    BcfToolsNormBcfLatest,
+)
+from .sort.versions import (
+    BcfToolsSort_1_9,
+    BcfToolsSortLatest,
+    BcfToolsSortBcf_1_9,
+    BcfToolsSortBcfLatest,
+)
+from .view.versions import (
+    BcfToolsView_1_5,
+    BcfToolsView_1_9,
+    BcfToolsViewLatest,
+    BcfToolsViewBcf_1_9,
+    BcfToolsViewBcfLatest,
+    BcfToolsVcfToBcf_1_9,
+    BcfToolsVcfToBcfLatest,
+    BcfToolsTextVcfToBcf_1_9,
+    BcfToolsTextVcfToBcfLatest,
+    BcfToolsBcfToVcf_1_9,
+    BcfToolsBcfToVcfLatest,
 )
-from .concat.versions import BcfToolsConcat_1_9, BcfToolsConcatLatest
-from .index.versions import BcfToolsIndex_1_9, BcfToolsIndexLatest
-from .norm.versions import BcfToolsNorm_1_5, BcfToolsNorm_1_9, BcfToolsNormLatest
-from .sort.versions import BcfToolsSort_1_9, BcfToolsSortLatest
-from .view.versions import BcfToolsView_1_5, BcfToolsView_1_9, BcfToolsViewLatest
@@ -5,6 +5,7 @@ from datetime import date
 from ..bcftoolstoolbase import BcfToolsToolBase
 from janis_core import get_value_for_hints_and_ordered_resource_tuple
 from janis_bioinformatics.data_types import Vcf, CompressedVcf, VcfTabix
+from janis_bioinformatics.utils.threads import additional_threads_argument
 
 from janis_core import (
     ToolInput,
@@ -97,6 +98,9 @@ class BcfToolsAnnotateBase(BcfToolsToolBase, ABC):
             *self.additional_args,
         ]
 
+    def arguments(self):
+        return [additional_threads_argument("--threads")]
+
     def outputs(self):
         return [ToolOutput("out", Vcf, glob=InputSelector("outputFilename"))]
 
@@ -232,7 +236,9 @@ class BcfToolsAnnotateBase(BcfToolsToolBase, ABC):
             "separated by whitespaces, each pair on a separate line.",
         ),
         ToolInput(
-            "threads", Int(optional=True), prefix="--threads", doc="see Common Options"
+            "threads",
+            Int(optional=True),
+            doc="(default: cores allocated - 1) see Common Options",
         ),
         ToolInput(
             "remove",
@@ -1,6 +1,7 @@
 from .base import BcfToolsAnnotateBase
 from ..bcftools_1_5 import BcfTools_1_5
 from ..bcftools_1_9 import BcfTools_1_9
+from ..bcftoolstoolbase import BcfToolsBcfBase
 
 
 class BcfToolsAnnotate_1_9(BcfTools_1_9, BcfToolsAnnotateBase):
@@ -12,3 +13,10 @@ class BcfToolsAnnotate_1_5(BcfTools_1_5, BcfToolsAnnotateBase):
 
 
 BcfToolsAnnotateLatest = BcfToolsAnnotate_1_9
+
+
+class BcfToolsAnnotateBcf_1_9(BcfTools_1_9, BcfToolsBcfBase, BcfToolsAnnotateBase):
+    pass
+
+
+BcfToolsAnnotateBcfLatest = BcfToolsAnnotateBcf_1_9
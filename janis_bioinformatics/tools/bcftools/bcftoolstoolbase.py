@@ -1,10 +1,78 @@
 from abc import ABC, abstractmethod
+from copy import deepcopy
 from datetime import date
+from typing import List
 
 from ..bioinformaticstoolbase import BioinformaticsTool
-from janis_core import ToolMetadata
+from janis_core import ToolMetadata, ToolArgument, Array, Filename, Stdout
+
+from janis_bioinformatics.data_types import Bcf, Vcf, CompressedVcf
 
 
 class BcfToolsToolBase(BioinformaticsTool, ABC):
     def tool_provider(self):
         return "bcftools"
+
+
+class BcfToolsBcfBase(ABC):
+    """
+    Mixin (in front of the tool's base) for the BCF variant of a bcftools tool: the
+    bcf_inputs and the VCF output are BCF, so a chain of these tools never parses text.
+    """
+
+    def bcf_inputs(self) -> List[str]:
+        return ["vcf"]
+
+    def tool(self):
+        return super().tool() + "Bcf"
+
+    def friendly_name(self):
+        return super().friendly_name() + " (BCF)"
+
+    def inputs(self):
+        bcf_inputs = self.bcf_inputs()
+        inputs = []
+        for inp in deepcopy(super().inputs()):
+            if inp.id() == "outputType":
+                # fixed by arguments
+                continue
+            optional = inp.input_type.optional
+            if inp.id() in bcf_inputs:
+                if isinstance(inp.input_type, Array):
+                    inp.input_type = Array(
+                        Bcf(optional=inp.input_type.subtype().optional),
+                        optional=optional,
+                    )
+                else:
+                    inp.input_type = Bcf(optional=optional)
+            elif inp.id() == "outputFilename":
+                inp.input_type = Filename(
+                    prefix=inp.input_type.prefix,
+                    suffix=inp.input_type.suffix,
+                    extension=".bcf",
+                )
+            inputs.append(inp)
+        return inputs
+
+    def arguments(self):
+        args = [
+            arg
+            for arg in (super().arguments() or [])
+            if arg.prefix not in ("--output-type", "-O")
+        ]
+        return [
+            *args,
+            ToolArgument(
+                "b", prefix="--output-type", doc="(-O) Compressed BCF, see: outputType"
+            ),
+        ]
+
+    def outputs(self):
+        outputs = deepcopy(super().outputs())
+        for out in outputs:
+            if isinstance(out.output_type, Stdout):
+                if isinstance(out.output_type.subtype, (Vcf, CompressedVcf)):
+                    out.output_type = Stdout(Bcf())
+            elif isinstance(out.output_type, (Vcf, CompressedVcf)):
+                out.output_type = Bcf(optional=out.output_type.optional)
+        return outputs
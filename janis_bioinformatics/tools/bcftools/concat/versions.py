@@ -1,5 +1,5 @@
 from janis_bioinformatics.tools.bcftools.bcftools_1_9 import BcfTools_1_9
-
+from ..bcftoolstoolbase import BcfToolsBcfBase
 from .base import BcfToolsConcatBase
 
 
@@ -8,3 +8,10 @@ class BcfToolsConcat_1_9(BcfTools_1_9, BcfToolsConcatBase):
 
 
 BcfToolsConcatLatest = BcfToolsConcat_1_9
+
+
+class BcfToolsConcatBcf_1_9(BcfTools_1_9, BcfToolsBcfBase, BcfToolsConcatBase):
+    pass
+
+
+BcfToolsConcatBcfLatest = BcfToolsConcatBcf_1_9
@@ -7,11 +7,11 @@ from janis_core import (
     Int,
     ToolOutput,
     InputSelector,
-    CpuSelector,
 )
 
 from janis_bioinformatics.data_types import Vcf, CompressedVcf, VcfTabix
 from janis_bioinformatics.tools.bcftools.bcftoolstoolbase import BcfToolsToolBase
+from janis_bioinformatics.utils.threads import additional_threads_argument
 
 
 class BcfToolsIndexBase(BcfToolsToolBase, ABC):
@@ -61,9 +61,7 @@ class BcfToolsIndexBase(BcfToolsToolBase, ABC):
             ToolInput(
                 tag="threads",
                 input_type=Int(optional=True),
-                default=CpuSelector(),
-                prefix="--threads",
-                doc="sets the number of threads [0]",
+                doc="(default: cores allocated - 1) sets the number of threads [0]",
             ),
             ToolInput(
                 tag="nrecords",
@@ -79,6 +77,9 @@ class BcfToolsIndexBase(BcfToolsToolBase, ABC):
             ),
         ]
 
+    def arguments(self):
+        return [additional_threads_argument("--threads")]
+
     def outputs(self):
         return [ToolOutput("out", VcfTabix, glob=InputSelector("vcf"))]
 
@@ -0,0 +1,28 @@
+from abc import ABC
+
+from janis_core import ToolInput, ToolOutput, InputSelector
+
+from janis_bioinformatics.data_types import Bcf, BcfCsi
+from .base_csi import BcfToolsIndexCsiBase
+
+
+class BcfToolsIndexBcfBase(BcfToolsIndexCsiBase, ABC):
+    def tool(self):
+        return "bcftoolsIndexBcf"
+
+    def friendly_name(self):
+        return "BCFTools: Index (BCF)"
+
+    def inputs(self):
+        # a BCF can only have a CSI index
+        return [
+            (
+                ToolInput("vcf", Bcf, position=1, localise_file=True)
+                if inp.id() == "vcf"
+                else inp
+            )
+            for inp in super().inputs()
+        ]
+
+    def outputs(self):
+        return [ToolOutput("out", BcfCsi, glob=InputSelector("vcf"))]
@@ -0,0 +1,24 @@
+from abc import ABC
+
+from janis_core import ToolArgument, ToolOutput, InputSelector
+
+from janis_bioinformatics.data_types import VcfCsi
+from .base import BcfToolsIndexBase
+
+
+class BcfToolsIndexCsiBase(BcfToolsIndexBase, ABC):
+    def tool(self):
+        return "bcftoolsIndexCsi"
+
+    def friendly_name(self):
+        return "BCFTools: Index (CSI)"
+
+    def inputs(self):
+        # the index type is fixed by the arguments
+        return [inp for inp in super().inputs() if inp.id() not in ("csi", "tbi")]
+
+    def arguments(self):
+        return [*(super().arguments() or []), ToolArgument("--csi", position=0)]
+
+    def outputs(self):
+        return [ToolOutput("out", VcfCsi, glob=InputSelector("vcf"))]
@@ -1,6 +1,8 @@
 from janis_bioinformatics.tools.bcftools.bcftools_1_9 import BcfTools_1_9
 
 from .base import BcfToolsIndexBase
+from .base_csi import BcfToolsIndexCsiBase
+from .base_bcf import BcfToolsIndexBcfBase
 
 
 class BcfToolsIndex_1_9(BcfTools_1_9, BcfToolsIndexBase):
@@ -8,3 +10,17 @@ class BcfToolsIndex_1_9(BcfTools_1_9, BcfToolsIndexBase):
 
 
 BcfToolsIndexLatest = BcfToolsIndex_1_9
+
+
+class BcfToolsIndexCsi_1_9(BcfTools_1_9, BcfToolsIndexCsiBase):
+    pass
+
+
+BcfToolsIndexCsiLatest = BcfToolsIndexCsi_1_9
+
+
+class BcfToolsIndexBcf_1_9(BcfTools_1_9, BcfToolsIndexBcfBase):
+    pass
+
+
+BcfToolsIndexBcfLatest = BcfToolsIndexBcf_1_9
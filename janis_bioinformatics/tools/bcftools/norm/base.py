@@ -14,6 +14,7 @@ from janis_core import (
 from janis_bioinformatics.data_types import FastaFai, CompressedVcf
 from janis_bioinformatics.data_types import Vcf
 from janis_bioinformatics.tools.bcftools.bcftoolstoolbase import BcfToolsToolBase
+from janis_bioinformatics.utils.threads import additional_threads_argument
 from janis_core import ToolMetadata
 
 
@@ -40,6 +41,9 @@ class BcfToolsNormBase(BcfToolsToolBase, ABC):
             *self.additional_args,
         ]
 
+    def arguments(self):
+        return [additional_threads_argument("--threads")]
+
     def outputs(self):
         return [ToolOutput("out", CompressedVcf, glob=InputSelector("outputFilename"))]
 
@@ -192,8 +196,7 @@ the --fasta-ref option is supplied.
         ToolInput(
             "threads",
             Int(optional=True),
-            prefix="--threads",
-            doc="Number of output compression threads to use in addition to main thread. "
+            doc="(default: cores allocated - 1) Number of output compression threads to use in addition to main thread. "
             "Only used when --output-type is b or z. Default: 0.",
         ),
         ToolInput(
@@ -1,6 +1,7 @@
 from ..bcftools_1_5 import BcfTools_1_5
 from ..bcftools_1_9 import BcfTools_1_9
 from .base import BcfToolsNormBase
+from ..bcftoolstoolbase import BcfToolsBcfBase
 
 
 class BcfToolsNorm_1_5(BcfTools_1_5, BcfToolsNormBase):
@@ -12,3 +13,10 @@ class BcfToolsNorm_1_9(BcfTools_1_9, BcfToolsNormBase):
 
 
 BcfToolsNormLatest = BcfToolsNorm_1_9
+
+
+class BcfToolsNormBcf_1_9(BcfTools_1_9, BcfToolsBcfBase, BcfToolsNormBase):
+    pass
+
+
+BcfToolsNormBcfLatest = BcfToolsNormBcf_1_9
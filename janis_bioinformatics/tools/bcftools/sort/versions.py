@@ -1,5 +1,6 @@
 from .base import BcfToolsSortBase
 from ..bcftools_1_9 import BcfTools_1_9
+from ..bcftoolstoolbase import BcfToolsBcfBase
 
 
 class BcfToolsSort_1_9(BcfTools_1_9, BcfToolsSortBase):
@@ -7,3 +8,10 @@ class BcfToolsSort_1_9(BcfTools_1_9, BcfToolsSortBase):
 
 
 BcfToolsSortLatest = BcfToolsSort_1_9
+
+
+class BcfToolsSortBcf_1_9(BcfTools_1_9, BcfToolsBcfBase, BcfToolsSortBase):
+    pass
+
+
+BcfToolsSortBcfLatest = BcfToolsSortBcf_1_9
@@ -15,6 +15,7 @@ from janis_core import (
     CaptureType,
 )
 from janis_bioinformatics.data_types import Vcf, CompressedVcf
+from janis_bioinformatics.utils.threads import additional_threads_argument
 from ..bcftoolstoolbase import BcfToolsToolBase
 from janis_core import ToolMetadata
 
@@ -100,7 +101,8 @@ class BcfToolsViewBase(BcfToolsToolBase, ABC):
                 position=1,
                 doc="(-O) [<b|u|z|v>] b: compressed BCF, u: uncompressed BCF, "
                 "z: compressed VCF, v: uncompressed VCF [v]",
-            )
+            ),
+            additional_threads_argument("--threads", position=1),
         ]
 
     additional_inputs = [
@@ -178,9 +180,7 @@ class BcfToolsViewBase(BcfToolsToolBase, ABC):
         ToolInput(
             "threads",
             Int(optional=True),
-            prefix="--threads",
-            position=1,
-            doc="number of extra output compression threads [0]",
+            doc="(default: cores allocated - 1) number of extra output compression threads [0]",
         ),
         ToolInput(
             "trimAltAlleles",
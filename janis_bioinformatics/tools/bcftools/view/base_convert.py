@@ -0,0 +1,140 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from janis_core import (
+    ToolInput,
+    ToolArgument,
+    ToolOutput,
+    Int,
+    Filename,
+    InputSelector,
+    ToolMetadata,
+)
+
+from janis_bioinformatics.data_types import Bcf, BcfCsi, CompressedVcf, Vcf, VcfTabix
+from ..bcftoolstoolbase import BcfToolsToolBase
+from janis_bioinformatics.utils.threads import additional_threads_argument
+
+
+class BcfToolsConvertBase(BcfToolsToolBase, ABC):
+    """
+    Convert between (compressed) VCF and BCF with bcftools view, and index the
+    result in the same task.
+    """
+
+    @abstractmethod
+    def input_type(self):
+        pass
+
+    @abstractmethod
+    def output_type(self):
+        pass
+
+    @abstractmethod
+    def output_format(self) -> str:
+        """The --output-type of bcftools view (b: compressed BCF, z: compressed VCF)"""
+        pass
+
+    @abstractmethod
+    def index_type(self) -> str:
+        """The index bcftools index generates, ie: --csi or --tbi"""
+        pass
+
+    def base_command(self):
+        return ["bcftools", "view"]
+
+    def inputs(self) -> List[ToolInput]:
+        return [
+            ToolInput("vcf", self.input_type(), position=1),
+            ToolInput(
+                "outputFilename",
+                Filename(extension=self.output_type().extension),
+                prefix="--output-file",
+                doc="(-o) Output file name",
+            ),
+            ToolInput(
+                "threads",
+                Int(optional=True),
+                doc="(default: cores allocated - 1) Number of extra output compression threads [0]",
+            ),
+        ]
+
+    def arguments(self):
+        return [
+            ToolArgument(self.output_format(), prefix="--output-type"),
+            additional_threads_argument("--threads"),
+            ToolArgument("&&", position=2, shell_quote=False),
+            ToolArgument("bcftools index", position=3, shell_quote=False),
+            ToolArgument(self.index_type(), position=4),
+            ToolArgument(InputSelector("outputFilename"), position=5),
+        ]
+
+    def outputs(self) -> List[ToolOutput]:
+        return [
+            ToolOutput("out", self.output_type(), glob=InputSelector("outputFilename"))
+        ]
+
+    def bind_metadata(self):
+        return ToolMetadata(
+            doi="http://www.ncbi.nlm.nih.gov/pubmed/19505943",
+            documentationUrl="https://samtools.github.io/bcftools/bcftools.html#view",
+            documentation=f"""\
+Convert a {self.input_type().name()} to an {self.output_type().name()} (bcftools view, then
+bcftools index {self.index_type()}).""",
+        )
+
+
+class BcfToolsVcfToBcfBase(BcfToolsConvertBase, ABC):
+    def tool(self):
+        return "bcftoolsVcfToBcf"
+
+    def friendly_name(self):
+        return "BCFTools: VCF to BCF"
+
+    def input_type(self):
+        return CompressedVcf()
+
+    def output_type(self):
+        return BcfCsi()
+
+    def output_format(self) -> str:
+        return "b"
+
+    def index_type(self) -> str:
+        return "--csi"
+
+
+class BcfToolsTextVcfToBcfBase(BcfToolsVcfToBcfBase, ABC):
+    """
+    For the (uncompressed) VCF of a caller, this skips the bgzip that's only
+    required to give it to BcfToolsVcfToBcf.
+    """
+
+    def tool(self):
+        return "bcftoolsTextVcfToBcf"
+
+    def friendly_name(self):
+        return "BCFTools: VCF (uncompressed) to BCF"
+
+    def input_type(self):
+        return Vcf()
+
+
+class BcfToolsBcfToVcfBase(BcfToolsConvertBase, ABC):
+    def tool(self):
+        return "bcftoolsBcfToVcf"
+
+    def friendly_name(self):
+        return "BCFTools: BCF to VCF"
+
+    def input_type(self):
+        return Bcf()
+
+    def output_type(self):
+        return VcfTabix()
+
+    def output_format(self) -> str:
+        return "z"
+
+    def index_type(self) -> str:
+        return "--tbi"
@@ -1,6 +1,12 @@
 from .base import BcfToolsViewBase
+from .base_convert import (
+    BcfToolsVcfToBcfBase,
+    BcfToolsTextVcfToBcfBase,
+    BcfToolsBcfToVcfBase,
+)
 from ..bcftools_1_5 import BcfTools_1_5
 from ..bcftools_1_9 import BcfTools_1_9
+from ..bcftoolstoolbase import BcfToolsBcfBase
 
 
 class BcfToolsView_1_5(BcfTools_1_5, BcfToolsViewBase):
@@ -12,3 +18,28 @@ class BcfToolsView_1_9(BcfTools_1_9, BcfToolsViewBase):
 
 
 BcfToolsViewLatest = BcfToolsView_1_9
+
+
+class BcfToolsViewBcf_1_9(BcfTools_1_9, BcfToolsBcfBase, BcfToolsViewBase):
+    def bcf_inputs(self):
+        return ["file"]
+
+
+BcfToolsViewBcfLatest = BcfToolsViewBcf_1_9
+
+
+class BcfToolsVcfToBcf_1_9(BcfTools_1_9, BcfToolsVcfToBcfBase):
+    pass
+
+
+class BcfToolsTextVcfToBcf_1_9(BcfTools_1_9, BcfToolsTextVcfToBcfBase):
+    pass
+
+
+class BcfToolsBcfToVcf_1_9(BcfTools_1_9, BcfToolsBcfToVcfBase):
+    pass
+
+
+BcfToolsVcfToBcfLatest = BcfToolsVcfToBcf_1_9
+BcfToolsTextVcfToBcfLatest = BcfToolsTextVcfToBcf_1_9
+BcfToolsBcfToVcfLatest = BcfToolsBcfToVcf_1_9
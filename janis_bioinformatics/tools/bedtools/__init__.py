@@ -9,3 +9,7 @@ from .genomecoveragebed.versions import (
     BedToolsGenomeCoverageBed_2_29_2,
     BedToolsGenomeCoverageBedLatest,
 )
+
+from .sortbed.versions import BedToolsSortBed_2_29_2, BedToolsSortBedLatest
+
+from .mergebed.versions import BedToolsMergeBed_2_29_2, BedToolsMergeBedLatest
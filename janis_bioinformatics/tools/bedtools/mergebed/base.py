@@ -0,0 +1,76 @@
+from abc import ABC
+from datetime import date
+
+from janis_core import ToolOutput, ToolInput, Boolean, Int, String, Array, Stdout
+
+from janis_bioinformatics.data_types import Bed
+from ..bedtoolstoolbase import BedToolsToolBase
+
+
+class BedToolsMergeBedBase(BedToolsToolBase, ABC):
+    def bind_metadata(self):
+
+        self.metadata.contributors = ["Jiaan Yu"]
+        self.metadata.dateCreated = date(2020, 7, 21)
+        self.metadata.dateUpdated = date(2020, 7, 21)
+        self.metadata.doi = None
+        self.metadata.citation = None
+        self.metadata.keywords = ["bedtools", "mergeBed", "merge"]
+        self.metadata.documentationUrl = (
+            "https://bedtools.readthedocs.io/en/latest/content/tools/merge.html"
+        )
+        self.metadata.documentation = """bedtools merge combines overlapping or “book-ended” features in an interval file into a single feature which spans all of the combined features. The input must be sorted by chromosome and then by start position."""
+
+    def tool(self):
+        return "bedtoolsMergeBed"
+
+    def friendly_name(self):
+        return "BEDTools: mergeBed"
+
+    def base_command(self):
+        return ["mergeBed"]
+
+    def inputs(self):
+        return [
+            ToolInput(
+                "inputBed",
+                Bed(),
+                prefix="-i",
+                doc="Input bed file, must be sorted by chrom, then start.",
+            ),
+            ToolInput(
+                "distance",
+                Int(optional=True),
+                prefix="-d",
+                doc="Maximum distance between features allowed for features to be merged. Default is 0. That is, overlapping and/or book-ended features are merged.",
+            ),
+            ToolInput(
+                "strandedness",
+                Boolean(optional=True),
+                prefix="-s",
+                doc="Force strandedness. That is, only merge features that are on the same strand.",
+            ),
+            ToolInput(
+                "columns",
+                Array(Int, optional=True),
+                prefix="-c",
+                separator=",",
+                doc="Specify columns from the input file to operate upon (see -o option, below). Multiple columns can be specified in a comma-delimited list.",
+            ),
+            ToolInput(
+                "operations",
+                Array(String, optional=True),
+                prefix="-o",
+                separator=",",
+                doc="Specify the operation that should be applied to -c. (eg: distinct, collapse, count, sum, min, max)",
+            ),
+            ToolInput(
+                "header",
+                Boolean(optional=True),
+                prefix="-header",
+                doc="Print the header from the A file prior to results.",
+            ),
+        ]
+
+    def outputs(self):
+        return [ToolOutput("out", Stdout(Bed))]
@@ -0,0 +1,9 @@
+from .base import BedToolsMergeBedBase
+from ..bedtools_2_29_2 import BedTools_2_29_2
+
+
+class BedToolsMergeBed_2_29_2(BedTools_2_29_2, BedToolsMergeBedBase):
+    pass
+
+
+BedToolsMergeBedLatest = BedToolsMergeBed_2_29_2
@@ -0,0 +1,74 @@
+from abc import ABC
+from datetime import date
+
+from janis_core import ToolOutput, ToolInput, Boolean, File, Stdout
+
+from janis_bioinformatics.data_types import Bed
+from ..bedtoolstoolbase import BedToolsToolBase
+
+
+class BedToolsSortBedBase(BedToolsToolBase, ABC):
+    def bind_metadata(self):
+
+        self.metadata.contributors = ["Jiaan Yu"]
+        self.metadata.dateCreated = date(2020, 7, 21)
+        self.metadata.dateUpdated = date(2020, 7, 21)
+        self.metadata.doi = None
+        self.metadata.citation = None
+        self.metadata.keywords = ["bedtools", "sortBed", "sort"]
+        self.metadata.documentationUrl = (
+            "https://bedtools.readthedocs.io/en/latest/content/tools/sort.html"
+        )
+        self.metadata.documentation = """Sorts a feature file by chromosome and other criteria. When a genome file (-g) or fasta index (-faidx) is given, the chromosomes are sorted in the same order as the reference, which is the order the -sorted ('chromsweep') mode of the other bedtools expects."""
+
+    def tool(self):
+        return "bedtoolsSortBed"
+
+    def friendly_name(self):
+        return "BEDTools: sortBed"
+
+    def base_command(self):
+        return ["sortBed"]
+
+    def inputs(self):
+        return [
+            ToolInput(
+                "inputBed",
+                Bed(),
+                prefix="-i",
+                doc="Input bed file.",
+            ),
+            ToolInput(
+                "genome",
+                File(optional=True),
+                prefix="-g",
+                doc="Sort according to the chromosome order in the genome file (<chromName><TAB><chromSize>).",
+            ),
+            ToolInput(
+                "faidx",
+                File(optional=True),
+                prefix="-faidx",
+                doc="Sort according to the chromosome order in the fasta index (.fai) file.",
+            ),
+            ToolInput(
+                "sizeA",
+                Boolean(optional=True),
+                prefix="-sizeA",
+                doc="Sort by feature size in ascending order.",
+            ),
+            ToolInput(
+                "sizeD",
+                Boolean(optional=True),
+                prefix="-sizeD",
+                doc="Sort by feature size in descending order.",
+            ),
+            ToolInput(
+                "header",
+                Boolean(optional=True),
+                prefix="-header",
+                doc="Print the header from the A file prior to results.",
+            ),
+        ]
+
+    def outputs(self):
+        return [ToolOutput("out", Stdout(Bed))]
@@ -0,0 +1,9 @@
+from .base import BedToolsSortBedBase
+from ..bedtools_2_29_2 import BedTools_2_29_2
+
+
+class BedToolsSortBed_2_29_2(BedTools_2_29_2, BedToolsSortBedBase):
+    pass
+
+
+BedToolsSortBedLatest = BedToolsSortBed_2_29_2
@@ -0,0 +1,112 @@
+from abc import ABC
+from copy import deepcopy
+
+from janis_core import (
+    ToolInput,
+    ToolArgument,
+    ToolOutput,
+    Filename,
+    Array,
+    File,
+    InputSelector,
+    StringFormatter,
+    WildcardSelector,
+)
+
+from janis_bioinformatics.data_types import Bam, BamBai
+from .base import BamSorMaDupBase
+
+
+class BamCatSorMaDupBase(BamSorMaDupBase, ABC):
+    """
+    Streams every (eg: lane) bam through bamcat into bamsormadup, so the merge, sort and
+    duplicate marking happen in one (multithreaded) pass, and bamsormadup writes the index.
+    """
+
+    def tool(self):
+        return "bamcatsormadup"
+
+    def friendly_name(self):
+        return "BamCat | BamSorMaDup"
+
+    def base_command(self):
+        return None
+
+    def inputs(self):
+        return [
+            ToolInput(
+                "bams",
+                Array(Bam()),
+                prefix="I=",
+                separate_value_from_prefix=False,
+                prefix_applies_to_all_elements=True,
+                position=-3,
+                doc="Bams to merge, they're re-sorted so they don't need to be in any order",
+            ),
+            ToolInput(
+                "outputFilename",
+                Filename(extension=".bam"),
+                prefix=">",
+                position=200,
+                shell_quote=False,
+            ),
+            *self.bamsormadup_inputs(),
+        ]
+
+    @staticmethod
+    def bamsormadup_inputs():
+        inputs = deepcopy(BamSorMaDupBase.additional_inputs)
+        for inp in inputs:
+            # only the bamcat output (that's piped) is uncompressed, the bam this writes is
+            # the one that's kept, so it's compressed like the MarkDuplicates bam
+            if inp.id() == "level":
+                inp.default = -1
+        return inputs
+
+    def arguments(self):
+        return [
+            ToolArgument("bamcat", position=-4, shell_quote=False),
+            ToolArgument(
+                "level=0",
+                position=-3,
+                shell_quote=False,
+                doc="the bamcat output is only piped into bamsormadup, so isn't compressed",
+            ),
+            ToolArgument("|", position=-2, shell_quote=False),
+            ToolArgument("bamsormadup", position=-1, shell_quote=False),
+            ToolArgument(
+                "metrics.txt",
+                prefix="M=",
+                separate_value_from_prefix=False,
+                doc="file containing metrics from duplicate removal",
+            ),
+            ToolArgument(
+                "bam",
+                prefix="inputformat=",
+                separate_value_from_prefix=False,
+                doc="input data format",
+            ),
+            ToolArgument(
+                "bam",
+                prefix="outputformat=",
+                separate_value_from_prefix=False,
+                doc="output data format",
+            ),
+            ToolArgument(
+                StringFormatter("{out}.bai", out=InputSelector("outputFilename")),
+                prefix="indexfilename=",
+                separate_value_from_prefix=False,
+                doc="write the bam index (only for SO=coordinate)",
+            ),
+        ]
+
+    def outputs(self):
+        return [
+            ToolOutput("out", BamBai(), glob=InputSelector("outputFilename")),
+            ToolOutput(
+                "metrics",
+                File(),
+                glob=WildcardSelector("metrics.txt", select_first=True),
+                doc="Picard (MarkDuplicates) style duplication metrics",
+            ),
+        ]
@@ -1,12 +1,18 @@
 from ..versions import BioBamBam_2_0_87
 from .base import BamSorMaDupBase
+from .base_bamcat import BamCatSorMaDupBase
 
 
 class BamSorMaDup_2_0_87(BioBamBam_2_0_87, BamSorMaDupBase):
     pass
 
 
+class BamCatSorMaDup_2_0_87(BioBamBam_2_0_87, BamCatSorMaDupBase):
+    pass
+
+
 BamSorMaDupLatest = BamSorMaDup_2_0_87
+BamCatSorMaDupLatest = BamCatSorMaDup_2_0_87
 
 
 if __name__ == "__main__":
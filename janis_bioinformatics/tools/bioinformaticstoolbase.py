@@ -1,4 +1,5 @@
 from abc import ABC
+from typing import List, Dict, Any
 
 from janis_core import (
     CommandTool,
@@ -8,6 +9,8 @@ from janis_core import (
     WorkflowBuilder,
 )
 
+from janis_bioinformatics.utils.containermanifest import container_manifest
+
 BIOINFORMATICS_MODULE = "bioinformatics"
 
 
@@ -20,6 +23,13 @@ class BioinformaticsWorkflow(Workflow, ABC):
     def tool_module(self):
         return BIOINFORMATICS_MODULE
 
+    def container_manifest(self) -> List[Dict[str, Any]]:
+        """
+        Every (deduplicated) container this workflow uses, with the steps that use it,
+        eg: to pre-pull the images before the workflow is run.
+        """
+        return container_manifest(self)
+
 
 class BioinformaticsPythonTool(PythonTool, ABC):
     def tool_module(self):
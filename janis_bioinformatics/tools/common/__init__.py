@@ -2,6 +2,7 @@ from .bwaaligner import BwaAligner
 from .mergeandmark.mergeandmark_4_0 import MergeAndMarkBams_4_0
 from .mergeandmark.mergeandmark_4_1_2 import MergeAndMarkBams_4_1_2
 from .mergeandmark.mergeandmark_4_1_3 import MergeAndMarkBams_4_1_3
+from .mergeandmark.mergeandmark_bamsormadup import MergeAndMarkBamsBamSorMaDup
 from .splitmultiallele import SplitMultiAllele
 from .bwamem_samtoolsview import BwaMem_SamToolsView
 from .indexfasta import IndexFasta
@@ -10,3 +11,16 @@ from .splitmultiallele_normalistvcf import SplitMultiAlleleNormaliseVcf
 from .filtervardictsomaticvcf import FilterVardictSomaticVcf
 from .gatkbasecalbam import GATKBaseRecalBQSRWorkflow_4_1_3
 from .gatkbasecalbam_4_1_2 import GATKBaseRecalBQSRWorkflow_4_1_2
+from .generatechromosomelist import GenerateChromosomeList
+from .splitvcfbychromosome import SplitVcfByChromosome
+from .concatgzippedtables import ConcatGzippedTables
+from .splitbedbycontig import SplitBedByContig
+from .concattexttables import ConcatTextTables
+from .createbalancedcallregions import CreateBalancedCallRegions
+from .collapsestarsplicejunctions import CollapseStarSpliceJunctions
+from .aggregatekallistoabundance import AggregateKallistoAbundance
+from .generateexonintervalshards import GenerateExonIntervalShards
+from .gatherdisjointbams import GatherDisjointBams
+from .verifycramrecordcounts import VerifyCramRecordCounts
+from .archivebamascram import ArchiveBamAsCram
+from .ubamaligner import UbamLaneAligner, UbamAligner
@@ -0,0 +1,96 @@
+from typing import Dict, List, Any, Optional
+
+from janis_core import TOutput, File
+
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsPythonTool
+
+
+class AggregateKallistoAbundance(BioinformaticsPythonTool):
+    @staticmethod
+    def code_block(
+        abundances: List[File],
+        samples: List[str],
+        column: str = "est_counts",
+        transcriptToGene: Optional[File] = None,
+        output_prefix: str = "kallisto",
+    ) -> Dict[str, Any]:
+        """
+        :param abundances: abundance.tsv of each sample, quantified against the same index
+        :param samples: Sample names (column headers), in the same order as abundances
+        :param column: Column of abundance.tsv to aggregate (est_counts or tpm)
+        :param transcriptToGene: Tab separated <transcript> <gene> mapping, to also output a gene matrix
+        :param output_prefix: Prefix of the output matrices
+        """
+        from collections import OrderedDict
+        from contextlib import ExitStack
+
+        if len(abundances) != len(samples):
+            raise Exception(
+                f"There are {len(abundances)} abundance files but {len(samples)} samples"
+            )
+
+        tx2gene = {}
+        if transcriptToGene:
+            with open(transcriptToGene) as inp:
+                for line in inp:
+                    pieces = line.split()
+                    if len(pieces) >= 2:
+                        tx2gene[pieces[0]] = pieces[1]
+
+        transcripts_out = f"{output_prefix}.transcripts.tsv"
+        genes = OrderedDict()
+
+        # every abundance.tsv from the same index lists the targets in the same order, so the
+        # files are read in lockstep (one line of each at a time) rather than loaded in full
+        with ExitStack() as stack:
+            inps = [stack.enter_context(open(a)) for a in abundances]
+            out = stack.enter_context(open(transcripts_out, "w+"))
+
+            headers = [inp.readline().rstrip("\n").split("\t") for inp in inps]
+            idx = headers[0].index(column)
+            out.write("\t".join(["target_id", *samples]) + "\n")
+
+            for lines in zip(*inps):
+                rows = [line.rstrip("\n").split("\t") for line in lines]
+                target = rows[0][0]
+                if any(r[0] != target for r in rows):
+                    raise Exception(
+                        f"The abundance files don't have the same targets (at {target}), "
+                        f"were they quantified against the same index?"
+                    )
+                values = [r[idx] for r in rows]
+                out.write("\t".join([target, *values]) + "\n")
+
+                if tx2gene:
+                    gene = tx2gene.get(target, target)
+                    totals = genes.setdefault(gene, [0.0] * len(samples))
+                    for i, v in enumerate(values):
+                        totals[i] += float(v)
+
+        genes_out = None
+        if tx2gene:
+            genes_out = f"{output_prefix}.genes.tsv"
+            with open(genes_out, "w+") as out:
+                out.write("\t".join(["gene_id", *samples]) + "\n")
+                for gene, totals in genes.items():
+                    out.write("\t".join([gene, *[f"{t:g}" for t in totals]]) + "\n")
+
+        return {"transcripts": transcripts_out, "genes": genes_out}
+
+    def outputs(self) -> List[TOutput]:
+        return [
+            TOutput("transcripts", File),
+            TOutput("genes", File(optional=True)),
+        ]
+
+    def id(self) -> str:
+        return "AggregateKallistoAbundance"
+
+    def friendly_name(self):
+        return "Aggregate kallisto abundance"
+
+    def tool_provider(self):
+        return "common"
+
+    def version(self):
+        return "v0.1.0"
@@ -0,0 +1,47 @@
+from janis_bioinformatics.data_types import Bam, FastaFai
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsWorkflow
+from janis_bioinformatics.tools.io_lib import ScrambleLatest, CramIndexLatest
+
+from .verifycramrecordcounts import VerifyCramRecordCounts
+
+
+class ArchiveBamAsCram(BioinformaticsWorkflow):
+    def id(self):
+        return "ArchiveBamAsCram"
+
+    def friendly_name(self):
+        return "Archive bam as cram"
+
+    def version(self):
+        return "v0.1.0"
+
+    def tool_provider(self):
+        return "common"
+
+    def bind_metadata(self):
+        self.metadata.documentation = """\
+Convert a (final) bam to a reference-compressed cram with scramble (multithreaded), index it
+(cram_index) and check the cram has the same number of records as the bam. The cram isn't
+copied by the check: the index step's cram is output, the workflow fails if the check does.
+
+The cram can only be decoded with the same reference, so it should be archived with the cram.
+        """.strip()
+
+    def constructor(self):
+
+        self.input("bam", Bam)
+        self.input("reference", FastaFai)
+
+        self.step(
+            "scramble", ScrambleLatest(inputFilename=self.bam, reference=self.reference)
+        )
+        self.step("index", CramIndexLatest(cram=self.scramble.out))
+        self.step(
+            "verify",
+            VerifyCramRecordCounts(
+                bam=self.bam, cram=self.index.out, reference=self.reference
+            ),
+        )
+
+        self.output("out", source=self.index.out)
+        self.output("counts", source=self.verify.counts)
@@ -1,5 +1,5 @@
 from janis_core import Array
-from janis_bioinformatics.data_types import FastqGzPair, FastaWithDict
+from janis_bioinformatics.data_types import FastqGzPair, FastaWithIndexes
 from janis_bioinformatics.tools import BioinformaticsWorkflow
 from janis_bioinformatics.tools.common.bwamem_samtoolsview import BwaMem_SamToolsView
 from janis_bioinformatics.tools.cutadapt import CutAdapt_2_1
@@ -23,7 +23,7 @@ class BwaAligner(BioinformaticsWorkflow):
 
         # Inputs
         self.input("sample_name", str)
-        self.input("reference", FastaWithDict)
+        self.input("reference", FastaWithIndexes)
         self.input("fastq", FastqGzPair)
 
         # pipe adapters
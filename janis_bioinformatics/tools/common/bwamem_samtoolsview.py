@@ -16,9 +16,10 @@ from janis_core import (
     Array,
     StringFormatter,
 )
+from janis_core.operators.logical import If, IsDefined
 from janis_core import get_value_for_hints_and_ordered_resource_tuple
 
-from janis_bioinformatics.data_types import FastaWithDict, FastqGzPair, Bam, Bed
+from janis_bioinformatics.data_types import FastaWithIndexes, FastqGzPair, Bam, Bed
 
 from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsTool
 
@@ -95,7 +96,12 @@ class BwaMem_SamToolsView(BioinformaticsTool):
             ),
             ToolArgument(
                 StringFormatter(
-                    "@RG\\tID:{name}\\tSM:{name}\\tLB:{name}\\tPL:{pl}",
+                    "@RG\\tID:{id}\\tSM:{name}\\tLB:{name}\\tPL:{pl}",
+                    id=If(
+                        IsDefined(InputSelector("readGroupId")),
+                        InputSelector("readGroupId"),
+                        InputSelector("sampleName"),
+                    ),
                     name=InputSelector("sampleName"),
                     pl=InputSelector("platformTechnology"),
                 ),
@@ -117,7 +123,7 @@ class BwaMem_SamToolsView(BioinformaticsTool):
 
     def inputs(self) -> List[ToolInput]:
         return [
-            ToolInput("reference", FastaWithDict(), position=2, shell_quote=False),
+            ToolInput("reference", FastaWithIndexes(), position=2, shell_quote=False),
             ToolInput("reads", FastqGzPair, position=3, shell_quote=False, doc=None),
             ToolInput(
                 "mates",
@@ -147,6 +153,12 @@ class BwaMem_SamToolsView(BioinformaticsTool):
                 doc="Used to construct the readGroupHeaderLine with format: "
                 "'@RG\\tID:{name}\\tSM:{name}\\tLB:{name}\\tPL:ILLUMINA'",
             ),
+            ToolInput(
+                "readGroupId",
+                String(optional=True),
+                doc="(ReadGroup: ID) Used to construct the readGroupHeaderLine, defaults to the "
+                "sampleName. Give each lane (or flowcell lane) of a sample its own ID.",
+            ),
             ToolInput(
                 "platformTechnology",
                 String(optional=True),
@@ -0,0 +1,70 @@
+from typing import Dict, List, Any
+
+from janis_core import TOutput, File
+
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsPythonTool
+
+
+class CollapseStarSpliceJunctions(BioinformaticsPythonTool):
+    @staticmethod
+    def code_block(
+        sjFiles: List[File],
+        minUniqueReads: int = 3,
+        minSamples: int = 1,
+        output_filename: str = "SJ.collapsed.tab",
+    ) -> Dict[str, Any]:
+        """
+        :param sjFiles: SJ.out.tab from the STAR 1st pass of each sample
+        :param minUniqueReads: Minimum number of uniquely mapping reads for a junction to count in a sample
+        :param minSamples: Minimum number of samples a novel junction must pass minUniqueReads in
+        :param output_filename: Filename to output to
+        """
+        from collections import OrderedDict
+
+        strands = {"0": ".", "1": "+", "2": "-"}
+        passed = OrderedDict()
+        for sj in sjFiles:
+            with open(sj) as inp:
+                for line in inp:
+                    pieces = line.rstrip("\n").split("\t")
+                    if len(pieces) < 7:
+                        continue
+                    chrom, start, end, strand, motif, annotated, unique = pieces[:7]
+                    # annotated junctions are already in the genome (GTF), non-canonical
+                    # and mitochondrial junctions are mostly noise
+                    if annotated == "1" or motif == "0":
+                        continue
+                    if chrom in ("M", "MT", "chrM", "chrMT"):
+                        continue
+                    if int(unique) < minUniqueReads:
+                        continue
+                    key = (chrom, start, end, strands.get(strand, "."))
+                    passed[key] = passed.get(key, 0) + 1
+
+        with open(output_filename, "w+") as out:
+            for (chrom, start, end, strand), n in passed.items():
+                if n >= minSamples:
+                    out.write(f"{chrom}\t{start}\t{end}\t{strand}\n")
+
+        return {"out": output_filename}
+
+    def outputs(self) -> List[TOutput]:
+        return [TOutput("out", File)]
+
+    def id(self) -> str:
+        return "CollapseStarSpliceJunctions"
+
+    def friendly_name(self):
+        return "Collapse STAR splice junctions"
+
+    def tool_provider(self):
+        return "common"
+
+    def version(self):
+        return "v0.1.0"
+
+    def bind_metadata(self):
+        self.metadata.documentation = """\
+Collapse and filter the novel splice junctions (SJ.out.tab) from the STAR 1st pass of many samples
+into one sjdbFileChrStartEnd table, so a single 2-pass genome can be generated for the cohort.
+        """
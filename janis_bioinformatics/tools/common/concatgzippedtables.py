@@ -0,0 +1,47 @@
+from typing import Dict, List, Any
+
+from janis_core import TOutput, File
+
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsPythonTool
+
+
+class ConcatGzippedTables(BioinformaticsPythonTool):
+    @staticmethod
+    def code_block(
+        files: List[File],
+        output_filename: str = "concatenated.gz",
+        headerLines: int = 1,
+    ) -> Dict[str, Any]:
+        """
+        :param files: Gzipped tables (eg: from a scatter) in the order they should be concatenated
+        :param output_filename: Filename to output to (gzipped)
+        :param headerLines: Number of header lines in each table, these are only written from the first table
+        """
+        import gzip, shutil
+
+        with gzip.open(output_filename, "wt") as out:
+            for idx, f in enumerate(files):
+                with gzip.open(f, "rt") as inp:
+                    for _ in range(headerLines):
+                        line = inp.readline()
+                        if idx == 0:
+                            out.write(line)
+                    # stream the rest of the table, never holding it in memory
+                    shutil.copyfileobj(inp, out)
+
+        return {"out": output_filename}
+
+    def outputs(self) -> List[TOutput]:
+        return [TOutput("out", File)]
+
+    def id(self) -> str:
+        return "ConcatGzippedTables"
+
+    def friendly_name(self):
+        return "Concatenate gzipped tables"
+
+    def tool_provider(self):
+        return "common"
+
+    def version(self):
+        return "v0.1.0"
@@ -0,0 +1,47 @@
+from typing import Dict, List, Any
+
+from janis_core import TOutput, File
+from janis_unix import TextFile
+
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsPythonTool
+
+
+class ConcatTextTables(BioinformaticsPythonTool):
+    @staticmethod
+    def code_block(
+        files: List[File],
+        output_filename: str = "concatenated.txt",
+        headerLines: int = 1,
+    ) -> Dict[str, Any]:
+        """
+        :param files: Tables (eg: from a scatter) in the order they should be concatenated
+        :param output_filename: Filename to output to
+        :param headerLines: Number of header lines in each table, these are only written from the first table
+        """
+        import shutil
+
+        with open(output_filename, "w+") as out:
+            for idx, f in enumerate(files):
+                with open(f) as inp:
+                    for _ in range(headerLines):
+                        line = inp.readline()
+                        if idx == 0:
+                            out.write(line)
+                    shutil.copyfileobj(inp, out)
+
+        return {"out": output_filename}
+
+    def outputs(self) -> List[TOutput]:
+        return [TOutput("out", TextFile)]
+
+    def id(self) -> str:
+        return "ConcatTextTables"
+
+    def friendly_name(self):
+        return "Concatenate text tables"
+
+    def tool_provider(self):
+        return "common"
+
+    def version(self):
+        return "v0.1.0"
@@ -0,0 +1,135 @@
+from typing import Dict, List, Any, Optional
+
+from janis_core import TOutput, Array, File
+
+from janis_bioinformatics.data_types import Bed, FastaFai
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsPythonTool
+
+
+class CreateBalancedCallRegions(BioinformaticsPythonTool):
+    @staticmethod
+    def code_block(
+        reference: FastaFai,
+        regionSize: int,
+        blacklist: Optional[Bed] = None,
+        regionTimings: Optional[File] = None,
+    ) -> Dict[str, Any]:
+        """
+        :param reference: Reference with a .fai, regions are output in the same (contig) order
+        :param regionSize: Guide region size, the number of regions is the callable length / regionSize
+        :param blacklist: Regions (eg: high-depth or low-complexity) that are left out of every call region
+        :param regionTimings: Tab separated <region> <seconds> (eg: from a previous run), the regions
+            are balanced on the estimated run time instead of on their length
+        """
+        import math
+        from collections import defaultdict
+
+        def parse_region(region):
+            chrom, positions = region.rsplit(":", 1)
+            start, end = positions.split("-")
+            return chrom, int(start), int(end)
+
+        contigs = []
+        with open(f"{reference}.fai") as inp:
+            for line in inp:
+                pieces = line.split("\t")
+                contigs.append((pieces[0], int(pieces[1])))
+
+        excluded = defaultdict(list)
+        if blacklist:
+            with open(blacklist) as inp:
+                for line in inp:
+                    if not line.strip() or line.startswith(("#", "track", "browser")):
+                        continue
+                    pieces = line.split("\t")
+                    excluded[pieces[0]].append((int(pieces[1]), int(pieces[2])))
+
+        # callable segments (0-based, half open) per contig, ie: the contig minus the blacklist
+        segments = []
+        for chrom, length in contigs:
+            start = 0
+            for s, e in sorted(excluded[chrom]):
+                if s > start:
+                    segments.append((chrom, start, min(s, length)))
+                start = max(start, e)
+            if start < length:
+                segments.append((chrom, start, length))
+
+        # cost (seconds per base) of each previously timed region, untimed bases get the mean
+        timed = defaultdict(list)
+        total_seconds, total_bases = 0.0, 0
+        if regionTimings:
+            with open(regionTimings) as inp:
+                for line in inp:
+                    pieces = line.split()
+                    if len(pieces) < 2:
+                        continue
+                    chrom, s, e = parse_region(pieces[0])
+                    if e <= s:
+                        continue
+                    timed[chrom].append((s, e, float(pieces[1]) / (e - s)))
+                    total_seconds += float(pieces[1])
+                    total_bases += e - s
+        default_cost = total_seconds / total_bases if total_seconds > 0 else 1.0
+
+        def costs(chrom, start, end):
+            # yields (start, end, cost per base) pieces that cover [start, end)
+            pos = start
+            for s, e, c in sorted(timed[chrom]):
+                if e <= pos or s >= end:
+                    continue
+                if s > pos:
+                    yield pos, s, default_cost
+                yield max(s, pos), min(e, end), c or default_cost
+                pos = min(e, end)
+            if pos < end:
+                yield pos, end, default_cost
+
+        callable_length = sum(e - s for _, s, e in segments)
+        n_regions = max(1, math.ceil(callable_length / regionSize))
+        total_cost = sum(
+            (e - s) * c
+            for chrom, start, end in segments
+            for s, e, c in costs(chrom, start, end)
+        )
+        target = total_cost / n_regions
+
+        regions = []
+        for chrom, start, end in segments:
+            region_start, accumulated = start, 0.0
+            for s, e, c in costs(chrom, start, end):
+                pos = s
+                while pos < e:
+                    needed = max(1, math.ceil((target - accumulated) / c))
+                    if pos + needed > e:
+                        accumulated += (e - pos) * c
+                        break
+                    pos += needed
+                    regions.append(f"{chrom}:{region_start}-{pos}")
+                    region_start, accumulated = pos, 0.0
+            if region_start < end:
+                regions.append(f"{chrom}:{region_start}-{end}")
+
+        return {"regions": regions}
+
+    def outputs(self) -> List[TOutput]:
+        return [TOutput("regions", Array(str))]
+
+    def id(self) -> str:
+        return "CreateBalancedCallRegions"
+
+    def friendly_name(self):
+        return "Create balanced genomic call regions"
+
+    def tool_provider(self):
+        return "common"
+
+    def version(self):
+        return "v0.1.0"
+
+    def bind_metadata(self):
+        self.metadata.documentation = """\
+Split the reference into call regions (0-based, end excluded, as freebayes expects) that leave
+out the blacklisted regions. Without timings, the regions are equally sized. With the per-region
+timings of a previous run, the regions are cut so each is expected to take the same time.
+        """
@@ -0,0 +1,41 @@
+from janis_core import Array
+
+from janis_bioinformatics.data_types import Bam
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsWorkflow
+from janis_bioinformatics.tools.samtools import SamToolsCatLatest, SamToolsIndexLatest
+
+
+class GatherDisjointBams(BioinformaticsWorkflow):
+    def id(self):
+        return "GatherDisjointBams"
+
+    def friendly_name(self):
+        return "Gather disjoint bam shards"
+
+    def version(self):
+        return "v0.1.0"
+
+    def tool_provider(self):
+        return "common"
+
+    def bind_metadata(self):
+        self.metadata.documentation = """\
+Gather bam shards that are coordinate sorted, don't overlap and are given in reference order
+(eg: ApplyBQSR or SplitReads outputs of the same bam over ordered, disjoint intervals).
+
+The BGZF blocks are concatenated (samtools cat) rather than every record being decoded and
+merged, so this is I/O bound. Shards that interleave (eg: lanes of the same sample) must still
+be merged with MergeSamFiles (see MergeAndMarkBams). Gatk4GatherBamFiles is the equivalent
+single (JVM) tool, and also writes the index.
+        """.strip()
+
+    def constructor(self):
+
+        self.input(
+            "bams", Array(Bam), doc="Ordered, non-overlapping, coordinate sorted shards"
+        )
+
+        self.step("cat", SamToolsCatLatest(bams=self.bams))
+        self.step("index", SamToolsIndexLatest(bam=self.cat.out))
+
+        self.output("out", source=self.index.out)
@@ -0,0 +1,44 @@
+from typing import Dict, List, Any, Optional
+
+from janis_core import TOutput, Array
+
+from janis_bioinformatics.data_types import FastaFai
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsPythonTool
+
+
+class GenerateChromosomeList(BioinformaticsPythonTool):
+    @staticmethod
+    def code_block(
+        reference: FastaFai, restrict_to: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        :param reference: Reference to list the contigs of (must have the .fai index)
+        :param restrict_to: Restrict (and order) the list to these chromosomes, eg: to skip alt / decoy contigs
+        """
+        contigs = []
+        with open(f"{reference}.fai") as fai:
+            for line in fai:
+                if not line.strip():
+                    continue
+                contigs.append(line.split("\t", 1)[0])
+
+        if restrict_to:
+            available = set(contigs)
+            contigs = [c for c in restrict_to if c in available]
+
+        return {"chromosomes": contigs}
+
+    def outputs(self) -> List[TOutput]:
+        return [TOutput("chromosomes", Array(str))]
+
+    def id(self) -> str:
+        return "GenerateChromosomeList"
+
+    def friendly_name(self):
+        return "Generate chromosome list"
+
+    def tool_provider(self):
+        return "common"
+
+    def version(self):
+        return "v0.1.0"
@@ -0,0 +1,94 @@
+from typing import Dict, List, Any
+
+from janis_core import TOutput, Array, File
+
+from janis_bioinformatics.data_types import Bed, FastaFai
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsPythonTool
+
+
+class GenerateExonIntervalShards(BioinformaticsPythonTool):
+    @staticmethod
+    def code_block(
+        gtf: File, reference: FastaFai, shards: int = 20, padding: int = 0
+    ) -> Dict[str, Any]:
+        """
+        :param gtf: GTF (optionally gzipped) to take the exons from
+        :param reference: Reference (with .fai), the shards are in the same contig order
+        :param shards: Number of shards, each covers about the same number of exonic bases
+        :param padding: Number of bases to pad each exon by (before merging)
+        """
+        import gzip
+        import os
+        from collections import defaultdict
+
+        contigs = []
+        with open(f"{reference}.fai") as inp:
+            for line in inp:
+                pieces = line.split("\t")
+                contigs.append((pieces[0], int(pieces[1])))
+        lengths = dict(contigs)
+
+        exons = defaultdict(list)
+        opener = gzip.open if gtf.endswith(".gz") else open
+        with opener(gtf, "rt") as inp:
+            for line in inp:
+                if line.startswith("#"):
+                    continue
+                pieces = line.split("\t", 5)
+                if len(pieces) < 5 or pieces[2] != "exon":
+                    continue
+                chrom = pieces[0]
+                if chrom not in lengths:
+                    continue
+                # GTF is 1-based and closed, bed is 0-based and half open
+                start = max(0, int(pieces[3]) - 1 - padding)
+                end = min(lengths[chrom], int(pieces[4]) + padding)
+                exons[chrom].append((start, end))
+
+        merged = []
+        for chrom, _ in contigs:
+            current = None
+            for start, end in sorted(exons[chrom]):
+                if current and start <= current[2]:
+                    current[2] = max(current[2], end)
+                    continue
+                if current:
+                    merged.append(tuple(current))
+                current = [chrom, start, end]
+            if current:
+                merged.append(tuple(current))
+
+        # consecutive (in reference order) intervals are grouped, so gathering the shards
+        # in order gives a sorted result
+        total = sum(e - s for _, s, e in merged)
+        per_shard = max(1, total / max(1, shards))
+
+        out, fp, accumulated = [], None, 0
+        for chrom, start, end in merged:
+            if fp is None or (accumulated >= per_shard and len(out) < shards):
+                if fp:
+                    fp.close()
+                fp = open(f"shard_{len(out)}.bed", "w+")
+                out.append(os.path.abspath(fp.name))
+                accumulated = 0
+            fp.write(f"{chrom}\t{start}\t{end}\n")
+            accumulated += end - start
+        if fp:
+            fp.close()
+
+        return {"out": out}
+
+    def outputs(self) -> List[TOutput]:
+        return [TOutput("out", Array(Bed))]
+
+    def id(self) -> str:
+        return "GenerateExonIntervalShards"
+
+    def friendly_name(self):
+        return "Generate exon interval shards"
+
+    def tool_provider(self):
+        return "common"
+
+    def version(self):
+        return "v0.1.0"
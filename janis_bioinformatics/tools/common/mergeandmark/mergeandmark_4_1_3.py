@@ -21,6 +21,13 @@ class MergeAndMarkBams_4_1_3(BioinformaticsWorkflow):
     def tool_provider(self):
         return "common"
 
+    def bind_metadata(self):
+        self.metadata.documentation = """\
+Merge (MergeSamFiles, a k-way merge of every record) and mark duplicates. This is for bams
+whose reads interleave (eg: the lanes of a sample), coordinate disjoint shards of the same bam
+can be gathered much faster with GatherDisjointBams.
+        """.strip()
+
     def constructor(self):
 
         self.input("bams", Array(BamBai()))
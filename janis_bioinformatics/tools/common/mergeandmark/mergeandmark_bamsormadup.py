@@ -0,0 +1,40 @@
+from janis_core import Array
+
+from janis_bioinformatics.data_types import Bam
+from janis_bioinformatics.tools.biobambam import BamCatSorMaDup_2_0_87
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsWorkflow
+
+
+class MergeAndMarkBamsBamSorMaDup(BioinformaticsWorkflow):
+    def id(self):
+        return "mergeAndMarkBamsBamSorMaDup"
+
+    def friendly_name(self):
+        return "Merge and Mark Duplicates (bamsormadup)"
+
+    def version(self):
+        return "2.0.87"
+
+    def tool_provider(self):
+        return "common"
+
+    def bind_metadata(self):
+        self.metadata.documentation = """\
+Same inputs and output as MergeAndMarkBams, but the bams are streamed (bamcat) into biobambam's
+bamsormadup, which sorts, marks duplicates and indexes in a single multithreaded pass (instead
+of a MergeSamFiles pass and a single threaded MarkDuplicates pass). Duplicates are flagged
+(0x400) rather than removed, as PerformanceSummary expects.
+        """.strip()
+
+    def constructor(self):
+
+        self.input("bams", Array(Bam))
+
+        self.step("bamsormadup", BamCatSorMaDup_2_0_87(bams=self.bams))
+
+        self.output("out", source=self.bamsormadup.out)
+        self.output("metrics", source=self.bamsormadup.metrics)
+
+
+if __name__ == "__main__":
+    MergeAndMarkBamsBamSorMaDup().translate("wdl")
@@ -0,0 +1,49 @@
+from typing import Dict, List, Any
+
+from janis_core import TOutput, Array
+
+from janis_bioinformatics.data_types import Bed
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsPythonTool
+
+
+class SplitBedByContig(BioinformaticsPythonTool):
+    @staticmethod
+    def code_block(bed: Bed) -> Dict[str, Any]:
+        """
+        :param bed: Bed to split, the contigs are output in the order they first appear
+        """
+        import os
+
+        handles, order = {}, []
+        with open(bed) as inp:
+            for line in inp:
+                if not line.strip() or line.startswith(("#", "track", "browser")):
+                    continue
+                contig = line.split("\t", 1)[0]
+                fp = handles.get(contig)
+                if fp is None:
+                    fp = open(f"split_{len(order)}.bed", "w+")
+                    handles[contig] = fp
+                    order.append(contig)
+                fp.write(line)
+
+        out = [os.path.abspath(handles[c].name) for c in order]
+        for fp in handles.values():
+            fp.close()
+
+        return {"contigs": order, "out": out}
+
+    def outputs(self) -> List[TOutput]:
+        return [TOutput("contigs", Array(str)), TOutput("out", Array(Bed))]
+
+    def id(self) -> str:
+        return "SplitBedByContig"
+
+    def friendly_name(self):
+        return "Split Bed by contig"
+
+    def tool_provider(self):
+        return "common"
+
+    def version(self):
+        return "v0.1.0"
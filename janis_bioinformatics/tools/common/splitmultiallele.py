@@ -1,6 +1,6 @@
 from typing import List, Dict, Any
 from janis_core import get_value_for_hints_and_ordered_resource_tuple
-from janis_bioinformatics.data_types import FastaWithDict, CompressedVcf
+from janis_bioinformatics.data_types import FastaFai, CompressedVcf
 from janis_bioinformatics.data_types import Vcf
 from janis_bioinformatics.tools import BioinformaticsTool
 from janis_core import (
@@ -75,7 +75,7 @@ class SplitMultiAllele(BioinformaticsTool):
         return [
             ToolInput("vcf", Vcf(), position=1, shell_quote=False),
             ToolInput(
-                "reference", FastaWithDict(), prefix="-r", position=4, shell_quote=False
+                "reference", FastaFai(), prefix="-r", position=4, shell_quote=False
             ),
             ToolInput(
                 "outputFilename",
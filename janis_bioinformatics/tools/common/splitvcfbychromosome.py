@@ -0,0 +1,62 @@
+from typing import Dict, List, Any, Optional
+
+from janis_core import TOutput, Array
+
+from janis_bioinformatics.data_types import Vcf
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsPythonTool
+
+
+class SplitVcfByChromosome(BioinformaticsPythonTool):
+    @staticmethod
+    def code_block(vcf: Vcf, restrict_to: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        :param vcf: VCF to split (plain or gzipped), each output keeps the full header
+        :param restrict_to: Restrict (and order) the output to these chromosomes
+        """
+        import gzip, os
+
+        opener = gzip.open if vcf.endswith(".gz") else open
+        allowed = set(restrict_to) if restrict_to else None
+
+        # The VCF is streamed once, each record is routed to the handle of its chromosome
+        header, handles, order = [], {}, []
+        with opener(vcf, "rt") as inp:
+            for line in inp:
+                if line.startswith("#"):
+                    header.append(line)
+                    continue
+                chrom = line.split("\t", 1)[0]
+                if allowed is not None and chrom not in allowed:
+                    continue
+                fp = handles.get(chrom)
+                if fp is None:
+                    # chromosome names aren't always safe filenames (eg: HLA-A*01:01)
+                    fp = open(f"split_{len(order)}.vcf", "w+")
+                    fp.writelines(header)
+                    handles[chrom] = fp
+                    order.append(chrom)
+                fp.write(line)
+
+        filenames = {c: os.path.abspath(handles[c].name) for c in order}
+        for fp in handles.values():
+            fp.close()
+
+        if restrict_to:
+            order = [c for c in restrict_to if c in filenames]
+
+        return {"chromosomes": order, "out": [filenames[c] for c in order]}
+
+    def outputs(self) -> List[TOutput]:
+        return [TOutput("chromosomes", Array(str)), TOutput("out", Array(Vcf))]
+
+    def id(self) -> str:
+        return "SplitVcfByChromosome"
+
+    def friendly_name(self):
+        return "Split VCF by chromosome"
+
+    def tool_provider(self):
+        return "common"
+
+    def version(self):
+        return "v0.1.0"
@@ -0,0 +1,136 @@
+from janis_core import Array, String
+
+from janis_bioinformatics.data_types import FastqGzPair, FastaWithIndexes
+from janis_bioinformatics.tools import BioinformaticsWorkflow
+from janis_bioinformatics.tools.common.bwamem_samtoolsview import BwaMem_SamToolsView
+from janis_bioinformatics.tools.common.mergeandmark.mergeandmark_bamsormadup import (
+    MergeAndMarkBamsBamSorMaDup,
+)
+from janis_bioinformatics.tools.gatk4 import (
+    Gatk4FastqToSam_4_1_3,
+    Gatk4MergeBamAlignment_4_1_3,
+)
+
+
+class UbamLaneAligner(BioinformaticsWorkflow):
+    def id(self):
+        return "UbamLaneAligner"
+
+    def friendly_name(self):
+        return "Align a lane and merge it with its unmapped bam"
+
+    def tool_provider(self):
+        return "common"
+
+    def version(self):
+        return "v0.1.0"
+
+    def bind_metadata(self):
+        self.metadata.documentation = """\
+FastqToSam (the uBAM keeps the read group, qualities and any other read level data) and BWA-MEM
+of the same lane, merged with MergeBamAlignment. The merge writes the reads unsorted (in the
+uBAM's queryname order, so the mates are together) with a low compression level, as they're
+only read again by the sample's sort and duplicate marking.
+        """.strip()
+
+    def constructor(self):
+
+        self.input("sample_name", String)
+        self.input(
+            "read_group_id",
+            String,
+            doc="Unique to this lane (eg: <flowcell>.<lane>), so the lanes' reads can be "
+            "told apart after they're merged",
+        )
+        self.input("reference", FastaWithIndexes)
+        self.input("reads", FastqGzPair)
+
+        self.step(
+            "fastqtosam",
+            Gatk4FastqToSam_4_1_3(
+                fastqR1=self.reads[0],
+                fastqR2=self.reads[1],
+                sampleName=self.sample_name,
+                # matches the read group BwaMem_SamToolsView writes
+                readGroupName=self.read_group_id,
+                platformUnit=self.read_group_id,
+                libraryName=self.sample_name,
+                platform="ILLUMINA",
+                tmpDir=".",
+            ),
+        )
+        self.step(
+            "bwamem",
+            BwaMem_SamToolsView(
+                reads=self.reads,
+                sampleName=self.sample_name,
+                readGroupId=self.read_group_id,
+                reference=self.reference,
+                markShorterSplits=True,
+            ),
+        )
+        self.step(
+            "merge_alignment",
+            Gatk4MergeBamAlignment_4_1_3(
+                ubam=self.fastqtosam.out,
+                bam=[self.bwamem.out],
+                reference=self.reference,
+                sortOrder="unsorted",
+                createIndex=False,
+                compressionLevel=1,
+                validationStringency="SILENT",
+                tmpDir=".",
+            ),
+        )
+
+        self.output("out", source=self.merge_alignment.out)
+
+
+class UbamAligner(BioinformaticsWorkflow):
+    def id(self):
+        return "UbamAligner"
+
+    def friendly_name(self):
+        return "Align lanes through uBAM and MergeBamAlignment"
+
+    def tool_provider(self):
+        return "common"
+
+    def version(self):
+        return "v0.1.0"
+
+    def bind_metadata(self):
+        self.metadata.documentation = """\
+The GATK "uBAM -> align -> MergeBamAlignment" preprocessing. Every lane is converted, aligned
+and merged in parallel (UbamLaneAligner) under its own read group ID, and the (unsorted) lane
+bams are sorted and duplicate marked together in a single multithreaded bamsormadup pass.
+        """.strip()
+
+    def constructor(self):
+
+        self.input("sample_name", String)
+        self.input("reference", FastaWithIndexes)
+        self.input("fastqs", Array(FastqGzPair), doc="One pair per lane")
+        self.input(
+            "read_group_ids",
+            Array(String),
+            doc="The read group ID of each lane (eg: <flowcell>.<lane>), in the same "
+            "order as the fastqs",
+        )
+
+        self.step(
+            "align_lane",
+            UbamLaneAligner(
+                sample_name=self.sample_name,
+                read_group_id=self.read_group_ids,
+                reference=self.reference,
+                reads=self.fastqs,
+            ),
+            scatter=["reads", "read_group_id"],
+        )
+        self.step(
+            "merge_and_mark", MergeAndMarkBamsBamSorMaDup(bams=self.align_lane.out)
+        )
+
+        self.output("out", source=self.merge_and_mark.out)
+        self.output("metrics", source=self.merge_and_mark.metrics)
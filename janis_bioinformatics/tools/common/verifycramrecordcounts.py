@@ -0,0 +1,99 @@
+from janis_core import (
+    ToolInput,
+    ToolArgument,
+    ToolOutput,
+    Int,
+    File,
+    InputSelector,
+    WildcardSelector,
+    StringFormatter,
+    ToolMetadata,
+)
+
+from janis_bioinformatics.data_types import Bam, CramCrai, FastaFai
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsTool
+from janis_bioinformatics.utils.threads import additional_threads
+
+
+class VerifyCramRecordCounts(BioinformaticsTool):
+    def tool(self) -> str:
+        return "VerifyCramRecordCounts"
+
+    def friendly_name(self):
+        return "Verify CRAM record counts"
+
+    def tool_provider(self):
+        return "common"
+
+    def version(self):
+        return "1.9"
+
+    def container(self):
+        return "quay.io/biocontainers/samtools:1.9--h8571acd_11"
+
+    def base_command(self):
+        return None
+
+    def inputs(self):
+        return [
+            ToolInput("bam", Bam(), doc="The bam the cram was converted from"),
+            ToolInput("cram", CramCrai()),
+            ToolInput(
+                "reference", FastaFai(), doc="The reference the cram is encoded against"
+            ),
+            ToolInput(
+                "threads",
+                Int(optional=True),
+                doc="(default: cores allocated - 1) Decompression threads samtools uses "
+                "in addition to the main thread",
+            ),
+        ]
+
+    def arguments(self):
+        return [
+            ToolArgument(
+                StringFormatter(
+                    "BAM=`samtools view -c -@ {threads} {bam}`",
+                    threads=additional_threads(),
+                    bam=InputSelector("bam"),
+                ),
+                position=1,
+                shell_quote=False,
+            ),
+            ToolArgument(
+                StringFormatter(
+                    "&& CRAM=`samtools view -c -@ {threads} -T {reference} {cram}`",
+                    threads=additional_threads(),
+                    reference=InputSelector("reference"),
+                    cram=InputSelector("cram"),
+                ),
+                position=2,
+                shell_quote=False,
+            ),
+            ToolArgument(
+                '&& printf "bam\\t%s\\ncram\\t%s\\n" $BAM $CRAM > counts.tsv && test "$BAM" -eq "$CRAM"',
+                position=3,
+                shell_quote=False,
+            ),
+        ]
+
+    def outputs(self):
+        return [
+            ToolOutput(
+                "counts",
+                File(),
+                glob=WildcardSelector("counts.tsv"),
+                doc="bam\\t<records>\\ncram\\t<records>",
+            ),
+        ]
+
+    def bind_metadata(self):
+        return ToolMetadata(
+            documentation="""\
+Count the records (samtools view -c) in the bam and in the cram that was converted from it, and
+fail if they're different. The cram is decoded against the given reference, so this also checks
+the cram can be read back with it.
+
+The cram is only read (not output again), a workflow fails when this step does, so its cram
+output can come straight from the step that wrote it.""",
+        )
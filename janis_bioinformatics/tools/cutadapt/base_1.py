@@ -13,6 +13,7 @@ from janis_core import (
     ToolMetadata,
     WildcardSelector,
     get_value_for_hints_and_ordered_resource_tuple,
+    CpuSelector,
 )
 
 from janis_bioinformatics.data_types import FastqGzPair
@@ -300,8 +301,8 @@ class CutAdaptBase_1(BioinformaticsTool):
             "cores",
             Int(optional=True),
             prefix="-j",
-            default=0,
-            doc="Number of CPU cores to use. Use 0 to auto-detect. Default: 1",
+            default=CpuSelector(),
+            doc="(default: cores allocated) Number of CPU cores to use. Use 0 to auto-detect. Default: 1",
         ),
         ToolInput(
             "adapter_g",
@@ -13,6 +13,7 @@ from janis_core import (
     ToolMetadata,
     WildcardSelector,
     get_value_for_hints_and_ordered_resource_tuple,
+    CpuSelector,
 )
 
 from janis_bioinformatics.data_types import FastqGzPair
@@ -113,7 +114,8 @@ class CutAdaptBase_2(BioinformaticsTool):
             input_type=Int(optional=True),
             prefix="--cores",
             separate_value_from_prefix=True,
-            doc="(-j)  Number of CPU cores to use. Use 0 to auto-detect. Default: 1",
+            default=CpuSelector(),
+            doc="(-j) (default: cores allocated) Number of CPU cores to use. Use 0 to auto-detect. Default: 1",
         ),
         ToolInput(
             tag="front",
@@ -8,7 +8,8 @@ from janis_bioinformatics.tools.dawson import (
 )
 from janis_bioinformatics.tools.dawson.createcallregions.base import CreateCallRegions
 from janis_bioinformatics.tools.freebayes.versions import FreeBayesCram_1_3 as FreeBayes
-from janis_bioinformatics.tools.htslib import BGZipLatest as BGZip, TabixLatest as Tabix
+from janis_bioinformatics.tools.htslib import BgzipTabixLatest
+from janis_bioinformatics.tools.pipebuilder import BioinformaticsPipeBuilder, PipeStage
 from janis_bioinformatics.tools.vcflib import (
     VcfAllelicPrimitivesLatest as VcfAllelicPrimitives,
     VcfCombineLatest as VcfCombine,
@@ -19,6 +20,43 @@ from janis_bioinformatics.tools.vcflib import (
 )
 from janis_core import Array, Int, String
 
+# The vcflib parts of the post processing are streamed (each one is a single task), the
+# normalisation runs in between as bcftools is not in the vcflib container.
+CombineAndSortSomatic = BioinformaticsPipeBuilder(
+    tool="FreeBayesSomaticCombineAndSort",
+    stages=[
+        PipeStage("combine", VcfCombine()),
+        # should not be necessary here, but just to be save
+        PipeStage("sort", VcfStreamSort(), stdin="vcf", inMemoryFlag=True),
+    ],
+    version="0.1",
+)
+
+SplitAndSortSomatic = BioinformaticsPipeBuilder(
+    tool="FreeBayesSomaticSplitAndSort",
+    stages=[
+        PipeStage(
+            "primitives",
+            VcfAllelicPrimitives(),
+            tagParsed="DECOMPOSED",
+            keepGenoFlag=True,
+        ),
+        PipeStage("fixup", VcfFixUp(), stdin="vcf"),
+        PipeStage("sort", VcfStreamSort(), stdin="vcf", inMemoryFlag=True),
+    ],
+    version="0.1",
+)
+
+UniqueSomatic = BioinformaticsPipeBuilder(
+    tool="FreeBayesSomaticUnique",
+    stages=[
+        PipeStage("uniqalleles", VcfUniqAlleles()),
+        PipeStage("sort", VcfStreamSort(), stdin="vcf", inMemoryFlag=True),
+        PipeStage("uniq", VcfUniq(), stdin="vcf"),
+    ],
+    version="0.1",
+)
+
 
 class FreeBayesSomaticWorkflow(BioinformaticsWorkflow):
     def id(self):
@@ -134,19 +172,15 @@ class FreeBayesSomaticWorkflow(BioinformaticsWorkflow):
             scatter="vcf",
         )
 
-        self.step("combineRegions", VcfCombine(vcf=self.callSomatic.out))
-
-        # should not be necessary here, but just to be save
         self.step(
-            "sortSomatic1",
-            VcfStreamSort(vcf=self.combineRegions.out, inMemoryFlag=True),
+            "combineRegions", CombineAndSortSomatic(combine_vcf=self.callSomatic.out)
         )
 
         # no need to compress this here if it leads to problems when we dont have an index for the allelic allelicPrimitves
         self.step(
             "normalizeSomatic1",
             BcfToolsNorm(
-                vcf=self.sortSomatic1.out,
+                vcf=self.combineRegions.out,
                 reference=self.reference,
                 outputType="v",
                 outputFilename="normalised.vcf",
@@ -155,40 +189,24 @@ class FreeBayesSomaticWorkflow(BioinformaticsWorkflow):
 
         self.step(
             "allelicPrimitves",
-            VcfAllelicPrimitives(
-                vcf=self.normalizeSomatic1.out,
-                tagParsed="DECOMPOSED",
-                keepGenoFlag=True,
-            ),
-        )
-
-        self.step("fixSplitLines", VcfFixUp(vcf=self.allelicPrimitves.out))
-
-        self.step(
-            "sortSomatic2", VcfStreamSort(vcf=self.fixSplitLines.out, inMemoryFlag=True)
+            SplitAndSortSomatic(primitives_vcf=self.normalizeSomatic1.out),
         )
 
         self.step(
             "normalizeSomatic2",
             BcfToolsNorm(
-                vcf=self.sortSomatic2.out,
+                vcf=self.allelicPrimitves.out,
                 reference=self.reference,
                 outputType="v",
                 outputFilename="normalised.vcf",
             ),
         )
 
-        self.step("uniqueAlleles", VcfUniqAlleles(vcf=self.normalizeSomatic2.out))
-
         self.step(
-            "sortFinal", VcfStreamSort(vcf=self.uniqueAlleles.out, inMemoryFlag=True)
+            "uniqueAlleles", UniqueSomatic(uniqalleles_vcf=self.normalizeSomatic2.out)
         )
 
-        self.step("uniqVcf", VcfUniq(vcf=self.sortFinal.out))
-
-        self.step("compressFinal", BGZip(file=self.uniqVcf.out))
-
-        self.step("indexFinal", Tabix(inp=self.compressFinal.out))
+        self.step("indexFinal", BgzipTabixLatest(file=self.uniqueAlleles.out))
 
         self.output("somaticOutVcf", source=self.indexFinal)
 
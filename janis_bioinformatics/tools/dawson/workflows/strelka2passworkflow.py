@@ -11,7 +11,7 @@ from janis_bioinformatics.tools.dawson.workflows.strelka2passanalysisstep1 impor
 from janis_bioinformatics.tools.dawson.workflows.strelka2passanalysisstep2 import (
     Strelka2PassWorkflowStep2,
 )
-from janis_bioinformatics.tools.htslib import BGZipLatest as BGZip, TabixLatest as Tabix
+from janis_bioinformatics.tools.htslib import BgzipTabixLatest
 from janis_core import Array, Boolean, String, File, Int
 from janis_bioinformatics.data_types import VcfTabix
 
@@ -105,8 +105,9 @@ class Strelka2PassWorkflow(BioinformaticsWorkflow):
                 minAD=self.minAD,
             ),
         )
-        self.step("compressSNVs", BGZip(file=self.refilterSNVs.out), scatter="file")
-        self.step("indexSNVs", Tabix(inp=self.compressSNVs.out), scatter="inp")
+        self.step(
+            "indexSNVs", BgzipTabixLatest(file=self.refilterSNVs.out), scatter="file"
+        )
 
         self.step(
             "refilterINDELs",
@@ -116,8 +117,11 @@ class Strelka2PassWorkflow(BioinformaticsWorkflow):
                 minAD=self.minAD,
             ),
         )
-        self.step("compressINDELs", BGZip(file=self.refilterINDELs.out), scatter="file")
-        self.step("indexINDELs", Tabix(inp=self.compressINDELs.out), scatter="inp")
+        self.step(
+            "indexINDELs",
+            BgzipTabixLatest(file=self.refilterINDELs.out),
+            scatter="file",
+        )
 
         self.output(
             "snvs",
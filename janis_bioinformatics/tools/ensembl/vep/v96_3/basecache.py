@@ -1,6 +1,6 @@
 from abc import ABC
 
-from janis_bioinformatics.data_types import FastaWithDict
+from janis_bioinformatics.data_types import FastaFai
 from janis_core import ToolInput, String, Boolean, Directory
 from .base import VepBase_96_3
 
@@ -44,7 +44,7 @@ class VepCacheBase_96_3(VepBase_96_3, ABC):
             ),
             ToolInput(
                 "reference",
-                FastaWithDict(optional=True),
+                FastaFai(optional=True),
                 prefix="--fasta",
                 doc="Specify a FASTA file or a directory containing FASTA files to use to look up reference sequence. "
                 "The first time you run VEP, an index will be built which can take a few minutes. This is required "
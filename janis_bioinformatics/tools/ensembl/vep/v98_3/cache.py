@@ -1,7 +1,7 @@
 from abc import ABC
 
 from janis_core import ToolInput, Boolean, Directory, Int
-from janis_bioinformatics.data_types import FastaWithDict
+from janis_bioinformatics.data_types import FastaFai
 from .base import VepBase_98_3
 
 
@@ -45,7 +45,7 @@ class VepCacheBase_98_3(VepBase_98_3, ABC):
             ),
             ToolInput(
                 "fasta",
-                FastaWithDict(optional=True),
+                FastaFai(optional=True),
                 prefix="--fasta",
                 doc="(--fa) Specify a FASTA file or a directory containing FASTA files to use to look up reference "
                 "sequence. The first time you run VEP with this parameter an index will be built which can take a "
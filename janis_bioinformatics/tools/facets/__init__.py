@@ -2,3 +2,7 @@ from .snp_pileup.versions import (
     FacetsSnpPileup_0_5_14,
     FacetsSnpPileupLatest,
 )
+from .workflows.snppileupbychromosome import (
+    FacetsSnpPileupChromosome,
+    FacetsSnpPileupByChromosome,
+)
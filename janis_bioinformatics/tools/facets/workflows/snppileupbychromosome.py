@@ -0,0 +1,160 @@
+from janis_core import Boolean, Int, String, Array
+
+from janis_bioinformatics.data_types import BamBai, Vcf
+from janis_bioinformatics.tools import BioinformaticsWorkflow
+from janis_bioinformatics.tools.common import SplitVcfByChromosome, ConcatGzippedTables
+from janis_bioinformatics.tools.facets.snp_pileup.versions import (
+    FacetsSnpPileup_0_5_14_2 as FacetsSnpPileup,
+)
+from janis_bioinformatics.tools.samtools import (
+    SamToolsViewRegionLatest as SamToolsViewRegion,
+    SamToolsIndexLatest as SamToolsIndex,
+)
+
+
+class FacetsSnpPileupChromosome(BioinformaticsWorkflow):
+    def id(self):
+        return "FacetsSnpPileupChromosome"
+
+    def friendly_name(self):
+        return "Facets: snp-pileup (single chromosome)"
+
+    def tool_provider(self):
+        return "Facets"
+
+    def version(self):
+        return "0.5.14-2"
+
+    def bind_metadata(self):
+        self.metadata.documentation = """
+        snp-pileup has no region option, so the tumour and normal are sliced to the chromosome
+        with an index (BAI) lookup first, and snp-pileup only reads the slices.
+        """.strip()
+
+    def constructor(self):
+
+        self.input("normal", BamBai)
+        self.input("tumour", BamBai)
+        self.input("vcf_file", Vcf, doc="SNP positions on this chromosome only")
+        self.input("chromosome", String)
+
+        self.input("count_orphans", Boolean(optional=True))
+        self.input("ignore_overlaps", Boolean(optional=True))
+        self.input("max_depth", Int(optional=True))
+        self.input("min_map_quality", Int(optional=True))
+        self.input("min_base_quality", Int(optional=True))
+        self.input("min_read_counts", String(optional=True))
+        self.input("pseudo_snps", String(optional=True))
+
+        self.step(
+            "slice_normal",
+            SamToolsViewRegion(sam=self.normal, regions=[self.chromosome]),
+        )
+        self.step("index_normal", SamToolsIndex(bam=self.slice_normal.out))
+        self.step(
+            "slice_tumour",
+            SamToolsViewRegion(sam=self.tumour, regions=[self.chromosome]),
+        )
+        self.step("index_tumour", SamToolsIndex(bam=self.slice_tumour.out))
+
+        self.step(
+            "snp_pileup",
+            FacetsSnpPileup(
+                normal=self.index_normal.out,
+                tumour=self.index_tumour.out,
+                vcf_file=self.vcf_file,
+                gzip=True,
+                count_orphans=self.count_orphans,
+                ignore_overlaps=self.ignore_overlaps,
+                max_depth=self.max_depth,
+                min_map_quality=self.min_map_quality,
+                min_base_quality=self.min_base_quality,
+                min_read_counts=self.min_read_counts,
+                pseudo_snps=self.pseudo_snps,
+            ),
+        )
+
+        self.output("out", source=self.snp_pileup.out)
+
+
+class FacetsSnpPileupByChromosome(BioinformaticsWorkflow):
+    def id(self):
+        return "FacetsSnpPileupByChromosome"
+
+    def friendly_name(self):
+        return "Facets: snp-pileup (scattered by chromosome)"
+
+    def tool_provider(self):
+        return "Facets"
+
+    def version(self):
+        return "0.5.14-2"
+
+    def bind_metadata(self):
+        self.metadata.keywords = ["facets", "snp-pileup", "copy number", "scatter"]
+        self.metadata.documentation = """
+        Copy number preparation for FACETS, parallelised by chromosome:
+
+        1. Split the SNP VCF by chromosome (single pass over the VCF)
+        2. For each chromosome, slice the tumour / normal and run snp-pileup
+        3. Concatenate the gzipped pileups, keeping only the first header
+
+        The output is equivalent to a single genome-wide snp-pileup.
+        """.strip()
+
+    def constructor(self):
+
+        self.input("normal", BamBai)
+        self.input("tumour", BamBai)
+        self.input("vcf_file", Vcf)
+        self.input(
+            "chromosomes",
+            Array(String, optional=True),
+            doc="Restrict the pileup to these chromosomes (eg: to skip alt / decoy contigs), "
+            "by default every chromosome in the vcf_file is used",
+        )
+        self.input("output_filename", String, default="snp_pileup.csv.gz")
+
+        self.input("count_orphans", Boolean(optional=True))
+        self.input("ignore_overlaps", Boolean(optional=True))
+        self.input("max_depth", Int(optional=True))
+        self.input("min_map_quality", Int(optional=True))
+        self.input("min_base_quality", Int(optional=True))
+        self.input("min_read_counts", String(optional=True))
+        self.input("pseudo_snps", String(optional=True))
+
+        self.step(
+            "split_vcf",
+            SplitVcfByChromosome(vcf=self.vcf_file, restrict_to=self.chromosomes),
+        )
+
+        self.step(
+            "snp_pileup",
+            FacetsSnpPileupChromosome(
+                normal=self.normal,
+                tumour=self.tumour,
+                vcf_file=self.split_vcf.out,
+                chromosome=self.split_vcf.chromosomes,
+                count_orphans=self.count_orphans,
+                ignore_overlaps=self.ignore_overlaps,
+                max_depth=self.max_depth,
+                min_map_quality=self.min_map_quality,
+                min_base_quality=self.min_base_quality,
+                min_read_counts=self.min_read_counts,
+                pseudo_snps=self.pseudo_snps,
+            ),
+            scatter=["vcf_file", "chromosome"],
+        )
+
+        self.step(
+            "concat",
+            ConcatGzippedTables(
+                files=self.snp_pileup.out, output_filename=self.output_filename
+            ),
+        )
+
+        self.output("out", source=self.concat.out)
+
+
+if __name__ == "__main__":
+    FacetsSnpPileupByChromosome().translate("wdl")
@@ -1 +1,9 @@
-from .versions import FreeBayesLatest, FreeBayes_1_2, FreeBayes_1_3
+from .versions import (
+    FreeBayesLatest,
+    FreeBayes_1_2,
+    FreeBayes_1_3,
+    FreeBayesCram_1_3,
+    FreeBayesTimed_1_3,
+    FreeBayesCsi_1_3,
+    FreeBayesTimedCsi_1_3,
+)
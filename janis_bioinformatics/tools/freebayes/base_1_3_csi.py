@@ -0,0 +1,21 @@
+from janis_bioinformatics.utils.typeconversion import cast_input_indexes_to_csi
+
+from .base_1_3 import FreeBayesBase_1_3
+from .base_1_3_timed import FreeBayesTimedBase_1_3
+
+
+class FreeBayesCsiBase_1_3(FreeBayesBase_1_3):
+    def id(self):
+        return super().id() + "_csi"
+
+    def inputs(self):
+        # the bams are CSI indexed, for contigs longer than 512 Mbp
+        return cast_input_indexes_to_csi(super().inputs())
+
+
+class FreeBayesTimedCsiBase_1_3(FreeBayesTimedBase_1_3):
+    def id(self):
+        return super().id() + "_csi"
+
+    def inputs(self):
+        return cast_input_indexes_to_csi(super().inputs())
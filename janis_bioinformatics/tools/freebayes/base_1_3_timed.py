@@ -0,0 +1,17 @@
+from janis_core import InputSelector
+
+from janis_bioinformatics.utils.timing import TimedCommandMixin
+from .base_1_3 import FreeBayesBase_1_3
+
+
+class FreeBayesTimedBase_1_3(TimedCommandMixin, FreeBayesBase_1_3):
+    """
+    Same as freebayes, but also records how long the region took (as "<region>\\t<seconds>" in
+    timing.tsv), so the call regions of the next run can be balanced on run time.
+    """
+
+    def id(self):
+        return super().id() + "_timed"
+
+    def timing_label(self):
+        return InputSelector("region")
@@ -1,6 +1,8 @@
 from .base_1_2 import FreeBayesBase_1_2
 from .base_1_3 import FreeBayesBase_1_3
 from .base_1_3_cram import FreeBayesCramBase_1_3
+from .base_1_3_timed import FreeBayesTimedBase_1_3
+from .base_1_3_csi import FreeBayesCsiBase_1_3, FreeBayesTimedCsiBase_1_3
 
 
 class FreeBayes_1_2(FreeBayesBase_1_2):
@@ -27,4 +29,28 @@ class FreeBayesCram_1_3(FreeBayesCramBase_1_3):
         return "1.3.1"
 
 
+class FreeBayesTimed_1_3(FreeBayesTimedBase_1_3):
+    def container(self):
+        return "shollizeck/freebayes:1.3.1"
+
+    def version(self):
+        return "1.3.1"
+
+
+class FreeBayesCsi_1_3(FreeBayesCsiBase_1_3):
+    def container(self):
+        return "shollizeck/freebayes:1.3.1"
+
+    def version(self):
+        return "1.3.1"
+
+
+class FreeBayesTimedCsi_1_3(FreeBayesTimedCsiBase_1_3):
+    def container(self):
+        return "shollizeck/freebayes:1.3.1"
+
+    def version(self):
+        return "1.3.1"
+
+
 FreeBayesLatest = FreeBayes_1_3
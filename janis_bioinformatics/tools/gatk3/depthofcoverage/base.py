@@ -67,21 +67,24 @@ class GATK3DepthOfCoverageBase(GATK3ToolBase, ABC):
     def outputs(self):
         return [
             ToolOutput(
-                "sample", TextFile(), glob=InputSelector("outputPrefix"), doc=""
+                "sample",
+                TextFile(optional=True),
+                glob=InputSelector("outputPrefix"),
+                doc="per locus coverage (not present with omitDepthOutputAtEachBase)",
             ),
             ToolOutput(
                 "sampleCumulativeCoverageCounts",
-                TextFile(),
+                TextFile(optional=True),
                 glob=InputSelector("outputPrefix")
                 + ".sample_cumulative_coverage_counts",
-                doc="",
+                doc="(not present with omitLocusTable)",
             ),
             ToolOutput(
                 "sampleCumulativeCoverageProportions",
-                TextFile(),
+                TextFile(optional=True),
                 glob=InputSelector("outputPrefix")
                 + ".sample_cumulative_coverage_proportions",
-                doc="",
+                doc="(not present with omitLocusTable)",
             ),
             ToolOutput(
                 "sampleIntervalStatistics",
@@ -299,4 +302,28 @@ _cumulative_coverage_proportions: proprotions of loci with >= X coverage, aggreg
             doc="Coverage threshold (in percent) for summarizing statistics",
             prefix_applies_to_all_elements=True,
         ),
+        ToolInput(
+            "omitDepthOutputAtEachBase",
+            Boolean(optional=True),
+            prefix="--omitDepthOutputAtEachBase",
+            doc="Do not output depth of coverage at each base",
+        ),
+        ToolInput(
+            "omitLocusTable",
+            Boolean(optional=True),
+            prefix="--omitLocusTable",
+            doc="Do not calculate per-sample per-depth counts of loci",
+        ),
+        ToolInput(
+            "omitIntervalStatistics",
+            Boolean(optional=True),
+            prefix="--omitIntervalStatistics",
+            doc="Do not calculate per-interval statistics",
+        ),
+        ToolInput(
+            "omitPerSampleStats",
+            Boolean(optional=True),
+            prefix="--omitPerSampleStats",
+            doc="Do not output the summary files per-sample",
+        ),
     ]
@@ -143,3 +143,7 @@ from .depthofcoverage.versions import (
 from .splitncigarreads.versions import *
 from .addorreplacereadgroups.versions import *
 from .reordersam.versions import *
+from .cnnscorevariants.versions import *
+from .filtervarianttranches.versions import *
+from .genomicsdbimport.versions import *
+from .genotypegvcfs.versions import *
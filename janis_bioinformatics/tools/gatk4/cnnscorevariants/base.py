@@ -1,9 +1,10 @@
 from abc import ABC
 from datetime import datetime
+from typing import Dict, Any
 
 from janis_unix import JsonFile
 
-from janis_bioinformatics.data_types import FastaWithDict, Vcf, VcfTabix
+from janis_bioinformatics.data_types import FastaWithDict, VcfTabix, BamBai, Bed
 from janis_bioinformatics.tools.gatk4.gatk4toolbase import Gatk4ToolBase
 
 from janis_core import (
@@ -21,8 +22,40 @@ from janis_core import (
     ToolMetadata,
     InputDocumentation,
     Array,
+    CpuSelector,
+    CaptureType,
+    get_value_for_hints_and_ordered_resource_tuple,
 )
 
+# per shard, the 2D (read tensor) model's cost scales with the reads around each variant
+CORES_TUPLE = [
+    (
+        CaptureType.key(),
+        {
+            CaptureType.TARGETED: 2,
+            CaptureType.EXOME: 4,
+            CaptureType.CHROMOSOME: 4,
+            CaptureType.THIRTYX: 8,
+            CaptureType.NINETYX: 8,
+            CaptureType.THREEHUNDREDX: 8,
+        },
+    )
+]
+
+MEM_TUPLE = [
+    (
+        CaptureType.key(),
+        {
+            CaptureType.TARGETED: 8,
+            CaptureType.EXOME: 16,
+            CaptureType.CHROMOSOME: 16,
+            CaptureType.THIRTYX: 32,
+            CaptureType.NINETYX: 32,
+            CaptureType.THREEHUNDREDX: 32,
+        },
+    )
+]
+
 
 class GatkCNNScoreVariantsBase(Gatk4ToolBase, ABC):
     @classmethod
@@ -35,8 +68,21 @@ class GatkCNNScoreVariantsBase(Gatk4ToolBase, ABC):
     def tool(self) -> str:
         return "Gatk4CNNScoreVariants"
 
+    def cpus(self, hints: Dict[str, Any]):
+        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        if val:
+            return val
+        return 4
+
+    def memory(self, hints: Dict[str, Any]):
+        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        if val:
+            return val
+        return 16
+
     def inputs(self):
         return [
+            *super().inputs(),
             ToolInput(
                 tag="outputFilename",
                 input_type=Filename(
@@ -57,7 +103,7 @@ class GatkCNNScoreVariantsBase(Gatk4ToolBase, ABC):
             ),
             ToolInput(
                 tag="variant",
-                input_type=Vcf(optional=True),
+                input_type=VcfTabix(),
                 prefix="--variant",
                 separate_value_from_prefix=True,
                 doc=InputDocumentation(
@@ -238,7 +284,7 @@ class GatkCNNScoreVariantsBase(Gatk4ToolBase, ABC):
             ),
             ToolInput(
                 tag="inp",
-                input_type=String(optional=True),
+                input_type=BamBai(optional=True),
                 prefix="--input",
                 separate_value_from_prefix=True,
                 doc=InputDocumentation(
@@ -281,7 +327,7 @@ class GatkCNNScoreVariantsBase(Gatk4ToolBase, ABC):
             ),
             ToolInput(
                 tag="intervals",
-                input_type=String(optional=True),
+                input_type=Bed(optional=True),
                 prefix="--intervals",
                 separate_value_from_prefix=True,
                 doc=InputDocumentation(
@@ -371,7 +417,7 @@ class GatkCNNScoreVariantsBase(Gatk4ToolBase, ABC):
             ),
             ToolInput(
                 tag="tensorType",
-                input_type=Boolean(optional=True),
+                input_type=String(optional=True),
                 prefix="--tensor-type",
                 separate_value_from_prefix=True,
                 doc=InputDocumentation(
@@ -480,19 +526,23 @@ class GatkCNNScoreVariantsBase(Gatk4ToolBase, ABC):
             ToolInput(
                 tag="interOpThreads",
                 input_type=Int(optional=True),
+                default=1,
                 prefix="--inter-op-threads",
                 separate_value_from_prefix=True,
                 doc=InputDocumentation(
-                    doc="(-inter-op-threads)  Number of inter-op parallelism threads to use for Tensorflow  Default value: 0. "
+                    doc="(-inter-op-threads)  Number of inter-op parallelism threads to use for Tensorflow  Default value: 0 (1 here, "
+                    "the CNN is a single chain of ops so the threads are better spent within each op)."
                 ),
             ),
             ToolInput(
                 tag="intraOpThreads",
                 input_type=Int(optional=True),
+                default=CpuSelector(),
                 prefix="--intra-op-threads",
                 separate_value_from_prefix=True,
                 doc=InputDocumentation(
-                    doc="(-intra-op-threads)  Number of intra-op parallelism threads to use for Tensorflow  Default value: 0. "
+                    doc="(-intra-op-threads)  Number of intra-op parallelism threads to use for Tensorflow  Default value: 0 "
+                    "(the allocated CPUs here)."
                 ),
             ),
             ToolInput(
@@ -1,9 +1,12 @@
-from .base import GatkCnnscorevariantsBase
+from .base import GatkCNNScoreVariantsBase
+from ..versions import Gatk_4_1_3_0
 
 
-class GatkCnnscorevariants_4_1_3_0(GatkCnnscorevariantsBase):
-    def version(self):
-        return "4.1.3.0"
+class Gatk4CNNScoreVariants_4_1_3(Gatk_4_1_3_0, GatkCNNScoreVariantsBase):
+    pass
 
-    def container(self):
-        return "broadinstitute/gatk:4.1.3.0"
+
+Gatk4CNNScoreVariantsLatest = Gatk4CNNScoreVariants_4_1_3
+
+if __name__ == "__main__":
+    print(Gatk4CNNScoreVariantsLatest().help())
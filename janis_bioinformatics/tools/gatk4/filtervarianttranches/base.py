@@ -1,7 +1,7 @@
 from abc import ABC
 from datetime import datetime
 
-from janis_bioinformatics.data_types import Vcf, VcfTabix
+from janis_bioinformatics.data_types import VcfTabix
 from janis_bioinformatics.tools.gatk4.gatk4toolbase import Gatk4ToolBase
 
 from janis_core import (
@@ -35,6 +35,7 @@ class GatkFilterVariantTranchesBase(Gatk4ToolBase, ABC):
 
     def inputs(self):
         return [
+            *super().inputs(),
             ToolInput(
                 tag="outputFilename",
                 input_type=Filename(
@@ -48,7 +49,7 @@ class GatkFilterVariantTranchesBase(Gatk4ToolBase, ABC):
             ),
             ToolInput(
                 tag="resource",
-                input_type=Array(Vcf, optional=True),
+                input_type=Array(VcfTabix, optional=True),
                 prefix="--resource",
                 separate_value_from_prefix=True,
                 prefix_applies_to_all_elements=True,
@@ -58,7 +59,7 @@ class GatkFilterVariantTranchesBase(Gatk4ToolBase, ABC):
             ),
             ToolInput(
                 tag="variant",
-                input_type=Vcf(optional=True),
+                input_type=VcfTabix(),
                 prefix="--variant",
                 separate_value_from_prefix=True,
                 doc=InputDocumentation(
@@ -1,9 +1,12 @@
-from .base import GatkFiltervarianttranchesBase
+from .base import GatkFilterVariantTranchesBase
+from ..versions import Gatk_4_1_3_0
 
 
-class GatkFiltervarianttranches_4_1_3_0(GatkFiltervarianttranchesBase):
-    def version(self):
-        return "4.1.3.0"
+class Gatk4FilterVariantTranches_4_1_3(Gatk_4_1_3_0, GatkFilterVariantTranchesBase):
+    pass
 
-    def container(self):
-        return "broadinstitute/gatk:4.1.3.0"
+
+Gatk4FilterVariantTranchesLatest = Gatk4FilterVariantTranches_4_1_3
+
+if __name__ == "__main__":
+    print(Gatk4FilterVariantTranchesLatest().help())
@@ -0,0 +1,128 @@
+from abc import ABC
+from typing import Dict, Any
+
+from janis_core import (
+    ToolInput,
+    ToolOutput,
+    Array,
+    String,
+    Int,
+    Boolean,
+    Directory,
+    InputSelector,
+    ToolMetadata,
+)
+
+from janis_bioinformatics.data_types import Bed, GvcfTabix
+from ..gatk4toolbase import Gatk4ToolBase
+
+
+class Gatk4GenomicsDBImportBase(Gatk4ToolBase, ABC):
+    @classmethod
+    def gatk_command(cls):
+        return "GenomicsDBImport"
+
+    def tool(self):
+        return "Gatk4GenomicsDBImport"
+
+    def friendly_name(self):
+        return "GATK4: GenomicsDBImport"
+
+    def cpus(self, hints: Dict[str, Any]):
+        return 2
+
+    def memory(self, hints: Dict[str, Any]):
+        return 16
+
+    def inputs(self):
+        return [
+            *super().inputs(),
+            ToolInput(
+                "gvcfs",
+                Array(GvcfTabix),
+                prefix="--variant",
+                prefix_applies_to_all_elements=True,
+                position=10,
+                doc="(-V) GVCFs (one per sample) to import, they must all cover the intervals",
+            ),
+            ToolInput(
+                "intervals",
+                Bed(),
+                prefix="--intervals",
+                position=10,
+                doc="(-L) Intervals to import, only these can be genotyped from the workspace",
+            ),
+            ToolInput(
+                "workspacePath",
+                String(optional=True),
+                prefix="--genomicsdb-workspace-path",
+                position=10,
+                default="genomicsdb",
+                doc="Workspace (directory) for GenomicsDB, it must not already exist",
+            ),
+            ToolInput(
+                "batchSize",
+                Int(optional=True),
+                prefix="--batch-size",
+                position=10,
+                doc="(default: 0, all samples at once) Batch size controls the number of samples for "
+                "which readers are open at once and therefore provides a way to minimize memory "
+                "consumption. The GATK recommends 50 for large cohorts.",
+            ),
+            ToolInput(
+                "readerThreads",
+                Int(optional=True),
+                prefix="--reader-threads",
+                position=10,
+                doc="(default: 1) How many simultaneous threads to use when opening VCFs in "
+                "batches, more than one is only supported when importing a single interval",
+            ),
+            ToolInput(
+                "mergeInputIntervals",
+                Boolean(optional=True),
+                prefix="--merge-input-intervals",
+                position=10,
+                doc="Import the data between the intervals as well, which is much faster than a "
+                "GenomicsDB partition per interval for many small (eg: exome) intervals",
+            ),
+            ToolInput(
+                "consolidate",
+                Boolean(optional=True),
+                prefix="--consolidate",
+                position=10,
+                doc="Consolidate the batches, reading (GenotypeGVCFs) is faster from a workspace "
+                "that was imported in many batches",
+            ),
+            ToolInput(
+                "tmpDir",
+                String(optional=True),
+                prefix="--tmp-dir",
+                position=10,
+                default="/tmp/",
+                doc="Temp directory to use.",
+            ),
+        ]
+
+    def outputs(self):
+        return [
+            ToolOutput(
+                "out",
+                Directory,
+                glob=InputSelector("workspacePath"),
+                doc="GenomicsDB workspace, to genotype with GenotypeGVCFs (gendb://)",
+            )
+        ]
+
+    def bind_metadata(self):
+        return ToolMetadata(
+            institution="Broad Institute",
+            doi=None,
+            keywords=["gatk", "gatk4", "broad", "genomicsdb", "joint genotyping"],
+            documentationUrl="https://gatk.broadinstitute.org/hc/en-us/articles/360036883491-GenomicsDBImport",
+            documentation="""Import single-sample GVCFs into GenomicsDB before joint genotyping.
+
+The GVCFs of the cohort are imported for a set of intervals into a GenomicsDB workspace (a directory),
+which GenotypeGVCFs reads with -V gendb://workspace. The import is usually scattered by interval, the
+batch size limits the number of GVCFs that are open (and in memory) at once.
+""".strip(),
+        )
@@ -0,0 +1,20 @@
+from .base import Gatk4GenomicsDBImportBase
+from ..versions import Gatk_4_1_3_0, Gatk_4_1_4_0, Gatk_4_1_8_1
+
+
+class Gatk4GenomicsDBImport_4_1_3(Gatk_4_1_3_0, Gatk4GenomicsDBImportBase):
+    pass
+
+
+class Gatk4GenomicsDBImport_4_1_4(Gatk_4_1_4_0, Gatk4GenomicsDBImportBase):
+    pass
+
+
+class Gatk4GenomicsDBImport_4_1_8(Gatk_4_1_8_1, Gatk4GenomicsDBImportBase):
+    pass
+
+
+Gatk4GenomicsDBImportLatest = Gatk4GenomicsDBImport_4_1_8
+
+if __name__ == "__main__":
+    print(Gatk4GenomicsDBImportLatest().help())
@@ -0,0 +1,135 @@
+from abc import ABC
+from typing import Dict, Any
+
+from janis_core import (
+    ToolInput,
+    ToolArgument,
+    ToolOutput,
+    Array,
+    String,
+    Boolean,
+    Directory,
+    Filename,
+    InputSelector,
+    StringFormatter,
+    ToolMetadata,
+)
+
+from janis_bioinformatics.data_types import Bed, FastaWithDict, VcfTabix
+from ..gatk4toolbase import Gatk4ToolBase
+
+
+class Gatk4GenotypeGVCFsBase(Gatk4ToolBase, ABC):
+    @classmethod
+    def gatk_command(cls):
+        return "GenotypeGVCFs"
+
+    def tool(self):
+        return "Gatk4GenotypeGVCFs"
+
+    def friendly_name(self):
+        return "GATK4: GenotypeGVCFs"
+
+    def cpus(self, hints: Dict[str, Any]):
+        return 2
+
+    def memory(self, hints: Dict[str, Any]):
+        return 16
+
+    def inputs(self):
+        return [
+            *super().inputs(),
+            ToolInput(
+                "workspace",
+                Directory(),
+                doc="GenomicsDB workspace (from GenomicsDBImport) with the GVCFs of the cohort",
+            ),
+            ToolInput(
+                "reference",
+                FastaWithDict(),
+                prefix="--reference",
+                position=10,
+                doc="(-R) Reference sequence file",
+            ),
+            ToolInput(
+                "intervals",
+                Bed(optional=True),
+                prefix="--intervals",
+                position=10,
+                doc="(-L) Intervals to genotype, these must have been imported into the workspace",
+            ),
+            ToolInput(
+                "outputFilename",
+                Filename(extension=".vcf.gz"),
+                prefix="--output",
+                position=10,
+                doc="(-O) File to which the (joint genotyped) variants should be written",
+            ),
+            ToolInput(
+                "dbsnp",
+                VcfTabix(optional=True),
+                prefix="--dbsnp",
+                position=10,
+                doc="(-D) A dbSNP VCF file.",
+            ),
+            ToolInput(
+                "annotationGroup",
+                Array(String(), optional=True),
+                prefix="--annotation-group",
+                prefix_applies_to_all_elements=True,
+                position=10,
+                doc="(-G) One or more groups of annotations to apply to variant calls",
+            ),
+            ToolInput(
+                "onlyOutputCallsStartingInIntervals",
+                Boolean(optional=True),
+                prefix="--only-output-calls-starting-in-intervals",
+                position=10,
+                doc="Restrict variant output to sites that start within provided intervals, so a "
+                "variant spanning two (scattered) intervals is only output once",
+            ),
+            ToolInput(
+                "tmpDir",
+                String(optional=True),
+                prefix="--tmp-dir",
+                position=10,
+                default="/tmp/",
+                doc="Temp directory to use.",
+            ),
+        ]
+
+    def arguments(self):
+        return [
+            *super().arguments(),
+            ToolArgument(
+                StringFormatter(
+                    "gendb://{workspace}", workspace=InputSelector("workspace")
+                ),
+                prefix="--variant",
+                position=10,
+                doc="(-V) The GenomicsDB workspace to genotype",
+            ),
+        ]
+
+    def outputs(self):
+        return [
+            ToolOutput(
+                "out",
+                VcfTabix,
+                glob=InputSelector("outputFilename"),
+                doc="Joint genotyped VCF of the cohort",
+            )
+        ]
+
+    def bind_metadata(self):
+        return ToolMetadata(
+            institution="Broad Institute",
+            doi=None,
+            keywords=["gatk", "gatk4", "broad", "genotype", "joint genotyping"],
+            documentationUrl="https://gatk.broadinstitute.org/hc/en-us/articles/360036899732-GenotypeGVCFs",
+            documentation="""Perform joint genotyping on one or more samples pre-called with HaplotypeCaller.
+
+The GVCFs are read from a GenomicsDB workspace (GenomicsDBImport) and only the variant sites are
+output, genotyped across the cohort.
+""".strip(),
+        )
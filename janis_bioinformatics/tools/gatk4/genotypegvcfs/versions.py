@@ -0,0 +1,20 @@
+from .base import Gatk4GenotypeGVCFsBase
+from ..versions import Gatk_4_1_3_0, Gatk_4_1_4_0, Gatk_4_1_8_1
+
+
+class Gatk4GenotypeGVCFs_4_1_3(Gatk_4_1_3_0, Gatk4GenotypeGVCFsBase):
+    pass
+
+
+class Gatk4GenotypeGVCFs_4_1_4(Gatk_4_1_4_0, Gatk4GenotypeGVCFsBase):
+    pass
+
+
+class Gatk4GenotypeGVCFs_4_1_8(Gatk_4_1_8_1, Gatk4GenotypeGVCFsBase):
+    pass
+
+
+Gatk4GenotypeGVCFsLatest = Gatk4GenotypeGVCFs_4_1_8
+
+if __name__ == "__main__":
+    print(Gatk4GenotypeGVCFsLatest().help())
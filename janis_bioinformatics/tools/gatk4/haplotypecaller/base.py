@@ -13,6 +13,7 @@ from janis_core import (
     Filename,
     InputSelector,
     CaptureType,
+    CpuSelector,
 )
 from janis_bioinformatics.data_types import (
     BamBai,
@@ -23,6 +24,11 @@ from janis_bioinformatics.data_types import (
     CompressedVcf,
 )
 from ..gatk4toolbase import Gatk4ToolBase
+from ..outputtier import (
+    output_tier_inputs,
+    output_tier_argument,
+    output_tier_outputs,
+)
 from janis_core import ToolMetadata
 
 
@@ -114,15 +120,12 @@ class Gatk4HaplotypeCallerBase(Gatk4ToolBase, ABC):
                 prefix="--intervals",
                 doc="-L (BASE) One or more genomic intervals over which to operate",
             ),
-            ToolInput(
-                "outputBamName",
-                Filename(prefix=InputSelector("inputRead"), extension=".bam"),
-                position=8,
-                prefix="-bamout",
-                doc="File to which assembled haplotypes should be written",
-            ),
+            *output_tier_inputs(prefix=InputSelector("inputRead")),
         ]
 
+    def arguments(self):
+        return [*super().arguments(), output_tier_argument()]
+
     def outputs(self):
         return [
             ToolOutput(
@@ -132,13 +135,7 @@ class Gatk4HaplotypeCallerBase(Gatk4ToolBase, ABC):
                 doc="A raw, unfiltered, highly sensitive callset in VCF format. "
                 "File to which variants should be written",
             ),
-            ToolOutput(
-                "bam",
-                BamBai,
-                glob=InputSelector("outputBamName"),
-                doc="File to which assembled haplotypes should be written",
-                secondaries_present_as={".bai": "^.bai"},
-            ),
+            *output_tier_outputs(),
         ]
 
     def bind_metadata(self):
@@ -185,12 +182,6 @@ to our recommendations as documented (https://software.broadinstitute.org/gatk/d
             prefix="--pair-hmm-implementation",
             doc="The PairHMM implementation to use for genotype likelihood calculations. The various implementations balance a tradeoff of accuracy and runtime. The --pair-hmm-implementation argument is an enumerated type (Implementation), which can have one of the following values: EXACT;ORIGINAL;LOGLESS_CACHING;AVX_LOGLESS_CACHING;AVX_LOGLESS_CACHING_OMP;EXPERIMENTAL_FPGA_LOGLESS_CACHING;FASTEST_AVAILABLE. Implementation:  FASTEST_AVAILABLE",
         ),
-        ToolInput(
-            "activityProfileOut",
-            String(optional=True),
-            prefix="--activity-profile-out",
-            doc="Output the raw activity profile results in IGV format (default: null)",
-        ),
         ToolInput(
             "alleles",
             File(optional=True),
@@ -229,15 +220,6 @@ to our recommendations as documented (https://software.broadinstitute.org/gatk/d
             prefix="--arguments_file",
             doc="read one or more arguments files and add them to the command line",
         ),
-        ToolInput(
-            "assemblyRegionOut",
-            String(optional=True),
-            prefix="--assembly-region-out",
-            doc="(default: null) Output the assembly region to this IGV formatted file. Which annotations to "
-            "exclude from output in the variant calls. Note that this argument has higher priority than "
-            "the -A or -G arguments, so these annotations will be excluded even if they are explicitly "
-            "included with the other options.",
-        ),
         ToolInput(
             "baseQualityScoreThreshold",
             Int(optional=True),
@@ -365,7 +347,8 @@ to our recommendations as documented (https://software.broadinstitute.org/gatk/d
             "nativePairHmmThreads",
             Int(optional=True),
             prefix="--native-pair-hmm-threads",
-            doc="(default: 4) How many threads should a native pairHMM implementation use",
+            default=CpuSelector(),
+            doc="(default: cores allocated) How many threads should a native pairHMM implementation use",
         ),
         ToolInput(
             "nativePairHmmUseDoublePrecision",
@@ -0,0 +1,54 @@
+from abc import ABC
+
+from janis_core import ToolArgument, ToolInput, ToolOutput, Filename, InputSelector
+
+from janis_bioinformatics.data_types import GvcfTabix
+from ..outputtier import output_tier_outputs
+from .base import Gatk4HaplotypeCallerBase
+
+
+class Gatk4HaplotypeCallerGvcfBase(Gatk4HaplotypeCallerBase, ABC):
+    def tool(self):
+        return "Gatk4HaplotypeCallerGvcf"
+
+    def friendly_name(self):
+        return "GATK4: Haplotype Caller (GVCF)"
+
+    def inputs(self):
+        # the reference confidence mode is fixed
+        inputs = [inp for inp in super().inputs() if inp.id() != "emitRefConfidence"]
+        return [
+            (
+                ToolInput(
+                    "outputFilename",
+                    Filename(prefix=InputSelector("inputRead"), extension=".g.vcf.gz"),
+                    position=8,
+                    prefix="--output",
+                    doc="File to which the GVCF should be written",
+                )
+                if inp.id() == "outputFilename"
+                else inp
+            )
+            for inp in inputs
+        ]
+
+    def arguments(self):
+        return [
+            *super().arguments(),
+            ToolArgument(
+                "GVCF",
+                prefix="--emit-ref-confidence",
+                doc="(-ERC) Mode for emitting reference confidence scores",
+            ),
+        ]
+
+    def outputs(self):
+        return [
+            ToolOutput(
+                "out",
+                GvcfTabix,
+                glob=InputSelector("outputFilename"),
+                doc="Per-sample GVCF (with the REF blocks) for GenomicsDBImport",
+            ),
+            *output_tier_outputs(),
+        ]
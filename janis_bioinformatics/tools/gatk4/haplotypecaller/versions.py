@@ -1,4 +1,5 @@
 from .base import Gatk4HaplotypeCallerBase
+from .base_gvcf import Gatk4HaplotypeCallerGvcfBase
 from ..versions import (
     Gatk_4_0_12,
     Gatk_4_1_2_0,
@@ -40,5 +41,20 @@ class Gatk4HaplotypeCaller_4_1_8(Gatk_4_1_8_1, Gatk4HaplotypeCallerBase):
 
 Gatk4HaplotypeCallerLatest = Gatk4HaplotypeCaller_4_1_8
 
+
+class Gatk4HaplotypeCallerGvcf_4_1_3(Gatk_4_1_3_0, Gatk4HaplotypeCallerGvcfBase):
+    pass
+
+
+class Gatk4HaplotypeCallerGvcf_4_1_4(Gatk_4_1_4_0, Gatk4HaplotypeCallerGvcfBase):
+    pass
+
+
+class Gatk4HaplotypeCallerGvcf_4_1_8(Gatk_4_1_8_1, Gatk4HaplotypeCallerGvcfBase):
+    pass
+
+
+Gatk4HaplotypeCallerGvcfLatest = Gatk4HaplotypeCallerGvcf_4_1_8
+
 if __name__ == "__main__":
     print(Gatk4HaplotypeCaller_4_1_8().help())
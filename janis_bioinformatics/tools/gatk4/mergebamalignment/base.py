@@ -82,7 +82,7 @@ class Gatk4MergeBamAlignmentBase(Gatk4ToolBase, ABC):
             ),
             ToolInput(
                 "bam",
-                Array(Sam()),
+                Array(Bam()),
                 prefix="--ALIGNED_BAM",
                 prefix_applies_to_all_elements=True,
                 doc="SAM or BAM file(s) with alignment data.",
@@ -22,6 +22,11 @@ from janis_core import (
 from janis_unix import TarFileGz, TextFile
 
 from ..gatk4toolbase import Gatk4ToolBase
+from ..outputtier import (
+    output_tier_inputs,
+    output_tier_argument,
+    output_tier_outputs,
+)
 
 CORES_TUPLE = [
     # (CaptureType.key(), {
@@ -94,19 +99,6 @@ class Gatk4Mutect2Base_4_1(Gatk4ToolBase, ABC):
                 prefix="--reference",
                 doc="(-R) Reference sequence file Required.",
             ),
-            ToolInput(
-                tag="outputBamName",
-                # This is not a FileName because otherwise we cant make this optional
-                input_type=String(optional=True),
-                prefix="-bamout",
-                doc="File to which assembled haplotypes should be written",
-            ),
-            ToolInput(
-                tag="activityProfileOut",
-                input_type=String(optional=True),
-                prefix="--activity-profile-out",
-                doc="Default value: null.",
-            ),
             ToolInput(
                 tag="addOutputSamProgramRecord",
                 input_type=Boolean(optional=True),
@@ -155,12 +147,6 @@ class Gatk4Mutect2Base_4_1(Gatk4ToolBase, ABC):
                 prefix="--arguments_file",
                 doc="read one or more arguments files and add them to the command line This argument may be specified 0 or more times. Default value: null. ",
             ),
-            ToolInput(
-                tag="assemblyRegionOut",
-                input_type=String(optional=True),
-                prefix="--assembly-region-out",
-                doc="Output the assembly region to this IGV formatted file Default value: null.",
-            ),
             ToolInput(
                 tag="baseQualityScoreThreshold",
                 input_type=Int(optional=True),
@@ -858,8 +844,12 @@ class Gatk4Mutect2Base_4_1(Gatk4ToolBase, ABC):
                 prefix="-sample",
                 doc="(--sample) The name of the sample(s) to keep, filtering out all others This argument must be specified at least once. Required. ",
             ),
+            *output_tier_inputs(),
         ]
 
+    def arguments(self):
+        return [*super().arguments(), output_tier_argument()]
+
     def outputs(self):
         return [
             ToolOutput(
@@ -880,13 +870,7 @@ class Gatk4Mutect2Base_4_1(Gatk4ToolBase, ABC):
                 glob=InputSelector("f1r2TarGz_outputFilename"),
                 doc="To determine type",
             ),
-            ToolOutput(
-                "bam",
-                BamBai(optional=True),
-                glob=InputSelector("outputBamName"),
-                doc="File to which assembled haplotypes should be written",
-                secondaries_present_as={".bai": "^.bai"},
-            ),
+            *output_tier_outputs(),
         ]
 
     def cpus(self, hints: Dict[str, Any]):
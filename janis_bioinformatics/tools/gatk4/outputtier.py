@@ -0,0 +1,154 @@
+from typing import List
+
+from janis_core import (
+    ToolInput,
+    ToolArgument,
+    ToolOutput,
+    String,
+    File,
+    Filename,
+    InputSelector,
+    StringFormatter,
+)
+from janis_core.operators.logical import If
+
+from janis_bioinformatics.data_types import BamBai
+
+OUTPUT_TIERS = ["minimal", "standard", "debug"]
+
+OUTPUT_TIER_DOC = (
+    "Which outputs the variant callers produce: 'minimal' (VCF and index), 'standard' (also an "
+    "md5 of the VCF, to check it after it's transferred or archived) or 'debug', which also "
+    "writes the bamout, assembly regions and activity profile. The bamout makes the calling "
+    "much slower on dense regions, so only use debug to inspect calls."
+)
+
+
+class OutputTier(String):
+    """
+    A String that must be one of the OUTPUT_TIERS, this is checked when the inputs are
+    validated. The engines only see a String, so output_tier_argument also fails the
+    caller when it's given anything else.
+    """
+
+    @staticmethod
+    def name():
+        return "OutputTier"
+
+    @staticmethod
+    def doc():
+        return "One of: " + ", ".join(OUTPUT_TIERS)
+
+    def validate_value(self, meta, allow_null_if_not_optional: bool):
+        if meta is None:
+            return self.optional or allow_null_if_not_optional
+        return meta in OUTPUT_TIERS
+
+    def invalid_value_hint(self, meta):
+        if meta is None:
+            return super().invalid_value_hint(meta)
+        return f"'{meta}' is not an output tier, expected one of: " + ", ".join(
+            OUTPUT_TIERS
+        )
+
+
+def output_tier_inputs(prefix=None) -> List[ToolInput]:
+    """
+    The tier, and the (unbound) names of the debug artefacts, only passed to the caller
+    (by output_tier_argument) when the tier is 'debug'.
+    """
+
+    def filename(extension):
+        if prefix is None:
+            return Filename(extension=extension)
+        return Filename(prefix=prefix, extension=extension)
+
+    return [
+        ToolInput(
+            "outputTier",
+            OutputTier(optional=True),
+            default="standard",
+            doc=OUTPUT_TIER_DOC,
+        ),
+        ToolInput(
+            "outputBamName",
+            filename(".bam"),
+            doc="(debug tier) File to which assembled haplotypes should be written",
+        ),
+        ToolInput(
+            "assemblyRegionOut",
+            filename(".assembly_regions.igv"),
+            doc="(debug tier) Output the assembly region to this IGV formatted file",
+        ),
+        ToolInput(
+            "activityProfileOut",
+            filename(".activity_profile.igv"),
+            doc="(debug tier) Output the raw activity profile results in IGV format",
+        ),
+    ]
+
+
+def output_tier_argument() -> ToolArgument:
+    """
+    The caller's flags for each tier. Any other tier is passed on as an (unknown) option
+    that names the problem, so GATK fails while it parses its arguments.
+    """
+    tier = InputSelector("outputTier")
+    md5 = "--create-output-variant-md5"
+    return ToolArgument(
+        If(
+            tier.equals("minimal"),
+            "",
+            If(
+                tier.equals("standard"),
+                md5,
+                If(
+                    tier.equals("debug"),
+                    StringFormatter(
+                        md5 + " -bamout '{bam}' --assembly-region-out '{regions}'"
+                        " --activity-profile-out '{profile}'",
+                        bam=InputSelector("outputBamName"),
+                        regions=InputSelector("assemblyRegionOut"),
+                        profile=InputSelector("activityProfileOut"),
+                    ),
+                    StringFormatter(
+                        "--outputTier-must-be-minimal-standard-or-debug '{tier}'",
+                        tier=tier,
+                    ),
+                ),
+            ),
+        ),
+        shell_quote=False,
+        doc="The VCF's md5 (standard and debug tiers), and the bamout, assembly regions "
+        "and activity profile (debug tier only)",
+    )
+
+
+def output_tier_outputs() -> List[ToolOutput]:
+    return [
+        ToolOutput(
+            "md5",
+            File(optional=True),
+            glob=InputSelector("outputFilename") + ".md5",
+            doc="(standard and debug tiers) md5 of the VCF",
+        ),
+        ToolOutput(
+            "bam",
+            BamBai(optional=True),
+            glob=InputSelector("outputBamName"),
+            doc="(debug tier) File to which assembled haplotypes should be written",
+            secondaries_present_as={".bai": "^.bai"},
+        ),
+        ToolOutput(
+            "assemblyRegions",
+            File(optional=True),
+            glob=InputSelector("assemblyRegionOut"),
+            doc="(debug tier) Assembly regions in IGV format",
+        ),
+        ToolOutput(
+            "activityProfile",
+            File(optional=True),
+            glob=InputSelector("activityProfileOut"),
+            doc="(debug tier) Raw activity profile in IGV format",
+        ),
+    ]
@@ -16,7 +16,7 @@ from janis_core import (
     InputDocumentation,
 )
 
-from janis_bioinformatics.data_types import BamBai, Bam, FastaWithIndexes
+from janis_bioinformatics.data_types import BamBai, Bam, FastaWithDict
 from janis_bioinformatics.tools.gatk4.gatk4toolbase import Gatk4ToolBase
 
 
@@ -54,7 +54,7 @@ class Gatk4ReorderSamBase(Gatk4ToolBase, ABC):
             ),
             ToolInput(
                 tag="reference",
-                input_type=FastaWithIndexes(),
+                input_type=FastaWithDict(),
                 prefix="--REFERENCE",
                 separate_value_from_prefix=True,
                 doc=InputDocumentation(
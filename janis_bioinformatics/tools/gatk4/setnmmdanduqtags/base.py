@@ -1,7 +1,7 @@
 from abc import ABC
 from datetime import datetime
 
-from janis_bioinformatics.data_types import Bam, FastaWithIndexes, BamBai
+from janis_bioinformatics.data_types import Bam, FastaWithDict, BamBai
 
 from janis_bioinformatics.tools.gatk4.gatk4toolbase import Gatk4ToolBase
 
@@ -59,7 +59,7 @@ class Gatk4SetNmMdAndUqTagsBase(Gatk4ToolBase, ABC):
             ),
             ToolInput(
                 tag="reference",
-                input_type=FastaWithIndexes(),
+                input_type=FastaWithDict(),
                 prefix="--REFERENCE_SEQUENCE",
                 separate_value_from_prefix=True,
                 doc=InputDocumentation(doc="(-R) Reference sequence file. Required."),
@@ -16,7 +16,7 @@ from janis_core import (
     Array,
 )
 
-from janis_bioinformatics.data_types import Bam, BamBai, FastaWithIndexes
+from janis_bioinformatics.data_types import Bam, BamBai, Bed, FastaWithDict
 from janis_bioinformatics.tools.gatk4.gatk4toolbase import Gatk4ToolBase
 
 
@@ -56,7 +56,7 @@ class Gatk4SplitNCigarReadsBase(Gatk4ToolBase, ABC):
             ),
             ToolInput(
                 tag="reference",
-                input_type=FastaWithIndexes(optional=True),
+                input_type=FastaWithDict(optional=True),
                 prefix="--reference",
                 separate_value_from_prefix=True,
                 doc=InputDocumentation(doc="(-R) Reference sequence file Required."),
@@ -270,6 +270,15 @@ class Gatk4SplitNCigarReadsBase(Gatk4ToolBase, ABC):
                     doc="(-L) One or more genomic intervals over which to operate This argument may be specified 0 or more times. Default value: null. "
                 ),
             ),
+            ToolInput(
+                tag="intervalsBed",
+                input_type=Bed(optional=True),
+                prefix="--intervals",
+                separate_value_from_prefix=True,
+                doc=InputDocumentation(
+                    doc="(-L) A bed of genomic intervals over which to operate, combined with intervals by intervalSetRule"
+                ),
+            ),
             ToolInput(
                 tag="lenient",
                 input_type=Boolean(optional=True),
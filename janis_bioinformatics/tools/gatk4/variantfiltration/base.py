@@ -17,7 +17,7 @@ from janis_core import (
     Array,
 )
 
-from janis_bioinformatics.data_types import FastaWithIndexes, CompressedVcf
+from janis_bioinformatics.data_types import FastaWithDict, CompressedVcf
 from janis_bioinformatics.tools.gatk4.gatk4toolbase import Gatk4ToolBase
 
 
@@ -435,7 +435,7 @@ class Gatk4VariantFiltrationBase(Gatk4ToolBase):
             ),
             ToolInput(
                 tag="reference",
-                input_type=FastaWithIndexes(optional=True),
+                input_type=FastaWithDict(optional=True),
                 prefix="--reference",
                 separate_value_from_prefix=True,
                 doc=InputDocumentation(
@@ -1,8 +1,19 @@
 from .bgzip.bgzip_1_2_1 import BGZip_1_2_1
 from .tabix.tabix_1_2_1 import Tabix_1_2_1
+from .bgziptabix.bgziptabix_1_2_1 import BgzipTabix_1_2_1, BgzipTabixBed_1_2_1
 
 from .bgzip.bgzip_1_9 import BGZip_1_9
-from .tabix.tabix_1_9 import Tabix_1_9
+from .tabix.tabix_1_9 import Tabix_1_9, TabixCsi_1_9
+from .bgziptabix.bgziptabix_1_9 import (
+    BgzipTabix_1_9,
+    BgzipTabixBed_1_9,
+    BgzipTabixBedCsi_1_9,
+)
 
 from .bgzip.latest import BGZipLatest
-from .tabix.latest import TabixLatest
+from .tabix.latest import TabixLatest, TabixCsiLatest
+from .bgziptabix.latest import (
+    BgzipTabixLatest,
+    BgzipTabixBedLatest,
+    BgzipTabixBedCsiLatest,
+)
@@ -12,6 +12,7 @@ from janis_core import (
     InputSelector,
     Filename,
     ToolArgument,
+    CpuSelector,
 )
 
 from janis_bioinformatics.data_types import Vcf, CompressedVcf
@@ -162,6 +163,7 @@ Again after decompression completes the input file will be removed.""".strip(),
         ToolInput(
             "threads",
             Int(optional=True),
+            default=CpuSelector(),
             prefix="--threads",
             doc="@: Number of threads to use [1].",
         ),
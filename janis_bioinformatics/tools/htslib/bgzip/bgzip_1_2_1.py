@@ -3,7 +3,9 @@ from ..htslib_1_2_1 import HTSLib_1_2_1
 
 
 class BGZip_1_2_1(HTSLib_1_2_1, BGZipBase):
-    pass
+    def inputs(self):
+        # --threads was only added to bgzip in htslib 1.4
+        return [inp for inp in super().inputs() if inp.tag != "threads"]
 
 
 if __name__ == "__main__":
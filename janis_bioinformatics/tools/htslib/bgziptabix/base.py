@@ -0,0 +1,89 @@
+from abc import ABC
+from typing import List
+
+from janis_core import (
+    ToolMetadata,
+    ToolOutput,
+    ToolInput,
+    ToolArgument,
+    Int,
+    String,
+    InputSelector,
+    Filename,
+    CpuSelector,
+)
+
+from janis_bioinformatics.data_types import Vcf, VcfTabix
+from ..htslibbase import HtsLibBase
+
+
+class BgzipTabixBase(HtsLibBase, ABC):
+    def tool_provider(self):
+        return "htslib"
+
+    def tool(self):
+        return "bgziptabix"
+
+    def base_command(self):
+        return "bgzip"
+
+    def inputs(self) -> List[ToolInput]:
+        return [
+            ToolInput("file", Vcf(), position=1, doc="File to bgzip compress"),
+            ToolInput(
+                "outputFilename",
+                Filename(extension=".vcf.gz"),
+                position=3,
+                shell_quote=False,
+            ),
+            ToolInput(
+                "preset",
+                String(optional=True),
+                prefix="--preset",
+                position=6,
+                default="vcf",
+                doc="-p: Input format for indexing. Valid values are: gff, bed, sam, vcf.",
+            ),
+            ToolInput(
+                "threads",
+                Int(optional=True),
+                default=CpuSelector(),
+                prefix="--threads",
+                doc="@: Number of threads to use when compressing [1].",
+            ),
+            ToolInput(
+                "compress",
+                Int(optional=True),
+                prefix="--compress",
+                doc="l: Compression level to use when compressing. From 0 to 9, or -1 "
+                "for the default level set by the compression library. [-1]",
+            ),
+        ]
+
+    def arguments(self):
+        return [
+            ToolArgument("--stdout", position=0),
+            ToolArgument(">", position=2, shell_quote=False),
+            ToolArgument("&&", position=4, shell_quote=False),
+            ToolArgument("tabix", position=5, shell_quote=False),
+            ToolArgument(
+                InputSelector("outputFilename"), position=7, shell_quote=False
+            ),
+        ]
+
+    def outputs(self) -> List[ToolOutput]:
+        return [ToolOutput("out", VcfTabix(), glob=InputSelector("outputFilename"))]
+
+    def friendly_name(self):
+        return "BGZip and Tabix"
+
+    def bind_metadata(self):
+        return ToolMetadata(
+            institution="HTSLib",
+            doi=None,
+            keywords=["htslib", "bgzip", "tabix", "compression"],
+            documentationUrl="http://www.htslib.org/doc/tabix.html",
+            documentation="""\
+Compress (bgzip, with --threads) and index (tabix) a file in the one task, rather than a BGZip
+step followed by a Tabix step that relaunches a container and copies the compressed file.""",
+        )
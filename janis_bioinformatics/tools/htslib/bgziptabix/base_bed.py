@@ -0,0 +1,35 @@
+from janis_core import ToolInput, ToolOutput, InputSelector, Filename, String
+
+from janis_bioinformatics.data_types import Bed, BedTabix
+from .base import BgzipTabixBase
+
+
+class BgzipTabixBedBase(BgzipTabixBase):
+    def tool(self):
+        return "bgziptabixbed"
+
+    def friendly_name(self):
+        return "BGZip and Tabix (bed)"
+
+    def inputs(self):
+        replacements = {
+            "file": ToolInput("file", Bed(), position=1, doc="Bed to bgzip compress"),
+            "outputFilename": ToolInput(
+                "outputFilename",
+                Filename(extension=".bed.gz"),
+                position=3,
+                shell_quote=False,
+            ),
+            "preset": ToolInput(
+                "preset",
+                String(optional=True),
+                prefix="--preset",
+                position=6,
+                default="bed",
+                doc="-p: Input format for indexing. Valid values are: gff, bed, sam, vcf.",
+            ),
+        }
+        return [replacements.get(inp.id(), inp) for inp in super().inputs()]
+
+    def outputs(self):
+        return [ToolOutput("out", BedTabix(), glob=InputSelector("outputFilename"))]
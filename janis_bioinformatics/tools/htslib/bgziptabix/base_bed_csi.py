@@ -0,0 +1,26 @@
+from janis_core import ToolArgument, ToolOutput, InputSelector
+
+from janis_bioinformatics.data_types import BedCsi
+from .base_bed import BgzipTabixBedBase
+
+
+class BgzipTabixBedCsiBase(BgzipTabixBedBase):
+    def tool(self):
+        return "bgziptabixbedcsi"
+
+    def friendly_name(self):
+        return "BGZip and Tabix (bed, CSI)"
+
+    def arguments(self):
+        return [
+            *super().arguments(),
+            ToolArgument(
+                "--csi",
+                position=6,
+                doc="-C: Produce a CSI index, which (unlike the tbi) supports contigs "
+                "longer than 512 Mbp (2^29)",
+            ),
+        ]
+
+    def outputs(self):
+        return [ToolOutput("out", BedCsi(), glob=InputSelector("outputFilename"))]
@@ -0,0 +1,18 @@
+from .base import BgzipTabixBase
+from .base_bed import BgzipTabixBedBase
+from ..htslib_1_2_1 import HTSLib_1_2_1
+
+
+class BgzipTabix_1_2_1(HTSLib_1_2_1, BgzipTabixBase):
+    def inputs(self):
+        # --threads was only added to bgzip in htslib 1.4
+        return [inp for inp in super().inputs() if inp.tag != "threads"]
+
+
+class BgzipTabixBed_1_2_1(HTSLib_1_2_1, BgzipTabixBedBase):
+    def inputs(self):
+        return [inp for inp in super().inputs() if inp.tag != "threads"]
+
+
+if __name__ == "__main__":
+    print(BgzipTabix_1_2_1().help())
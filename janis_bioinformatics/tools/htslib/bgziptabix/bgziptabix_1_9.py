@@ -0,0 +1,20 @@
+from .base import BgzipTabixBase
+from .base_bed import BgzipTabixBedBase
+from .base_bed_csi import BgzipTabixBedCsiBase
+from ..htslib_1_9 import HTSLib_1_9
+
+
+class BgzipTabix_1_9(HTSLib_1_9, BgzipTabixBase):
+    pass
+
+
+class BgzipTabixBed_1_9(HTSLib_1_9, BgzipTabixBedBase):
+    pass
+
+
+class BgzipTabixBedCsi_1_9(HTSLib_1_9, BgzipTabixBedCsiBase):
+    pass
+
+
+if __name__ == "__main__":
+    print(BgzipTabix_1_9().help())
@@ -0,0 +1,6 @@
+from .bgziptabix_1_9 import BgzipTabix_1_9, BgzipTabixBed_1_9, BgzipTabixBedCsi_1_9
+
+# 1.9 rather than HTSLibLatest, as the bgzip in 1.2.1 can't use threads
+BgzipTabixLatest = BgzipTabix_1_9
+BgzipTabixBedLatest = BgzipTabixBed_1_9
+BgzipTabixBedCsiLatest = BgzipTabixBedCsi_1_9
@@ -0,0 +1,31 @@
+from abc import ABC
+
+from janis_core import ToolArgument, ToolOutput, InputSelector
+
+from janis_bioinformatics.data_types import VcfCsi
+from .base import TabixBase
+
+
+class TabixCsiBase(TabixBase, ABC):
+    def tool(self):
+        return "tabixCsi"
+
+    def friendly_name(self):
+        return "Tabix (CSI)"
+
+    def inputs(self):
+        # the index type is fixed by the arguments
+        return [inp for inp in super().inputs() if inp.id() != "csi"]
+
+    def arguments(self):
+        return [
+            ToolArgument(
+                "--csi",
+                position=1,
+                doc="-C: Produce a CSI index, which (unlike the tbi) supports contigs "
+                "longer than 512 Mbp (2^29)",
+            )
+        ]
+
+    def outputs(self):
+        return [ToolOutput("out", VcfCsi(), glob=InputSelector("inp"))]
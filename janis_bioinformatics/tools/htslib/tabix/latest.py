@@ -1,10 +1,15 @@
 from .base import TabixBase
 from ..latest import HTSLibLatest
+from .tabix_1_9 import TabixCsi_1_9
 
 
 class TabixLatest(HTSLibLatest, TabixBase):
     pass
 
 
+# 1.9 rather than HTSLibLatest, as the CSI index is written by the 1.9 tabix
+TabixCsiLatest = TabixCsi_1_9
+
+
 if __name__ == "__main__":
     print(TabixLatest().help())
@@ -1,6 +1,11 @@
 from .base import TabixBase
+from .base_csi import TabixCsiBase
 from ..htslib_1_9 import HTSLib_1_9
 
 
 class Tabix_1_9(HTSLib_1_9, TabixBase):
     pass
+
+
+class TabixCsi_1_9(HTSLib_1_9, TabixCsiBase):
+    pass
@@ -97,8 +97,8 @@ class Bcl2FastqBase(IlluminaToolBase, ABC):
                 "processingThreads",
                 input_type=Int(),
                 prefix="-p",
-                default=4,
-                doc="number of threads used for processing demultiplexed data",
+                default=CpuSelector(),
+                doc="(default: cores allocated) number of threads used for processing demultiplexed data",
             ),
             ToolInput(
                 "writingThreads",
@@ -6,7 +6,7 @@ import janis_core as j
 from janis_unix.data_types.csv import Csv
 from janis_unix.data_types.json import JsonFile
 from janis_unix.data_types.tsv import Tsv
-from janis_bioinformatics.data_types import FastaWithDict, Vcf, Bed, VcfTabix
+from janis_bioinformatics.data_types import FastaFai, Vcf, Bed, VcfTabix
 from janis_bioinformatics.tools.illumina.illuminabase import IlluminaToolBase
 
 CORES_TUPLE = [
@@ -70,7 +70,7 @@ class HapPyValidatorBase(IlluminaToolBase, ABC):
             ),
             j.ToolInput(
                 "reference",
-                FastaWithDict(),
+                FastaFai(),
                 prefix="--reference",
                 doc="(-r)  Specify a reference file.",
             ),
@@ -17,7 +17,7 @@ from janis_core import (
 from janis_core import get_value_for_hints_and_ordered_resource_tuple
 from janis_unix import Tsv
 
-from janis_bioinformatics.data_types import FastaWithDict, VcfTabix, BamBai, BedTabix
+from janis_bioinformatics.data_types import FastaFai, VcfTabix, BamBai, BedTabix
 from janis_bioinformatics.tools.illumina.illuminabase import IlluminaToolBase
 
 CORES_TUPLE = [
@@ -84,7 +84,7 @@ class StrelkaGermlineBase(IlluminaToolBase, ABC):
             ),
             ToolInput(
                 "reference",
-                FastaWithDict(),
+                FastaFai(),
                 prefix="--referenceFasta",
                 position=1,
                 shell_quote=False,
@@ -1 +1,2 @@
 from .scramble.versions import *
+from .cramindex.versions import *
@@ -0,0 +1,37 @@
+from abc import ABC
+
+from janis_bioinformatics.data_types import Cram, CramCrai
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsTool
+from janis_core import (
+    InputSelector,
+    ToolInput,
+    ToolMetadata,
+    ToolOutput,
+)
+
+
+class CramIndexBase(BioinformaticsTool, ABC):
+    def tool(self):
+        return "cram_index"
+
+    def friendly_name(self):
+        return "cram_index"
+
+    def tool_provider(self):
+        return "io_lib"
+
+    def base_command(self):
+        return ["cram_index"]
+
+    def inputs(self):
+        return [ToolInput("cram", Cram(), position=1, localise_file=True)]
+
+    def outputs(self):
+        return [ToolOutput("out", CramCrai(), glob=InputSelector("cram"))]
+
+    def bind_metadata(self):
+        return ToolMetadata(
+            keywords=["cram", "index"],
+            documentationUrl="https://github.com/jkbonfield/io_lib/",
+            documentation="cram_index: writes the .crai index next to the cram",
+        )
@@ -0,0 +1,13 @@
+from ..versions import ioLib_1_14_1_2
+from .base import CramIndexBase
+
+
+class CramIndex_1_14_1_2(ioLib_1_14_1_2, CramIndexBase):
+    pass
+
+
+CramIndexLatest = CramIndex_1_14_1_2
+
+
+if __name__ == "__main__":
+    print(CramIndexLatest().help())
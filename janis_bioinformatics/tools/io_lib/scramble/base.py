@@ -68,7 +68,7 @@ class ScrambleBase(BioinformaticsTool, ABC):
             ToolInput(
                 "reference", FastaFai(), prefix="-r", doc="Reference sequence file."
             ),
-            ToolInput("outputFilename", Filename(extension=".bam")),
+            ToolInput("outputFilename", Filename(extension=".cram"), position=201),
             *ScrambleBase.additional_inputs,
         ]
 
@@ -83,7 +83,7 @@ class ScrambleBase(BioinformaticsTool, ABC):
         ]
 
     def outputs(self):
-        return [ToolOutput("out", Stdout(Cram()))]
+        return [ToolOutput("out", Cram(), glob=InputSelector("outputFilename"))]
 
     def memory(self, hints: Dict[str, Any]):
         val = get_value_for_hints_and_ordered_resource_tuple(hints, SCRAMBLE_MEM_TUPLE)
@@ -1,2 +1,3 @@
 from .index.versions import *
 from .quant.versions import *
+from .workflows.kallistobatchquant import KallistoBatchQuant
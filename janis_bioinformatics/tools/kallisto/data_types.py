@@ -10,4 +10,5 @@ class KallistoIdx(File):
         return "KallistoIdx"
 
     def can_receive_from(self, other, source_has_default=False):
-        return False
+        # only a kallisto index (not any File) can be used as a kallisto index
+        return isinstance(other, KallistoIdx)
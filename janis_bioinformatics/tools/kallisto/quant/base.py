@@ -13,9 +13,10 @@ from janis_core import (
     Filename,
     File,
     InputSelector,
+    CpuSelector,
 )
 
-from janis_bioinformatics.data_types import Fasta, Fastq
+from janis_bioinformatics.data_types import FastqOrFastqGz
 from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsTool
 
 from ..data_types import KallistoIdx
@@ -50,7 +51,31 @@ class KallistoQuantBase(BioinformaticsTool, ABC):
                 position=3,
                 doc="directory to put outputs in",
             ),
-            ToolInput("fastq", Array(Fastq), position=4, doc="FASTQ files to process"),
+            ToolInput(
+                "fastq",
+                Array(FastqOrFastqGz),
+                position=4,
+                doc="FASTQ files to process (eg: a FastqPair or FastqGzPair), kallisto reads gzipped files directly",
+            ),
+            ToolInput(
+                "threads",
+                Int(optional=True),
+                default=CpuSelector(),
+                prefix="-t",
+                doc="Number of threads to use (default: 1), only the bootstraps are threaded",
+            ),
+            ToolInput(
+                "bootstrap_samples",
+                Int(optional=True),
+                prefix="-b",
+                doc="Number of bootstrap samples (default: 0)",
+            ),
+            ToolInput(
+                "seed",
+                Int(optional=True),
+                prefix="--seed",
+                doc="Seed for the bootstrap sampling (default: 42)",
+            ),
             ToolInput(
                 "bias",
                 Boolean(optional=True),
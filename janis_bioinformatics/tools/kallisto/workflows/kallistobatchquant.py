@@ -0,0 +1,75 @@
+from janis_core import Array, Boolean, File, Int, String
+
+from janis_bioinformatics.data_types import FastqGzPair
+from janis_bioinformatics.tools import BioinformaticsWorkflow
+from janis_bioinformatics.tools.common import AggregateKallistoAbundance
+from janis_bioinformatics.tools.kallisto.data_types import KallistoIdx
+from janis_bioinformatics.tools.kallisto.quant.versions import KallistoQuant_0_46_2
+
+
+class KallistoBatchQuant(BioinformaticsWorkflow):
+    def id(self):
+        return "KallistoBatchQuant"
+
+    def friendly_name(self):
+        return "Kallisto: batch quantification"
+
+    def tool_provider(self):
+        return "Kallisto"
+
+    def version(self):
+        return "v0.46.2"
+
+    def bind_metadata(self):
+        self.metadata.contributors = ["Thomas Conway"]
+        self.metadata.keywords = ["kallisto", "quant", "batch"]
+        self.metadata.documentation = """
+        Quantify many samples (gzipped paired reads) in parallel against one kallisto index, and
+        aggregate their abundance.tsv into one transcript matrix (and a gene matrix when a
+        transcript to gene mapping is given).
+        """.strip()
+
+    def constructor(self):
+
+        self.input("sample_names", Array(String))
+        self.input("reads", Array(FastqGzPair))
+        self.input("index", KallistoIdx)
+        self.input("bootstrap_samples", Int(optional=True))
+        self.input("bias", Boolean(optional=True))
+        self.input(
+            "transcript_to_gene",
+            File(optional=True),
+            doc="Tab separated <transcript> <gene>, to also output a gene matrix",
+        )
+        self.input(
+            "column",
+            String,
+            default="est_counts",
+            doc="abundance.tsv column to aggregate (est_counts or tpm)",
+        )
+
+        self.step(
+            "quant",
+            KallistoQuant_0_46_2(
+                index=self.index,
+                outdir=self.sample_names,
+                fastq=self.reads,
+                bootstrap_samples=self.bootstrap_samples,
+                bias=self.bias,
+            ),
+            scatter=["outdir", "fastq"],
+        )
+
+        self.step(
+            "aggregate",
+            AggregateKallistoAbundance(
+                abundances=self.quant.out,
+                samples=self.sample_names,
+                column=self.column,
+                transcriptToGene=self.transcript_to_gene,
+            ),
+        )
+
+        self.output("abundances", source=self.quant.out)
+        self.output("transcripts", source=self.aggregate.transcripts)
+        self.output("genes", source=self.aggregate.genes)
@@ -0,0 +1,111 @@
+from copy import deepcopy
+
+from janis_core import (
+    ToolInput,
+    ToolArgument,
+    ToolOutput,
+    Array,
+    File,
+    String,
+    Filename,
+    InputSelector,
+    WildcardSelector,
+)
+
+from janis_bioinformatics.tools.multiqc.base import MultiqcBase
+
+
+class MultiqcBatchBase(MultiqcBase):
+    """
+    One MultiQC report over a batch of samples, from the fastqc zips and the (per sample)
+    samtools flagstat and Picard / GATK insert size metrics.
+    """
+
+    def tool(self) -> str:
+        return "MultiQCBatch"
+
+    def friendly_name(self) -> str:
+        return "Multiqc (batch)"
+
+    def base_command(self):
+        return None
+
+    def inputs(self):
+        # the options go between the staging and the directory / files to scan
+        options = []
+        for inp in deepcopy(super().inputs()):
+            if inp.id() in ("directory", "filename", "outdir", "sampleNames"):
+                continue
+            inp.position = 20
+            options.append(inp)
+
+        return [
+            ToolInput(
+                "sampleNames",
+                Array(String),
+                position=2,
+                doc="The samples, in the order of flagstats and insertSizeMetrics",
+            ),
+            ToolInput(
+                "flagstats",
+                Array(File),
+                position=4,
+                doc="samtools flagstat of each sample",
+            ),
+            ToolInput(
+                "insertSizeMetrics",
+                Array(File),
+                position=6,
+                doc="CollectInsertSizeMetrics of each sample",
+            ),
+            ToolInput(
+                "fastqc",
+                Array(File),
+                position=31,
+                doc="fastqc zips of every fastq (the sample name is taken from the fastq)",
+            ),
+            ToolInput(
+                "filename",
+                Filename(extension=".html"),
+                prefix="--filename",
+                position=20,
+                doc="(-n) Report filename, the parsed data is written to '<filename>_data'",
+            ),
+            *options,
+        ]
+
+    def arguments(self):
+        # flagstat is captured from stdout, so every sample's file has the same name, they're
+        # copied into 'qc/<sample>/<sample>.flagstat' so MultiQC tells the samples apart
+        return [
+            ToolArgument("printf '%s\\n'", position=1, shell_quote=False),
+            ToolArgument(
+                "> samples.txt && printf '%s\\n'", position=3, shell_quote=False
+            ),
+            ToolArgument(
+                "> flagstats.txt && printf '%s\\n'", position=5, shell_quote=False
+            ),
+            ToolArgument(
+                "> insertsizes.txt"
+                " && paste samples.txt flagstats.txt insertsizes.txt"
+                " | while read sample flagstat insertsize; do"
+                ' mkdir -p "qc/$sample"'
+                ' && cp "$flagstat" "qc/$sample/$sample.flagstat"'
+                ' && cp "$insertsize" "qc/$sample/$sample.insert_size_metrics.txt";'
+                " done && multiqc",
+                position=7,
+                shell_quote=False,
+            ),
+            ToolArgument("qc", position=30),
+        ]
+
+    def outputs(self):
+        return [
+            ToolOutput("out", File, glob=InputSelector("filename")),
+            ToolOutput(
+                "data",
+                File,
+                glob=WildcardSelector("*_data/multiqc_data.json"),
+                doc="Machine readable (JSON) data of every module in the report",
+            ),
+        ]
@@ -1,4 +1,5 @@
 from janis_bioinformatics.tools.multiqc.base import MultiqcBase
+from janis_bioinformatics.tools.multiqc.base_batch import MultiqcBatchBase
 
 
 class Multiqc_v1_7(MultiqcBase):
@@ -7,3 +8,7 @@ class Multiqc_v1_7(MultiqcBase):
 
     def container(self):
         return "ewels/multiqc:v1.7"
+
+
+class MultiqcBatch_v1_7(Multiqc_v1_7, MultiqcBatchBase):
+    pass
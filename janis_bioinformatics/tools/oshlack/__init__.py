@@ -1,3 +1,6 @@
 from .allsorts.versions import *
-from .oncopipe.star import OncopipeStarAligner
-from .oncopipe.variants import OncopipeVariantCaller
+from .oncopipe.star import OncopipeStarAligner, OncopipeStarCohortAligner
+from .oncopipe.variants import (
+    OncopipeVariantCaller,
+    OncopipeVariantCallerSetReadGroup,
+)
@@ -2,7 +2,7 @@ from datetime import datetime
 
 from janis_unix import Echo
 
-from janis_bioinformatics.data_types import FastqGzPairedEnd, FastaWithIndexes
+from janis_bioinformatics.data_types import FastqGzPairedEnd, FastaWithDict
 from janis_core import WorkflowMetadata, String, Array, WorkflowBuilder
 
 from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsWorkflow
@@ -61,7 +61,7 @@ Original code example:
         self.input("name", String, doc="Sample ID")
         self.input("fastqs", Array(FastqGzPairedEnd), doc="Reads")
 
-        self.input("reference", FastaWithIndexes, doc="Fasta reference")
+        self.input("reference", FastaWithDict, doc="Fasta reference")
 
         self.step(
             "process",
@@ -87,7 +87,7 @@ Original code example:
 
         wf.input("name", String, doc="Sample ID")
         wf.input("fastq", FastqGzPairedEnd)
-        wf.input("reference", FastaWithIndexes, doc="Fasta reference")
+        wf.input("reference", FastaWithDict, doc="Fasta reference")
 
         wf.step(
             "get_sample_info",
@@ -118,7 +118,6 @@ Original code example:
                 bam=wf.run_start.out_bam,
                 reference=wf.reference,
                 sample_name=wf.sample_name,
-                platform="",
             ),
         )
 
@@ -1,7 +1,16 @@
-from janis_core import StringFormatter, Directory, File, WorkflowMetadata
+from janis_core import (
+    StringFormatter,
+    Directory,
+    File,
+    WorkflowMetadata,
+    Array,
+    Int,
+    String,
+)
 
 from janis_bioinformatics.data_types import FastqGzPair, Fasta
 from janis_bioinformatics.tools import BioinformaticsWorkflow
+from janis_bioinformatics.tools.common import CollapseStarSpliceJunctions
 from janis_bioinformatics.tools.star.versions import (
     StarAlignReads_2_7_1,
     StarGenerateIndexes_2_7_1,
@@ -83,7 +92,102 @@ class OncopipeStarAligner(BioinformaticsWorkflow):
                 readFilesCommand="zcat",
                 genomeDir=self.star_gen2pass.out,
                 outSAMattrRGline=StringFormatter(
-                    "ID:{sample} SM:{lane} LB:{library} PL:{platform} PU:1",
+                    "ID:{sample} SM:{sample} LB:{library} PL:{platform} PU:{lane}",
+                    sample=self.sampleName,
+                    lane=self.lane,
+                    library=self.library,
+                    platform=self.platform,
+                ),
+                outSAMtype=["BAM", "SortedByCoordinate"],
+            ),
+        )
+
+        self.output(
+            "out_bam", source=self.star_map_2pass_PE.out_sorted_bam.assert_not_null()
+        )
+
+
+class OncopipeStarFirstPass(BioinformaticsWorkflow):
+    def id(self) -> str:
+        return "oncopipe_STAR_1pass"
+
+    def friendly_name(self):
+        return "Oncopipe: StarAligner (trim + 1st pass)"
+
+    def bind_metadata(self):
+        return WorkflowMetadata(
+            version="v0.1.0", contributors=["Michael Franklin", "Jiaan Yu"]
+        )
+
+    def constructor(self):
+
+        self.input("sampleName", str)
+        self.input("reads", FastqGzPair)
+        self.input("genomeDir", Directory)
+
+        self.step(
+            "trim",
+            TrimmomaticPairedEnd_0_35(
+                sampleName=self.sampleName,
+                inp=self.reads,
+                phred33=True,
+                steps=[
+                    "ILLUMINACLIP:/usr/local/share/trimmomatic-0.35-6/adapters/TruSeq2-PE.fa:2:30:10",
+                    "LEADING:15",
+                    "TRAILING:15",
+                    "SLIDINGWINDOW:4:15",
+                    "MINLEN:35",
+                ],
+            ),
+            doc="Trim reads using Trimmomatic",
+        )
+
+        self.step(
+            "star_map_1pass_PE",
+            StarAlignReads_2_7_1(
+                readFilesIn=self.trim.pairedOut,
+                genomeDir=self.genomeDir,
+                limitOutSJcollapsed=3000000,  # lots of splice junctions may need more than default 1M buffer
+                readFilesCommand="zcat",
+                outSAMtype=["None"],
+            ),
+            doc="Map reads using the STAR aligner: 1st pass",
+        )
+
+        self.output("trimmed_reads", source=self.trim.pairedOut)
+        self.output("splice_junctions", source=self.star_map_1pass_PE.SJ_out_tab)
+
+
+class OncopipeStarSecondPass(BioinformaticsWorkflow):
+    def id(self) -> str:
+        return "oncopipe_STAR_2pass"
+
+    def friendly_name(self):
+        return "Oncopipe: StarAligner (2nd pass)"
+
+    def bind_metadata(self):
+        return WorkflowMetadata(
+            version="v0.1.0", contributors=["Michael Franklin", "Jiaan Yu"]
+        )
+
+    def constructor(self):
+
+        self.input("sampleName", str)
+        self.input("reads", FastqGzPair)
+        self.input("genomeDir", Directory)
+
+        self.input("lane", str)
+        self.input("library", str)
+        self.input("platform", str)
+
+        self.step(
+            "star_map_2pass_PE",
+            StarAlignReads_2_7_1(
+                readFilesIn=self.reads,
+                readFilesCommand="zcat",
+                genomeDir=self.genomeDir,
+                outSAMattrRGline=StringFormatter(
+                    "ID:{sample} SM:{sample} LB:{library} PL:{platform} PU:{lane}",
                     sample=self.sampleName,
                     lane=self.lane,
                     library=self.library,
@@ -98,5 +202,98 @@ class OncopipeStarAligner(BioinformaticsWorkflow):
         )
 
 
+class OncopipeStarCohortAligner(BioinformaticsWorkflow):
+    def id(self) -> str:
+        return "oncopipe_STAR_cohort"
+
+    def friendly_name(self):
+        return "Oncopipe: StarAligner (cohort two-pass)"
+
+    def bind_metadata(self):
+        return WorkflowMetadata(
+            version="v0.1.0",
+            contributors=["Michael Franklin", "Jiaan Yu"],
+            documentation="""\
+Cohort equivalent of OncopipeStarAligner: the 1st passes of all samples run in parallel, the novel
+splice junctions are collapsed and filtered across the cohort, and a single 2-pass genome is
+generated and shared by the 2nd pass of every sample (instead of a genome per sample).
+
+For a single sample, STAR's in-process --twopassMode Basic (StarAlignReads twopassMode="Basic")
+gives the per-sample behaviour without writing the intermediate genome.""",
+        )
+
+    def constructor(self):
+
+        self.input("sampleNames", Array(String))
+        self.input("reads", Array(FastqGzPair))
+        self.input("lanes", Array(String))
+        self.input("genomeDir", Directory)
+
+        self.input("reference", Fasta)
+        self.input("gtf", File)
+
+        self.input("library", str)
+        self.input("platform", str)
+
+        self.input(
+            "sj_min_unique_reads",
+            Int,
+            default=3,
+            doc="Uniquely mapping reads needed for a novel junction to pass in a sample",
+        )
+        self.input(
+            "sj_min_samples",
+            Int,
+            default=1,
+            doc="Samples a novel junction must pass in to be added to the 2-pass genome",
+        )
+
+        self.step(
+            "first_pass",
+            OncopipeStarFirstPass(
+                sampleName=self.sampleNames, reads=self.reads, genomeDir=self.genomeDir
+            ),
+            scatter=["sampleName", "reads"],
+        )
+
+        self.step(
+            "collapse_splice_junctions",
+            CollapseStarSpliceJunctions(
+                sjFiles=self.first_pass.splice_junctions,
+                minUniqueReads=self.sj_min_unique_reads,
+                minSamples=self.sj_min_samples,
+            ),
+        )
+
+        self.step(
+            "star_gen2pass",
+            StarGenerateIndexes_2_7_1(
+                genomeFastaFiles=self.reference,
+                sjdbFileChrStartEnd=self.collapse_splice_junctions.out,
+                sjdbOverhang=99,
+                sjdbGTFfile=self.gtf,
+                limitOutSJcollapsed=3000000,  # lots of splice junctions may need more than default 1M buffer
+                outputGenomeDir=".",
+            ),
+            doc="Generate the 2-pass genome once for the cohort",
+        )
+
+        self.step(
+            "second_pass",
+            OncopipeStarSecondPass(
+                sampleName=self.sampleNames,
+                reads=self.first_pass.trimmed_reads,
+                lane=self.lanes,
+                genomeDir=self.star_gen2pass.out,
+                library=self.library,
+                platform=self.platform,
+            ),
+            scatter=["sampleName", "reads", "lane"],
+        )
+
+        self.output("out_bams", source=self.second_pass.out_bam)
+        self.output("splice_junctions", source=self.collapse_splice_junctions.out)
+
+
 if __name__ == "__main__":
     OncopipeStarAligner().translate("cwl")
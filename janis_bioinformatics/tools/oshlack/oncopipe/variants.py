@@ -1,7 +1,9 @@
-from janis_core import Double, WorkflowMetadata, StringFormatter
+from janis_core import Double, File, Int, String, WorkflowMetadata, StringFormatter
 
-from janis_bioinformatics.data_types import Bam, FastaWithIndexes
+from janis_bioinformatics.data_types import Bam, FastaWithDict
 from janis_bioinformatics.tools import BioinformaticsWorkflow
+from janis_bioinformatics.tools.bcftools import BcfToolsConcatLatest
+from janis_bioinformatics.tools.common import GenerateExonIntervalShards
 from janis_bioinformatics.tools.gatk4 import (
     Gatk4AddOrReplaceReadGroups_4_1_4,
     Gatk4MarkDuplicates_4_1_4,
@@ -26,6 +28,14 @@ class OncopipeVariantCaller(BioinformaticsWorkflow):
             version="v0.1.0", contributors=["Michael Franklin", "Jiaan Yu"]
         )
 
+    def set_read_group(self) -> bool:
+        """
+        STAR already sets the read group (outSAMattrRGline) in the Oncopipe aligners, so the
+        bam is only rewritten with AddOrReplaceReadGroups when this is overridden (see
+        OncopipeVariantCallerSetReadGroup), eg: for bams from another aligner.
+        """
+        return False
+
     def constructor(self):
         # variant_pipeline = segment {
         #     add_rg +
@@ -37,31 +47,40 @@ class OncopipeVariantCaller(BioinformaticsWorkflow):
         # }
 
         self.input("bam", Bam)
-        self.input("reference", FastaWithIndexes)
+        self.input("reference", FastaWithDict)
+        self.input("gtf", File, doc="Annotation the exon interval shards are made from")
         self.input("sample_name", str)
-        self.input("platform", str)
-        self.input("call_conf", Double, default=20.0)
-
-        self.step(
-            "add_rg",
-            Gatk4AddOrReplaceReadGroups_4_1_4(
-                inp=self.bam,
-                sort_order="coordinate",
-                rgid=self.sample_name,
-                rglb="lib1",
-                rgpl=self.platform,
-                rgpu="1",
-                rgsm=self.sample_name,
-                validation_stringency="LENIENT",
-                create_index=True,
-            ),
-            doc="Add read group",
+        self.input(
+            "platform",
+            String(optional=not self.set_read_group()),
+            doc="Platform (PL) of the read group, only used when it's set by this workflow",
         )
+        self.input("call_conf", Double, default=20.0)
+        self.input("shards", Int, default=20)
+
+        bam = self.bam
+        if self.set_read_group():
+            self.step(
+                "add_rg",
+                Gatk4AddOrReplaceReadGroups_4_1_4(
+                    inp=self.bam,
+                    sort_order="coordinate",
+                    rgid=self.sample_name,
+                    rglb="lib1",
+                    rgpl=self.platform,
+                    rgpu="1",
+                    rgsm=self.sample_name,
+                    validation_stringency="LENIENT",
+                    create_index=True,
+                ),
+                doc="Add read group",
+            )
+            bam = self.add_rg.out
 
         self.step(
             "mark_duplicates",
             Gatk4MarkDuplicates_4_1_4(
-                bam=[self.add_rg.out], validationStringency="SILENT", createIndex=True
+                bam=[bam], validationStringency="SILENT", createIndex=True
             ),
             doc="Mark duplicates and create index",
         )
@@ -75,6 +94,14 @@ class OncopipeVariantCaller(BioinformaticsWorkflow):
         #     ),
         # )
 
+        self.step(
+            "generate_shards",
+            GenerateExonIntervalShards(
+                gtf=self.gtf, reference=self.reference, shards=self.shards
+            ),
+            doc="Exon intervals (in reference order) split into shards of similar size",
+        )
+
         # https://github.com/bcbio/bcbio-nextgen/issues/2163
         # missing params from migration:
         #   -rf ReassignOneMappingQuality -> readFilter
@@ -88,26 +115,38 @@ class OncopipeVariantCaller(BioinformaticsWorkflow):
             Gatk4SplitNCigarReads_4_1_4(
                 inp=[self.mark_duplicates.out],
                 reference=self.reference,
+                intervalsBed=self.generate_shards.out,
                 # readFilter="ReassignOneMappingQuality",
             ),
+            scatter="intervalsBed",
             doc="split'n'trim and reassign mapping qualities",
         )
 
+        # each shard is called over its own intervals, so a read that spans two shards can't
+        # produce the same call twice
         self.step(
             "rnaseq_call_variants",
             Gatk4HaplotypeCaller_4_1_4(
                 inputRead=self.splitncigar.out,
                 reference=self.reference,
+                intervals=self.generate_shards.out,
                 dontUseSoftClippedBases=True,
                 standardMinConfidenceThresholdForCalling=self.call_conf,
             ),
+            scatter=["inputRead", "intervals"],
+        )
+
+        self.step(
+            "gather_variants",
+            BcfToolsConcatLatest(vcf=self.rnaseq_call_variants.out),
+            doc="The shards are in reference order, so they're concatenated in order",
         )
 
         self.step(
             "filter_variants",
             Gatk4VariantFiltration_4_1_4(
                 reference=self.reference,
-                variant=self.rnaseq_call_variants.out,
+                variant=self.gather_variants.out,
                 clusterWindowSize=35,
                 clusterSize=3,
                 filterName=["FS", "QD"],
@@ -117,7 +156,7 @@ class OncopipeVariantCaller(BioinformaticsWorkflow):
 
         self.output(
             "out_HAP_vcf",
-            source=self.rnaseq_call_variants.out,
+            source=self.gather_variants.out,
             output_name=StringFormatter(
                 "{sample_name}_HAP", sample_name=self.sample_name
             ),
@@ -131,5 +170,16 @@ class OncopipeVariantCaller(BioinformaticsWorkflow):
         )
 
 
+class OncopipeVariantCallerSetReadGroup(OncopipeVariantCaller):
+    def id(self) -> str:
+        return "oncopipe_variantcaller_setreadgroup"
+
+    def friendly_name(self):
+        return "Oncopipe: VariantCaller (set read group)"
+
+    def set_read_group(self):
+        return True
+
+
 if __name__ == "__main__":
     OncopipeVariantCaller().translate("wdl")
@@ -14,9 +14,10 @@ from janis_core import (
     InputSelector,
     CaptureType,
     get_value_for_hints_and_ordered_resource_tuple,
+    CpuSelector,
 )
 
-from janis_bioinformatics.data_types import Bam, BamBai, FastaWithDict, Bed, Vcf
+from janis_bioinformatics.data_types import Bam, BamBai, FastaWithIndexes, Bed, Vcf
 from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsTool
 
 
@@ -89,7 +90,7 @@ class GridssBase_2_2(BioinformaticsTool):
             ),
             ToolInput(
                 "reference",
-                FastaWithDict(),
+                FastaWithIndexes(),
                 prefix="REFERENCE_SEQUENCE=",
                 separate_value_from_prefix=False,
             ),
@@ -166,7 +167,8 @@ class GridssBase_2_2(BioinformaticsTool):
                 Int(optional=True),
                 prefix="WORKER_THREADS=",
                 separate_value_from_prefix=False,
-                doc="(THREADS=Integer  Number of worker threads to spawn. Defaults to number of cores available. "
+                default=CpuSelector(),
+                doc="(default: cores allocated) (THREADS=Integer  Number of worker threads to spawn. Defaults to number of cores available. "
                 "Note that I/O threads are not included in this worker thread count so CPU usage can be "
                 "higher than the number of worker thread. Default value: 6. "
                 "This option can be set to 'null' to clear the default value.",
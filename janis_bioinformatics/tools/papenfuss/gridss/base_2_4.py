@@ -17,7 +17,7 @@ from janis_core import (
     get_value_for_hints_and_ordered_resource_tuple,
 )
 
-from janis_bioinformatics.data_types import Bam, BamBai, FastaWithDict, Bed, Vcf
+from janis_bioinformatics.data_types import Bam, BamBai, FastaWithIndexes, Bed, Vcf
 from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsTool
 
 
@@ -67,7 +67,9 @@ class GridssBase_2_4(BioinformaticsTool):
     def inputs(self):
         return [
             ToolInput("bams", Array(BamBai()), position=10),
-            ToolInput("reference", FastaWithDict(), position=1, prefix="--reference"),
+            ToolInput(
+                "reference", FastaWithIndexes(), position=1, prefix="--reference"
+            ),
             ToolInput(
                 "outputFilename",
                 Filename(suffix=".svs", extension=".vcf"),
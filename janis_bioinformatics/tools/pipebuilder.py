@@ -0,0 +1,320 @@
+from typing import List, Optional, Dict, Any
+
+from janis_core import (
+    CommandTool,
+    ToolInput,
+    ToolArgument,
+    ToolOutput,
+    InputSelector,
+    StringFormatter,
+    Filename,
+    CpuSelector,
+    MemorySelector,
+)
+from janis_core.operators.logical import IsDefined
+from janis_core.operators.operator import Operator
+from janis_core.operators.selectors import DiskSelector, TimeSelector
+
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsToolBuilder
+
+# Every stage gets its own block of positions, the stage's own positions are
+# offset to the middle of the block so negative positions stay inside it.
+STAGE_WIDTH = 1000
+
+# Stages that fail write to this file, as the CWL command runs in sh (eg: dash) which
+# can't `set -o pipefail`, and the pipe's exit status is otherwise the last stage's.
+FAILED_STAGES_FILENAME = ".pipe_failed_stages"
+
+# InputSelectors of the runtime (eg: runtime_cpu), which aren't inputs of the stage
+RESOURCE_SELECTORS = (CpuSelector, MemorySelector, DiskSelector, TimeSelector)
+
+
+class PipeStage:
+    def __init__(self, name: str, tool: CommandTool, stdin: str = None, **values):
+        """
+        A single command in a BioinformaticsPipeBuilder.
+
+        :param name: Unique name of the stage, its unset inputs are exposed as '{name}_{input}'
+        :param tool: A CommandTool that reads from stdin (except the first) and writes to stdout
+            (except the last). Tools that write to a file should be given '/dev/stdout'.
+        :param stdin: The input of the tool that's read from the previous stage ('/dev/stdin').
+        :param values: Fixed (literal) values for the tool's inputs, these are baked into the command.
+        """
+        self.name = name
+        self.tool = tool
+        self.stdin = stdin
+        self.values = values
+
+        ins = {i.id() for i in tool.inputs()}
+        unrecognised = {k for k in values if k not in ins}
+        if stdin is not None:
+            if stdin not in ins:
+                unrecognised.add(stdin)
+            elif stdin in values:
+                raise Exception(
+                    f"The stdin input '{stdin}' of stage '{name}' can't also be given a value"
+                )
+        if unrecognised:
+            raise Exception(
+                f"The stage '{name}' ({tool.id()}) does not have the inputs: "
+                + ", ".join(sorted(unrecognised))
+            )
+
+
+class BioinformaticsPipeBuilder(BioinformaticsToolBuilder):
+    def __init__(
+        self,
+        tool: str,
+        stages: List[PipeStage],
+        version: str,
+        container: str = None,
+        friendly_name: Optional[str] = None,
+        metadata=None,
+        **kwargs,
+    ):
+        """
+        Compose existing stdin / stdout tools into one CommandTool that streams between
+        them (stage1 | stage2 | ... > stdout), so the chain runs as one task and the
+        intermediate files are never written.
+
+        Like `set -o pipefail`, the tool fails if any of the stages fail (not only the last):
+        each stage is run as `{ command || echo <stage> >> FAILED_STAGES_FILENAME; }` and
+        the pipe is followed by a test that no stage wrote to it.
+
+        :param tool: Unique identifier of the composed tool
+        :param stages: The commands of the pipe, in order
+        :param version: Version of the composed tool
+        :param container: Container that has all of the tools in it, only required if the
+            stages don't share the same container.
+        """
+        if not stages:
+            raise Exception(f"The pipe '{tool}' must have at least one stage")
+
+        names = [s.name for s in stages]
+        if len(set(names)) != len(names):
+            raise Exception(f"The stages of pipe '{tool}' must have unique names")
+        if stages[0].stdin is not None:
+            raise Exception(
+                f"The first stage ('{stages[0].name}') of pipe '{tool}' can't read from stdin"
+            )
+        for s in stages[1:]:
+            if s.stdin is None:
+                raise Exception(
+                    f"The stage '{s.name}' of pipe '{tool}' must declare its stdin input"
+                )
+
+        if container is None:
+            containers = {s.tool.container() for s in stages}
+            if len(containers) > 1:
+                raise Exception(
+                    f"The stages of pipe '{tool}' use different containers ("
+                    + ", ".join(sorted(containers))
+                    + "), a container with all of these tools must be given"
+                )
+            container = containers.pop()
+
+        self._stages = stages
+
+        inputs, arguments = [], []
+        for idx, stage in enumerate(stages):
+            ins, args = self.stage_inputs_and_arguments(idx, stage)
+            inputs.extend(ins)
+            arguments.extend(args)
+        arguments.append(
+            ToolArgument(
+                f"&& test ! -e {FAILED_STAGES_FILENAME}",
+                position=len(stages) * STAGE_WIDTH,
+                shell_quote=False,
+            )
+        )
+
+        last = stages[-1]
+        outputs = [
+            ToolOutput(
+                o.tag,
+                o.output_type,
+                selector=self.rewire(o.selector, last),
+                presents_as=o.presents_as,
+                secondaries_present_as=o.secondaries_present_as,
+                doc=o.doc,
+            )
+            for o in last.tool.outputs()
+        ]
+
+        super().__init__(
+            tool=tool,
+            base_command=None,
+            inputs=inputs,
+            outputs=outputs,
+            container=container,
+            version=version,
+            friendly_name=friendly_name,
+            arguments=arguments,
+            metadata=metadata,
+            cpu=kwargs.pop("cpu", self.total_cpus),
+            memory=kwargs.pop("memory", self.total_memory),
+            **kwargs,
+        )
+
+    @staticmethod
+    def exposed_id(stage: PipeStage, inputid: str):
+        return f"{stage.name}_{inputid}"
+
+    @staticmethod
+    def offset(idx: int, position: Optional[int]) -> int:
+        return idx * STAGE_WIDTH + STAGE_WIDTH // 2 + (position or 0)
+
+    def stage_inputs_and_arguments(self, idx: int, stage: PipeStage):
+        inputs, arguments = [], []
+
+        command = stage.tool.base_command()
+        if isinstance(command, list):
+            command = " ".join(command)
+        start = "| {" if idx > 0 else "{"
+        arguments.extend(
+            [
+                ToolArgument(start, position=idx * STAGE_WIDTH, shell_quote=False),
+                ToolArgument(
+                    command, position=idx * STAGE_WIDTH + 1, shell_quote=False
+                ),
+                ToolArgument(
+                    f"|| echo {stage.name} >> {FAILED_STAGES_FILENAME}; }}",
+                    position=(idx + 1) * STAGE_WIDTH - 1,
+                    shell_quote=False,
+                ),
+            ]
+        )
+
+        for inp in stage.tool.inputs():
+            position = self.offset(idx, inp.position)
+
+            if inp.id() == stage.stdin:
+                arguments.append(
+                    ToolArgument(
+                        "/dev/stdin",
+                        prefix=inp.prefix,
+                        position=position,
+                        separate_value_from_prefix=inp.separate_value_from_prefix,
+                    )
+                )
+            elif inp.id() in stage.values:
+                arguments.extend(
+                    self.fixed_arguments(inp, stage.values[inp.id()], position)
+                )
+            else:
+                inputs.append(
+                    ToolInput(
+                        self.exposed_id(stage, inp.id()),
+                        self.rewire(inp.input_type, stage),
+                        position=position,
+                        prefix=inp.prefix,
+                        separate_value_from_prefix=inp.separate_value_from_prefix,
+                        prefix_applies_to_all_elements=inp.prefix_applies_to_all_elements,
+                        presents_as=inp.presents_as,
+                        secondaries_present_as=inp.secondaries_present_as,
+                        separator=inp.separator,
+                        shell_quote=inp.shell_quote,
+                        localise_file=inp.localise_file,
+                        default=self.rewire(inp.default, stage),
+                        doc=inp.doc,
+                    )
+                )
+
+        for arg in stage.tool.arguments() or []:
+            arguments.append(
+                ToolArgument(
+                    self.rewire(arg.value, stage),
+                    prefix=arg.prefix,
+                    position=self.offset(idx, arg.position),
+                    separate_value_from_prefix=arg.separate_value_from_prefix,
+                    doc=arg.doc,
+                    shell_quote=arg.shell_quote,
+                )
+            )
+
+        return inputs, arguments
+
+    @staticmethod
+    def fixed_arguments(inp: ToolInput, value, position: int) -> List[ToolArgument]:
+        if value is None or value is False:
+            return []
+        if value is True:
+            if not inp.prefix:
+                return []
+            return [ToolArgument(inp.prefix, position=position)]
+
+        if isinstance(value, (list, tuple)):
+            if inp.prefix_applies_to_all_elements:
+                return [
+                    ToolArgument(
+                        str(v),
+                        prefix=inp.prefix,
+                        position=position,
+                        separate_value_from_prefix=inp.separate_value_from_prefix,
+                    )
+                    for v in value
+                ]
+            value = (inp.separator or " ").join(str(v) for v in value)
+
+        return [
+            ToolArgument(
+                str(value),
+                prefix=inp.prefix,
+                position=position,
+                separate_value_from_prefix=inp.separate_value_from_prefix,
+                shell_quote=inp.shell_quote,
+            )
+        ]
+
+    def rewire(self, value, stage: PipeStage):
+        """
+        Point the input selectors of a stage's tool at the exposed (prefixed) inputs,
+        or replace them by the value the input was fixed to.
+        """
+        if isinstance(value, RESOURCE_SELECTORS):
+            # the pipe's own runtime, which is shared by all of the stages
+            return value
+        if isinstance(value, InputSelector):
+            key = value.input_to_select
+            if key in stage.values:
+                return stage.values[key]
+            if key == stage.stdin:
+                raise Exception(
+                    f"The stage '{stage.name}' selects its stdin input '{key}', which isn't "
+                    f"available in a pipe"
+                )
+            return InputSelector(
+                self.exposed_id(stage, key),
+                remove_file_extension=value.remove_file_extension,
+            )
+        if isinstance(value, StringFormatter):
+            return StringFormatter(
+                value._format,
+                **{k: self.rewire(v, stage) for k, v in value.kwargs.items()},
+            )
+        if isinstance(value, IsDefined) and isinstance(value.args[0], InputSelector):
+            # a fixed value is baked in, so it's known here whether it's defined
+            if value.args[0].input_to_select in stage.values:
+                return stage.values[value.args[0].input_to_select] is not None
+        if isinstance(value, Operator):
+            # eg: If(IsDefined(threads), threads, CpuSelector() - 1)
+            return value.__class__(*[self.rewire(a, stage) for a in value.args])
+        if isinstance(value, Filename):
+            return Filename(
+                prefix=self.rewire(value.prefix, stage),
+                suffix=value.suffix,
+                extension=value.extension,
+                optional=value.optional,
+            )
+        return value
+
+    def total_cpus(self, hints: Dict[str, Any]):
+        # every stage is running at the same time
+        cpus = [s.tool.cpus(hints) for s in self._stages]
+        cpus = [c for c in cpus if isinstance(c, (int, float))]
+        return sum(cpus) if cpus else None
+
+    def total_memory(self, hints: Dict[str, Any]):
+        memory = [s.tool.memory(hints) for s in self._stages]
+        memory = [m for m in memory if isinstance(m, (int, float))]
+        return sum(memory) if memory else None
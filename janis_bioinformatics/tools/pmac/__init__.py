@@ -1,21 +1,44 @@
 from .combinevariants.versions import *
 from .trimiupac.versions import *
 from .parsefastqc.v0_1_0 import ParseFastqcAdaptors
+from .parsefastqc.v0_2_0 import ParseFastqcAdaptors_0_2_0
+from .parsefastqc.cutadaptlookup import ParseCutadaptAdaptorsLookup
 from .performancesummary.versions import *
 from .genecovpersample.versions import *
 from .addsymtodepthofcoverage.versions import *
 from .addbamstats.versions import *
 from .extractstrelkasomaticaddp.versions import *
 from .generatecountsforallsorts.versions import *
+from .aggregatedepthofcoverage.v0_1_0 import AggregateDepthOfCoverageByGene
 from .annotateDepthOfCoverageWorkflow import AnnotateDepthOfCoverage_0_1_0
+from .annotateDepthOfCoverageByContigWorkflow import (
+    AnnotateDepthOfCoverageByContig_0_1_0,
+)
 from .performanceSummaryTargetedWorkflow import PerformanceSummaryTargeted_0_1_0
 from .performanceSummaryGenomeWorkflow import PerformanceSummaryGenome_0_1_0
 from .addBamStatsSomaticWorkflow import AddBamStatsSomatic_0_1_0
 from .addBamStatsGermlineWorkflow import AddBamStatsGermline_0_1_0
-from .molpathGermlineWorkflow import MolpathGermline_1_0_0
-from .molpathTumorOnlyWorkflow import MolpathTumorOnly_1_0_0
+from .molpathGermlineWorkflow import (
+    MolpathGermline_1_0_0,
+    MolpathGermlineBamSorMaDup_1_0_0,
+)
+from .molpathTumorOnlyWorkflow import (
+    MolpathTumorOnly_1_0_0,
+    MolpathTumorOnlyBamSorMaDup_1_0_0,
+    MolpathTumorOnlyCram_1_0_0,
+)
 from .generatevardictheaderlines import GenerateVardictHeaderLines
 from .generatebedtoolscoveragegenomefile import GenerateGenomeFileForBedtoolsCoverage
-from .starArribaWorkflow import StarArriba_0_1_0
-from .starArribaOriginalWorkflow import StarArribaOriginal_0_1_0
+from .starArribaWorkflow import StarArriba_0_1_0, StarArribaCram_0_1_0
+from .starArribaOriginalWorkflow import (
+    StarArribaOriginal_0_1_0,
+    StarArribaOriginalCram_0_1_0,
+)
+from .splitfeaturecountsbysample import SplitFeatureCountsBySample
 from .allsortsWorkflow import ALLSortsWorkflow_0_1_0
+from .allsortsCohortWorkflow import ALLSortsCohortWorkflow_0_1_0
+from .preparePanelBedWorkflow import PreparePanelBed_0_1_0
+from .molpathBatchWorkflow import (
+    MolpathGermlineBatch_1_0_0,
+    MolpathTumorOnlyBatch_1_0_0,
+)
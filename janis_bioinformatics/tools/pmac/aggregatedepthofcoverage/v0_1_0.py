@@ -0,0 +1,123 @@
+from typing import Dict, List, Any
+
+from janis_core import TOutput, File, OutputDocumentation
+from janis_unix import TextFile
+
+from janis_bioinformatics.data_types import Bed
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsPythonTool
+
+
+class AggregateDepthOfCoverageByGene(BioinformaticsPythonTool):
+    @staticmethod
+    def code_block(
+        intervalSummaries: List[File],
+        bed: Bed,
+        output_filename: str = "gene_summary.txt",
+    ) -> Dict[str, Any]:
+        """
+        :param intervalSummaries: GATK DepthOfCoverage sample_interval_summary files (eg: one per contig)
+        :param bed: Annotated bed file, the gene symbol is the 4th column
+        :param output_filename: Filename to output to
+        """
+        from collections import OrderedDict
+
+        # GATK reports the bed (0-based, half open) intervals as 1-based, closed intervals
+        genes_by_target = {}
+        with open(bed) as inp:
+            for line in inp:
+                pieces = line.rstrip("\n").split("\t")
+                if len(pieces) < 4 or line.startswith(("#", "track", "browser")):
+                    continue
+                chrom, start, end = pieces[0], int(pieces[1]) + 1, int(pieces[2])
+                target = f"{chrom}:{start}-{end}" if start != end else f"{chrom}:{end}"
+                genes_by_target[target] = pieces[3]
+
+        def target_length(target):
+            region = target.rsplit(":", 1)[1]
+            if "-" not in region:
+                return 1
+            start, end = region.split("-")
+            return int(end) - int(start) + 1
+
+        threshold_columns = None
+        genes = OrderedDict()
+        for summary in intervalSummaries:
+            with open(summary) as inp:
+                header = inp.readline().rstrip("\n").split("\t")
+                above = [i for i, h in enumerate(header) if "_%_above_" in h]
+                if threshold_columns is None:
+                    threshold_columns = [header[i].split("_%_")[1] for i in above]
+                for line in inp:
+                    pieces = line.rstrip("\n").split("\t")
+                    if not pieces[0] or pieces[0] == "Total":
+                        continue
+                    gene = genes_by_target.get(pieces[0], ".")
+                    length = target_length(pieces[0])
+                    g = genes.setdefault(
+                        gene, [0, 0, 0.0, [0.0] * len(threshold_columns)]
+                    )
+                    g[0] += 1
+                    g[1] += length
+                    g[2] += float(pieces[1])
+                    for j, i in enumerate(above):
+                        g[3][j] += float(pieces[i]) * length
+
+        with open(output_filename, "w+") as out:
+            out.write(
+                "\t".join(
+                    [
+                        "Gene",
+                        "intervals",
+                        "bases",
+                        "total_coverage",
+                        "average_coverage",
+                        *[f"%_{t}" for t in threshold_columns or []],
+                    ]
+                )
+                + "\n"
+            )
+            for gene, (n, length, total, above) in genes.items():
+                out.write(
+                    "\t".join(
+                        [
+                            gene,
+                            str(n),
+                            str(length),
+                            f"{total:.0f}",
+                            f"{total / length:.2f}",
+                            *[f"{a / length:.1f}" for a in above],
+                        ]
+                    )
+                    + "\n"
+                )
+
+        return {"out": output_filename}
+
+    def outputs(self) -> List[TOutput]:
+        return [
+            TOutput(
+                "out",
+                TextFile,
+                doc=OutputDocumentation(
+                    doc="Per-gene coverage summary, length weighted over the gene's intervals"
+                ),
+            )
+        ]
+
+    def id(self) -> str:
+        return "AggregateDepthOfCoverageByGene"
+
+    def friendly_name(self) -> str:
+        return "Aggregate DepthOfCoverage by gene"
+
+    def tool_provider(self):
+        return "Peter MacCallum Cancer Centre"
+
+    def version(self):
+        return "v0.1.0"
+
+    def bind_metadata(self):
+        self.metadata.documentation = """\
+Aggregate the per-interval summaries of GATK DepthOfCoverage to the gene level (using the gene
+symbol in the annotated bed), so the per-base output never needs to be generated.
+        """
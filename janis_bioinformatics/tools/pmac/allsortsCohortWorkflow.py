@@ -0,0 +1,121 @@
+from janis_core import Array, Directory, File, String, WorkflowMetadata
+
+from janis_bioinformatics.data_types import FastqGzPair
+
+from janis_bioinformatics.tools import BioinformaticsWorkflow
+from janis_bioinformatics.tools.pmac import GenerateCountsForALLSorts_0_1_0
+from janis_bioinformatics.tools.pmac.splitfeaturecountsbysample import (
+    SplitFeatureCountsBySample,
+)
+from janis_bioinformatics.tools.star import StarAlignReads_2_7_1
+from janis_bioinformatics.tools.subread import featureCounts_2_0_1
+from janis_bioinformatics.tools.oshlack import AllSorts_0_1_0
+from janis_bioinformatics.utils.operators import FilterNullOperator
+
+
+class ALLSortsCohortWorkflow_0_1_0(BioinformaticsWorkflow):
+    def id(self) -> str:
+        return "ALLSortsCohortWorkflow"
+
+    def friendly_name(self):
+        return "ALLSorts Workflow (cohort)"
+
+    def tool_provider(self):
+        return "Peter MacCallum Cancer Centre"
+
+    def bind_metadata(self):
+        return WorkflowMetadata(
+            version="v0.1.0",
+            contributors=["Jiaan Yu"],
+            documentation="""\
+Batch equivalent of the ALLSorts workflow: STAR is scattered across the samples, then
+featureCounts runs once over all of the bams (so the GTF is only loaded once), the counts are
+transformed once, and every sample is classified in a single AllSorts run.""",
+        )
+
+    def constructor(self):
+
+        self.input("sample_names", Array(String))
+        self.input("reads", Array(FastqGzPair))
+        self.input("genomeDir", Directory)
+        self.input("gtf", File)
+
+        self.step(
+            "star",
+            StarAlignReads_2_7_1(
+                readFilesIn=self.reads,
+                genomeDir=self.genomeDir,
+                limitOutSJcollapsed=3000000,  # lots of splice junctions may need more than default 1M buffer
+                readFilesCommand="zcat",
+                outSAMtype=["BAM", "Unsorted"],
+                outSAMunmapped="Within",
+                outSAMattributes="Standard",
+            ),
+            scatter="readFilesIn",
+        )
+
+        # out_unsorted_bam is optional, so the scatter gives an array of optional bams. A
+        # missing bam fails split_counts, which checks there's a count column per sample.
+        self.step(
+            "featureCounts",
+            featureCounts_2_0_1(
+                bam=FilterNullOperator(self.star.out_unsorted_bam),
+                annotationFile=self.gtf,
+                attributeType="gene_name",
+            ),
+        )
+
+        # generate_counts_for_allsorts.py labels each featureCounts file with one sample
+        self.step(
+            "split_counts",
+            SplitFeatureCountsBySample(
+                counts=self.featureCounts.out, samples=self.sample_names
+            ),
+        )
+
+        # A script that transforms featurecounts output to allsorts input
+        self.step(
+            "transformation",
+            GenerateCountsForALLSorts_0_1_0(
+                inp=self.split_counts.out,
+                type="featureCounts",
+                samples=self.sample_names,
+            ),
+        )
+
+        self.step(
+            "allsorts",
+            AllSorts_0_1_0(samples=self.transformation.out, destination="."),
+        )
+
+        self.output(
+            "out_gene_counts",
+            source=self.featureCounts.out,
+            output_name="feature_counts",
+        )
+        self.output("out_counts", source=self.transformation.out, output_name="counts")
+
+        self.output(
+            "out_predictions",
+            source=self.allsorts.out_predictions,
+            output_folder="allsorts",
+            output_name="predictions",
+        )
+        self.output(
+            "out_probabilities",
+            source=self.allsorts.out_probabilities,
+            output_folder="allsorts",
+            output_name="probabilities",
+        )
+        self.output(
+            "out_distributions",
+            source=self.allsorts.out_distributions,
+            output_folder="allsorts",
+            output_name="distributions",
+        )
+        self.output(
+            "out_waterfalls",
+            source=self.allsorts.out_waterfalls,
+            output_folder="allsorts",
+            output_name="waterfalls",
+        )
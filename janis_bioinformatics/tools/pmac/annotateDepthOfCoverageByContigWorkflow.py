@@ -0,0 +1,103 @@
+from janis_core import WorkflowMetadata, String, Boolean, StringFormatter
+
+# data types
+from janis_bioinformatics.data_types import BamBai, Bed, FastaWithDict
+
+from janis_bioinformatics.tools import BioinformaticsWorkflow
+from janis_bioinformatics.tools.common import SplitBedByContig, ConcatTextTables
+from janis_bioinformatics.tools.gatk3 import GATK3DepthOfCoverageLatest
+from janis_bioinformatics.tools.pmac.addsymtodepthofcoverage.versions import (
+    AddSymToDepthOfCoverageLatest,
+)
+from janis_bioinformatics.tools.pmac.aggregatedepthofcoverage.v0_1_0 import (
+    AggregateDepthOfCoverageByGene,
+)
+
+
+class AnnotateDepthOfCoverageByContig_0_1_0(BioinformaticsWorkflow):
+    def id(self) -> str:
+        return "AnnotateDepthOfCoverageByContig"
+
+    def friendly_name(self):
+        return "Annotate GATK3 DepthOfCoverage Workflow (scattered by contig)"
+
+    def tool_provider(self):
+        return "Peter MacCallum Cancer Centre"
+
+    def bind_metadata(self):
+        return WorkflowMetadata(
+            version="v0.1.0",
+            contributors=["Jiaan Yu"],
+            documentation="""\
+Same output as AnnotateDepthOfCoverage, but the annotated bed is split by contig and
+DepthOfCoverage only produces the summary (per-interval) tables for each contig, unless the
+per-base output is explicitly requested. The gene symbols are added to each contig's
+interval summary before they're merged, and a per-gene summary is aggregated from them.""",
+        )
+
+    def constructor(self):
+
+        self.input("bam", BamBai)
+        self.input("bed", Bed)
+        self.input("reference", FastaWithDict)
+        self.input("sample_name", String)
+        self.input(
+            "omit_depth_output_at_each_base",
+            Boolean,
+            default=True,
+            doc="The per-base output is very large for exome-sized beds, only set this to "
+            "false when the per-base table is actually required",
+        )
+
+        self.step("split_bed", SplitBedByContig(bed=self.bed))
+
+        self.step(
+            "gatk3depthofcoverage",
+            GATK3DepthOfCoverageLatest(
+                reference=self.reference,
+                bam=self.bam,
+                intervals=self.split_bed.out,
+                countType="COUNT_FRAGMENTS_REQUIRE_SAME_BASE",
+                summaryCoverageThreshold=[1, 50, 100, 300, 500],
+                outputPrefix=self.sample_name,
+                omitDepthOutputAtEachBase=self.omit_depth_output_at_each_base,
+                omitLocusTable=True,
+            ),
+            scatter="intervals",
+        )
+
+        self.step(
+            "addsymtodepthofcoverage",
+            AddSymToDepthOfCoverageLatest(
+                inputFile=self.gatk3depthofcoverage.sampleIntervalSummary,
+                bed=self.split_bed.out,
+            ),
+            scatter=["inputFile", "bed"],
+        )
+
+        self.step(
+            "merge_interval_summary",
+            ConcatTextTables(
+                files=self.addsymtodepthofcoverage.out,
+                output_filename=self.sample_name,
+            ),
+        )
+        self.step(
+            "aggregate_gene_summary",
+            AggregateDepthOfCoverageByGene(
+                intervalSummaries=self.gatk3depthofcoverage.sampleIntervalSummary,
+                bed=self.bed,
+            ),
+        )
+
+        self.output(
+            "out", source=self.merge_interval_summary.out, output_name=self.sample_name
+        )
+        self.output(
+            "gene_summary",
+            source=self.aggregate_gene_summary.out,
+            output_name=StringFormatter(
+                "{sample_name}.gene_summary", sample_name=self.sample_name
+            ),
+        )
+        self.output("per_base", source=self.gatk3depthofcoverage.sample)
@@ -2,7 +2,16 @@ from abc import ABC
 import datetime
 
 from janis_bioinformatics.tools import BioinformaticsTool
-from janis_core import ToolInput, ToolOutput, File, Filename, Int, InputSelector, String
+from janis_core import (
+    ToolInput,
+    ToolOutput,
+    File,
+    Filename,
+    Int,
+    InputSelector,
+    String,
+    CpuSelector,
+)
 from janis_unix import TextFile
 
 
@@ -57,6 +66,7 @@ class GeneCoveragePerSampleBase(BioinformaticsTool, ABC):
             ToolInput(
                 "threads",
                 Int(optional=True),
+                default=CpuSelector(),
                 prefix="--threads",
                 doc="number of threads, default:32",
             ),
@@ -0,0 +1,195 @@
+from abc import ABC, abstractmethod
+
+from janis_core import Array, File, String, WorkflowMetadata
+
+from janis_bioinformatics.data_types import FastqGzPair, Bed, FastaWithIndexes
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsWorkflow
+from janis_bioinformatics.tools.bedtools import BedToolsSortBedLatest
+from janis_bioinformatics.tools.multiqc import MultiqcBatch_v1_7
+from janis_bioinformatics.tools.pmac.molpathGermlineWorkflow import (
+    MolpathGermline_1_0_0,
+)
+from janis_bioinformatics.tools.pmac.molpathTumorOnlyWorkflow import (
+    MolpathTumorOnly_1_0_0,
+)
+from janis_bioinformatics.tools.pmac.parsefastqc.cutadaptlookup import (
+    ParseCutadaptAdaptorsLookup,
+)
+from janis_bioinformatics.tools.pmac.preparePanelBedWorkflow import (
+    PreparePanelBed_0_1_0,
+)
+from janis_bioinformatics.utils.operators import FlattenOperator
+
+
+class MolpathBatchBase(BioinformaticsWorkflow, ABC):
+    """
+    Runs a Molpath workflow over every sample of a sample sheet, with the sample
+    independent work (sorting the panel beds, the bedtools genome file from the reference
+    and parsing the adapters lookup) done once per batch, and the QC of all of the samples
+    aggregated into one MultiQC report.
+    """
+
+    @abstractmethod
+    def sample_workflow(self) -> BioinformaticsWorkflow:
+        """
+        The (per sample) workflow that's scattered over the sample sheet, it must have
+        the inputs: sample_name, fastqs, reference, region_bed, region_bed_extended,
+        region_bed_annotated, genecoverage_bed, genome_file and cutadapt_adaptor_sequences,
+        and the outputs: fastq_qc, flagstat and insert_size_metrics (for MultiQC).
+        """
+        pass
+
+    def tool_provider(self):
+        return "Peter MacCallum Cancer Centre"
+
+    def constructor(self):
+
+        # The sample sheet, janis has no record type, so these are the columns (one
+        # element per sample, in the same order)
+        self.input("sample_names", Array(String))
+        self.input(
+            "fastqs",
+            Array(Array(FastqGzPair)),
+            doc="The fastq pairs (lanes) of each sample, in the order of sample_names",
+        )
+
+        self.input("reference", FastaWithIndexes)
+        self.input(
+            "region_bed",
+            Bed,
+            doc="Panel bed, it's sorted and merged once (the sample workflow expects it to be)",
+        )
+        self.input("region_bed_extended", Bed, doc="Sorted once, but not merged")
+        self.input(
+            "region_bed_annotated",
+            Bed,
+            doc="Sorted once, not merged as the names (4th column) are kept",
+        )
+        self.input("genecoverage_bed", Bed, doc="Gene coverage bed, it's sorted once")
+        self.input(
+            "cutadapt_adaptors_lookup",
+            File(optional=True),
+            doc="Named adapters (name[tab]sequence), the overrepresented sequences fastqc finds "
+            "in this list are trimmed by cutadapt. It's parsed once for the batch",
+        )
+
+        self.step(
+            "prepare_panel_bed",
+            PreparePanelBed_0_1_0(
+                reference=self.reference,
+                region_bed=self.region_bed,
+                genecoverage_bed=self.genecoverage_bed,
+            ),
+        )
+        # the rest of the beds are sorted against the same genome file, but aren't
+        # merged as they're used for intervals (and the annotated bed's names are kept)
+        for bed in ("region_bed_extended", "region_bed_annotated"):
+            self.step(
+                f"sort_{bed}",
+                BedToolsSortBedLatest(
+                    inputBed=self[bed], genome=self.prepare_panel_bed.genome_file
+                ),
+            )
+        self.step(
+            "parse_adaptors_lookup",
+            ParseCutadaptAdaptorsLookup(
+                cutadapt_adaptors_lookup=self.cutadapt_adaptors_lookup
+            ),
+        )
+
+        workflow = self.sample_workflow()
+        sources = {
+            "sample_name": self.sample_names,
+            "fastqs": self.fastqs,
+            "reference": self.reference,
+            "region_bed": self.prepare_panel_bed.sorted_region_bed,
+            "region_bed_extended": self.sort_region_bed_extended.out,
+            "region_bed_annotated": self.sort_region_bed_annotated.out,
+            "genecoverage_bed": self.prepare_panel_bed.sorted_genecoverage_bed,
+            "genome_file": self.prepare_panel_bed.genome_file,
+            "cutadapt_adaptor_sequences": self.parse_adaptors_lookup.adaptor_sequences,
+        }
+        # every other input (eg: the known sites and the resources) is given once to the
+        # batch, and shared by all of the samples
+        for inp in workflow.input_nodes.values():
+            if inp.id() not in sources:
+                sources[inp.id()] = self.input(
+                    inp.id(), inp.datatype, default=inp.default, doc=inp.doc
+                )
+
+        self.step(
+            "samples",
+            workflow(**sources),
+            scatter=["sample_name", "fastqs"],
+        )
+
+        # the outputs of a sample are kept together in a folder of the sample's name
+        for out in workflow.output_nodes.values():
+            folder = out.output_folder
+            if folder is None:
+                folder = []
+            elif not isinstance(folder, list):
+                folder = [folder]
+            self.output(
+                out.id(),
+                source=self.samples[out.id()],
+                output_folder=[self.sample_names, *folder],
+            )
+
+        self.step(
+            "multiqc",
+            MultiqcBatch_v1_7(
+                sampleNames=self.sample_names,
+                flagstats=self.samples.flagstat,
+                insertSizeMetrics=self.samples.insert_size_metrics,
+                fastqc=FlattenOperator(self.samples.fastq_qc),
+            ),
+        )
+        self.output("multiqc_report", source=self.multiqc.out, output_folder="QC")
+        self.output("multiqc_data", source=self.multiqc.data, output_folder="QC")
+
+
+class MolpathGermlineBatch_1_0_0(MolpathBatchBase):
+    def id(self):
+        return "MolpathGermlineBatchWorkflow"
+
+    def friendly_name(self):
+        return "Molpath Germline Workflow (batch)"
+
+    def bind_metadata(self):
+        return WorkflowMetadata(
+            version="v1.0.0",
+            documentation="""\
+Batch equivalent of the Molpath Germline workflow: the workflow is scattered across the samples
+of a sample sheet (sample_names and fastqs), while the panel beds are sorted (and the bedtools
+genome file generated, and the adapters lookup parsed) once for the batch instead of once per
+sample. Unlike the sample workflow, which takes region_bed as it's given, the region bed is also
+merged (see PreparePanelBed). The fastqc, flagstat and insert size metrics of every sample are
+aggregated into one MultiQC report (and its JSON data).""",
+        )
+
+    def sample_workflow(self):
+        return MolpathGermline_1_0_0()
+
+
+class MolpathTumorOnlyBatch_1_0_0(MolpathBatchBase):
+    def id(self):
+        return "MolpathTumorOnlyBatchWorkflow"
+
+    def friendly_name(self):
+        return "Molpath Tumor Only Workflow (batch)"
+
+    def bind_metadata(self):
+        return WorkflowMetadata(
+            version="v1.0.0",
+            documentation="""\
+Batch equivalent of the Molpath Tumor Only workflow: the workflow is scattered across the samples
+of a sample sheet (sample_names and fastqs), while the panel beds are sorted (and the bedtools
+genome file generated, and the adapters lookup parsed) once for the batch instead of once per
+sample. Unlike the sample workflow, which takes region_bed as it's given, the region bed is also
+merged (see PreparePanelBed). The fastqc, flagstat and insert size metrics of every sample are
+aggregated into one MultiQC report (and its JSON data).""",
+        )
+
+    def sample_workflow(self):
+        return MolpathTumorOnly_1_0_0()
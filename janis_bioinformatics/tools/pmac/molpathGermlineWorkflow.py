@@ -13,7 +13,7 @@ from janis_core import (
 )
 from janis_unix.data_types import TextFile
 from janis_bioinformatics.data_types import (
-    FastaWithDict,
+    FastaWithIndexes,
     VcfTabix,
     FastqGzPair,
     Bed,
@@ -21,17 +21,20 @@ from janis_bioinformatics.data_types import (
     BamBai,
 )
 from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsWorkflow
+from janis_bioinformatics.utils.operators import FlattenOperator
+from janis_bioinformatics.tools.gatk4.outputtier import OUTPUT_TIER_DOC, OutputTier
 from janis_bioinformatics.tools.babrahambioinformatics import FastQC_0_11_5
 from janis_bioinformatics.tools.common import (
     BwaAligner,
     MergeAndMarkBams_4_1_3,
+    MergeAndMarkBamsBamSorMaDup,
     GATKBaseRecalBQSRWorkflow_4_1_3,
     SplitMultiAlleleNormaliseVcf,
 )
 from janis_bioinformatics.tools.gatk4 import Gatk4HaplotypeCaller_4_1_3
 from janis_bioinformatics.tools.papenfuss import Gridss_2_6_2
 from janis_bioinformatics.tools.pmac import (
-    ParseFastqcAdaptors,
+    ParseFastqcAdaptors_0_2_0,
     AnnotateDepthOfCoverage_0_1_0,
     PerformanceSummaryTargeted_0_1_0,
     AddBamStatsGermline_0_1_0,
@@ -52,32 +55,58 @@ class MolpathGermline_1_0_0(BioinformaticsWorkflow):
     def bind_metadata(self):
         return WorkflowMetadata(version="v1.0.0", contributors=["Jiaan Yu"])
 
+    def merge_and_mark_tool(self):
+        """
+        The lane bams (align_and_sort.out) are merged and duplicate marked by this tool, it
+        must output the indexed (BamBai) bam as "out". Override this to use another method.
+        """
+        return MergeAndMarkBams_4_1_3(
+            bams=self.align_and_sort.out, sampleName=self.sample_name
+        )
+
     def constructor(self):
 
         # Inputs
         self.input("sample_name", String)
         self.input("fastqs", Array(FastqGzPair))
-        self.input("reference", FastaWithDict)
-        self.input("region_bed", Bed)
+        self.input("reference", FastaWithIndexes)
+        self.input(
+            "region_bed",
+            Bed,
+            doc="Sorted in the same order as the genome_file, and merged so overlapping targets "
+            "aren't counted twice (the sorted_region_bed of PreparePanelBed, which the batch runs)",
+        )
         self.input("region_bed_extended", Bed)
         self.input("region_bed_annotated", Bed)
-        self.input("genecoverage_bed", Bed)
+        self.input(
+            "genecoverage_bed",
+            Bed,
+            doc="Sorted in the same order as the genome_file (see PreparePanelBed)",
+        )
         self.input("genome_file", TextFile)
         self.input("black_list", Bed(optional=True))
         self.input("snps_dbsnp", VcfTabix)
         self.input("snps_1000gp", VcfTabix)
         self.input("known_indels", VcfTabix)
         self.input("mills_indels", VcfTabix)
-
-        # fastqc
-        self.step(
-            "fastqc", FastQC_0_11_5(reads=self.fastqs, threads=4), scatter="reads"
+        self.input(
+            "cutadapt_adaptor_sequences",
+            Array(String, optional=True),
+            doc="Adapter sequences, the overrepresented sequences fastqc finds in this list are "
+            "trimmed by cutadapt (see ParseCutadaptAdaptorsLookup to parse a name[tab]sequence lookup)",
         )
-        # get the overrepresentative sequence from fastqc
+        self.input("output_tier", OutputTier, default="standard", doc=OUTPUT_TIER_DOC)
+
+        # fastqc, one call for all of the fastqs (the threads from the hints are used
+        # to run the files in parallel)
+        self.step("fastqc", FastQC_0_11_5(reads=FlattenOperator(self.fastqs)))
+        # get the overrepresentative sequence from fastqc, once for the sample
         self.step(
             "getfastqc_adapters",
-            ParseFastqcAdaptors(fastqc_datafiles=self.fastqc.datafile,),
-            scatter="fastqc_datafiles",
+            ParseFastqcAdaptors_0_2_0(
+                fastqc_datafiles=self.fastqc.datafile,
+                cutadapt_adaptor_sequences=self.cutadapt_adaptor_sequences,
+            ),
         )
         # align and generate sorted index bam
         self.step(
@@ -90,15 +119,10 @@ class MolpathGermline_1_0_0(BioinformaticsWorkflow):
                 cutadapt_adapter=self.getfastqc_adapters,
                 cutadapt_removeMiddle3Adapter=self.getfastqc_adapters,
             ),
-            scatter=["fastq", "cutadapt_adapter", "cutadapt_removeMiddle3Adapter"],
+            scatter="fastq",
         )
         # merge into one bam and markdups
-        self.step(
-            "merge_and_mark",
-            MergeAndMarkBams_4_1_3(
-                bams=self.align_and_sort.out, sampleName=self.sample_name
-            ),
-        )
+        self.step("merge_and_mark", self.merge_and_mark_tool())
         # performance: doc
         self.step(
             "annotate_doc",
@@ -154,6 +178,7 @@ class MolpathGermline_1_0_0(BioinformaticsWorkflow):
                 reference=self.reference,
                 dbsnp=self.snps_dbsnp,
                 pairHmmImplementation="LOGLESS_CACHING",
+                outputTier=self.output_tier,
             ),
         )
         self.step(
@@ -189,10 +214,41 @@ class MolpathGermline_1_0_0(BioinformaticsWorkflow):
             source=self.performance_summary.regionFileOut,
             output_folder="PERFORMANCE",
         )
+        self.output(
+            "flagstat",
+            source=self.performance_summary.flagstat,
+            output_folder="PERFORMANCE",
+        )
+        self.output(
+            "insert_size_metrics",
+            source=self.performance_summary.insertSizeMetrics,
+            output_folder="PERFORMANCE",
+        )
 
         self.output("gridss_vcf", source=self.gridss.out, output_folder="SV")
         self.output("gridss_bam", source=self.gridss.assembly, output_folder="SV")
 
         self.output("hap_vcf", source=self.haplotype_caller.out, output_folder="VCF")
         self.output("hap_bam", source=self.haplotype_caller.bam, output_folder="VCF")
+        self.output(
+            "hap_assembly_regions",
+            source=self.haplotype_caller.assemblyRegions,
+            output_folder="VCF",
+        )
+        self.output(
+            "hap_activity_profile",
+            source=self.haplotype_caller.activityProfile,
+            output_folder="VCF",
+        )
         self.output("normalise_vcf", source=self.addbamstats.out, output_folder="VCF")
+
+
+class MolpathGermlineBamSorMaDup_1_0_0(MolpathGermline_1_0_0):
+    def id(self):
+        return "MolpathGermlineWorkflowBamSorMaDup"
+
+    def friendly_name(self):
+        return "Molpath Germline Workflow (bamsormadup)"
+
+    def merge_and_mark_tool(self):
+        return MergeAndMarkBamsBamSorMaDup(bams=self.align_and_sort.out)
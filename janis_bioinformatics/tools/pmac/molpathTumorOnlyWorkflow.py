@@ -15,7 +15,7 @@ from janis_core import (
 from janis_unix.data_types import TextFile
 from janis_unix.tools import UncompressArchive
 from janis_bioinformatics.data_types import (
-    FastaWithDict,
+    FastaWithIndexes,
     VcfTabix,
     FastqGzPair,
     Bed,
@@ -23,19 +23,23 @@ from janis_bioinformatics.data_types import (
     BamBai,
 )
 from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsWorkflow
+from janis_bioinformatics.utils.operators import FlattenOperator
+from janis_bioinformatics.tools.gatk4.outputtier import OUTPUT_TIER_DOC, OutputTier
 from janis_bioinformatics.tools.babrahambioinformatics import FastQC_0_11_5
 from janis_bioinformatics.tools.bcftools import BcfToolsSort_1_9
 from janis_bioinformatics.tools.common import (
     BwaAligner,
     MergeAndMarkBams_4_1_3,
+    MergeAndMarkBamsBamSorMaDup,
+    ArchiveBamAsCram,
     GATKBaseRecalBQSRWorkflow_4_1_3,
     SplitMultiAlleleNormaliseVcf,
 )
 from janis_bioinformatics.tools.gatk4 import Gatk4HaplotypeCaller_4_1_3
-from janis_bioinformatics.tools.htslib import BGZip_1_9, TabixLatest
+from janis_bioinformatics.tools.htslib import BGZip_1_9, BgzipTabix_1_9
 from janis_bioinformatics.tools.papenfuss import Gridss_2_6_2
 from janis_bioinformatics.tools.pmac import (
-    ParseFastqcAdaptors,
+    ParseFastqcAdaptors_0_2_0,
     AnnotateDepthOfCoverage_0_1_0,
     PerformanceSummaryTargeted_0_1_0,
     CombineVariants_0_0_8,
@@ -64,17 +68,55 @@ class MolpathTumorOnly_1_0_0(BioinformaticsWorkflow):
     def bind_metadata(self):
         return WorkflowMetadata(version="v1.0.0", contributors=["Jiaan Yu"])
 
+    def merge_and_mark_tool(self):
+        """
+        The lane bams (align_and_sort.out) are merged and duplicate marked by this tool, it
+        must output the indexed (BamBai) bam as "out". Override this to use another method.
+        """
+        return MergeAndMarkBams_4_1_3(
+            bams=self.align_and_sort.out,
+            sampleName=self.sample_name,
+            maxRecordsInRam=self.maxRecordsInRam,
+        )
+
+    def merge_and_mark_inputs(self):
+        """
+        Declares the inputs that only the merge_and_mark_tool uses, override this with the
+        merge_and_mark_tool.
+        """
+        self.input(
+            "maxRecordsInRam",
+            Int,
+            doc="Used by the MergeSamFiles and MarkDuplicates merge_and_mark_tool",
+        )
+
+    def output_markdups_bam(self):
+        """
+        Outputs the duplicate marked bam (merge_and_mark.out), override this to archive it
+        differently (eg: MolpathTumorOnlyCram_1_0_0).
+        """
+        self.output("markdups_bam", source=self.merge_and_mark.out, output_folder="BAM")
+
     def constructor(self):
 
         # Inputs
         self.input("sample_name", String)
         self.input("fastqs", Array(FastqGzPair))
         self.input("seqrun", String, doc="SeqRun Name (for Vcf2Tsv)")
-        self.input("reference", FastaWithDict)
-        self.input("region_bed", Bed)
+        self.input("reference", FastaWithIndexes)
+        self.input(
+            "region_bed",
+            Bed,
+            doc="Sorted in the same order as the genome_file, and merged so overlapping targets "
+            "aren't counted twice (the sorted_region_bed of PreparePanelBed, which the batch runs)",
+        )
         self.input("region_bed_extended", Bed)
         self.input("region_bed_annotated", Bed)
-        self.input("genecoverage_bed", Bed)
+        self.input(
+            "genecoverage_bed",
+            Bed,
+            doc="Sorted in the same order as the genome_file (see PreparePanelBed)",
+        )
         self.input("genome_file", TextFile)
         self.input("panel_name", String)
         self.input("vcfcols", TextFile)
@@ -83,22 +125,30 @@ class MolpathTumorOnly_1_0_0(BioinformaticsWorkflow):
         self.input("snps_1000gp", VcfTabix)
         self.input("known_indels", VcfTabix)
         self.input("mills_indels", VcfTabix)
+        self.input(
+            "cutadapt_adaptor_sequences",
+            Array(String, optional=True),
+            doc="Adapter sequences, the overrepresented sequences fastqc finds in this list are "
+            "trimmed by cutadapt (see ParseCutadaptAdaptorsLookup to parse a name[tab]sequence lookup)",
+        )
         self.input("mutalyzer_server", String)
         self.input("pathos_db", String)
-        self.input("maxRecordsInRam", Int)
+        self.merge_and_mark_inputs()
         # tumor only
         self.input("gnomad", VcfTabix)
         self.input("panel_of_normals", VcfTabix(optional=True))
+        self.input("output_tier", OutputTier, default="standard", doc=OUTPUT_TIER_DOC)
 
-        # fastqc
-        self.step(
-            "fastqc", FastQC_0_11_5(reads=self.fastqs, threads=4), scatter="reads"
-        )
-        # get the overrepresentative sequence from fastqc
+        # fastqc, one call for all of the fastqs (the threads from the hints are used
+        # to run the files in parallel)
+        self.step("fastqc", FastQC_0_11_5(reads=FlattenOperator(self.fastqs)))
+        # get the overrepresentative sequence from fastqc, once for the sample
         self.step(
             "getfastqc_adapters",
-            ParseFastqcAdaptors(fastqc_datafiles=self.fastqc.datafile,),
-            scatter="fastqc_datafiles",
+            ParseFastqcAdaptors_0_2_0(
+                fastqc_datafiles=self.fastqc.datafile,
+                cutadapt_adaptor_sequences=self.cutadapt_adaptor_sequences,
+            ),
         )
         # align and generate sorted index bam
         self.step(
@@ -111,17 +161,10 @@ class MolpathTumorOnly_1_0_0(BioinformaticsWorkflow):
                 cutadapt_adapter=self.getfastqc_adapters,
                 cutadapt_removeMiddle3Adapter=self.getfastqc_adapters,
             ),
-            scatter=["fastq", "cutadapt_adapter", "cutadapt_removeMiddle3Adapter"],
+            scatter="fastq",
         )
         # merge into one bam and markdups
-        self.step(
-            "merge_and_mark",
-            MergeAndMarkBams_4_1_3(
-                bams=self.align_and_sort.out,
-                sampleName=self.sample_name,
-                maxRecordsInRam=self.maxRecordsInRam,
-            ),
-        )
+        self.step("merge_and_mark", self.merge_and_mark_tool())
         # performance: doc
         self.step(
             "annotate_doc",
@@ -178,6 +221,7 @@ class MolpathTumorOnly_1_0_0(BioinformaticsWorkflow):
                 reference=self.reference,
                 gnomad=self.gnomad,
                 panel_of_normals=self.panel_of_normals,
+                output_tier=self.output_tier,
             ),
         )
         # haplotypecaller to do: take base recal away from the
@@ -189,6 +233,7 @@ class MolpathTumorOnly_1_0_0(BioinformaticsWorkflow):
                 reference=self.reference,
                 dbsnp=self.snps_dbsnp,
                 pairHmmImplementation="LOGLESS_CACHING",
+                outputTier=self.output_tier,
             ),
         )
         self.step(
@@ -219,8 +264,7 @@ class MolpathTumorOnly_1_0_0(BioinformaticsWorkflow):
             ),
         )
         # Molpath specific processes
-        self.step("compressvcf2", BGZip_1_9(file=self.addbamstats.out))
-        self.step("tabixvcf", TabixLatest(inp=self.compressvcf2.out))
+        self.step("tabixvcf", BgzipTabix_1_9(file=self.addbamstats.out))
         self.step(
             "calculate_variant_length",
             VcfLength_1_0_1(vcf=self.tabixvcf.out),
@@ -289,7 +333,7 @@ class MolpathTumorOnly_1_0_0(BioinformaticsWorkflow):
         # output
         self.output("fastq_qc", source=self.fastqc.out, output_folder="QC")
 
-        self.output("markdups_bam", source=self.merge_and_mark.out, output_folder="BAM")
+        self.output_markdups_bam()
 
         self.output(
             "doc_out", source=self.annotate_doc.out, output_folder="PERFORMANCE"
@@ -307,6 +351,16 @@ class MolpathTumorOnly_1_0_0(BioinformaticsWorkflow):
             source=self.performance_summary.regionFileOut,
             output_folder="PERFORMANCE",
         )
+        self.output(
+            "flagstat",
+            source=self.performance_summary.flagstat,
+            output_folder="PERFORMANCE",
+        )
+        self.output(
+            "insert_size_metrics",
+            source=self.performance_summary.insertSizeMetrics,
+            output_folder="PERFORMANCE",
+        )
 
         self.output("gridss_vcf", source=self.gridss.out, output_folder="SV")
         self.output("gridss_bam", source=self.gridss.assembly, output_folder="SV")
@@ -328,8 +382,58 @@ class MolpathTumorOnly_1_0_0(BioinformaticsWorkflow):
         )
         self.output("mutect2_vcf", source=self.mutect2.variants, output_folder="VCF")
         self.output("mutect2_bam", source=self.mutect2.out_bam, output_folder="VCF")
+        self.output(
+            "haplotypecaller_assembly_regions",
+            source=self.haplotype_caller.assemblyRegions,
+            output_folder="VCF",
+        )
+        self.output(
+            "haplotypecaller_activity_profile",
+            source=self.haplotype_caller.activityProfile,
+            output_folder="VCF",
+        )
+        self.output(
+            "mutect2_assembly_regions",
+            source=self.mutect2.out_assembly_regions,
+            output_folder="VCF",
+        )
+        self.output(
+            "mutect2_activity_profile",
+            source=self.mutect2.out_activity_profile,
+            output_folder="VCF",
+        )
         self.output("mutect2_norm", source=self.mutect2.out, output_folder="VCF")
         self.output("addbamstats_vcf", source=self.addbamstats.out)
         # what more output to save?
         # self.output("final_vcf", source=self.filter_variants_2.out)
         # self.output("tsv", source=self.convert_to_tsv.out)
+
+
+class MolpathTumorOnlyBamSorMaDup_1_0_0(MolpathTumorOnly_1_0_0):
+    def id(self):
+        return "MolpathTumorOnlyWorkflowBamSorMaDup"
+
+    def friendly_name(self):
+        return "Molpath Tumor Only Workflow (bamsormadup)"
+
+    def merge_and_mark_inputs(self):
+        # bamsormadup doesn't need maxRecordsInRam
+        pass
+
+    def merge_and_mark_tool(self):
+        return MergeAndMarkBamsBamSorMaDup(bams=self.align_and_sort.out)
+
+
+class MolpathTumorOnlyCram_1_0_0(MolpathTumorOnly_1_0_0):
+    def id(self):
+        return "MolpathTumorOnlyWorkflowCram"
+
+    def friendly_name(self):
+        return "Molpath Tumor Only Workflow (cram output)"
+
+    def output_markdups_bam(self):
+        self.step(
+            "archive_bam",
+            ArchiveBamAsCram(bam=self.merge_and_mark.out, reference=self.reference),
+        )
+        self.output("markdups_cram", source=self.archive_bam.out, output_folder="BAM")
@@ -0,0 +1,65 @@
+from typing import List, Optional
+
+from janis_core import File, Array
+from janis_core.tool.tool import TOutput
+
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsPythonTool
+
+
+class ParseCutadaptAdaptorsLookup(BioinformaticsPythonTool):
+    @staticmethod
+    def code_block(cutadapt_adaptors_lookup: Optional[File]):
+        """
+        :param cutadapt_adaptors_lookup: Specifies a file which contains the list of adapter sequences which will
+            be explicity searched against the library. The file must contain sets of named adapters in
+            the form name[tab]sequence. Lines prefixed with a hash will be ignored.
+        """
+        if not cutadapt_adaptors_lookup:
+            return {"adaptor_sequences": []}
+
+        from sys import stderr
+
+        adaptor_sequences = []
+        with open(cutadapt_adaptors_lookup) as fp:
+            for row in fp:
+                st = row.strip()
+                if not st or st.startswith("#"):
+                    continue
+
+                # In reality, the format is $name[\t+]$seqence (more than one tab)
+                # so we'll just split on a tab, and remove all the empty elements.
+                split = [f for f in st.split("\t") if f]
+
+                # Invalid format for line, so skip it.
+                if len(split) != 2:
+                    print(
+                        f"Skipping cutadapt line '{st}' as irregular elements ({len(split)})",
+                        file=stderr,
+                    )
+                    continue
+
+                if split[1] not in adaptor_sequences:
+                    adaptor_sequences.append(split[1])
+
+        return {"adaptor_sequences": adaptor_sequences}
+
+    def outputs(self) -> List[TOutput]:
+        return [TOutput("adaptor_sequences", Array(str))]
+
+    def id(self) -> str:
+        return "ParseCutadaptAdaptorsLookup"
+
+    def friendly_name(self):
+        return "Parse Cutadapt Adaptors Lookup"
+
+    def version(self):
+        return "v0.1.0"
+
+    def tool_provider(self):
+        return "Peter MacCallum Cancer Centre"
+
+    def bind_metadata(self):
+        self.metadata.documentation = """\
+Parse the sequences (in the order they're listed) from a cutadapt adapters lookup, so it can be
+parsed once (eg: for a batch) and the sequences given to ParseFastqcAdaptors (v0.2.0)."""
+        self.metadata.version = "0.1.0"
@@ -0,0 +1,105 @@
+"""
+Each modification of this tool should duplicate this code
+"""
+
+from typing import List, Optional
+
+from janis_core import File, Array
+from janis_core.tool.tool import TOutput
+
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsPythonTool
+
+
+class ParseFastqcAdaptors_0_2_0(BioinformaticsPythonTool):
+    @staticmethod
+    def code_block(
+        fastqc_datafiles: List[File],
+        cutadapt_adaptor_sequences: Optional[List[str]] = None,
+    ):
+        """
+
+        :param fastqc_datafiles:
+
+        :param cutadapt_adaptor_sequences: The adapter sequences which will be explicitly searched against
+            the library (eg: the adaptor_sequences of ParseCutadaptAdaptorsLookup).
+        :return:
+        """
+        if not cutadapt_adaptor_sequences:
+            return {"adaptor_sequences": []}
+
+        import mmap, re, csv
+        from io import StringIO
+        from sys import stderr
+
+        def get_overrepresented_text(f):
+            """
+            Get the table "Overrepresented sequences" within the fastqc_data.txt
+            """
+            adapt_section_query = (
+                rb"(?s)>>Overrepresented sequences\t\S+\n(.*?)>>END_MODULE"
+            )
+            # fastqc_datafile could be fairly large, so we'll use mmap, and then
+            with open(f) as fd, mmap.mmap(
+                fd.fileno(), 0, access=mmap.ACCESS_READ
+            ) as fp:
+                overrepresented_sequences_match = re.search(adapt_section_query, fp)
+                if overrepresented_sequences_match is None:
+                    raise Exception(
+                        f"Couldn't find query ('{adapt_section_query.decode('utf8')}') in {f}"
+                    )
+
+                return overrepresented_sequences_match.groups()[0].decode("utf8")
+
+        def parse_tsv_table(tbl: str, skip_headers):
+            """
+            Parse a TSV table from a string using csvreader
+            """
+
+            rd = csv.reader(StringIO(tbl), delimiter="\t", quotechar='"')
+            ret = list(rd)
+            if len(ret) == 0:
+                return ret
+            if skip_headers:
+                ret.pop(0)  # discard headers
+            return ret
+
+        # Start doing the work
+        adaptor_ids = set()
+        for fastqcfile in fastqc_datafiles:
+            text = get_overrepresented_text(fastqcfile)
+            adaptor_ids = adaptor_ids.union(
+                set(a[0] for a in parse_tsv_table(text, skip_headers=True))
+            )
+
+        # in the order of the lookup, so the cutadapt command is the same between runs
+        adaptor_sequences = [s for s in cutadapt_adaptor_sequences if s in adaptor_ids]
+        for aid in adaptor_ids.difference(adaptor_sequences):
+            print(
+                f"Couldn't find a corresponding sequence for '{aid}' in lookup",
+                file=stderr,
+            )
+
+        return {"adaptor_sequences": adaptor_sequences}
+
+    def outputs(self) -> List[TOutput]:
+        return [TOutput("adaptor_sequences", Array(str))]
+
+    def id(self) -> str:
+        return "ParseFastqcAdaptors"
+
+    def friendly_name(self):
+        return "Parse FastQC Adaptors"
+
+    def version(self):
+        return "v0.2.0"
+
+    def tool_provider(self):
+        return "Peter MacCallum Cancer Centre"
+
+    def bind_metadata(self):
+        self.metadata.documentation = """\
+Parse overrepresented region and lookup in the Cutadapt sequences. Unlike v0.1.0, the lookup
+is given as the sequences (see ParseCutadaptAdaptorsLookup), so it's only parsed once for a batch."""
+        self.metadata.creator = "Michael Franklin"
+        self.metadata.dateCreated = "2020-01-07"
+        self.metadata.version = "0.2.0"
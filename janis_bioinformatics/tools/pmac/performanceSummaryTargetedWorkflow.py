@@ -37,10 +37,22 @@ class PerformanceSummaryTargeted_0_1_0(BioinformaticsWorkflow):
 
         # Inputs
         self.input("bam", BamBai)
-        self.input("genecoverage_bed", Bed)
-        self.input("region_bed", Bed)
+        self.input(
+            "genecoverage_bed",
+            Bed,
+            doc="Sorted in the same order as the genome_file (see PreparePanelBed)",
+        )
+        self.input(
+            "region_bed",
+            Bed,
+            doc="Sorted in the same order as the genome_file (see PreparePanelBed)",
+        )
         self.input("sample_name", String)
-        self.input("genome_file", TextFile)
+        self.input(
+            "genome_file",
+            TextFile,
+            doc="bedtools genome file, the bedtools steps run in the -sorted (chromsweep) mode",
+        )
         # Steps
         self.step(
             "gatk4collectinsertsizemetrics",
@@ -111,3 +123,6 @@ class PerformanceSummaryTargeted_0_1_0(BioinformaticsWorkflow):
         self.output("out", source=self.performancesummary.out)
         self.output("geneFileOut", source=self.genecoverage.geneFileOut)
         self.output("regionFileOut", source=self.genecoverage.regionFileOut)
+        # for MultiQC
+        self.output("flagstat", source=self.bamflagstat.out)
+        self.output("insertSizeMetrics", source=self.gatk4collectinsertsizemetrics.out)
@@ -0,0 +1,74 @@
+from janis_core import WorkflowMetadata
+
+# data types
+from janis_bioinformatics.data_types import Bed, FastaWithDict
+
+from janis_bioinformatics.tools import BioinformaticsWorkflow
+from janis_bioinformatics.tools.bedtools import (
+    BedToolsSortBedLatest,
+    BedToolsMergeBedLatest,
+)
+from janis_bioinformatics.tools.pmac.generatebedtoolscoveragegenomefile import (
+    GenerateGenomeFileForBedtoolsCoverage,
+)
+
+
+class PreparePanelBed_0_1_0(BioinformaticsWorkflow):
+    def id(self) -> str:
+        return "PreparePanelBed"
+
+    def friendly_name(self):
+        return "Prepare panel beds for bedtools (-sorted) coverage"
+
+    def tool_provider(self):
+        return "Peter MacCallum Cancer Centre"
+
+    def bind_metadata(self):
+        return WorkflowMetadata(
+            version="v0.1.0",
+            contributors=["Jiaan Yu"],
+            documentation="""\
+Run once per panel (not per sample): generate the bedtools genome file from the reference dict,
+and sort the panel beds into the same chromosome order as the reference. The region bed is also
+merged so overlapping targets aren't counted twice.
+
+The outputs can be given straight to PerformanceSummaryTargeted (and the Molpath workflows),
+where bedtools intersect / coverage run with -sorted -g genome_file, so coverage streams through
+the BAM once rather than loading the bed into memory for every sample.""",
+        )
+
+    def constructor(self):
+
+        self.input("reference", FastaWithDict)
+        self.input("region_bed", Bed)
+        self.input(
+            "genecoverage_bed",
+            Bed,
+            doc="Not merged, as the gene and region names (4th column) are required by GeneCovPerSample",
+        )
+
+        self.step(
+            "generate_genome_file",
+            GenerateGenomeFileForBedtoolsCoverage(reference=self.reference),
+        )
+
+        self.step(
+            "sort_region_bed",
+            BedToolsSortBedLatest(
+                inputBed=self.region_bed, genome=self.generate_genome_file.out
+            ),
+        )
+        self.step(
+            "merge_region_bed",
+            BedToolsMergeBedLatest(inputBed=self.sort_region_bed.out),
+        )
+        self.step(
+            "sort_genecoverage_bed",
+            BedToolsSortBedLatest(
+                inputBed=self.genecoverage_bed, genome=self.generate_genome_file.out
+            ),
+        )
+
+        self.output("genome_file", source=self.generate_genome_file.out)
+        self.output("sorted_region_bed", source=self.merge_region_bed.out)
+        self.output("sorted_genecoverage_bed", source=self.sort_genecoverage_bed.out)
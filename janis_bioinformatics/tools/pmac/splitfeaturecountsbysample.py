@@ -0,0 +1,84 @@
+from typing import Dict, List, Any
+
+from janis_core import TOutput, File, Array, OutputDocumentation
+from janis_unix import TextFile
+
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsPythonTool
+
+
+class SplitFeatureCountsBySample(BioinformaticsPythonTool):
+    @staticmethod
+    def code_block(counts: File, samples: List[str]) -> Dict[str, Any]:
+        """
+        :param counts: featureCounts output of many bams (one count column per bam)
+        :param samples: Sample names in the same order as the bams given to featureCounts
+        """
+        import os
+
+        # featureCounts: Geneid, Chr, Start, End, Strand, Length, <count per bam>
+        n_annotation_columns = 6
+
+        with open(counts) as inp:
+            comments = []
+            line = inp.readline()
+            while line.startswith("#"):
+                comments.append(line)
+                line = inp.readline()
+            header = line.rstrip("\n").split("\t")
+            n_samples = len(header) - n_annotation_columns
+            if n_samples != len(samples):
+                raise Exception(
+                    f"featureCounts has {n_samples} count columns, but {len(samples)} samples were given"
+                )
+
+            outs = [open(f"{s}.featureCounts.txt", "w+") for s in samples]
+            for idx, out in enumerate(outs):
+                out.writelines(comments)
+                out.write(
+                    "\t".join(
+                        header[:n_annotation_columns]
+                        + [header[n_annotation_columns + idx]]
+                    )
+                    + "\n"
+                )
+
+            for line in inp:
+                pieces = line.rstrip("\n").split("\t")
+                annotation = "\t".join(pieces[:n_annotation_columns])
+                for idx, out in enumerate(outs):
+                    out.write(f"{annotation}\t{pieces[n_annotation_columns + idx]}\n")
+
+        for out in outs:
+            out.close()
+
+        return {"out": [os.path.abspath(out.name) for out in outs]}
+
+    def outputs(self) -> List[TOutput]:
+        return [
+            TOutput(
+                "out",
+                Array(TextFile),
+                doc=OutputDocumentation(
+                    doc="Single sample featureCounts tables, in the same order as samples"
+                ),
+            )
+        ]
+
+    def id(self) -> str:
+        return "SplitFeatureCountsBySample"
+
+    def friendly_name(self) -> str:
+        return "Split featureCounts by sample"
+
+    def tool_provider(self):
+        return "Peter MacCallum Cancer Centre"
+
+    def version(self):
+        return "v0.1.0"
+
+    def bind_metadata(self):
+        self.metadata.contributors = ["Jiaan Yu"]
+        self.metadata.documentation = """\
+Split the featureCounts table of a batch (one count column per bam) into single sample tables,
+so generate_counts_for_allsorts.py can label each of them in one invocation.
+        """
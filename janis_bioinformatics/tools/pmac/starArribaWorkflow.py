@@ -1,8 +1,9 @@
 from janis_core import Array, Directory, File, String, WorkflowMetadata, StringFormatter
 
-from janis_bioinformatics.data_types import Fasta, FastqGzPair
+from janis_bioinformatics.data_types import Fasta, FastaFai, FastqGzPair
 
 from janis_bioinformatics.tools import BioinformaticsWorkflow
+from janis_bioinformatics.tools.common import ArchiveBamAsCram
 from janis_bioinformatics.tools.gatk4 import Gatk4SortSamLatest
 from janis_bioinformatics.tools.star import StarAlignReads_2_7_1
 from janis_bioinformatics.tools.suhrig import Arriba_1_2_0
@@ -22,6 +23,13 @@ class StarArriba_0_1_0(BioinformaticsWorkflow):
     def bind_metadata(self):
         return WorkflowMetadata(version="v0.1.0", contributors=["Jiaan Yu"])
 
+    def output_bam(self):
+        """
+        Outputs the sorted bam (sortsam.out), override this to archive it differently
+        (eg: StarArribaCram_0_1_0).
+        """
+        self.output("bam", source=self.sortsam.out, output_name=self.sampleName)
+
     def constructor(self):
         self.input("sampleName", String)
         self.input("reads", FastqGzPair)
@@ -94,7 +102,7 @@ class StarArriba_0_1_0(BioinformaticsWorkflow):
             ),
         )
 
-        self.output("bam", source=self.sortsam.out, output_name=self.sampleName)
+        self.output_bam()
         self.output(
             "out_fusion",
             source=self.arriba.out,
@@ -111,5 +119,25 @@ class StarArriba_0_1_0(BioinformaticsWorkflow):
         )
 
 
+class StarArribaCram_0_1_0(StarArriba_0_1_0):
+    def id(self) -> str:
+        return "starArribaCram"
+
+    def friendly_name(self):
+        return "Star Arriba Workflow (cram output)"
+
+    def output_bam(self):
+        self.input(
+            "cram_reference",
+            FastaFai,
+            doc="Reference (with .fai) of the genomeDir, the cram is compressed against it",
+        )
+        self.step(
+            "archive_bam",
+            ArchiveBamAsCram(bam=self.sortsam.out, reference=self.cram_reference),
+        )
+        self.output("cram", source=self.archive_bam.out, output_name=self.sampleName)
+
+
 if __name__ == "__main__":
     StarArriba_0_1_0.translate("cwl")
@@ -9,5 +9,18 @@ from .mpileup.versions import (
     SamToolsMpileupLatest,
 )
 from .sort.sort import SamToolsSort_1_7, SamToolsSort_1_9, SamToolsSortLatest
-from .view.view import SamToolsView_1_7, SamToolsView_1_9, SamToolsViewLatest
-from .index.versions import SamToolsIndex_1_7, SamToolsIndex_1_9, SamToolsIndexLatest
+from .view.view import (
+    SamToolsView_1_7,
+    SamToolsView_1_9,
+    SamToolsViewLatest,
+    SamToolsViewRegion_1_9,
+    SamToolsViewRegionLatest,
+)
+from .index.versions import (
+    SamToolsIndex_1_7,
+    SamToolsIndex_1_9,
+    SamToolsIndexLatest,
+    SamToolsIndexCsi_1_9,
+    SamToolsIndexCsiLatest,
+)
+from .cat.versions import SamToolsCat_1_7, SamToolsCat_1_9, SamToolsCatLatest
@@ -0,0 +1,69 @@
+from abc import ABC
+
+from janis_core import (
+    ToolInput,
+    ToolOutput,
+    Array,
+    File,
+    Filename,
+    InputSelector,
+)
+from janis_bioinformatics.data_types.bam import Bam
+from janis_bioinformatics.tools.samtools.samtoolstoolbase import SamToolsToolBase
+from janis_core import ToolMetadata
+
+
+class SamToolsCatBase(SamToolsToolBase, ABC):
+    def tool(self):
+        return "SamToolsCat"
+
+    @classmethod
+    def samtools_command(cls):
+        return "cat"
+
+    def inputs(self):
+        return [
+            ToolInput(
+                "bams",
+                Array(Bam),
+                position=10,
+                doc="Bams to concatenate, in order. They must share the same sequence dictionary.",
+            ),
+            ToolInput(
+                "outputFilename",
+                Filename(extension=".bam"),
+                prefix="-o",
+                position=5,
+                doc="Write the concatenated bam to this file",
+            ),
+            ToolInput(
+                "header",
+                File(optional=True),
+                prefix="-h",
+                position=5,
+                doc="Use the header in this SAM file, instead of the header of the first bam",
+            ),
+        ]
+
+    def outputs(self):
+        return [ToolOutput("out", Bam, glob=InputSelector("outputFilename"))]
+
+    def friendly_name(self):
+        return "SamTools: Cat"
+
+    def bind_metadata(self):
+        from datetime import date
+
+        return ToolMetadata(
+            contributors=["Jiaan Yu"],
+            dateCreated=date(2020, 7, 28),
+            dateUpdated=date(2020, 7, 28),
+            institution="Samtools",
+            doi=None,
+            citation=None,
+            keywords=["samtools", "cat"],
+            documentationUrl="http://www.htslib.org/doc/samtools-cat.html",
+            documentation="""Concatenate BAMs or CRAMs. Although this works on either BAM or CRAM, all input files must be the same format as each other. The sequence dictionary of each input file must be identical, although this command does not check this. This command uses a similar trick to reheader which enables fast BAM concatenation.
+
+As the BGZF blocks are copied (the records aren't decoded), the output is only coordinate sorted if the inputs are coordinate sorted and don't overlap (eg: shards of the same bam over ordered, disjoint intervals).""",
+        )
@@ -0,0 +1,14 @@
+from .base import SamToolsCatBase
+from ..samtools_1_7 import SamTools_1_7
+from ..samtools_1_9 import SamTools_1_9
+
+
+class SamToolsCat_1_7(SamTools_1_7, SamToolsCatBase):
+    pass
+
+
+class SamToolsCat_1_9(SamTools_1_9, SamToolsCatBase):
+    pass
+
+
+SamToolsCatLatest = SamToolsCat_1_9
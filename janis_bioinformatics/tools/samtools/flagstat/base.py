@@ -15,6 +15,7 @@ from janis_core import (
 from janis_unix import TextFile
 from janis_bioinformatics.data_types.bam import Bam
 from janis_bioinformatics.tools.samtools.samtoolstoolbase import SamToolsToolBase
+from janis_bioinformatics.utils.threads import additional_threads_argument
 from janis_core import ToolMetadata
 
 
@@ -32,12 +33,13 @@ class SamToolsFlagstatBase(SamToolsToolBase, ABC):
             ToolInput(
                 "threads",
                 Int(optional=True),
-                position=5,
-                prefix="-@",
-                doc="Number of BAM compression threads to use in addition to main thread [0].",
+                doc="(default: cores allocated - 1) Number of BAM compression threads to use in addition to main thread [0].",
             ),
         ]
 
+    def arguments(self):
+        return [additional_threads_argument("-@", position=5)]
+
     def outputs(self):
         return [ToolOutput("out", Stdout(TextFile))]
 
@@ -15,7 +15,7 @@ from janis_core import (
     InputSelector,
 )
 from janis_bioinformatics.data_types.bam import Bam
-from janis_bioinformatics.data_types import FastaWithDict
+from janis_bioinformatics.data_types import FastaFai
 from janis_bioinformatics.data_types import Sam
 from ..samtoolstoolbase import SamToolsToolBase
 from janis_core import ToolMetadata
@@ -36,7 +36,7 @@ class SamToolsViewBase(SamToolsToolBase, ABC):
             ToolInput("sam", Sam(), position=10),
             ToolInput(
                 "reference",
-                FastaWithDict(optional=True),
+                FastaFai(optional=True),
                 position=6,
                 prefix="-T",
                 doc="A FASTA format reference FILE, optionally compressed by bgzip and ideally indexed "
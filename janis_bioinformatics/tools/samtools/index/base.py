@@ -7,12 +7,12 @@ from janis_core import (
     ToolArgument,
     Int,
     InputSelector,
-    CpuSelector,
 )
 from janis_core import ToolMetadata
 
 from janis_bioinformatics.data_types.bam import Bam, BamBai
 from ..samtoolstoolbase import SamToolsToolBase
+from janis_bioinformatics.utils.threads import additional_threads_argument
 
 
 class SamToolsIndexBase(SamToolsToolBase, ABC):
@@ -31,9 +31,7 @@ class SamToolsIndexBase(SamToolsToolBase, ABC):
             ToolInput(
                 "threads",
                 Int(optional=True),
-                prefix="-@",
-                default=CpuSelector(),
-                position=10,
+                doc="(default: cores allocated - 1) Number of input/output compression threads to use in addition to main thread [0].",
             ),
         ]
 
@@ -58,6 +56,9 @@ class SamToolsIndexBase(SamToolsToolBase, ABC):
         return self.metadata
 
     def arguments(self):
-        return [ToolArgument("-b", position=4, doc="Output in the BAM format.")]
+        return [
+            ToolArgument("-b", position=4, doc="Output in the BAM format."),
+            additional_threads_argument("-@", position=5),
+        ]
 
     additional_inputs = []
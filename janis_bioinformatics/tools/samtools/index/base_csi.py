@@ -0,0 +1,41 @@
+from abc import ABC
+
+from janis_core import ToolInput, ToolOutput, ToolArgument, Int, InputSelector
+
+from janis_bioinformatics.data_types.bam import BamCsi
+from .base import SamToolsIndexBase
+from janis_bioinformatics.utils.threads import additional_threads_argument
+
+
+class SamToolsIndexCsiBase(SamToolsIndexBase, ABC):
+    def tool(self):
+        return "SamToolsIndexCsi"
+
+    def friendly_name(self):
+        return "SamTools: Index (CSI)"
+
+    def inputs(self):
+        return [
+            *super().inputs(),
+            ToolInput(
+                "minShift",
+                Int(optional=True),
+                prefix="-m",
+                position=5,
+                doc="Create a CSI index, with a minimum interval size of 2^INT [14]",
+            ),
+        ]
+
+    def outputs(self):
+        return [ToolOutput("out", BamCsi, glob=InputSelector("bam"))]
+
+    def arguments(self):
+        return [
+            ToolArgument(
+                "-c",
+                position=4,
+                doc="Create a CSI index, which (unlike the BAI) supports contigs "
+                "longer than 512 Mbp (2^29)",
+            ),
+            additional_threads_argument("-@", position=5),
+        ]
@@ -1,4 +1,5 @@
 from .base import SamToolsIndexBase
+from .base_csi import SamToolsIndexCsiBase
 from janis_bioinformatics.tools.samtools.samtools_1_9 import SamTools_1_9
 
 from janis_bioinformatics.tools.samtools.samtools_1_7 import SamTools_1_7
@@ -13,3 +14,10 @@ class SamToolsIndex_1_9(SamTools_1_9, SamToolsIndexBase):
 
 
 SamToolsIndexLatest = SamToolsIndex_1_9
+
+
+class SamToolsIndexCsi_1_9(SamTools_1_9, SamToolsIndexCsiBase):
+    pass
+
+
+SamToolsIndexCsiLatest = SamToolsIndexCsi_1_9
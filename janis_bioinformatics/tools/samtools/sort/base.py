@@ -10,6 +10,7 @@ from janis_core import (
     Array,
     InputSelector,
     WildcardSelector,
+    CpuSelector,
 )
 from janis_bioinformatics.data_types.bam import Bam
 from janis_bioinformatics.tools.samtools.samtoolstoolbase import SamToolsToolBase
@@ -162,6 +163,7 @@ When the -n option is not present, reads are sorted by reference (according to t
         ToolInput(
             "threads",
             Int(optional=True),
+            default=CpuSelector(),
             prefix="-@",
             doc="Set number of sorting and compression threads. By default, operation is single-threaded.",
         ),
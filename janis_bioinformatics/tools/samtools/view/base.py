@@ -16,9 +16,10 @@ from janis_core import (
     Array,
 )
 from janis_bioinformatics.data_types.bam import Bam
-from janis_bioinformatics.data_types import FastaWithDict
+from janis_bioinformatics.data_types import FastaFai
 from janis_bioinformatics.data_types import Sam
 from ..samtoolstoolbase import SamToolsToolBase
+from janis_bioinformatics.utils.threads import additional_threads_argument
 from janis_core import ToolMetadata
 
 
@@ -37,7 +38,7 @@ class SamToolsViewBase(SamToolsToolBase, ABC):
             ToolInput("sam", Sam(), position=10),
             ToolInput(
                 "reference",
-                FastaWithDict(optional=True),
+                FastaFai(optional=True),
                 position=6,
                 prefix="-T",
                 doc="A FASTA format reference FILE, optionally compressed by bgzip and ideally indexed "
@@ -100,6 +101,7 @@ Use of region specifications requires a coordinate-sorted and indexed input file
             ),
             ToolArgument("-h", position=3, doc="Include the header in the output."),
             ToolArgument("-b", position=4, doc="Output in the BAM format."),
+            additional_threads_argument("-@", position=5),
         ]
 
     additional_inputs = [
@@ -272,8 +274,6 @@ Use of region specifications requires a coordinate-sorted and indexed input file
         ToolInput(
             "threads",
             Int(optional=True),
-            position=5,
-            prefix="-@",
-            doc="Number of BAM compression threads to use in addition to main thread [0].",
+            doc="(default: cores allocated - 1) Number of BAM compression threads to use in addition to main thread [0].",
         ),
     ]
@@ -0,0 +1,31 @@
+from abc import ABC
+
+from janis_core import ToolInput
+
+from janis_bioinformatics.data_types import BamBai
+from .base import SamToolsViewBase
+
+
+class SamToolsViewRegionBase(SamToolsViewBase, ABC):
+    def tool(self):
+        return "SamToolsViewRegion"
+
+    def friendly_name(self):
+        return "SamTools: View (indexed regions)"
+
+    def inputs(self):
+        # the region lookup needs the index, so the input is an indexed bam (the .bai is
+        # localised with it) rather than any sam / bam
+        return [
+            (
+                ToolInput(
+                    "sam",
+                    BamBai(),
+                    position=10,
+                    doc="Coordinate sorted and indexed bam to slice to the regions",
+                )
+                if inp.id() == "sam"
+                else inp
+            )
+            for inp in super().inputs()
+        ]
@@ -1,4 +1,5 @@
 from .base import SamToolsViewBase
+from .base_region import SamToolsViewRegionBase
 from ..samtools_1_7 import SamTools_1_7
 from ..samtools_1_9 import SamTools_1_9
 
@@ -12,3 +13,10 @@ class SamToolsView_1_9(SamTools_1_9, SamToolsViewBase):
 
 
 SamToolsViewLatest = SamToolsView_1_9
+
+
+class SamToolsViewRegion_1_9(SamTools_1_9, SamToolsViewRegionBase):
+    pass
+
+
+SamToolsViewRegionLatest = SamToolsViewRegion_1_9
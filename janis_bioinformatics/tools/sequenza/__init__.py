@@ -8,3 +8,7 @@ from .seqz_binning.versions import (
     SequenzaBinning_3_0_0,
     SequenzaBinningLatest,
 )
+from .workflows.bam2seqzbychromosome import (
+    SequenzaBam2SeqzChromosome,
+    SequenzaBam2SeqzByChromosome,
+)
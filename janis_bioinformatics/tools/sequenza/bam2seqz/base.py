@@ -7,6 +7,8 @@ from janis_core import (
     ToolArgument,
     Boolean,
     Int,
+    String,
+    Array,
     Filename,
     InputSelector,
 )
@@ -55,6 +57,17 @@ class SeqzBam2SeqBase(SequenzaBase, ABC):
                 position=8,
                 doc="The reference FASTA file used to generate the intermediate pileup. Required when input are BAM",
             ),
+            ToolInput(
+                "chromosome",
+                Array(String(), optional=True),
+                prefix="--chromosome",
+                position=9,
+                doc="Argument to restrict the input/output to a chromosome or a chromosome region. "
+                "Coordinate format is Name:pos.start-pos.end, eg: chr17:7565097-7590856, for a particular "
+                "region; eg: chr17, for the entire chromosome. Chromosome names can checked in the BAM/pileup "
+                "files and are depending on the FASTA reference used for alignment. Default behaviour is to "
+                "not selecting any chromosome.",
+            ),
             ToolInput(
                 "output_filename",
                 Filename(extension=".gz"),
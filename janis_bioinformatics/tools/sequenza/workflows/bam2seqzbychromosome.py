@@ -0,0 +1,127 @@
+from janis_core import File, Int, String, Array
+
+from janis_bioinformatics.data_types import BamBai, FastaFai
+from janis_bioinformatics.tools import BioinformaticsWorkflow
+from janis_bioinformatics.tools.common import (
+    GenerateChromosomeList,
+    ConcatGzippedTables,
+)
+from janis_bioinformatics.tools.sequenza.bam2seqz.versions import (
+    SequenzaBam2Seqz_3_0_0 as SequenzaBam2Seqz,
+)
+from janis_bioinformatics.tools.sequenza.seqz_binning.versions import (
+    SequenzaBinning_3_0_0 as SequenzaBinning,
+)
+
+
+class SequenzaBam2SeqzChromosome(BioinformaticsWorkflow):
+    def id(self):
+        return "SequenzaBam2SeqzChromosome"
+
+    def friendly_name(self):
+        return "Sequenza: bam2seqz + binning (single chromosome)"
+
+    def tool_provider(self):
+        return "Sequenza"
+
+    def version(self):
+        return "3.0.0"
+
+    def constructor(self):
+
+        self.input("normal", BamBai)
+        self.input("tumour", BamBai)
+        self.input("wiggle_file", File)
+        self.input("fasta_reference", FastaFai)
+        self.input("chromosome", String)
+        self.input("window", Int, default=50)
+
+        # bam2seqz uses the BAI to only pileup the requested chromosome
+        self.step(
+            "bam2seqz",
+            SequenzaBam2Seqz(
+                normal=self.normal,
+                tumour=self.tumour,
+                wiggle_file=self.wiggle_file,
+                fasta_reference=self.fasta_reference,
+                chromosome=[self.chromosome],
+            ),
+        )
+        self.step(
+            "binning",
+            SequenzaBinning(seqz=self.bam2seqz.out, window=self.window),
+        )
+
+        self.output("out", source=self.binning.out)
+
+
+class SequenzaBam2SeqzByChromosome(BioinformaticsWorkflow):
+    def id(self):
+        return "SequenzaBam2SeqzByChromosome"
+
+    def friendly_name(self):
+        return "Sequenza: bam2seqz + binning (scattered by chromosome)"
+
+    def tool_provider(self):
+        return "Sequenza"
+
+    def version(self):
+        return "3.0.0"
+
+    def bind_metadata(self):
+        self.metadata.keywords = ["sequenza", "bam2seqz", "copy number", "scatter"]
+        self.metadata.documentation = """
+        Copy number preparation for Sequenza, parallelised by chromosome:
+
+        1. List the chromosomes from the reference index
+        2. For each chromosome, run bam2seqz (restricted with --chromosome) and seqz_binning
+        3. Concatenate the gzipped binned seqz files, keeping only the first header
+        """.strip()
+
+    def constructor(self):
+
+        self.input("normal", BamBai)
+        self.input("tumour", BamBai)
+        self.input("wiggle_file", File, doc="The GC-content wiggle file")
+        self.input("fasta_reference", FastaFai)
+        self.input(
+            "chromosomes",
+            Array(String, optional=True),
+            doc="Restrict the seqz to these chromosomes (eg: to skip alt / decoy contigs), "
+            "by default every contig in the reference is used",
+        )
+        self.input("window", Int, default=50)
+        self.input("output_filename", String, default="binned.seqz.gz")
+
+        self.step(
+            "chromosome_list",
+            GenerateChromosomeList(
+                reference=self.fasta_reference, restrict_to=self.chromosomes
+            ),
+        )
+
+        self.step(
+            "bam2seqz",
+            SequenzaBam2SeqzChromosome(
+                normal=self.normal,
+                tumour=self.tumour,
+                wiggle_file=self.wiggle_file,
+                fasta_reference=self.fasta_reference,
+                chromosome=self.chromosome_list.chromosomes,
+                window=self.window,
+            ),
+            scatter="chromosome",
+        )
+
+        self.step(
+            "concat",
+            ConcatGzippedTables(
+                files=self.bam2seqz.out, output_filename=self.output_filename
+            ),
+        )
+
+        self.output("out", source=self.concat.out)
+
+
+if __name__ == "__main__":
+    SequenzaBam2SeqzByChromosome().translate("wdl")
@@ -1,4 +1,5 @@
 from abc import ABC
+from typing import Dict, Any
 
 from janis_unix import TextFile
 from janis_core import (
@@ -13,11 +14,28 @@ from janis_core import (
     File,
     String,
     Float,
+    CpuSelector,
+    CaptureType,
+    get_value_for_hints_and_ordered_resource_tuple,
 )
 from janis_core import ToolMetadata
 from janis_bioinformatics.data_types import Bam
 from janis_bioinformatics.tools.subread.subreadtoolbase import SubreadToolBase
 
+CORES_TUPLE = [
+    (
+        CaptureType.key(),
+        {
+            CaptureType.TARGETED: 2,
+            CaptureType.EXOME: 4,
+            CaptureType.CHROMOSOME: 4,
+            CaptureType.THIRTYX: 8,
+            CaptureType.NINETYX: 8,
+            CaptureType.THREEHUNDREDX: 8,
+        },
+    )
+]
+
 
 class featureCountsBase(SubreadToolBase, ABC):
     def tool(self):
@@ -50,6 +68,12 @@ class featureCountsBase(SubreadToolBase, ABC):
             ),
         ]
 
+    def cpus(self, hints: Dict[str, Any]):
+        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        if val:
+            return val
+        return 4
+
     def outputs(self):
         return [ToolOutput("out", TextFile, glob=InputSelector("outputFilename"))]
 
@@ -276,8 +300,9 @@ This function assigns mapped sequencing reads to genomic features""".strip(),
         ToolInput(
             "threads",
             Int(optional=True),
+            default=CpuSelector(),
             prefix="-T",
-            doc="Number of the threads. 1 by default.",
+            doc="(default: cores allocated) Number of the threads. 1 by default.",
         ),
         ToolInput(
             "byReadGroup",
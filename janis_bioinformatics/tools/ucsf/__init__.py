@@ -1 +1,2 @@
 from .cnvkit.cnvkit_0_9_6 import CNVKit_0_9_6, CNVKitLatest
+from .cnvkit import *
@@ -0,0 +1,14 @@
+from .target.versions import CNVKitTarget_0_9_6, CNVKitTargetLatest
+from .antitarget.versions import CNVKitAntitarget_0_9_6, CNVKitAntitargetLatest
+from .coverage.versions import CNVKitCoverage_0_9_6, CNVKitCoverageLatest
+from .reference.versions import CNVKitReference_0_9_6, CNVKitReferenceLatest
+from .fix.versions import CNVKitFix_0_9_6, CNVKitFixLatest
+from .segment.versions import CNVKitSegment_0_9_6, CNVKitSegmentLatest
+from .call.versions import CNVKitCall_0_9_6, CNVKitCallLatest
+from .workflows.cnvkitcohort import (
+    CNVKitSampleCoverage,
+    CNVKitBuildReference,
+    CNVKitCallSample,
+    CNVKitCallSamples,
+    CNVKitCohort,
+)
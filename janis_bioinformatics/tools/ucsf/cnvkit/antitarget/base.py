@@ -0,0 +1,55 @@
+from abc import ABC
+
+from janis_core import ToolInput, ToolOutput, Int, Filename, InputSelector
+
+from janis_bioinformatics.data_types import Bed
+from janis_bioinformatics.tools.ucsf.cnvkit.cnvkittoolbase import CNVKitToolBase
+
+
+class CNVKitAntitargetBase(CNVKitToolBase, ABC):
+    def tool(self):
+        return "CNVKitAntitarget"
+
+    def friendly_name(self):
+        return "CNVKit: Antitarget"
+
+    @classmethod
+    def cnvkit_command(cls):
+        return "antitarget"
+
+    def inputs(self):
+        return [
+            ToolInput(
+                "targets",
+                Bed(),
+                position=1,
+                doc="BED or interval file listing the targeted regions.",
+            ),
+            ToolInput(
+                "outputFilename",
+                Filename(suffix=".antitarget", extension=".bed"),
+                prefix="--output",
+                doc="(-o) Output file name.",
+            ),
+            ToolInput(
+                "access",
+                Bed(optional=True),
+                prefix="--access",
+                doc="(-g) Regions of accessible sequence on chromosomes (.bed), as output by genome2access.py.",
+            ),
+            ToolInput(
+                "avgSize",
+                Int(optional=True),
+                prefix="--avg-size",
+                doc="(-a) Average size of antitarget bins (results are approximate). [Default: 150000]",
+            ),
+            ToolInput(
+                "minSize",
+                Int(optional=True),
+                prefix="--min-size",
+                doc="(-m) Minimum size of antitarget bins (smaller regions are dropped). [Default: 1/16 avg size, calculated]",
+            ),
+        ]
+
+    def outputs(self):
+        return [ToolOutput("out", Bed(), glob=InputSelector("outputFilename"))]
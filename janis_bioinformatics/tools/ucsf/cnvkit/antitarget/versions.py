@@ -0,0 +1,9 @@
+from janis_bioinformatics.tools.ucsf.cnvkit.cnvkit_0_9_6 import CNVKitVersion_0_9_6
+from .base import CNVKitAntitargetBase
+
+
+class CNVKitAntitarget_0_9_6(CNVKitVersion_0_9_6, CNVKitAntitargetBase):
+    pass
+
+
+CNVKitAntitargetLatest = CNVKitAntitarget_0_9_6
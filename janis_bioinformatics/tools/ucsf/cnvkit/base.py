@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List
 
-from janis_core import ToolOutput, ToolInput, Filename, File, String
+from janis_core import ToolOutput, ToolInput, Filename, File, String, Int, CpuSelector
 
 from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsTool
 
@@ -59,9 +59,10 @@ class CNVKitBase(BioinformaticsTool):
             ),
             ToolInput(
                 "processes",
-                String(optional=True),
+                Int(optional=True),
+                default=CpuSelector(),
                 prefix="--processes",
-                doc="(-p) [PROCESSES] Number of subprocesses used to running each of the BAM files in parallel. Without an argument, use the maximum number of available CPUs. [Default: process each BAM in serial]",
+                doc="(-p) [PROCESSES] (default: cores allocated) Number of subprocesses used to running each of the BAM files in parallel. Without an argument, use the maximum number of available CPUs. [Default: process each BAM in serial]",
             ),
             ToolInput(
                 "rscriptPath",
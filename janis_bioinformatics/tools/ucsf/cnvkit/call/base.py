@@ -0,0 +1,95 @@
+from abc import ABC
+
+from janis_core import (
+    ToolInput,
+    ToolOutput,
+    Boolean,
+    File,
+    Float,
+    Int,
+    String,
+    Filename,
+    InputSelector,
+)
+
+from janis_bioinformatics.data_types import Vcf
+from janis_bioinformatics.tools.ucsf.cnvkit.cnvkittoolbase import CNVKitToolBase
+
+
+class CNVKitCallBase(CNVKitToolBase, ABC):
+    def tool(self):
+        return "CNVKitCall"
+
+    def friendly_name(self):
+        return "CNVKit: Call"
+
+    @classmethod
+    def cnvkit_command(cls):
+        return "call"
+
+    def inputs(self):
+        return [
+            ToolInput(
+                "segments",
+                File(),
+                position=1,
+                doc="Copy ratios (.cnr or .cns) to call absolute copy numbers of.",
+            ),
+            ToolInput(
+                "outputFilename",
+                Filename(
+                    prefix=InputSelector("segments", remove_file_extension=True),
+                    suffix=".call",
+                    extension=".cns",
+                ),
+                prefix="--output",
+                doc="(-o) Output file name.",
+            ),
+            ToolInput(
+                "method",
+                String(optional=True),
+                prefix="--method",
+                doc="(-m) {threshold,clonal,none} Calling method. [Default: threshold]",
+            ),
+            ToolInput(
+                "center",
+                String(optional=True),
+                prefix="--center",
+                doc="{mean,median,mode,biweight} Re-center the log2 ratio values using this estimator of the center or average value.",
+            ),
+            ToolInput(
+                "purity",
+                Float(optional=True),
+                prefix="--purity",
+                doc="Estimated tumor cell fraction, a.k.a. purity or cellularity.",
+            ),
+            ToolInput(
+                "ploidy",
+                Int(optional=True),
+                prefix="--ploidy",
+                doc="Ploidy of the sample cells. [Default: 2]",
+            ),
+            ToolInput(
+                "vcf",
+                Vcf(optional=True),
+                prefix="--vcf",
+                doc="(-v) VCF file name containing variants for calculation of b-allele frequencies.",
+            ),
+            ToolInput(
+                "maleReference",
+                Boolean(optional=True),
+                prefix="--male-reference",
+                doc="(-y) Assume inputs were normalized to a male reference (i.e. female samples "
+                "will have +1 log-coverage of chrX; otherwise male samples would have -1 chrX).",
+            ),
+            ToolInput(
+                "dropLowCoverage",
+                Boolean(optional=True),
+                prefix="--drop-low-coverage",
+                doc="Drop very-low-coverage bins before segmentation to avoid false-positive "
+                "deletions in poor-quality tumor samples.",
+            ),
+        ]
+
+    def outputs(self):
+        return [ToolOutput("out", File(), glob=InputSelector("outputFilename"))]
@@ -1,7 +1,7 @@
 from janis_bioinformatics.tools.ucsf.cnvkit.base import CNVKitBase
 
 
-class CNVKit_0_9_6(CNVKitBase):
+class CNVKitVersion_0_9_6:
     def container(self):
         return "etal/cnvkit:0.9.6"
 
@@ -9,4 +9,8 @@ class CNVKit_0_9_6(CNVKitBase):
         return "0.9.6"
 
 
+class CNVKit_0_9_6(CNVKitVersion_0_9_6, CNVKitBase):
+    pass
+
+
 CNVKitLatest = CNVKit_0_9_6
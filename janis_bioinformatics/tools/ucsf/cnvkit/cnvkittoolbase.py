@@ -0,0 +1,58 @@
+from abc import ABC, abstractmethod
+
+from janis_bioinformatics.tools import BioinformaticsTool
+
+
+class CNVKitToolBase(BioinformaticsTool, ABC):
+    def tool_provider(self):
+        return "UCSF"
+
+    @classmethod
+    @abstractmethod
+    def cnvkit_command(cls):
+        raise Exception(
+            "Subclass must implement the cnvkit_command method: expects one of: ["
+            "   batch, target, access, antitarget, autobin, coverage, reference, "
+            "   fix, segment, call, diagram, scatter, heatmap, export"
+            "]"
+        )
+
+    @classmethod
+    def base_command(cls):
+        return ["cnvkit.py", cls.cnvkit_command()]
+
+    def inputs(self):
+        return []
+
+    def arguments(self):
+        return []
+
+    def doc(self):
+        return """
+    A command-line toolkit and Python library for detecting copy number variants 
+    and alterations genome-wide from high-throughput sequencing.
+
+    Documentation: https://cnvkit.readthedocs.io/en/stable/pipeline.html""".strip()
+
+    def bind_metadata(self):
+        from datetime import date
+
+        self.metadata.dateCreated = date(2019, 7, 3)
+        self.metadata.documentationUrl = (
+            "https://cnvkit.readthedocs.io/en/stable/pipeline.html"
+        )
+        self.metadata.doi = "10.1371/journal.pcbi.1004873"
+        self.metadata.citation = (
+            "Talevich, E., Shain, A.H., Botton, T., & Bastian, B.C. (2014). "
+            "CNVkit: Genome-wide copy number detection and visualization from targeted "
+            "sequencing. PLOS Computational Biology 12(4):e1004873"
+        )
+
+    @abstractmethod
+    def container(self):
+        raise Exception(
+            "An error likely occurred when resolving the method order for docker for the cnvkit classes "
+            "or you're trying to execute the docker method of the base class (ie, don't do that). "
+            "The method order resolution must preference cnvkit subclasses, "
+            "and the subclass must contain a definition for docker."
+        )
@@ -0,0 +1,84 @@
+from abc import ABC
+from typing import Dict, Any
+
+from janis_core import (
+    ToolInput,
+    ToolOutput,
+    Boolean,
+    File,
+    Int,
+    Filename,
+    InputSelector,
+    CpuSelector,
+)
+
+from janis_bioinformatics.data_types import BamBai, Bed, FastaFai
+from janis_bioinformatics.tools.ucsf.cnvkit.cnvkittoolbase import CNVKitToolBase
+
+
+class CNVKitCoverageBase(CNVKitToolBase, ABC):
+    def tool(self):
+        return "CNVKitCoverage"
+
+    def friendly_name(self):
+        return "CNVKit: Coverage"
+
+    @classmethod
+    def cnvkit_command(cls):
+        return "coverage"
+
+    def cpus(self, hints: Dict[str, Any]):
+        return 4
+
+    def memory(self, hints: Dict[str, Any]):
+        return 8
+
+    def inputs(self):
+        return [
+            ToolInput("bam", BamBai(), position=1, doc="Mapped sequence reads (.bam)"),
+            ToolInput(
+                "interval",
+                Bed(),
+                position=2,
+                doc="Intervals (.bed or .list), the (anti)target bins for this coverage",
+            ),
+            ToolInput(
+                "outputFilename",
+                Filename(
+                    prefix=InputSelector("bam", remove_file_extension=True),
+                    extension=".cnn",
+                ),
+                prefix="--output",
+                doc="(-o) Output file name.",
+            ),
+            ToolInput(
+                "fasta",
+                FastaFai(optional=True),
+                prefix="--fasta",
+                doc="(-f) Reference genome, FASTA format (e.g. UCSC hg19.fa)",
+            ),
+            ToolInput(
+                "count",
+                Boolean(optional=True),
+                prefix="--count",
+                doc="(-c) Get read depths by counting read midpoints within each bin. "
+                "(An alternative algorithm).",
+            ),
+            ToolInput(
+                "minMapq",
+                Int(optional=True),
+                prefix="--min-mapq",
+                doc="(-q) Minimum mapping quality score (phred scale 0-60) to count a read for coverage depth. [Default: 0]",
+            ),
+            ToolInput(
+                "processes",
+                Int(optional=True),
+                default=CpuSelector(),
+                prefix="--processes",
+                doc="(-p) Number of subprocesses to calculate coverage in parallel. "
+                "Without an argument, use the maximum number of available CPUs. [Default: use 1 process]",
+            ),
+        ]
+
+    def outputs(self):
+        return [ToolOutput("out", File(), glob=InputSelector("outputFilename"))]
@@ -0,0 +1,9 @@
+from janis_bioinformatics.tools.ucsf.cnvkit.cnvkit_0_9_6 import CNVKitVersion_0_9_6
+from .base import CNVKitCoverageBase
+
+
+class CNVKitCoverage_0_9_6(CNVKitVersion_0_9_6, CNVKitCoverageBase):
+    pass
+
+
+CNVKitCoverageLatest = CNVKitCoverage_0_9_6
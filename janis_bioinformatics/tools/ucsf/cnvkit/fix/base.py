@@ -0,0 +1,77 @@
+from abc import ABC
+
+from janis_core import (
+    ToolInput,
+    ToolOutput,
+    Boolean,
+    File,
+    String,
+    Filename,
+    InputSelector,
+)
+
+from janis_bioinformatics.tools.ucsf.cnvkit.cnvkittoolbase import CNVKitToolBase
+
+
+class CNVKitFixBase(CNVKitToolBase, ABC):
+    def tool(self):
+        return "CNVKitFix"
+
+    def friendly_name(self):
+        return "CNVKit: Fix"
+
+    @classmethod
+    def cnvkit_command(cls):
+        return "fix"
+
+    def inputs(self):
+        return [
+            ToolInput(
+                "targetCoverage",
+                File(),
+                position=1,
+                doc="Target coverage file (.targetcoverage.cnn).",
+            ),
+            ToolInput(
+                "antitargetCoverage",
+                File(),
+                position=2,
+                doc="Antitarget coverage file (.antitargetcoverage.cnn).",
+            ),
+            ToolInput(
+                "reference", File(), position=3, doc="Reference coverage (.cnn)."
+            ),
+            ToolInput(
+                "outputFilename",
+                Filename(prefix=InputSelector("sampleId"), extension=".cnr"),
+                prefix="--output",
+                doc="(-o) Output file name.",
+            ),
+            ToolInput(
+                "sampleId",
+                String(optional=True),
+                prefix="--sample-id",
+                doc="(-i) Sample ID for target/antitarget files. Otherwise inferred from file names.",
+            ),
+            ToolInput(
+                "noGc",
+                Boolean(optional=True),
+                prefix="--no-gc",
+                doc="Skip GC correction.",
+            ),
+            ToolInput(
+                "noEdge",
+                Boolean(optional=True),
+                prefix="--no-edge",
+                doc="Skip edge-effect correction.",
+            ),
+            ToolInput(
+                "noRmask",
+                Boolean(optional=True),
+                prefix="--no-rmask",
+                doc="Skip RepeatMasker correction.",
+            ),
+        ]
+
+    def outputs(self):
+        return [ToolOutput("out", File(), glob=InputSelector("outputFilename"))]
@@ -0,0 +1,101 @@
+from abc import ABC
+from typing import Dict, Any
+
+from janis_core import (
+    ToolInput,
+    ToolOutput,
+    Array,
+    Boolean,
+    File,
+    Filename,
+    InputSelector,
+)
+
+from janis_bioinformatics.data_types import Bed, FastaFai
+from janis_bioinformatics.tools.ucsf.cnvkit.cnvkittoolbase import CNVKitToolBase
+
+
+class CNVKitReferenceBase(CNVKitToolBase, ABC):
+    def tool(self):
+        return "CNVKitReference"
+
+    def friendly_name(self):
+        return "CNVKit: Reference"
+
+    @classmethod
+    def cnvkit_command(cls):
+        return "reference"
+
+    def memory(self, hints: Dict[str, Any]):
+        return 8
+
+    def inputs(self):
+        return [
+            ToolInput(
+                "targetCoverages",
+                Array(File(), optional=True),
+                position=1,
+                doc="Normal-sample target .cnn files. If omitted (with antitargetCoverages), "
+                "a 'flat' reference is built from the targets and antitargets.",
+            ),
+            ToolInput(
+                "antitargetCoverages",
+                Array(File(), optional=True),
+                position=2,
+                doc="Normal-sample antitarget .cnn files, cnvkit pairs these with the target "
+                "coverages by filename (the name must contain 'antitarget').",
+            ),
+            ToolInput(
+                "outputFilename",
+                Filename(suffix=".reference", extension=".cnn"),
+                prefix="--output",
+                doc="(-o) Output file name.",
+            ),
+            ToolInput(
+                "fasta",
+                FastaFai(optional=True),
+                prefix="--fasta",
+                doc="(-f) Reference genome, FASTA format (e.g. UCSC hg19.fa)",
+            ),
+            ToolInput(
+                "targets",
+                Bed(optional=True),
+                prefix="--targets",
+                doc="(-t) Target intervals (.bed or .list), only used for a flat reference",
+            ),
+            ToolInput(
+                "antitargets",
+                Bed(optional=True),
+                prefix="--antitargets",
+                doc="(-a) Antitarget intervals (.bed or .list), only used for a flat reference",
+            ),
+            ToolInput(
+                "maleReference",
+                Boolean(optional=True),
+                prefix="--male-reference",
+                doc="(-y) Create a male reference: shift female samples' chrX log-coverage by -1, "
+                "so the reference chrX average is -1. Otherwise, shift male samples' chrX by +1, "
+                "so the reference chrX average is 0.",
+            ),
+            ToolInput(
+                "noGc",
+                Boolean(optional=True),
+                prefix="--no-gc",
+                doc="Skip GC correction.",
+            ),
+            ToolInput(
+                "noEdge",
+                Boolean(optional=True),
+                prefix="--no-edge",
+                doc="Skip edge-effect correction.",
+            ),
+            ToolInput(
+                "noRmask",
+                Boolean(optional=True),
+                prefix="--no-rmask",
+                doc="Skip RepeatMasker correction.",
+            ),
+        ]
+
+    def outputs(self):
+        return [ToolOutput("out", File(), glob=InputSelector("outputFilename"))]
@@ -0,0 +1,9 @@
+from janis_bioinformatics.tools.ucsf.cnvkit.cnvkit_0_9_6 import CNVKitVersion_0_9_6
+from .base import CNVKitReferenceBase
+
+
+class CNVKitReference_0_9_6(CNVKitVersion_0_9_6, CNVKitReferenceBase):
+    pass
+
+
+CNVKitReferenceLatest = CNVKitReference_0_9_6
@@ -0,0 +1,90 @@
+from abc import ABC
+from typing import Dict, Any
+
+from janis_core import (
+    ToolInput,
+    ToolOutput,
+    Boolean,
+    File,
+    Float,
+    Int,
+    String,
+    Filename,
+    InputSelector,
+    CpuSelector,
+)
+
+from janis_bioinformatics.tools.ucsf.cnvkit.cnvkittoolbase import CNVKitToolBase
+
+
+class CNVKitSegmentBase(CNVKitToolBase, ABC):
+    def tool(self):
+        return "CNVKitSegment"
+
+    def friendly_name(self):
+        return "CNVKit: Segment"
+
+    @classmethod
+    def cnvkit_command(cls):
+        return "segment"
+
+    def cpus(self, hints: Dict[str, Any]):
+        return 4
+
+    def inputs(self):
+        return [
+            ToolInput(
+                "copyRatios",
+                File(),
+                position=1,
+                doc="Bin-level log2 ratios (.cnr file).",
+            ),
+            ToolInput(
+                "outputFilename",
+                Filename(
+                    prefix=InputSelector("copyRatios", remove_file_extension=True),
+                    extension=".cns",
+                ),
+                prefix="--output",
+                doc="(-o) Output file name.",
+            ),
+            ToolInput(
+                "method",
+                String(optional=True),
+                prefix="--method",
+                doc="(-m) {cbs,flasso,haar,none,hmm,hmm-tumor,hmm-germline} Segmentation method "
+                "(see docs), or 'none' for chromosome arm-level averages as segments. [Default: cbs]",
+            ),
+            ToolInput(
+                "threshold",
+                Float(optional=True),
+                prefix="--threshold",
+                doc="(-t) Significance threshold (p-value or FDR, depending on method) to accept "
+                "breakpoints during segmentation. For HMM methods, this is the smoothing window size.",
+            ),
+            ToolInput(
+                "dropLowCoverage",
+                Boolean(optional=True),
+                prefix="--drop-low-coverage",
+                doc="Drop very-low-coverage bins before segmentation to avoid false-positive "
+                "deletions in poor-quality tumor samples.",
+            ),
+            ToolInput(
+                "dropOutliers",
+                Int(optional=True),
+                prefix="--drop-outliers",
+                doc="Drop outlier bins more than this many multiples of the 95th quantile away "
+                "from the average within a rolling window. Set to 0 for no outlier filtering. [Default: 10]",
+            ),
+            ToolInput(
+                "processes",
+                Int(optional=True),
+                default=CpuSelector(),
+                prefix="--processes",
+                doc="(-p) Number of subprocesses to segment in parallel. "
+                "Give 0 or a negative value to use the maximum number of available CPUs. [Default: use 1 process]",
+            ),
+        ]
+
+    def outputs(self):
+        return [ToolOutput("out", File(), glob=InputSelector("outputFilename"))]
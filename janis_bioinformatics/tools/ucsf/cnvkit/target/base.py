@@ -0,0 +1,71 @@
+from abc import ABC
+
+from janis_core import (
+    ToolInput,
+    ToolOutput,
+    Boolean,
+    File,
+    Int,
+    Filename,
+    InputSelector,
+)
+
+from janis_bioinformatics.data_types import Bed
+from janis_bioinformatics.tools.ucsf.cnvkit.cnvkittoolbase import CNVKitToolBase
+
+
+class CNVKitTargetBase(CNVKitToolBase, ABC):
+    def tool(self):
+        return "CNVKitTarget"
+
+    def friendly_name(self):
+        return "CNVKit: Target"
+
+    @classmethod
+    def cnvkit_command(cls):
+        return "target"
+
+    def inputs(self):
+        return [
+            ToolInput(
+                "interval",
+                Bed(),
+                position=1,
+                doc="BED or interval file listing the targeted regions.",
+            ),
+            ToolInput(
+                "outputFilename",
+                Filename(suffix=".target", extension=".bed"),
+                prefix="--output",
+                doc="(-o) Output file name.",
+            ),
+            ToolInput(
+                "annotate",
+                File(optional=True),
+                prefix="--annotate",
+                doc="Use gene models from this file to assign names to the target regions. "
+                "Format: UCSC refFlat.txt or ensFlat.txt file (preferred), or BED, interval list, "
+                "GFF, or similar.",
+            ),
+            ToolInput(
+                "shortNames",
+                Boolean(optional=True),
+                prefix="--short-names",
+                doc="Reduce multi-accession bait labels to be short and consistent.",
+            ),
+            ToolInput(
+                "split",
+                Boolean(optional=True),
+                prefix="--split",
+                doc="Split large tiled intervals into smaller, consecutive targets.",
+            ),
+            ToolInput(
+                "avgSize",
+                Int(optional=True),
+                prefix="--avg-size",
+                doc="(-a) Average size of split target bins (results are approximate). [Default: 266.7]",
+            ),
+        ]
+
+    def outputs(self):
+        return [ToolOutput("out", Bed(), glob=InputSelector("outputFilename"))]
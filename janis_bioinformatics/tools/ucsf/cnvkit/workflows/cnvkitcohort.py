@@ -0,0 +1,309 @@
+from janis_core import Array, Boolean, File, String
+
+from janis_bioinformatics.data_types import BamBai, Bed, FastaFai
+from janis_bioinformatics.tools import BioinformaticsWorkflow
+from janis_bioinformatics.tools.ucsf.cnvkit.antitarget.versions import (
+    CNVKitAntitarget_0_9_6 as CNVKitAntitarget,
+)
+from janis_bioinformatics.tools.ucsf.cnvkit.call.versions import (
+    CNVKitCall_0_9_6 as CNVKitCall,
+)
+from janis_bioinformatics.tools.ucsf.cnvkit.coverage.versions import (
+    CNVKitCoverage_0_9_6 as CNVKitCoverage,
+)
+from janis_bioinformatics.tools.ucsf.cnvkit.fix.versions import (
+    CNVKitFix_0_9_6 as CNVKitFix,
+)
+from janis_bioinformatics.tools.ucsf.cnvkit.reference.versions import (
+    CNVKitReference_0_9_6 as CNVKitReference,
+)
+from janis_bioinformatics.tools.ucsf.cnvkit.segment.versions import (
+    CNVKitSegment_0_9_6 as CNVKitSegment,
+)
+from janis_bioinformatics.tools.ucsf.cnvkit.target.versions import (
+    CNVKitTarget_0_9_6 as CNVKitTarget,
+)
+
+
+class CNVKitSampleCoverage(BioinformaticsWorkflow):
+    def id(self):
+        return "CNVKitSampleCoverage"
+
+    def friendly_name(self):
+        return "CNVKit: target and antitarget coverage"
+
+    def tool_provider(self):
+        return "UCSF"
+
+    def version(self):
+        return "0.9.6"
+
+    def constructor(self):
+
+        self.input("bam", BamBai)
+        self.input("targets", Bed)
+        self.input("antitargets", Bed)
+        self.input("fasta", FastaFai(optional=True))
+
+        # cnvkit reference tells the target and antitarget coverages apart by filename
+        self.step(
+            "target_coverage",
+            CNVKitCoverage(
+                bam=self.bam,
+                interval=self.targets,
+                fasta=self.fasta,
+                outputFilename="targetcoverage.cnn",
+            ),
+        )
+        self.step(
+            "antitarget_coverage",
+            CNVKitCoverage(
+                bam=self.bam,
+                interval=self.antitargets,
+                fasta=self.fasta,
+                outputFilename="antitargetcoverage.cnn",
+            ),
+        )
+
+        self.output("target", source=self.target_coverage.out)
+        self.output("antitarget", source=self.antitarget_coverage.out)
+
+
+class CNVKitBuildReference(BioinformaticsWorkflow):
+    def id(self):
+        return "CNVKitBuildReference"
+
+    def friendly_name(self):
+        return "CNVKit: build pooled normal reference"
+
+    def tool_provider(self):
+        return "UCSF"
+
+    def version(self):
+        return "0.9.6"
+
+    def bind_metadata(self):
+        self.metadata.documentation = """
+        Build the (anti)target bins and a pooled reference from a panel of normals, once.
+        The outputs (targets, antitargets, reference) can be kept and given to CNVKitCallSamples
+        for every subsequent batch that uses the same panel.
+        """.strip()
+
+    def constructor(self):
+
+        self.input("normal_bams", Array(BamBai))
+        self.input("baits", Bed, doc="BED of the targeted (bait) regions")
+        self.input("fasta", FastaFai)
+        self.input(
+            "access",
+            Bed(optional=True),
+            doc="Regions of accessible sequence on chromosomes (from cnvkit.py access)",
+        )
+        self.input("annotate", File(optional=True), doc="refFlat.txt to name targets")
+        self.input("male_reference", Boolean(optional=True))
+
+        self.step(
+            "target",
+            CNVKitTarget(interval=self.baits, annotate=self.annotate, split=True),
+        )
+        self.step(
+            "antitarget", CNVKitAntitarget(targets=self.target.out, access=self.access)
+        )
+
+        self.step(
+            "coverage",
+            CNVKitSampleCoverage(
+                bam=self.normal_bams,
+                targets=self.target.out,
+                antitargets=self.antitarget.out,
+                fasta=self.fasta,
+            ),
+            scatter="bam",
+        )
+
+        self.step(
+            "pool_reference",
+            CNVKitReference(
+                targetCoverages=self.coverage.target,
+                antitargetCoverages=self.coverage.antitarget,
+                fasta=self.fasta,
+                maleReference=self.male_reference,
+            ),
+        )
+
+        self.output("targets", source=self.target.out)
+        self.output("antitargets", source=self.antitarget.out)
+        self.output("reference", source=self.pool_reference.out)
+
+
+class CNVKitCallSample(BioinformaticsWorkflow):
+    def id(self):
+        return "CNVKitCallSample"
+
+    def friendly_name(self):
+        return "CNVKit: call sample against reference"
+
+    def tool_provider(self):
+        return "UCSF"
+
+    def version(self):
+        return "0.9.6"
+
+    def constructor(self):
+
+        self.input("sample_name", String)
+        self.input("bam", BamBai)
+        self.input("targets", Bed)
+        self.input("antitargets", Bed)
+        self.input("reference", File)
+        self.input("fasta", FastaFai(optional=True))
+        self.input("male_reference", Boolean(optional=True))
+
+        self.step(
+            "coverage",
+            CNVKitSampleCoverage(
+                bam=self.bam,
+                targets=self.targets,
+                antitargets=self.antitargets,
+                fasta=self.fasta,
+            ),
+        )
+        self.step(
+            "fix",
+            CNVKitFix(
+                targetCoverage=self.coverage.target,
+                antitargetCoverage=self.coverage.antitarget,
+                reference=self.reference,
+                sampleId=self.sample_name,
+            ),
+        )
+        self.step("segment", CNVKitSegment(copyRatios=self.fix.out))
+        self.step(
+            "call_cnv",
+            CNVKitCall(segments=self.segment.out, maleReference=self.male_reference),
+        )
+
+        self.output("copy_ratios", source=self.fix.out)
+        self.output("segments", source=self.segment.out)
+        self.output("calls", source=self.call_cnv.out)
+
+
+class CNVKitCallSamples(BioinformaticsWorkflow):
+    def id(self):
+        return "CNVKitCallSamples"
+
+    def friendly_name(self):
+        return "CNVKit: call samples against a prebuilt reference"
+
+    def tool_provider(self):
+        return "UCSF"
+
+    def version(self):
+        return "0.9.6"
+
+    def bind_metadata(self):
+        self.metadata.documentation = """
+        Coverage, fix, segment and call for each tumour (in parallel) against a cached
+        reference built by CNVKitBuildReference.
+        """.strip()
+
+    def constructor(self):
+
+        self.input("sample_names", Array(String))
+        self.input("bams", Array(BamBai))
+        self.input("targets", Bed)
+        self.input("antitargets", Bed)
+        self.input("reference", File, doc="Pooled reference (.cnn)")
+        self.input("fasta", FastaFai(optional=True))
+        self.input("male_reference", Boolean(optional=True))
+
+        self.step(
+            "call_sample",
+            CNVKitCallSample(
+                sample_name=self.sample_names,
+                bam=self.bams,
+                targets=self.targets,
+                antitargets=self.antitargets,
+                reference=self.reference,
+                fasta=self.fasta,
+                male_reference=self.male_reference,
+            ),
+            scatter=["sample_name", "bam"],
+        )
+
+        self.output("copy_ratios", source=self.call_sample.copy_ratios)
+        self.output("segments", source=self.call_sample.segments)
+        self.output("calls", source=self.call_sample.calls)
+
+
+class CNVKitCohort(BioinformaticsWorkflow):
+    def id(self):
+        return "CNVKitCohort"
+
+    def friendly_name(self):
+        return "CNVKit: cohort (batch) workflow"
+
+    def tool_provider(self):
+        return "UCSF"
+
+    def version(self):
+        return "0.9.6"
+
+    def bind_metadata(self):
+        self.metadata.keywords = ["cnvkit", "copy number", "cohort", "scatter"]
+        self.metadata.documentation = """
+        Multi-sample equivalent of `cnvkit.py batch`:
+
+        1. Build the target / antitarget bins and the pooled normal reference once
+        2. For each tumour (in parallel): coverage, fix, segment and call against that reference
+
+        The reference is also an output, so later batches on the same panel can skip
+        straight to CNVKitCallSamples.
+        """.strip()
+
+    def constructor(self):
+
+        self.input("tumour_names", Array(String))
+        self.input("tumour_bams", Array(BamBai))
+        self.input("normal_bams", Array(BamBai))
+        self.input("baits", Bed)
+        self.input("fasta", FastaFai)
+        self.input("access", Bed(optional=True))
+        self.input("annotate", File(optional=True))
+        self.input("male_reference", Boolean(optional=True))
+
+        self.step(
+            "build_reference",
+            CNVKitBuildReference(
+                normal_bams=self.normal_bams,
+                baits=self.baits,
+                fasta=self.fasta,
+                access=self.access,
+                annotate=self.annotate,
+                male_reference=self.male_reference,
+            ),
+        )
+
+        self.step(
+            "call_samples",
+            CNVKitCallSamples(
+                sample_names=self.tumour_names,
+                bams=self.tumour_bams,
+                targets=self.build_reference.targets,
+                antitargets=self.build_reference.antitargets,
+                reference=self.build_reference.reference,
+                fasta=self.fasta,
+                male_reference=self.male_reference,
+            ),
+        )
+
+        self.output("reference", source=self.build_reference.reference)
+        self.output("targets", source=self.build_reference.targets)
+        self.output("antitargets", source=self.build_reference.antitargets)
+        self.output("copy_ratios", source=self.call_samples.copy_ratios)
+        self.output("segments", source=self.call_samples.segments)
+        self.output("calls", source=self.call_samples.calls)
+
+
+if __name__ == "__main__":
+    CNVKitCohort().translate("wdl")
@@ -11,6 +11,7 @@ from janis_core import (
     ToolOutput,
     Array,
     ToolMetadata,
+    CpuSelector,
 )
 
 from janis_bioinformatics.tools import BioinformaticsTool
@@ -47,7 +48,13 @@ TOPHRED64: Convert quality scores to Phred-64
 """,
             ),
             ToolInput("sampleName", String, doc="Used to name the output"),
-            ToolInput("threads", Int(optional=True), prefix="-threads", position=2),
+            ToolInput(
+                "threads",
+                Int(optional=True),
+                default=CpuSelector(),
+                prefix="-threads",
+                position=2,
+            ),
             ToolInput(
                 "phred33",
                 Boolean(optional=True),
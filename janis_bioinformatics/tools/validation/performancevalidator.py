@@ -2,7 +2,7 @@ from janis_bioinformatics.tools import BioinformaticsWorkflow
 from janis_core import Array, Boolean
 from janis_bioinformatics.data_types import Vcf, VcfIdx
 from janis_bioinformatics.tools.gatk4 import Gatk4GenotypeConcordanceLatest
-from janis_bioinformatics.tools.htslib import BGZip_1_2_1, Tabix_1_2_1
+from janis_bioinformatics.tools.htslib import BgzipTabix_1_2_1
 
 
 class PerformanceValidator_1_2_1(BioinformaticsWorkflow):
@@ -12,12 +12,11 @@ class PerformanceValidator_1_2_1(BioinformaticsWorkflow):
         self.input("truth", VcfIdx)
         self.input("intervals", Array(Vcf()))
 
-        self.step("bgzip", BGZip_1_2_1(file=self.vcf))
-        self.step("tabix", Tabix_1_2_1(file=self.bgzip))
+        self.step("tabix", BgzipTabix_1_2_1(file=self.vcf))
         self.step(
             "genotypeConcord",
             Gatk4GenotypeConcordanceLatest(
-                callVCF=self.tabix,
+                callVCF=self.tabix.out,
                 truthVCF=self.truth,
                 intervals=self.intervals,
                 treatMissingSitesAsHomeRef=True,
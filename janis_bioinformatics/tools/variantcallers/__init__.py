@@ -4,3 +4,8 @@ from .vardictgermline_variants import VardictGermlineVariantCaller
 from .gridssgermline import GridssGermlineVariantCaller
 from .vardictsomatic_variants import VardictSomaticVariantCaller
 from .gatk import *
+from .freebayesgermline_cohort import (
+    FreeBayesGermlineCohortVariantCaller,
+    FreeBayesGermlineCohortVariantCallerBcf,
+    FreeBayesGermlineCohortVariantCallerCsi,
+)
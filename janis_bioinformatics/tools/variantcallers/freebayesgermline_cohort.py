@@ -0,0 +1,164 @@
+from janis_core import Array, File, Int
+
+from janis_bioinformatics.data_types import BamBai, BamCsi, Bed, FastaFai
+from janis_bioinformatics.tools import BioinformaticsWorkflow
+from janis_bioinformatics.tools.bcftools import (
+    BcfToolsConcatLatest,
+    BcfToolsConcatBcfLatest,
+    BcfToolsTextVcfToBcfLatest,
+    BcfToolsBcfToVcfLatest,
+)
+from janis_bioinformatics.tools.common import (
+    ConcatTextTables,
+    CreateBalancedCallRegions,
+)
+from janis_bioinformatics.tools.freebayes import (
+    FreeBayesTimed_1_3,
+    FreeBayesTimedCsi_1_3,
+)
+from janis_bioinformatics.tools.htslib import BGZipLatest, TabixLatest
+
+
+class FreeBayesGermlineCohortVariantCaller(BioinformaticsWorkflow):
+    def id(self):
+        return "FreeBayesGermlineCohortVariantCaller"
+
+    def friendly_name(self):
+        return "FreeBayes Germline Cohort Variant Caller"
+
+    def tool_provider(self):
+        return "Variant Callers"
+
+    def version(self):
+        return "v0.1.0"
+
+    def bind_metadata(self):
+        self.metadata.keywords = [
+            "variants",
+            "freebayes",
+            "germline",
+            "joint calling",
+            "multi sample",
+        ]
+        self.metadata.documentation = """
+        Joint germline calling of a cohort (eg: a family or trio) with freebayes. The reference is
+        split into balanced call regions (leaving out the blacklist), and freebayes is run on each
+        region across all of the samples in parallel. The regions are planned in reference order, so
+        the compressed region VCFs are concatenated (in order) into a sorted VCF.
+
+        The time taken by each region is recorded in region_timings, give this back as
+        previous_region_timings on the next run (with the same reference) to balance the regions
+        on run time.
+        """.strip()
+
+    def keep_intermediates_as_bcf(self):
+        """
+        Convert each region straight to BCF, and concatenate these as BCF (which isn't
+        parsed as text again), the final VCF is only written (and tabix indexed) once.
+        """
+        return False
+
+    def csi_indexed(self):
+        """
+        The bams are CSI (instead of BAI) indexed, the BAI can't index the contigs
+        longer than 512 Mbp (2^29) of some plant and amphibian genomes.
+        """
+        return False
+
+    def constructor(self):
+
+        self.input("bams", Array(BamCsi if self.csi_indexed() else BamBai))
+        self.input("reference", FastaFai)
+        self.input("region_size", Int, default=10000000)
+        self.input(
+            "blacklist",
+            Bed(optional=True),
+            doc="Regions (eg: high-depth / collapsed repeats) that are not called at all",
+        )
+        self.input(
+            "previous_region_timings",
+            File(optional=True),
+            doc="region_timings output of a previous run, used to rebalance the call regions",
+        )
+        # freebayes sums the coverage over all of the samples at a position, so this should be
+        # scaled by the number of bams (eg: 3 bams at 30x, 3 * 100 = 300)
+        self.input(
+            "skip_cov",
+            Int(optional=True),
+            doc="Skip regions where the coverage (summed over all samples) is above this, "
+            "so collapsed repeats don't stall a region",
+        )
+
+        self.step(
+            "create_regions",
+            CreateBalancedCallRegions(
+                reference=self.reference,
+                regionSize=self.region_size,
+                blacklist=self.blacklist,
+                regionTimings=self.previous_region_timings,
+            ),
+        )
+
+        freebayes = FreeBayesTimedCsi_1_3 if self.csi_indexed() else FreeBayesTimed_1_3
+        self.step(
+            "freebayes",
+            freebayes(
+                bams=self.bams,
+                reference=self.reference,
+                region=self.create_regions.regions,
+                skipCov=self.skip_cov,
+                strictFlag=True,
+                gtQuals=True,
+            ),
+            scatter="region",
+        )
+
+        if self.keep_intermediates_as_bcf():
+            self.step(
+                "compress",
+                BcfToolsTextVcfToBcfLatest(vcf=self.freebayes.out),
+                scatter="vcf",
+            )
+            self.step("concat", BcfToolsConcatBcfLatest(vcf=self.compress.out))
+            # converted (and tabix indexed) back to a VCF once, from the concatenated BCF
+            self.step("bcf_to_vcf", BcfToolsBcfToVcfLatest(vcf=self.concat.out))
+            vcf = self.bcf_to_vcf.out
+        else:
+            self.step("compress", BGZipLatest(file=self.freebayes.out), scatter="file")
+            self.step("concat", BcfToolsConcatLatest(vcf=self.compress.out))
+            self.step("tabix", TabixLatest(inp=self.concat.out))
+            vcf = self.tabix.out
+
+        self.step(
+            "merge_timings",
+            ConcatTextTables(
+                files=self.freebayes.timing,
+                output_filename="region_timings.tsv",
+                headerLines=0,
+            ),
+        )
+
+        self.output("out", source=vcf)
+        self.output("region_timings", source=self.merge_timings.out)
+
+
+class FreeBayesGermlineCohortVariantCallerBcf(FreeBayesGermlineCohortVariantCaller):
+    def id(self):
+        return "FreeBayesGermlineCohortVariantCallerBcf"
+
+    def friendly_name(self):
+        return "FreeBayes Germline Cohort Variant Caller (BCF intermediates)"
+
+    def keep_intermediates_as_bcf(self):
+        return True
+
+
+class FreeBayesGermlineCohortVariantCallerCsi(FreeBayesGermlineCohortVariantCaller):
+    def id(self):
+        return "FreeBayesGermlineCohortVariantCallerCsi"
+
+    def friendly_name(self):
+        return "FreeBayes Germline Cohort Variant Caller (CSI indexed bams)"
+
+    def csi_indexed(self):
+        return True
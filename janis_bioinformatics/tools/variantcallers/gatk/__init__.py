@@ -4,3 +4,8 @@ from .gatksomatic_variants_4_0_12 import GatkSomaticVariantCaller_4_0_12
 from .gatksomatic_variants_4_1_3 import GatkSomaticVariantCaller_4_1_3
 from .gatksomatic_variants_paired import GatkSomaticVariantCallerPairedTargeted
 from .gatksomatic_variants_single import GatkSomaticVariantCallerTumorOnlyTargeted
+from .gatkcnnfilter_variants_4_1_3 import GatkCNNFilterVariants_4_1_3
+from .gatkjointgenotyping_4_1_3 import (
+    GatkJointGenotypingShard_4_1_3,
+    GatkJointGenotyping_4_1_3,
+)
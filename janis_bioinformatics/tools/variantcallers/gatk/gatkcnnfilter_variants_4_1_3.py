@@ -0,0 +1,101 @@
+from janis_core import Array, Int, Double
+
+from janis_bioinformatics.data_types import FastaWithDict, BamBai, VcfTabix, Bed
+from janis_bioinformatics.tools import BioinformaticsWorkflow
+from janis_bioinformatics.tools.bcftools import BcfToolsViewLatest, BcfToolsConcatLatest
+from janis_bioinformatics.tools.gatk4 import (
+    Gatk4CNNScoreVariants_4_1_3,
+    Gatk4FilterVariantTranches_4_1_3,
+)
+from janis_bioinformatics.tools.htslib import TabixLatest
+
+
+class GatkCNNFilterVariants_4_1_3(BioinformaticsWorkflow):
+    def id(self):
+        return "GATK4_CNNFilterVariants"
+
+    def friendly_name(self):
+        return "GATK4 CNN Filter Variants"
+
+    def tool_provider(self):
+        return "Variant Callers"
+
+    def bind_metadata(self):
+        self.metadata.version = "4.1.3.0"
+        self.metadata.keywords = ["variants", "gatk", "gatk4", "cnn", "filter"]
+        self.metadata.documentation = """
+        Score the (HaplotypeCaller) variants with the 2D (read tensor) CNN, and filter them on the tranches
+        of the scores at the known sites (resources).
+
+        1. Split the VCF into the interval shards (on the variant's start, so each variant is in one shard)
+        2. CNNScoreVariants on each shard (the reads are taken from the indexed bam around each variant)
+        3. Concatenate the scored shards (in order)
+        4. FilterVariantTranches, once, on the whole VCF as the tranches are computed from all the scores
+
+        The tensorflow intra-op threads default to the allocated CPUs. The batch sizes can't be derived from
+        the CPUs, the defaults (8 inferred per batch, 32 queued) suit 2D tensors on 4-8 CPUs, keep the
+        transfer batch a multiple of the inference batch when changing them.
+                """.strip()
+
+    def constructor(self):
+
+        self.input("vcf", VcfTabix)
+        self.input(
+            "bam",
+            BamBai,
+            doc="Reads the variants were called from (the HaplotypeCaller bamout is best)",
+        )
+        self.input("reference", FastaWithDict)
+        self.input(
+            "intervals",
+            Array(Bed),
+            doc="Non-overlapping interval shards, in reference order "
+            "(eg: SplitBedByContig or GenerateExonIntervalShards)",
+        )
+        self.input(
+            "resources",
+            Array(VcfTabix),
+            doc="Known sites (eg: hapmap, mills and 1000G snps) for FilterVariantTranches",
+        )
+        self.input("inference_batch_size", Int, default=8)
+        self.input("transfer_batch_size", Int, default=32)
+        self.input("snp_tranche", Double(optional=True))
+        self.input("indel_tranche", Double(optional=True))
+
+        self.step(
+            "split_vcf",
+            BcfToolsViewLatest(file=self.vcf, targetsFile=self.intervals),
+            scatter="targetsFile",
+        )
+        self.step("index_shard", TabixLatest(inp=self.split_vcf.out), scatter="inp")
+        self.step(
+            "cnn_score",
+            Gatk4CNNScoreVariants_4_1_3(
+                variant=self.index_shard.out,
+                inp=self.bam,
+                reference=self.reference,
+                tensorType="read_tensor",
+                inferenceBatchSize=self.inference_batch_size,
+                transferBatchSize=self.transfer_batch_size,
+            ),
+            scatter="variant",
+        )
+        self.step("concat", BcfToolsConcatLatest(vcf=self.cnn_score.out))
+        self.step("index_scored", TabixLatest(inp=self.concat.out))
+        self.step(
+            "filter_tranches",
+            Gatk4FilterVariantTranches_4_1_3(
+                variant=self.index_scored.out,
+                resource=self.resources,
+                infoKey="CNN_2D",
+                snpTranche=self.snp_tranche,
+                indelTranche=self.indel_tranche,
+            ),
+        )
+
+        self.output("scored", source=self.index_scored.out)
+        self.output("out", source=self.filter_tranches.out)
+
+
+if __name__ == "__main__":
+    GatkCNNFilterVariants_4_1_3().translate("wdl", to_console=True)
@@ -1,9 +1,11 @@
 from datetime import date
 
+from janis_core import String
 from janis_bioinformatics.tools import gatk4
 from janis_bioinformatics.data_types import FastaWithDict, BamBai, VcfTabix, Bed
 from janis_bioinformatics.tools import BioinformaticsWorkflow
 from janis_bioinformatics.tools.common import SplitMultiAlleleNormaliseVcf
+from janis_bioinformatics.tools.gatk4.outputtier import OUTPUT_TIER_DOC, OutputTier
 from janis_bioinformatics.tools.pmac import AddBamStatsGermline_0_1_0
 
 
@@ -48,6 +50,7 @@ class GatkGermlineVariantCaller_4_0_12(BioinformaticsWorkflow):
         self.input("snps_1000gp", VcfTabix)
         self.input("known_indels", VcfTabix)
         self.input("mills_indels", VcfTabix)
+        self.input("output_tier", OutputTier, default="standard", doc=OUTPUT_TIER_DOC)
 
         # self.step(
         #     "split_bam",
@@ -84,6 +87,7 @@ class GatkGermlineVariantCaller_4_0_12(BioinformaticsWorkflow):
                 reference=self.reference,
                 dbsnp=self.snps_dbsnp,
                 pairHmmImplementation="LOGLESS_CACHING",
+                outputTier=self.output_tier,
             ),
         )
         self.step(
@@ -101,6 +105,14 @@ class GatkGermlineVariantCaller_4_0_12(BioinformaticsWorkflow):
 
         self.output("variants", source=self.haplotype_caller.out)
         self.output("out_bam", source=self.haplotype_caller.bam)
+        self.output(
+            "out_assembly_regions",
+            source=self.haplotype_caller.assemblyRegions,
+        )
+        self.output(
+            "out_activity_profile",
+            source=self.haplotype_caller.activityProfile,
+        )
         self.output("out", source=self.addbamstats.out)
 
 
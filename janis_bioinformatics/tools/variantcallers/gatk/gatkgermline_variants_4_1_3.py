@@ -1,10 +1,12 @@
 from datetime import date
 
+from janis_core import String
 from janis_unix.tools import UncompressArchive
 from janis_bioinformatics.tools import gatk4
 from janis_bioinformatics.data_types import FastaWithDict, BamBai, VcfTabix, Bed
 from janis_bioinformatics.tools import BioinformaticsWorkflow
 from janis_bioinformatics.tools.common import SplitMultiAllele
+from janis_bioinformatics.tools.gatk4.outputtier import OUTPUT_TIER_DOC, OutputTier
 
 
 class GatkGermlineVariantCaller_4_1_3(BioinformaticsWorkflow):
@@ -45,6 +47,7 @@ class GatkGermlineVariantCaller_4_1_3(BioinformaticsWorkflow):
         )
         self.input("reference", FastaWithDict)
         self.input("snps_dbsnp", VcfTabix)
+        self.input("output_tier", OutputTier, default="standard", doc=OUTPUT_TIER_DOC)
 
         self.step(
             "split_bam",
@@ -59,6 +62,7 @@ class GatkGermlineVariantCaller_4_1_3(BioinformaticsWorkflow):
                 reference=self.reference,
                 dbsnp=self.snps_dbsnp,
                 pairHmmImplementation="LOGLESS_CACHING",
+                outputTier=self.output_tier,
             ),
         )
         self.step("uncompressvcf", UncompressArchive(file=self.haplotype_caller.out))
@@ -69,6 +73,14 @@ class GatkGermlineVariantCaller_4_1_3(BioinformaticsWorkflow):
 
         self.output("variants", source=self.haplotype_caller.out)
         self.output("out_bam", source=self.haplotype_caller.bam)
+        self.output(
+            "out_assembly_regions",
+            source=self.haplotype_caller.assemblyRegions,
+        )
+        self.output(
+            "out_activity_profile",
+            source=self.haplotype_caller.activityProfile,
+        )
         self.output("out", source=self.splitnormalisevcf.out)
 
 
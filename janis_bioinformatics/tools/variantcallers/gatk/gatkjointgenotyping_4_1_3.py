@@ -0,0 +1,162 @@
+from janis_core import Array, Int
+
+from janis_bioinformatics.data_types import FastaWithDict, BamBai, VcfTabix, Bed
+from janis_bioinformatics.tools import BioinformaticsWorkflow
+from janis_bioinformatics.tools.bcftools import BcfToolsConcatLatest
+from janis_bioinformatics.tools.gatk4 import (
+    Gatk4HaplotypeCallerGvcf_4_1_3,
+    Gatk4GenomicsDBImport_4_1_3,
+    Gatk4GenotypeGVCFs_4_1_3,
+)
+from janis_bioinformatics.tools.htslib import TabixLatest
+
+
+class GatkJointGenotypingShard_4_1_3(BioinformaticsWorkflow):
+    def id(self):
+        return "GATK4_JointGenotypingShard"
+
+    def friendly_name(self):
+        return "GATK4 Joint Genotyping (one interval shard)"
+
+    def tool_provider(self):
+        return "Variant Callers"
+
+    def bind_metadata(self):
+        self.metadata.version = "4.1.3.0"
+        self.metadata.keywords = [
+            "variants",
+            "gatk",
+            "gatk4",
+            "gvcf",
+            "joint genotyping",
+        ]
+        self.metadata.documentation = """
+        Joint genotype the cohort in one interval shard: HaplotypeCaller (GVCF) for each sample,
+        GenomicsDBImport of the sample GVCFs, then GenotypeGVCFs from the workspace.
+                """.strip()
+
+    def constructor(self):
+
+        self.input("bams", Array(BamBai))
+        self.input("reference", FastaWithDict)
+        self.input("interval", Bed)
+        self.input("dbsnp", VcfTabix(optional=True))
+        self.input("batch_size", Int(optional=True))
+        self.input(
+            "reader_threads",
+            Int(optional=True),
+            doc="GenomicsDBImport --reader-threads, only set this when the interval is a "
+            "single contiguous region",
+        )
+
+        self.step(
+            "haplotype_caller",
+            Gatk4HaplotypeCallerGvcf_4_1_3(
+                inputRead=self.bams,
+                reference=self.reference,
+                intervals=self.interval,
+                dbsnp=self.dbsnp,
+            ),
+            scatter="inputRead",
+        )
+        self.step(
+            "genomicsdbimport",
+            Gatk4GenomicsDBImport_4_1_3(
+                gvcfs=self.haplotype_caller.out,
+                intervals=self.interval,
+                batchSize=self.batch_size,
+                readerThreads=self.reader_threads,
+                mergeInputIntervals=True,
+                tmpDir=".",
+            ),
+        )
+        self.step(
+            "genotype_gvcfs",
+            Gatk4GenotypeGVCFs_4_1_3(
+                workspace=self.genomicsdbimport.out,
+                reference=self.reference,
+                intervals=self.interval,
+                dbsnp=self.dbsnp,
+                onlyOutputCallsStartingInIntervals=True,
+                tmpDir=".",
+            ),
+        )
+
+        self.output("gvcfs", source=self.haplotype_caller.out)
+        self.output("out", source=self.genotype_gvcfs.out)
+
+
+class GatkJointGenotyping_4_1_3(BioinformaticsWorkflow):
+    def id(self):
+        return "GATK4_JointGenotyping"
+
+    def friendly_name(self):
+        return "GATK4 Joint Genotyping"
+
+    def tool_provider(self):
+        return "Variant Callers"
+
+    def bind_metadata(self):
+        self.metadata.version = "4.1.3.0"
+        self.metadata.keywords = [
+            "variants",
+            "gatk",
+            "gatk4",
+            "gvcf",
+            "joint genotyping",
+        ]
+        self.metadata.documentation = """
+        Joint genotype a cohort, scattered by interval shard:
+
+        1. HaplotypeCaller in GVCF mode, for each sample in each shard
+        2. GenomicsDBImport of the shard's GVCFs (the intervals of the shard are merged, so each
+           shard is one GenomicsDB partition rather than one per interval)
+        3. GenotypeGVCFs from the shard's workspace (only the calls that start in the shard)
+        4. Concatenate the genotyped shards (in order) and index
+
+        The batch size bounds the number of GVCFs GenomicsDBImport holds open (and in memory) at
+        once, 50 is the GATK recommendation for large cohorts. More than one reader thread only helps
+        when the GVCFs are on a high latency (eg: network) filesystem.
+                """.strip()
+
+    def constructor(self):
+
+        self.input("bams", Array(BamBai))
+        self.input("reference", FastaWithDict)
+        self.input(
+            "intervals",
+            Array(Bed),
+            doc="Non-overlapping interval shards, in reference order "
+            "(eg: SplitBedByContig or GenerateExonIntervalShards)",
+        )
+        self.input("dbsnp", VcfTabix(optional=True))
+        self.input("genomicsdb_batch_size", Int, default=50)
+        self.input(
+            "genomicsdb_reader_threads",
+            Int(optional=True),
+            doc="GenomicsDBImport --reader-threads (default: 1), GATK only reads with more than "
+            "one thread when a shard is a single interval, so only set this when it is (eg: "
+            "not with GenerateExonIntervalShards, whose shards have many)",
+        )
+
+        self.step(
+            "joint_genotype",
+            GatkJointGenotypingShard_4_1_3(
+                bams=self.bams,
+                reference=self.reference,
+                interval=self.intervals,
+                dbsnp=self.dbsnp,
+                batch_size=self.genomicsdb_batch_size,
+                reader_threads=self.genomicsdb_reader_threads,
+            ),
+            scatter="interval",
+        )
+        self.step("concat", BcfToolsConcatLatest(vcf=self.joint_genotype.out))
+        self.step("index", TabixLatest(inp=self.concat.out))
+
+        self.output("gvcfs", source=self.joint_genotype.gvcfs)
+        self.output("out", source=self.index.out)
+
+
+if __name__ == "__main__":
+    GatkJointGenotyping_4_1_3().translate("wdl", to_console=True)
@@ -6,6 +6,7 @@ from janis_bioinformatics.tools import gatk4
 from janis_bioinformatics.data_types import FastaWithDict, BamBai, VcfTabix, Bed
 from janis_bioinformatics.tools import BioinformaticsWorkflow
 from janis_bioinformatics.tools.common import SplitMultiAllele
+from janis_bioinformatics.tools.gatk4.outputtier import OUTPUT_TIER_DOC, OutputTier
 from janis_bioinformatics.tools.htslib import BGZipLatest, TabixLatest
 from janis_bioinformatics.tools.vcftools import VcfToolsvcftoolsLatest
 
@@ -34,6 +35,7 @@ class GatkSomaticVariantCaller_4_1_3(BioinformaticsWorkflow):
         self.input("reference", FastaWithDict)
         self.input("gnomad", VcfTabix)
         self.input("panel_of_normals", VcfTabix(optional=True))
+        self.input("output_tier", OutputTier, default="standard", doc=OUTPUT_TIER_DOC)
 
         # split normal and tumor bam
         self.step(
@@ -56,6 +58,7 @@ class GatkSomaticVariantCaller_4_1_3(BioinformaticsWorkflow):
                 reference=self.reference,
                 germlineResource=self.gnomad,
                 panelOfNormals=self.panel_of_normals,
+                outputTier=self.output_tier,
             ),
         )
         self.step(
@@ -110,6 +113,8 @@ class GatkSomaticVariantCaller_4_1_3(BioinformaticsWorkflow):
 
         self.output("variants", source=self.filtermutect2calls.out)
         self.output("out_bam", source=self.mutect2.bam)
+        self.output("out_assembly_regions", source=self.mutect2.assemblyRegions)
+        self.output("out_activity_profile", source=self.mutect2.activityProfile)
         self.output("out", source=self.filterpass.out)
 
     @staticmethod
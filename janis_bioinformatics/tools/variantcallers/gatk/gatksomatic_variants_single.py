@@ -1,7 +1,9 @@
 from datetime import date
 
+from janis_core import String
 from janis_bioinformatics.tools import gatk4
 from janis_bioinformatics.tools.common import SplitMultiAlleleNormaliseVcf
+from janis_bioinformatics.tools.gatk4.outputtier import OUTPUT_TIER_DOC, OutputTier
 from janis_bioinformatics.data_types import FastaWithDict, BamBai, VcfTabix, Bed
 from janis_bioinformatics.tools import BioinformaticsWorkflow
 
@@ -31,7 +33,7 @@ class GatkSomaticVariantCallerTumorOnlyTargeted(BioinformaticsWorkflow):
 
         It has the following steps:
 
-        1. Mutect2 (output: vcf, bam, f1r2.tar.gz)
+        1. Mutect2 (output: vcf, f1r2.tar.gz, and the bamout in the debug output_tier)
         2. LearnOrientationModel
         3. GetPileupSummaries
         4. CalculateContamination
@@ -51,6 +53,7 @@ class GatkSomaticVariantCallerTumorOnlyTargeted(BioinformaticsWorkflow):
         self.input("reference", FastaWithDict)
         self.input("gnomad", VcfTabix)
         self.input("panel_of_normals", VcfTabix(optional=True))
+        self.input("output_tier", OutputTier, default="standard", doc=OUTPUT_TIER_DOC)
 
         # variant calling + learn read orientation model
         self.step(
@@ -61,6 +64,7 @@ class GatkSomaticVariantCallerTumorOnlyTargeted(BioinformaticsWorkflow):
                 reference=self.reference,
                 panelOfNormals=self.panel_of_normals,
                 germlineResource=self.gnomad,
+                outputTier=self.output_tier,
             ),
         )
         self.step(
@@ -106,4 +110,6 @@ class GatkSomaticVariantCallerTumorOnlyTargeted(BioinformaticsWorkflow):
 
         self.output("variants", source=self.mutect2.out)
         self.output("out_bam", source=self.mutect2.bam)
+        self.output("out_assembly_regions", source=self.mutect2.assemblyRegions)
+        self.output("out_activity_profile", source=self.mutect2.activityProfile)
         self.output("out", source=self.splitnormalisevcf.out)
@@ -1,6 +1,6 @@
 from janis_core import String, Logger, Array
 
-from janis_bioinformatics.data_types import FastaWithDict, BamBai, Bed
+from janis_bioinformatics.data_types import FastaWithIndexes, BamBai, Bed
 from janis_bioinformatics.tools import BioinformaticsWorkflow
 from janis_bioinformatics.tools.papenfuss import Gridss_2_5_1, Gridss_2_6_2
 from janis_bioinformatics.tools.samtools import SamToolsView_1_7
@@ -19,7 +19,7 @@ class GridssGermlineVariantCaller(BioinformaticsWorkflow):
     def constructor(self):
 
         self.input("bam", BamBai)
-        self.input("reference", FastaWithDict)
+        self.input("reference", FastaWithIndexes)
         self.input("blacklist", Bed)
 
         # Steps
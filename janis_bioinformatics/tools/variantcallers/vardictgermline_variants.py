@@ -5,7 +5,7 @@ from janis_bioinformatics.data_types import FastaWithDict, BamBai, Bed
 from janis_bioinformatics.tools import BioinformaticsWorkflow
 from janis_bioinformatics.tools.bcftools import BcfToolsAnnotate_1_5
 from janis_bioinformatics.tools.common import SplitMultiAllele
-from janis_bioinformatics.tools.htslib import BGZipLatest, TabixLatest
+from janis_bioinformatics.tools.htslib import BgzipTabixLatest
 from janis_bioinformatics.tools.vardict import VarDictGermline_1_6_0
 from janis_bioinformatics.tools.pmac.trimiupac.versions import TrimIUPAC_0_0_5
 from janis_bioinformatics.tools.vcftools import VcfToolsvcftoolsLatest
@@ -56,8 +56,7 @@ class VardictGermlineVariantCaller(BioinformaticsWorkflow):
             "annotate",
             BcfToolsAnnotate_1_5(vcf=self.vardict.out, headerLines=self.header_lines),
         )
-        self.step("compressvcf", BGZipLatest(file=self.annotate.out, stdout=True))
-        self.step("tabixvcf", TabixLatest(inp=self.compressvcf.out))
+        self.step("tabixvcf", BgzipTabixLatest(file=self.annotate.out))
 
         self.step(
             "splitnormalisevcf",
@@ -3,7 +3,7 @@ from abc import ABC
 from janis_core import ToolInput, Int, ToolOutput, Stdout
 from janis_core import ToolMetadata
 
-from janis_bioinformatics.data_types import FastaWithDict, CompressedVcf
+from janis_bioinformatics.data_types import FastaFai, CompressedVcf
 from janis_bioinformatics.data_types import Vcf
 from janis_bioinformatics.tools.vcflib.vcflibtoolbase import VcfLibToolBase
 
@@ -34,9 +34,7 @@ class VcfRocBase(VcfLibToolBase, ABC):
                 default=30,
                 doc="compare records up to this many bp away (default 30)",
             ),
-            ToolInput(
-                "reference", FastaWithDict, prefix="-r", doc="FASTA reference file"
-            ),
+            ToolInput("reference", FastaFai, prefix="-r", doc="FASTA reference file"),
         ]
 
     def outputs(self):
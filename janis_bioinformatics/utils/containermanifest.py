@@ -0,0 +1,101 @@
+import argparse
+import json
+import sys
+from collections import OrderedDict
+from importlib import import_module
+from typing import Dict, List, Any, Tuple
+
+from janis_core import Tool, ToolType
+
+
+def split_image(image: str) -> Tuple[str, str]:
+    """
+    Split a container into its repository and tag (or digest), the registry
+    (and its port) stay in the repository: 'host:5000/gatk:4.1.3.0' -> ('host:5000/gatk', '4.1.3.0')
+    """
+    if "@" in image:
+        repository, digest = image.split("@", 1)
+        return repository, digest
+    repository, _, tag = image.rpartition(":")
+    if not repository or "/" in tag:
+        return image, "latest"
+    return repository, tag
+
+
+def container_manifest(tool: Tool) -> List[Dict[str, Any]]:
+    """
+    Walk the steps of a workflow (into its subworkflows) and return every container
+    it will use (once), with the steps that use it. A step in a scatter (or in a
+    scattered subworkflow) fans out to one job per element, 'scattered_steps' is
+    the number of these, as the image is pulled by all of them at once.
+    """
+    manifest: Dict[str, Dict[str, Any]] = OrderedDict()
+
+    def add(t: Tool, path: str, scattered: bool):
+        if t.type() == ToolType.Workflow:
+            for stp in t.step_nodes.values():
+                add(
+                    stp.tool,
+                    f"{path}.{stp.id()}" if path else stp.id(),
+                    scattered or stp.scatter is not None,
+                )
+            return
+
+        image = t.container()
+        if image not in manifest:
+            repository, version = split_image(image)
+            manifest[image] = {
+                "container": image,
+                "repository": repository,
+                "version": version,
+                "tools": [],
+                "steps": [],
+                "scattered_steps": 0,
+            }
+        entry = manifest[image]
+        toolid = f"{t.id()}/{t.version()}"
+        if toolid not in entry["tools"]:
+            entry["tools"].append(toolid)
+        entry["steps"].append(path or t.id())
+        if scattered:
+            entry["scattered_steps"] += 1
+
+    add(tool, "", False)
+    return list(manifest.values())
+
+
+def load_tool(path: str) -> Tool:
+    """
+    Load a tool from 'module.path.ClassName', eg:
+        janis_bioinformatics.tools.dawson.workflows.freebayessomaticworkflow.FreeBayesSomaticWorkflow
+    """
+    modulename, _, name = path.replace(":", ".").rpartition(".")
+    if not modulename:
+        raise Exception(f"Expected 'module.path.ClassName', received '{path}'")
+    obj = getattr(import_module(modulename), name)
+    return obj() if isinstance(obj, type) else obj
+
+
+def main(args=None):
+    cli = argparse.ArgumentParser(
+        description="List the containers a workflow will use, so they can be pulled "
+        "(eg: into a registry mirror or Singularity cache) before it's run"
+    )
+    cli.add_argument("workflow", help="module.path.ClassName of the workflow (or tool)")
+    cli.add_argument(
+        "--images-only",
+        action="store_true",
+        help="Only print the containers (one per line), eg: to pipe into 'xargs -n1 docker pull'",
+    )
+    parsed = cli.parse_args(args)
+
+    manifest = container_manifest(load_tool(parsed.workflow))
+    if parsed.images_only:
+        print("\n".join(c["container"] for c in manifest))
+    else:
+        json.dump(manifest, sys.stdout, indent=4)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+from copy import copy
+
+from janis_core import Array
+from janis_core.operators.standard import FlattenOperator as CoreFlattenOperator
+from janis_core.operators.standard import FilterNullOperator as CoreFilterNullOperator
+from janis_core.types import get_instantiated_type
+
+
+class FlattenOperator(CoreFlattenOperator):
+    """
+    janis_core's FlattenOperator (0.10.x) takes the subtype of the selector itself rather
+    than of the type it returns, so it can't be given a workflow input or step output.
+    """
+
+    def returntype(self):
+        outer = get_instantiated_type(self.args[0].returntype())
+        return Array(get_instantiated_type(outer.subtype()).subtype())
+
+
+class FilterNullOperator(CoreFilterNullOperator):
+    """
+    janis_core's FilterNullOperator (0.10.x) has the same issue as its FlattenOperator, so
+    it can't be given the (scattered) output of a step.
+    """
+
+    def returntype(self):
+        outer = get_instantiated_type(self.args[0].returntype())
+        inner = copy(get_instantiated_type(outer.subtype()))
+        inner.optional = False
+        return Array(inner)
@@ -0,0 +1,27 @@
+from janis_core import CpuSelector, InputSelector, ToolArgument
+from janis_core.operators.logical import If, IsDefined
+
+
+def additional_threads(threads_input: str = "threads"):
+    """
+    The number of threads to use *in addition to* the main thread (eg: for bcftools --threads,
+    samtools view -@): the threads input if it's given, otherwise one less than the cores
+    allocated. The threads input must have no prefix or position of its own.
+    """
+    threads = InputSelector(threads_input)
+    return If(IsDefined(threads), threads, CpuSelector() - 1)
+
+
+def additional_threads_argument(
+    prefix: str, position: int = 0, threads_input: str = "threads"
+) -> ToolArgument:
+    """
+    Binds a flag that takes the number of threads to use in addition to the main thread,
+    see additional_threads.
+    """
+    return ToolArgument(
+        additional_threads(threads_input),
+        prefix=prefix,
+        position=position,
+        doc=f"Threads in addition to the main thread, see: {threads_input}",
+    )
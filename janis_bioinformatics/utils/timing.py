@@ -0,0 +1,64 @@
+from abc import ABC, abstractmethod
+
+from janis_core import (
+    File,
+    StringFormatter,
+    ToolArgument,
+    ToolOutput,
+    WildcardSelector,
+)
+
+
+class TimedCommandMixin(ABC):
+    """
+    Mixin (before the CommandTool) that wraps the tool's base command to record how long it
+    ran, as "<label>\\t<seconds>" in timing.tsv (the 'timing' output). The command's arguments,
+    outputs and exit status are unchanged, and no timing is written if it fails.
+
+    The clock is read with `date +%s` (POSIX), as the CWL command runs in sh rather than bash,
+    and the substitutions use backticks as CWL reserves $(...) for its parameter references.
+    """
+
+    TIMING_FILENAME = "timing.tsv"
+
+    @abstractmethod
+    def timing_label(self):
+        """
+        The label (eg: an InputSelector of the region) the time is recorded against
+        """
+        pass
+
+    def base_command(self):
+        return None
+
+    def arguments(self):
+        command = super().base_command()
+        if isinstance(command, list):
+            command = " ".join(command)
+
+        return [
+            ToolArgument("timing_start=`date +%s` &&", position=-2, shell_quote=False),
+            ToolArgument(command, position=-1, shell_quote=False),
+            *(super().arguments() or []),
+            ToolArgument(
+                StringFormatter(
+                    "&& timing_end=`date +%s`"
+                    ' && printf "%s\\t%s\\n" "{label}"'
+                    " `expr $timing_end - $timing_start` > " + self.TIMING_FILENAME,
+                    label=self.timing_label(),
+                ),
+                position=1000,
+                shell_quote=False,
+            ),
+        ]
+
+    def outputs(self):
+        return [
+            *super().outputs(),
+            ToolOutput(
+                "timing",
+                File,
+                glob=WildcardSelector(self.TIMING_FILENAME),
+                doc="<label>\\t<seconds> the command ran for",
+            ),
+        ]
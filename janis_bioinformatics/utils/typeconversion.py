@@ -1,4 +1,14 @@
-from janis_bioinformatics.data_types import Bam, BamBai, Cram, CramCrai
+from janis_bioinformatics.data_types import (
+    Bam,
+    BamBai,
+    BamCsi,
+    Cram,
+    CramCrai,
+    VcfTabix,
+    VcfCsi,
+    BedTabix,
+    BedCsi,
+)
 from janis_core import Array
 
 
@@ -35,3 +45,30 @@ def cast_input_bams_to_crams(inputs):
         inp.input_type.optional = is_optional
 
     return retval
+
+
+# function that takes the inputs of a tool and changes every bai / tbi indexed type into the
+# respective csi indexed type (for contigs longer than 512 Mbp), keeping anything else the same
+def cast_input_indexes_to_csi(inputs):
+    from copy import deepcopy
+
+    # exact types, so the subclasses (eg: GvcfTabix, only given to GATK) are left alone
+    mapping = {BamBai: BamCsi, VcfTabix: VcfCsi, BedTabix: BedCsi}
+
+    retval = deepcopy(inputs)
+    for inp in retval:
+        is_optional = inp.input_type.optional
+
+        if type(inp.input_type) in mapping:
+            inp.input_type = mapping[type(inp.input_type)](optional=is_optional)
+        elif (
+            isinstance(inp.input_type, Array)
+            and type(inp.input_type.subtype()) in mapping
+        ):
+            internal = mapping[type(inp.input_type.subtype())]
+            inp.input_type = Array(
+                internal(optional=inp.input_type.subtype().optional),
+                optional=is_optional,
+            )
+
+    return retval
@@ -28,6 +28,9 @@ setup(
         "janis.extension": ["bioinformatics=janis_bioinformatics"],
         "janis.tools": ["bioinformatics=janis_bioinformatics.tools"],
         "janis.types": ["bioinformatics=janis_bioinformatics.data_types"],
+        "console_scripts": [
+            "janis-bioinformatics-containers=janis_bioinformatics.utils.containermanifest:main"
+        ],
     },
     install_requires=["janis-pipelines.core >= 0.10.4"],
     zip_safe=False,
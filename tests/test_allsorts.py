@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+
+from janis_core import CaptureType, CpuSelector
+
+from janis_bioinformatics.data_types import Bam
+from janis_bioinformatics.tools.pmac.allsortsCohortWorkflow import (
+    ALLSortsCohortWorkflow_0_1_0,
+)
+from janis_bioinformatics.tools.pmac.splitfeaturecountsbysample import (
+    SplitFeatureCountsBySample,
+)
+from janis_bioinformatics.tools.subread import featureCounts_2_0_1
+from tests.translation import translate_and_check
+
+COUNTS = """\
+# Program:featureCounts v2.0.1; Command:"featureCounts" "-o" "counts.txt" "a.bam" "b.bam"
+Geneid\tChr\tStart\tEnd\tStrand\tLength\ta.bam\tb.bam
+GENE1\tchr1\t1\t100\t+\t100\t5\t7
+GENE2\tchr2\t1\t50\t-\t50\t0\t3
+"""
+
+
+class TestSplitFeatureCountsBySample(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        os.chdir(tempfile.mkdtemp())
+        with open("counts.txt", "w") as f:
+            f.write(COUNTS)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+
+    def test_one_table_per_sample(self):
+        result = SplitFeatureCountsBySample.code_block("counts.txt", ["A", "B"])
+
+        self.assertListEqual(
+            ["A.featureCounts.txt", "B.featureCounts.txt"],
+            [os.path.basename(f) for f in result["out"]],
+        )
+        with open("B.featureCounts.txt") as f:
+            lines = f.read().splitlines()
+        self.assertTrue(lines[0].startswith("# Program:featureCounts"))
+        self.assertEqual("Geneid\tChr\tStart\tEnd\tStrand\tLength\tb.bam", lines[1])
+        self.assertEqual("GENE2\tchr2\t1\t50\t-\t50\t3", lines[3])
+
+    def test_a_sample_per_count_column(self):
+        with self.assertRaises(Exception):
+            SplitFeatureCountsBySample.code_block("counts.txt", ["A"])
+
+
+class TestFeatureCountsThreads(unittest.TestCase):
+    def test_threads_follow_cpus(self):
+        tool = featureCounts_2_0_1()
+        (threads,) = [i for i in tool.inputs() if i.id() == "threads"]
+        self.assertIsInstance(threads.default, CpuSelector)
+
+    def test_cpus_scale_with_hints(self):
+        tool = featureCounts_2_0_1()
+        self.assertEqual(4, tool.cpus({}))
+        self.assertEqual(8, tool.cpus({CaptureType.key(): CaptureType.THIRTYX}))
+
+
+class TestALLSortsCohortWorkflow(unittest.TestCase):
+    def test_feature_counts_gets_the_aligned_bams(self):
+        w = ALLSortsCohortWorkflow_0_1_0()
+        bams = w.step_nodes["featureCounts"].sources["bam"].source().source
+        rettype = bams.returntype()
+        self.assertFalse(rettype.optional)
+        self.assertIsInstance(rettype.subtype(), Bam)
+        self.assertFalse(rettype.subtype().optional)
+
+    def test_translates(self):
+        translate_and_check(ALLSortsCohortWorkflow_0_1_0())
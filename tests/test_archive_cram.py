@@ -0,0 +1,34 @@
+import unittest
+
+from janis_bioinformatics.tools.common import (
+    ArchiveBamAsCram,
+    VerifyCramRecordCounts,
+)
+from tests.translation import translate_and_check
+
+
+class TestVerifyCramRecordCounts(unittest.TestCase):
+    def test_counts_are_the_only_output(self):
+        self.assertListEqual(
+            ["counts"], [o.id() for o in VerifyCramRecordCounts().outputs()]
+        )
+
+    def test_cram_is_not_copied(self):
+        path = translate_and_check(VerifyCramRecordCounts())
+        if path:
+            with open(path) as f:
+                wdl = f.read()
+            self.assertNotIn("cp ", wdl)
+            self.assertIn("samtools view -c", wdl)
+            self.assertRegex(wdl, r"else \(select_first\(\[runtime_cpu, .*\]\) - 1\)")
+
+
+class TestArchiveBamAsCram(unittest.TestCase):
+    def test_translates(self):
+        translate_and_check(ArchiveBamAsCram())
+
+    def test_cram_comes_from_the_index_step(self):
+        w = ArchiveBamAsCram()
+        outputs = {o.id(): o for o in w.output_nodes.values()}
+        self.assertEqual("index", outputs["out"].source.node.id())
+        self.assertEqual("verify", outputs["counts"].source.node.id())
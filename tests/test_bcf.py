@@ -0,0 +1,99 @@
+import unittest
+
+from janis_core import Array, Stdout
+
+from janis_bioinformatics.data_types import Bcf, BcfCsi, CompressedVcf, VcfTabix
+from janis_bioinformatics.tools.bcftools import (
+    BcfToolsAnnotateBcfLatest,
+    BcfToolsBcfToVcfLatest,
+    BcfToolsConcatBcfLatest,
+    BcfToolsIndexBcfLatest,
+    BcfToolsNormBcfLatest,
+    BcfToolsNormLatest,
+    BcfToolsSortBcfLatest,
+    BcfToolsTextVcfToBcfLatest,
+    BcfToolsVcfToBcfLatest,
+    BcfToolsViewBcfLatest,
+)
+from janis_bioinformatics.tools.variantcallers.freebayesgermline_cohort import (
+    FreeBayesGermlineCohortVariantCallerBcf,
+)
+from tests.translation import translate_and_check
+
+BCF_TOOLS = [
+    BcfToolsAnnotateBcfLatest,
+    BcfToolsConcatBcfLatest,
+    BcfToolsNormBcfLatest,
+    BcfToolsSortBcfLatest,
+    BcfToolsViewBcfLatest,
+]
+
+
+def output_type(tool):
+    out = tool.outputs()[0].output_type
+    return out.subtype if isinstance(out, Stdout) else out
+
+
+class TestBcfTypes(unittest.TestCase):
+    def test_indexed_bcf_can_be_given_to_bcf(self):
+        self.assertTrue(Bcf().can_receive_from(BcfCsi()))
+        self.assertFalse(BcfCsi().can_receive_from(Bcf()))
+
+    def test_bcf_is_not_a_vcf(self):
+        self.assertFalse(Bcf().can_receive_from(VcfTabix()))
+        self.assertFalse(CompressedVcf().can_receive_from(Bcf()))
+
+
+class TestBcfTools(unittest.TestCase):
+    def test_read_and_write_bcf(self):
+        for cls in BCF_TOOLS:
+            tool = cls()
+            with self.subTest(tool.id()):
+                self.assertTrue(tool.id().endswith("Bcf"))
+                (bcf_input,) = [i for i in tool.inputs() if i.id() in tool.bcf_inputs()]
+                intype = bcf_input.input_type
+                if isinstance(intype, Array):
+                    intype = intype.subtype()
+                self.assertIsInstance(intype, Bcf)
+                self.assertIsInstance(output_type(tool), Bcf)
+
+    def test_output_type_is_fixed_to_bcf(self):
+        for cls in BCF_TOOLS:
+            tool = cls()
+            with self.subTest(tool.id()):
+                self.assertNotIn("outputType", {i.id() for i in tool.inputs()})
+                (argument,) = [
+                    a for a in tool.arguments() if a.prefix in ("--output-type", "-O")
+                ]
+                self.assertEqual("b", argument.value)
+
+    def test_vcf_tools_are_unchanged(self):
+        tool = BcfToolsNormLatest()
+        self.assertIn("outputType", {i.id() for i in tool.inputs()})
+        self.assertNotIsInstance(output_type(tool), Bcf)
+
+    def test_conversions(self):
+        self.assertIsInstance(output_type(BcfToolsVcfToBcfLatest()), BcfCsi)
+        self.assertIsInstance(output_type(BcfToolsTextVcfToBcfLatest()), BcfCsi)
+        self.assertIsInstance(output_type(BcfToolsBcfToVcfLatest()), VcfTabix)
+        self.assertIsInstance(output_type(BcfToolsIndexBcfLatest()), BcfCsi)
+
+    def test_translate(self):
+        for cls in [
+            *BCF_TOOLS,
+            BcfToolsIndexBcfLatest,
+            BcfToolsVcfToBcfLatest,
+            BcfToolsTextVcfToBcfLatest,
+            BcfToolsBcfToVcfLatest,
+        ]:
+            tool = cls()
+            with self.subTest(tool.id()):
+                translate_and_check(tool)
+
+
+class TestBcfIntermediates(unittest.TestCase):
+    def test_regions_are_concatenated_as_bcf(self):
+        w = FreeBayesGermlineCohortVariantCallerBcf()
+        self.assertIsInstance(w.step_nodes["concat"].tool, BcfToolsConcatBcfLatest)
+        (out,) = [o for o in w.tool_outputs() if o.id() == "out"]
+        self.assertIsInstance(out.outtype, VcfTabix)
@@ -0,0 +1,54 @@
+import unittest
+
+from janis_bioinformatics.data_types import BedTabix, VcfTabix
+from janis_bioinformatics.tools.dawson.workflows.freebayessomaticworkflow import (
+    FreeBayesSomaticWorkflow,
+)
+from janis_bioinformatics.tools.dawson.workflows.strelka2passworkflow import (
+    Strelka2PassWorkflow,
+)
+from janis_bioinformatics.tools.htslib import (
+    BgzipTabixBedLatest,
+    BgzipTabixLatest,
+)
+from janis_bioinformatics.tools.validation.performancevalidator import (
+    PerformanceValidator_1_2_1,
+)
+from janis_bioinformatics.tools.variantcallers.vardictgermline_variants import (
+    VardictGermlineVariantCaller,
+)
+from tests.translation import translate_and_check
+
+
+class TestBgzipTabix(unittest.TestCase):
+    def test_compresses_then_indexes_the_same_file(self):
+        path = translate_and_check(BgzipTabixLatest())
+        if path:
+            with open(path) as f:
+                command = " ".join(f.read().replace("\\\n", " ").split())
+            self.assertRegex(
+                command,
+                r"bgzip .*--threads .* > (~\{select_first\(\[outputFilename, .*\]\)\}) "
+                r"&& tabix .* \1",
+            )
+
+    def test_outputs_are_indexed(self):
+        self.assertIsInstance(BgzipTabixLatest().outputs()[0].output_type, VcfTabix)
+        self.assertIsInstance(BgzipTabixBedLatest().outputs()[0].output_type, BedTabix)
+
+    def test_bed_preset(self):
+        (preset,) = [i for i in BgzipTabixBedLatest().inputs() if i.id() == "preset"]
+        self.assertEqual("bed", preset.default)
+        translate_and_check(BgzipTabixBedLatest())
+
+
+class TestBgzipTabixWorkflows(unittest.TestCase):
+    def test_workflows_translate(self):
+        for w in [
+            FreeBayesSomaticWorkflow(),
+            Strelka2PassWorkflow(),
+            VardictGermlineVariantCaller(),
+            PerformanceValidator_1_2_1(),
+        ]:
+            with self.subTest(w.id()):
+                translate_and_check(w)
@@ -0,0 +1,108 @@
+import gzip
+import os
+import tempfile
+import unittest
+
+from janis_bioinformatics.data_types import BamBai
+from janis_bioinformatics.tools.common import (
+    GenerateChromosomeList,
+    SplitVcfByChromosome,
+)
+from janis_bioinformatics.tools.facets.workflows.snppileupbychromosome import (
+    FacetsSnpPileupByChromosome,
+)
+from janis_bioinformatics.tools.samtools import SamToolsViewRegionLatest
+from janis_bioinformatics.tools.sequenza.workflows.bam2seqzbychromosome import (
+    SequenzaBam2SeqzByChromosome,
+)
+from tests.translation import translate_and_check
+
+VCF = """\
+##fileformat=VCFv4.2
+#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO
+chr1\t10\t.\tA\tG\t.\t.\t.
+chr2\t20\t.\tC\tT\t.\t.\t.
+chr1\t30\t.\tG\tA\t.\t.\t.
+chrUn_1\t5\t.\tT\tC\t.\t.\t.
+"""
+
+
+class TestSplitVcfByChromosome(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmpdir = tempfile.mkdtemp()
+        os.chdir(self.tmpdir)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+
+    def read(self, path):
+        with open(path) as f:
+            return f.read()
+
+    def test_splits_in_order_with_header(self):
+        with gzip.open("in.vcf.gz", "wt") as f:
+            f.write(VCF)
+
+        result = SplitVcfByChromosome.code_block("in.vcf.gz")
+
+        self.assertListEqual(["chr1", "chr2", "chrUn_1"], result["chromosomes"])
+        chr1 = self.read(result["out"][0])
+        self.assertTrue(chr1.startswith("##fileformat=VCFv4.2\n#CHROM"))
+        self.assertEqual(2, len([l for l in chr1.splitlines() if l.startswith("chr1")]))
+
+    def test_restrict_to(self):
+        with open("in.vcf", "w") as f:
+            f.write(VCF)
+
+        result = SplitVcfByChromosome.code_block(
+            "in.vcf", restrict_to=["chr2", "chr1", "chrX"]
+        )
+
+        self.assertListEqual(["chr2", "chr1"], result["chromosomes"])
+        self.assertIn("chr2\t20", self.read(result["out"][0]))
+
+    def test_input_and_output_ids_are_distinct(self):
+        tool = SplitVcfByChromosome()
+        self.assertFalse(
+            {i.id() for i in tool.inputs()} & {o.id() for o in tool.outputs()}
+        )
+
+
+class TestGenerateChromosomeList(unittest.TestCase):
+    def setUp(self):
+        self.reference = os.path.join(tempfile.mkdtemp(), "ref.fasta")
+        with open(self.reference + ".fai", "w") as f:
+            f.write(
+                "chr1\t100\t6\t60\t61\nchr2\t50\t200\t60\t61\nchrM\t10\t300\t60\t61\n"
+            )
+
+    def test_lists_contigs(self):
+        result = GenerateChromosomeList.code_block(self.reference)
+        self.assertListEqual(["chr1", "chr2", "chrM"], result["chromosomes"])
+
+    def test_restrict_to(self):
+        result = GenerateChromosomeList.code_block(
+            self.reference, restrict_to=["chrM", "chr1", "chr3"]
+        )
+        self.assertListEqual(["chrM", "chr1"], result["chromosomes"])
+
+    def test_input_and_output_ids_are_distinct(self):
+        tool = GenerateChromosomeList()
+        self.assertFalse(
+            {i.id() for i in tool.inputs()} & {o.id() for o in tool.outputs()}
+        )
+
+
+class TestSamToolsViewRegion(unittest.TestCase):
+    def test_input_is_indexed(self):
+        (sam,) = [i for i in SamToolsViewRegionLatest().inputs() if i.id() == "sam"]
+        self.assertIsInstance(sam.input_type, BamBai)
+
+
+class TestChromosomeScatterWorkflows(unittest.TestCase):
+    def test_facets_snp_pileup_by_chromosome(self):
+        translate_and_check(FacetsSnpPileupByChromosome())
+
+    def test_sequenza_bam2seqz_by_chromosome(self):
+        translate_and_check(SequenzaBam2SeqzByChromosome())
@@ -0,0 +1,45 @@
+import unittest
+
+from janis_core import CaptureType
+
+from janis_bioinformatics.data_types import VcfTabix
+from janis_bioinformatics.tools.gatk4 import (
+    Gatk4CNNScoreVariants_4_1_3,
+    Gatk4FilterVariantTranches_4_1_3,
+)
+from janis_bioinformatics.tools.variantcallers.gatk.gatkcnnfilter_variants_4_1_3 import (
+    GatkCNNFilterVariants_4_1_3,
+)
+from tests.translation import translate_and_check
+
+
+class TestCNNScoreVariants(unittest.TestCase):
+    def test_variant_is_a_required_indexed_vcf(self):
+        for tool in [Gatk4CNNScoreVariants_4_1_3(), Gatk4FilterVariantTranches_4_1_3()]:
+            (variant,) = [i for i in tool.inputs() if i.id() == "variant"]
+            self.assertIsInstance(variant.input_type, VcfTabix)
+            self.assertFalse(variant.input_type.optional)
+
+    def test_resources_scale_with_the_capture_type(self):
+        tool = Gatk4CNNScoreVariants_4_1_3()
+        targeted = {CaptureType.key(): CaptureType.TARGETED}
+        wgs = {CaptureType.key(): CaptureType.THIRTYX}
+
+        self.assertLess(tool.cpus(targeted), tool.cpus(wgs))
+        self.assertLess(tool.memory(targeted), tool.memory(wgs))
+        self.assertEqual(4, tool.cpus({}))
+        self.assertEqual(16, tool.memory({}))
+
+    def test_translate_tools(self):
+        translate_and_check(Gatk4CNNScoreVariants_4_1_3())
+        translate_and_check(Gatk4FilterVariantTranches_4_1_3())
+
+
+class TestGatkCNNFilterVariants(unittest.TestCase):
+    def test_translates(self):
+        translate_and_check(GatkCNNFilterVariants_4_1_3())
+
+    def test_scores_each_shard_and_filters_once(self):
+        w = GatkCNNFilterVariants_4_1_3()
+        self.assertEqual(["variant"], w.step_nodes["cnn_score"].scatter.fields)
+        self.assertIsNone(w.step_nodes["filter_tranches"].scatter)
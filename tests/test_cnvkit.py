@@ -0,0 +1,51 @@
+import unittest
+
+from janis_bioinformatics.tools.ucsf.cnvkit import (
+    CNVKitTargetLatest,
+    CNVKitAntitargetLatest,
+    CNVKitCoverageLatest,
+    CNVKitReferenceLatest,
+    CNVKitFixLatest,
+    CNVKitSegmentLatest,
+    CNVKitCallLatest,
+    CNVKitSampleCoverage,
+    CNVKitBuildReference,
+    CNVKitCallSample,
+    CNVKitCallSamples,
+    CNVKitCohort,
+)
+from tests.translation import translate_and_check
+
+
+class TestCNVKitTools(unittest.TestCase):
+    def test_subcommands(self):
+        for tool in [
+            CNVKitTargetLatest,
+            CNVKitAntitargetLatest,
+            CNVKitCoverageLatest,
+            CNVKitReferenceLatest,
+            CNVKitFixLatest,
+            CNVKitSegmentLatest,
+            CNVKitCallLatest,
+        ]:
+            with self.subTest(tool=tool.__name__):
+                translate_and_check(tool())
+
+
+class TestCNVKitWorkflows(unittest.TestCase):
+    def test_sample_coverage(self):
+        translate_and_check(CNVKitSampleCoverage())
+
+    def test_build_reference(self):
+        translate_and_check(CNVKitBuildReference())
+
+    def test_call_sample(self):
+        translate_and_check(CNVKitCallSample())
+
+    def test_call_samples(self):
+        translate_and_check(CNVKitCallSamples())
+
+    def test_cohort_outputs_the_reference(self):
+        wf = CNVKitCohort()
+        self.assertIn("reference", wf.output_nodes)
+        translate_and_check(wf)
@@ -0,0 +1,80 @@
+import io
+import json
+import unittest
+from contextlib import redirect_stdout
+
+from janis_bioinformatics.tools.common import UbamAligner
+from janis_bioinformatics.utils.containermanifest import (
+    container_manifest,
+    load_tool,
+    main,
+    split_image,
+)
+
+UBAM_ALIGNER = "janis_bioinformatics.tools.common.UbamAligner"
+
+
+class TestSplitImage(unittest.TestCase):
+    def test_tag(self):
+        self.assertEqual(
+            ("broadinstitute/gatk", "4.1.3.0"),
+            split_image("broadinstitute/gatk:4.1.3.0"),
+        )
+
+    def test_registry_port(self):
+        self.assertEqual(
+            ("host:5000/gatk", "4.1.3.0"), split_image("host:5000/gatk:4.1.3.0")
+        )
+        self.assertEqual(("host:5000/gatk", "latest"), split_image("host:5000/gatk"))
+
+    def test_no_tag(self):
+        self.assertEqual(("ubuntu", "latest"), split_image("ubuntu"))
+
+    def test_digest(self):
+        self.assertEqual(("ubuntu", "sha256:abc"), split_image("ubuntu@sha256:abc"))
+
+
+class TestContainerManifest(unittest.TestCase):
+    def test_containers_are_listed_once_with_their_steps(self):
+        manifest = {c["container"]: c for c in UbamAligner().container_manifest()}
+
+        gatk = manifest["broadinstitute/gatk:4.1.3.0"]
+        self.assertListEqual(
+            ["align_lane.fastqtosam", "align_lane.merge_alignment"], gatk["steps"]
+        )
+        self.assertEqual(2, len(gatk["tools"]))
+
+    def test_steps_in_scattered_subworkflows_are_scattered(self):
+        manifest = {c["repository"]: c for c in container_manifest(UbamAligner())}
+
+        self.assertEqual(2, manifest["broadinstitute/gatk"]["scattered_steps"])
+        self.assertEqual(
+            0, manifest["quay.io/biocontainers/biobambam"]["scattered_steps"]
+        )
+
+    def test_load_tool(self):
+        self.assertIsInstance(load_tool(UBAM_ALIGNER), UbamAligner)
+        self.assertIsInstance(
+            load_tool("janis_bioinformatics.tools.common:UbamAligner"), UbamAligner
+        )
+        with self.assertRaises(Exception):
+            load_tool("UbamAligner")
+
+
+class TestContainerManifestCli(unittest.TestCase):
+    def run_main(self, *args):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            main([*args, UBAM_ALIGNER])
+        return out.getvalue()
+
+    def test_images_only(self):
+        self.assertListEqual(
+            [c["container"] for c in UbamAligner().container_manifest()],
+            self.run_main("--images-only").splitlines(),
+        )
+
+    def test_json(self):
+        self.assertListEqual(
+            UbamAligner().container_manifest(), json.loads(self.run_main())
+        )
@@ -0,0 +1,90 @@
+import unittest
+
+from janis_core import Array, ToolInput
+
+from janis_bioinformatics.data_types import (
+    Bam,
+    BamBai,
+    BamCsi,
+    BedCsi,
+    BedTabix,
+    CompressedVcf,
+    GvcfTabix,
+    VcfCsi,
+    VcfTabix,
+)
+from janis_bioinformatics.tools.bcftools import BcfToolsIndexCsiLatest
+from janis_bioinformatics.tools.freebayes import FreeBayesCsi_1_3
+from janis_bioinformatics.tools.htslib import BgzipTabixBedCsiLatest, TabixCsiLatest
+from janis_bioinformatics.tools.samtools import SamToolsIndexCsiLatest
+from janis_bioinformatics.utils.typeconversion import cast_input_indexes_to_csi
+from tests.translation import translate_and_check
+
+
+class TestCsiTypes(unittest.TestCase):
+    def test_csi_types_are_received_in_place_of_the_bare_types(self):
+        self.assertTrue(Bam().can_receive_from(BamCsi()))
+        self.assertTrue(CompressedVcf().can_receive_from(VcfCsi()))
+
+    def test_csi_and_bai_tbi_are_not_interchangeable(self):
+        for csi, other in [(BamCsi, BamBai), (VcfCsi, VcfTabix), (BedCsi, BedTabix)]:
+            with self.subTest(csi.name()):
+                self.assertTrue(csi().can_receive_from(csi()))
+                self.assertFalse(csi().can_receive_from(other()))
+                self.assertFalse(other().can_receive_from(csi()))
+
+
+class TestCastInputIndexesToCsi(unittest.TestCase):
+    def test_retypes_indexed_inputs(self):
+        inputs = [
+            ToolInput("bam", BamBai()),
+            ToolInput("bams", Array(BamBai(), optional=True)),
+            ToolInput("vcf", VcfTabix(optional=True)),
+            ToolInput("bed", BedTabix()),
+            ToolInput("gvcf", GvcfTabix()),
+            ToolInput("unindexed", Bam()),
+        ]
+        cast = {i.id(): i.input_type for i in cast_input_indexes_to_csi(inputs)}
+
+        self.assertIsInstance(cast["bam"], BamCsi)
+        self.assertIsInstance(cast["bams"], Array)
+        self.assertTrue(cast["bams"].optional)
+        self.assertIsInstance(cast["bams"].subtype(), BamCsi)
+        self.assertIsInstance(cast["vcf"], VcfCsi)
+        self.assertTrue(cast["vcf"].optional)
+        self.assertIsInstance(cast["bed"], BedCsi)
+        # GATK only types and unindexed inputs are left alone
+        self.assertIsInstance(cast["gvcf"], GvcfTabix)
+        self.assertNotIsInstance(cast["unindexed"], BamCsi)
+        # the original inputs aren't modified
+        self.assertIsInstance(inputs[0].input_type, BamBai)
+
+    def test_freebayes_csi(self):
+        (bams,) = [i for i in FreeBayesCsi_1_3().inputs() if i.id() == "bams"]
+        self.assertIsInstance(bams.input_type.subtype(), BamCsi)
+
+
+class TestCsiIndexTools(unittest.TestCase):
+    def test_outputs_are_csi_indexed(self):
+        for tool, outtype in [
+            (SamToolsIndexCsiLatest(), BamCsi),
+            (TabixCsiLatest(), VcfCsi),
+            (BgzipTabixBedCsiLatest(), BedCsi),
+            (BcfToolsIndexCsiLatest(), VcfCsi),
+        ]:
+            with self.subTest(tool.id()):
+                self.assertIsInstance(tool.outputs()[0].output_type, outtype)
+                translate_and_check(tool)
+
+    def test_tabix_writes_a_csi(self):
+        for tool in [TabixCsiLatest(), BgzipTabixBedCsiLatest()]:
+            with self.subTest(tool.id()):
+                path = translate_and_check(tool)
+                if path:
+                    with open(path) as f:
+                        wdl = f.read()
+                    self.assertIn("'--csi'", wdl)
+                    self.assertIn('+ ".csi"', wdl)
+
+    def test_freebayes_csi_translates(self):
+        translate_and_check(FreeBayesCsi_1_3())
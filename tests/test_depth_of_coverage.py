@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+
+from janis_unix import TextFile
+
+from janis_bioinformatics.tools.common import ConcatTextTables
+from janis_bioinformatics.tools.gatk3 import GATK3DepthOfCoverageLatest
+from janis_bioinformatics.tools.pmac import (
+    AggregateDepthOfCoverageByGene,
+    AnnotateDepthOfCoverageByContig_0_1_0,
+)
+from tests.translation import translate_and_check
+
+
+class TestConcatTextTables(unittest.TestCase):
+    def test_keeps_the_first_header(self):
+        tmpdir = tempfile.mkdtemp()
+        files = []
+        for i, rows in enumerate([["a\t1"], ["b\t2", "c\t3"]]):
+            files.append(os.path.join(tmpdir, f"{i}.txt"))
+            with open(files[-1], "w") as f:
+                f.write("\n".join(["name\tvalue", *rows]) + "\n")
+
+        out = ConcatTextTables.code_block(
+            files, output_filename=os.path.join(tmpdir, "out.txt")
+        )["out"]
+        with open(out) as f:
+            self.assertEqual("name\tvalue\na\t1\nb\t2\nc\t3\n", f.read())
+
+    def test_output_is_a_text_file(self):
+        (out,) = ConcatTextTables().outputs()
+        self.assertIsInstance(out.outtype, TextFile)
+
+
+class TestAggregateDepthOfCoverageByGene(unittest.TestCase):
+    def test_length_weighted(self):
+        tmpdir = tempfile.mkdtemp()
+        bed = os.path.join(tmpdir, "panel.bed")
+        with open(bed, "w") as f:
+            f.write("chr1\t0\t10\tGENE1\nchr1\t20\t50\tGENE1\nchr2\t0\t10\tGENE2\n")
+        summary = os.path.join(tmpdir, "sample.sample_interval_summary")
+        with open(summary, "w") as f:
+            f.write("Target\ttotal_coverage\taverage_coverage\tS_%_above_50\n")
+            f.write("chr1:1-10\t100\t10.00\t0.0\n")
+            f.write("chr1:21-50\t3000\t100.00\t100.0\n")
+            f.write("chr2:1-10\t500\t50.00\t50.0\n")
+
+        out = AggregateDepthOfCoverageByGene.code_block(
+            [summary], bed, output_filename=os.path.join(tmpdir, "genes.txt")
+        )["out"]
+        with open(out) as f:
+            lines = [l.rstrip("\n").split("\t") for l in f]
+
+        self.assertListEqual(
+            ["Gene", "intervals", "bases", "total_coverage", "average_coverage"],
+            lines[0][:5],
+        )
+        self.assertListEqual(["GENE1", "2", "40", "3100", "77.50", "75.0"], lines[1])
+        self.assertListEqual(["GENE2", "1", "10", "500", "50.00", "50.0"], lines[2])
+
+
+class TestGATK3DepthOfCoverage(unittest.TestCase):
+    def test_outputs_omitted_by_flags_are_optional(self):
+        outputs = {o.id(): o for o in GATK3DepthOfCoverageLatest().outputs()}
+        for out in (
+            "sample",
+            "sampleCumulativeCoverageCounts",
+            "sampleCumulativeCoverageProportions",
+        ):
+            self.assertTrue(outputs[out].output_type.optional, out)
+        self.assertFalse(outputs["sampleIntervalSummary"].output_type.optional)
+
+
+class TestAnnotateDepthOfCoverageByContig(unittest.TestCase):
+    def test_outputs_have_distinct_names(self):
+        wf = AnnotateDepthOfCoverageByContig_0_1_0()
+        out, gene_summary = wf.output_nodes["out"], wf.output_nodes["gene_summary"]
+        self.assertNotEqual(repr(out.output_name), repr(gene_summary.output_name))
+
+    def test_translates(self):
+        translate_and_check(AnnotateDepthOfCoverageByContig_0_1_0())
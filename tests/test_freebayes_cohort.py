@@ -0,0 +1,147 @@
+import os
+import subprocess
+import tempfile
+import unittest
+
+from janis_core import CommandTool, ToolOutput, Stdout, StringFormatter
+
+from janis_bioinformatics.tools.common import CreateBalancedCallRegions
+from janis_bioinformatics.tools.freebayes.versions import FreeBayesTimed_1_3
+from janis_bioinformatics.tools.variantcallers.freebayesgermline_cohort import (
+    FreeBayesGermlineCohortVariantCaller,
+    FreeBayesGermlineCohortVariantCallerBcf,
+    FreeBayesGermlineCohortVariantCallerCsi,
+)
+from janis_bioinformatics.utils.timing import TimedCommandMixin
+from tests.translation import translate_and_check
+
+
+class Command(CommandTool):
+    def __init__(self, command):
+        self.command = command
+        super().__init__()
+
+    def tool(self):
+        return "Command"
+
+    def base_command(self):
+        return self.command
+
+    def inputs(self):
+        return []
+
+    def outputs(self):
+        return [ToolOutput("out", Stdout)]
+
+    def container(self):
+        return "ubuntu:bionic"
+
+    def version(self):
+        return "v0.1.0"
+
+
+class TimedCommand(TimedCommandMixin, Command):
+    def timing_label(self):
+        return "chr1:0-100"
+
+    def run(self, cwd):
+        # the arguments in their position, as the engines would lay them out
+        command = []
+        for arg in sorted(self.arguments(), key=lambda a: a.position):
+            value = arg.value
+            if isinstance(value, StringFormatter):
+                value = value._format.format(**value.kwargs)
+            command.append(value)
+        return subprocess.run(
+            ["sh", "-c", " ".join(command)], cwd=cwd, stdout=subprocess.PIPE
+        )
+
+
+class TestTimedCommandMixin(unittest.TestCase):
+    def test_records_the_time(self):
+        cwd = tempfile.mkdtemp()
+        result = TimedCommand(["echo", "called"]).run(cwd)
+
+        self.assertEqual(0, result.returncode)
+        self.assertEqual(b"called\n", result.stdout)
+        with open(os.path.join(cwd, "timing.tsv")) as f:
+            label, seconds = f.read().rstrip("\n").split("\t")
+        self.assertEqual("chr1:0-100", label)
+        self.assertGreaterEqual(int(seconds), 0)
+
+    def test_keeps_the_exit_status(self):
+        cwd = tempfile.mkdtemp()
+        result = TimedCommand("false").run(cwd)
+
+        self.assertNotEqual(0, result.returncode)
+        self.assertFalse(os.path.exists(os.path.join(cwd, "timing.tsv")))
+
+    def test_label_must_be_given(self):
+        class UnlabelledCommand(TimedCommandMixin, Command):
+            pass
+
+        with self.assertRaises(TypeError):
+            UnlabelledCommand("true")
+
+    def test_freebayes_timed(self):
+        tool = FreeBayesTimed_1_3()
+        self.assertIn("timing", {o.id() for o in tool.outputs()})
+        translate_and_check(tool)
+
+
+class TestCreateBalancedCallRegions(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.reference = os.path.join(self.tmpdir, "ref.fasta")
+        with open(self.reference + ".fai", "w") as f:
+            f.write("chr1\t1000\t6\t60\t61\nchr2\t500\t1100\t60\t61\n")
+
+    def test_regions_leave_out_the_blacklist(self):
+        blacklist = os.path.join(self.tmpdir, "blacklist.bed")
+        with open(blacklist, "w") as f:
+            f.write("chr1\t400\t600\n")
+
+        regions = CreateBalancedCallRegions.code_block(
+            self.reference, 400, blacklist=blacklist
+        )["regions"]
+
+        self.assertListEqual(
+            [
+                "chr1:0-325",
+                "chr1:325-400",
+                "chr1:600-925",
+                "chr1:925-1000",
+                "chr2:0-325",
+                "chr2:325-500",
+            ],
+            regions,
+        )
+
+    def test_balanced_on_timings(self):
+        timings = os.path.join(self.tmpdir, "timings.tsv")
+        with open(timings, "w") as f:
+            # the first half of chr1 is 9x slower than the rest of the genome, so its
+            # regions are smaller (each is expected to take ~37s of the 110s)
+            f.write("chr1:0-500\t90\nchr1:500-1000\t10\nchr2:0-500\t10\n")
+
+        regions = CreateBalancedCallRegions.code_block(
+            self.reference, 500, regionTimings=timings
+        )["regions"]
+
+        self.assertListEqual(
+            ["chr1:0-204", "chr1:204-408", "chr1:408-1000", "chr2:0-500"], regions
+        )
+
+
+class TestFreeBayesGermlineCohortVariantCaller(unittest.TestCase):
+    def test_translates(self):
+        translate_and_check(FreeBayesGermlineCohortVariantCaller())
+
+    def test_bcf_intermediates(self):
+        wf = FreeBayesGermlineCohortVariantCallerBcf()
+        self.assertIn("bcf_to_vcf", wf.step_nodes)
+        self.assertNotIn("tabix", wf.step_nodes)
+        translate_and_check(wf)
+
+    def test_csi_indexed(self):
+        translate_and_check(FreeBayesGermlineCohortVariantCallerCsi())
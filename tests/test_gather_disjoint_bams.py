@@ -0,0 +1,25 @@
+import unittest
+
+from janis_bioinformatics.data_types import BamBai
+from janis_bioinformatics.tools.common import GatherDisjointBams
+from janis_bioinformatics.tools.samtools import SamToolsCatLatest
+from tests.translation import translate_and_check
+
+
+class TestSamToolsCat(unittest.TestCase):
+    def test_command(self):
+        path = translate_and_check(SamToolsCatLatest())
+        if path:
+            with open(path) as f:
+                wdl = f.read()
+            # the output and header options come before the bams
+            self.assertRegex(wdl, r"samtools cat \\\s+-o ")
+
+
+class TestGatherDisjointBams(unittest.TestCase):
+    def test_output_is_indexed(self):
+        (out,) = GatherDisjointBams().tool_outputs()
+        self.assertIsInstance(out.outtype, BamBai)
+
+    def test_translates(self):
+        translate_and_check(GatherDisjointBams())
@@ -0,0 +1,52 @@
+import unittest
+
+from janis_bioinformatics.data_types import Gvcf, GvcfTabix, Vcf, VcfTabix
+from janis_bioinformatics.tools.gatk4.genomicsdbimport.versions import (
+    Gatk4GenomicsDBImportLatest,
+)
+from janis_bioinformatics.tools.gatk4.genotypegvcfs.versions import (
+    Gatk4GenotypeGVCFsLatest,
+)
+from janis_bioinformatics.tools.gatk4.haplotypecaller.versions import (
+    Gatk4HaplotypeCallerGvcfLatest,
+)
+from janis_bioinformatics.tools.variantcallers.gatk import (
+    GatkJointGenotypingShard_4_1_3,
+    GatkJointGenotyping_4_1_3,
+)
+from tests.translation import translate_and_check
+
+
+class TestGvcfTypes(unittest.TestCase):
+    def test_gvcf_is_a_vcf(self):
+        self.assertTrue(Vcf().can_receive_from(Gvcf()))
+        self.assertTrue(VcfTabix().can_receive_from(GvcfTabix()))
+
+    def test_vcf_is_not_a_gvcf(self):
+        self.assertFalse(GvcfTabix().can_receive_from(VcfTabix()))
+
+
+class TestJointGenotypingTools(unittest.TestCase):
+    def test_haplotype_caller_gvcf(self):
+        tool = Gatk4HaplotypeCallerGvcfLatest()
+        (out,) = [o for o in tool.outputs() if o.id() == "out"]
+        self.assertIsInstance(out.output_type, GvcfTabix)
+        translate_and_check(tool)
+
+    def test_genomicsdb_import_reader_threads_are_opt_in(self):
+        # more than one is only supported for a single interval, which a shard may not be
+        tool = Gatk4GenomicsDBImportLatest()
+        (reader_threads,) = [i for i in tool.inputs() if i.id() == "readerThreads"]
+        self.assertIsNone(reader_threads.default)
+        translate_and_check(tool)
+
+    def test_genotype_gvcfs(self):
+        translate_and_check(Gatk4GenotypeGVCFsLatest())
+
+
+class TestGatkJointGenotyping(unittest.TestCase):
+    def test_shard(self):
+        translate_and_check(GatkJointGenotypingShard_4_1_3())
+
+    def test_cohort(self):
+        translate_and_check(GatkJointGenotyping_4_1_3())
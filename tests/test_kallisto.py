@@ -0,0 +1,114 @@
+import os
+import tempfile
+import unittest
+
+from janis_core import Array, File, WorkflowBuilder
+
+from janis_bioinformatics.data_types import (
+    Bam,
+    Fastq,
+    FastqGz,
+    FastqGzPair,
+    FastqOrFastqGz,
+    FastqPair,
+)
+from janis_bioinformatics.tools.common import AggregateKallistoAbundance
+from janis_bioinformatics.tools.kallisto.data_types import KallistoIdx
+from janis_bioinformatics.tools.kallisto.quant.versions import KallistoQuant_0_46_2
+from janis_bioinformatics.tools.kallisto.workflows.kallistobatchquant import (
+    KallistoBatchQuant,
+)
+from tests.translation import translate_and_check
+
+
+class TestFastqOrFastqGz(unittest.TestCase):
+    def test_receives_plain_and_gzipped_reads(self):
+        self.assertTrue(FastqOrFastqGz().can_receive_from(Fastq()))
+        self.assertTrue(FastqOrFastqGz().can_receive_from(FastqGz()))
+        self.assertTrue(Array(FastqOrFastqGz()).can_receive_from(FastqPair()))
+        self.assertTrue(Array(FastqOrFastqGz()).can_receive_from(FastqGzPair()))
+
+    def test_rejects_other_files(self):
+        self.assertFalse(FastqOrFastqGz().can_receive_from(Bam()))
+        self.assertFalse(FastqOrFastqGz().can_receive_from(File()))
+        self.assertFalse(FastqOrFastqGz().can_receive_from(FastqGz(optional=True)))
+
+
+class TestKallistoQuant(unittest.TestCase):
+    def quant_workflow(self, reads_type):
+        w = WorkflowBuilder("kallisto_quant_" + reads_type.name().lower())
+        w.input("index", KallistoIdx)
+        w.input("reads", reads_type)
+        w.step("quant", KallistoQuant_0_46_2(index=w.index, fastq=w.reads))
+        w.output("out", source=w.quant.out)
+        return w
+
+    def test_quantifies_plain_reads(self):
+        translate_and_check(self.quant_workflow(FastqPair()))
+
+    def test_quantifies_gzipped_reads(self):
+        translate_and_check(self.quant_workflow(FastqGzPair()))
+
+    def test_index_only_receives_an_index(self):
+        self.assertTrue(KallistoIdx().can_receive_from(KallistoIdx()))
+        self.assertFalse(KallistoIdx().can_receive_from(File()))
+
+
+class TestAggregateKallistoAbundance(unittest.TestCase):
+    HEADER = "target_id\tlength\teff_length\test_counts\ttpm\n"
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        os.chdir(tempfile.mkdtemp())
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+
+    def write(self, path, rows):
+        with open(path, "w") as f:
+            f.write(self.HEADER)
+            f.writelines("\t".join(r) + "\n" for r in rows)
+        return path
+
+    def read(self, path):
+        with open(path) as f:
+            return f.read().splitlines()
+
+    def test_aggregates_transcripts_and_genes(self):
+        a = self.write(
+            "a.tsv", [("tx1", "10", "5", "1", "0.5"), ("tx2", "10", "5", "2", "1")]
+        )
+        b = self.write(
+            "b.tsv", [("tx1", "10", "5", "3", "1.5"), ("tx2", "10", "5", "4", "2")]
+        )
+        with open("tx2gene.tsv", "w") as f:
+            f.write("tx1\tG1\ntx2\tG1\n")
+
+        result = AggregateKallistoAbundance.code_block(
+            [a, b], ["A", "B"], transcriptToGene="tx2gene.tsv"
+        )
+
+        self.assertListEqual(
+            ["target_id\tA\tB", "tx1\t1\t3", "tx2\t2\t4"],
+            self.read(result["transcripts"]),
+        )
+        self.assertListEqual(["gene_id\tA\tB", "G1\t3\t7"], self.read(result["genes"]))
+
+    def test_no_genes_without_a_mapping(self):
+        a = self.write("a.tsv", [("tx1", "10", "5", "1", "0.5")])
+        result = AggregateKallistoAbundance.code_block([a], ["A"], column="tpm")
+        self.assertIsNone(result["genes"])
+        self.assertListEqual(
+            ["target_id\tA", "tx1\t0.5"], self.read(result["transcripts"])
+        )
+
+    def test_targets_must_match(self):
+        a = self.write("a.tsv", [("tx1", "10", "5", "1", "0.5")])
+        b = self.write("b.tsv", [("tx2", "10", "5", "1", "0.5")])
+        with self.assertRaises(Exception):
+            AggregateKallistoAbundance.code_block([a, b], ["A", "B"])
+
+
+class TestKallistoBatchQuant(unittest.TestCase):
+    def test_translates(self):
+        translate_and_check(KallistoBatchQuant())
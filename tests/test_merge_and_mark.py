@@ -0,0 +1,65 @@
+import unittest
+
+from janis_bioinformatics.data_types import BamBai
+from janis_bioinformatics.tools.biobambam import BamCatSorMaDup_2_0_87
+from janis_bioinformatics.tools.common import MergeAndMarkBams_4_1_3
+from janis_bioinformatics.tools.common.mergeandmark.mergeandmark_bamsormadup import (
+    MergeAndMarkBamsBamSorMaDup,
+)
+from janis_bioinformatics.tools.pmac import (
+    MolpathGermlineBamSorMaDup_1_0_0,
+    MolpathTumorOnly_1_0_0,
+    MolpathTumorOnlyBamSorMaDup_1_0_0,
+)
+from tests.translation import translate_and_check
+
+
+class TestMergeAndMarkBamsBamSorMaDup(unittest.TestCase):
+    def test_same_output_as_merge_and_mark(self):
+        (out,) = [
+            o for o in MergeAndMarkBamsBamSorMaDup().tool_outputs() if o.id() == "out"
+        ]
+        self.assertIsInstance(out.outtype, BamBai)
+
+    def test_only_the_piped_bam_is_uncompressed(self):
+        tool = BamCatSorMaDup_2_0_87()
+        (level,) = [i for i in tool.inputs() if i.id() == "level"]
+        self.assertEqual(-1, level.default)
+        (bamcat_level,) = [a for a in tool.arguments() if a.value == "level=0"]
+        self.assertLess(bamcat_level.position, level.position or 0)
+
+        path = translate_and_check(tool)
+        if path:
+            with open(path) as f:
+                self.assertRegex(f.read(), r"\s+level=0 \\\s+\| \\\s+bamsormadup")
+
+    def test_bamcat_translates(self):
+        translate_and_check(BamCatSorMaDup_2_0_87())
+
+    def test_translates(self):
+        translate_and_check(MergeAndMarkBamsBamSorMaDup())
+
+
+class TestMolpathMergeAndMark(unittest.TestCase):
+    def test_tumor_only_merges_with_mergesamfiles(self):
+        w = MolpathTumorOnly_1_0_0()
+        self.assertIn("maxRecordsInRam", w.input_nodes)
+        self.assertIsInstance(
+            w.step_nodes["merge_and_mark"].tool, MergeAndMarkBams_4_1_3
+        )
+
+    def test_bamsormadup_only_drops_max_records_in_ram(self):
+        w = MolpathTumorOnlyBamSorMaDup_1_0_0()
+        self.assertSetEqual(
+            set(MolpathTumorOnly_1_0_0().input_nodes) - {"maxRecordsInRam"},
+            set(w.input_nodes),
+        )
+        self.assertIsInstance(
+            w.step_nodes["merge_and_mark"].tool, MergeAndMarkBamsBamSorMaDup
+        )
+
+    def test_germline_translates(self):
+        translate_and_check(MolpathGermlineBamSorMaDup_1_0_0())
+
+    def test_tumor_only_translates(self):
+        translate_and_check(MolpathTumorOnlyBamSorMaDup_1_0_0())
@@ -0,0 +1,112 @@
+import os
+import tempfile
+import unittest
+
+from janis_bioinformatics.tools.pmac import (
+    MolpathGermline_1_0_0,
+    MolpathGermlineBatch_1_0_0,
+    MolpathTumorOnlyBatch_1_0_0,
+    ParseCutadaptAdaptorsLookup,
+    ParseFastqcAdaptors_0_2_0,
+)
+from tests.translation import translate_and_check
+
+LOOKUP = """\
+# name\tsequence
+illumina_universal\t\tAGATCGGAAGAG
+nextera\tCTGTCTCTTATA
+irregular line
+illumina_small_rna\tTGGAATTCTCGG
+nextera_duplicate\tCTGTCTCTTATA
+"""
+
+FASTQC_DATA = """\
+##FastQC\t0.11.5
+>>Basic Statistics\tpass
+#Measure\tValue
+>>END_MODULE
+>>Overrepresented sequences\twarn
+#Sequence\tCount\tPercentage\tPossible Source
+{sequences}>>END_MODULE
+"""
+
+
+class TestParseCutadaptAdaptorsLookup(unittest.TestCase):
+    def test_parses_sequences_in_order(self):
+        lookup = os.path.join(tempfile.mkdtemp(), "lookup.txt")
+        with open(lookup, "w") as f:
+            f.write(LOOKUP)
+
+        result = ParseCutadaptAdaptorsLookup.code_block(lookup)
+        self.assertListEqual(
+            ["AGATCGGAAGAG", "CTGTCTCTTATA", "TGGAATTCTCGG"],
+            result["adaptor_sequences"],
+        )
+
+    def test_no_lookup(self):
+        result = ParseCutadaptAdaptorsLookup.code_block(None)
+        self.assertListEqual([], result["adaptor_sequences"])
+
+
+class TestParseFastqcAdaptors(unittest.TestCase):
+    def write_fastqc(self, *sequences):
+        path = os.path.join(tempfile.mkdtemp(), "fastqc_data.txt")
+        with open(path, "w") as f:
+            f.write(
+                FASTQC_DATA.format(
+                    sequences="".join(f"{s}\t100\t1.0\tNo Hit\n" for s in sequences)
+                )
+            )
+        return path
+
+    def test_finds_the_overrepresented_adaptors(self):
+        fastqcs = [
+            self.write_fastqc("TGGAATTCTCGG", "ACGTACGTACGT"),
+            self.write_fastqc("AGATCGGAAGAG"),
+        ]
+        result = ParseFastqcAdaptors_0_2_0.code_block(
+            fastqcs, ["AGATCGGAAGAG", "CTGTCTCTTATA", "TGGAATTCTCGG"]
+        )
+        self.assertListEqual(
+            ["AGATCGGAAGAG", "TGGAATTCTCGG"], result["adaptor_sequences"]
+        )
+
+    def test_no_sequences(self):
+        fastqc = self.write_fastqc("AGATCGGAAGAG")
+        for sequences in (None, []):
+            result = ParseFastqcAdaptors_0_2_0.code_block([fastqc], sequences)
+            self.assertListEqual([], result["adaptor_sequences"])
+
+
+class TestMolpathBatch(unittest.TestCase):
+    # batch step that each (sample independent) input of the sample workflow comes from
+    PREPARED = {
+        "region_bed": "prepare_panel_bed",
+        "region_bed_extended": "sort_region_bed_extended",
+        "region_bed_annotated": "sort_region_bed_annotated",
+        "genecoverage_bed": "prepare_panel_bed",
+        "genome_file": "prepare_panel_bed",
+        "cutadapt_adaptor_sequences": "parse_adaptors_lookup",
+    }
+
+    def test_sample_independent_work_is_done_once(self):
+        for wf in (MolpathGermlineBatch_1_0_0(), MolpathTumorOnlyBatch_1_0_0()):
+            for step in set(self.PREPARED.values()):
+                self.assertIsNone(wf.step_nodes[step].scatter)
+
+            samples = wf.step_nodes["samples"]
+            self.assertListEqual(["sample_name", "fastqs"], samples.scatter.fields)
+            for inp, step in self.PREPARED.items():
+                source = samples.sources[inp].source().source
+                self.assertEqual(step, source.node.id(), inp)
+
+    def test_sample_workflow_takes_the_parsed_adaptors(self):
+        wf = MolpathGermline_1_0_0()
+        self.assertNotIn("cutadapt_adaptors_lookup", wf.input_nodes)
+        self.assertTrue(wf.input_nodes["cutadapt_adaptor_sequences"].datatype.optional)
+
+    def test_germline_batch_translates(self):
+        translate_and_check(MolpathGermlineBatch_1_0_0())
+
+    def test_tumor_only_batch_translates(self):
+        translate_and_check(MolpathTumorOnlyBatch_1_0_0())
@@ -0,0 +1,134 @@
+import os
+import shutil
+import stat
+import subprocess
+import tempfile
+import unittest
+
+from janis_bioinformatics.data_types import FastqGz
+from janis_bioinformatics.tools.multiqc import MultiqcBatch_v1_7
+from janis_bioinformatics.tools.pmac import (
+    MolpathGermline_1_0_0,
+    MolpathTumorOnly_1_0_0,
+    PerformanceSummaryTargeted_0_1_0,
+)
+from janis_bioinformatics.utils.operators import FlattenOperator
+from tests.translation import translate_and_check
+
+# stands in for multiqc: writes the files it was given to scan (and its arguments) as the
+# report, and an empty multiqc_data.json
+FAKE_MULTIQC = """\
+#!/bin/sh
+args="$*"
+while [ $# -gt 0 ]; do
+    case "$1" in --filename) name="$2"; shift;; esac
+    shift
+done
+echo "$args" > "$name"
+find qc -type f | sort >> "$name"
+mkdir -p "${name%.html}_data" && echo "{}" > "${name%.html}_data/multiqc_data.json"
+"""
+
+
+class TestFlattenOperator(unittest.TestCase):
+    def test_flattens_a_workflow_input(self):
+        wf = MolpathGermline_1_0_0()
+        operator = FlattenOperator(wf.fastqs)
+        self.assertIsInstance(operator.returntype().subtype(), FastqGz)
+        self.assertListEqual(
+            ["a", "b", "c"], operator.evaluate({"fastqs": [["a", "b"], ["c"]]})
+        )
+
+
+class TestMolpathQc(unittest.TestCase):
+    def test_fastqc_and_adapters_run_once_per_sample(self):
+        for wf in (MolpathGermline_1_0_0(), MolpathTumorOnly_1_0_0()):
+            self.assertIsNone(wf.step_nodes["fastqc"].scatter)
+            self.assertIsNone(wf.step_nodes["getfastqc_adapters"].scatter)
+            self.assertListEqual(
+                ["fastq"], wf.step_nodes["align_and_sort"].scatter.fields
+            )
+
+    def test_outputs_the_multiqc_inputs(self):
+        for wf in (MolpathGermline_1_0_0(), MolpathTumorOnly_1_0_0()):
+            for out in ("fastq_qc", "flagstat", "insert_size_metrics"):
+                self.assertIn(out, wf.output_nodes)
+
+        wf = PerformanceSummaryTargeted_0_1_0()
+        for out in ("flagstat", "insertSizeMetrics"):
+            self.assertIn(out, wf.output_nodes)
+
+
+class TestMultiqcBatch(unittest.TestCase):
+    def test_translates(self):
+        translate_and_check(MultiqcBatch_v1_7())
+
+    @unittest.skipUnless(shutil.which("cwltool"), "cwltool is not installed")
+    def test_samples_are_staged_in_their_own_folders(self):
+        tmpdir = tempfile.mkdtemp(prefix="janis-bioinformatics-test-")
+        bindir = os.path.join(tmpdir, "bin")
+        os.mkdir(bindir)
+        multiqc = os.path.join(bindir, "multiqc")
+        with open(multiqc, "w") as f:
+            f.write(FAKE_MULTIQC)
+        os.chmod(multiqc, os.stat(multiqc).st_mode | stat.S_IEXEC)
+
+        MultiqcBatch_v1_7().translate(
+            "cwl",
+            to_console=False,
+            to_disk=True,
+            export_path=tmpdir,
+            with_docker=False,
+        )
+        (cwl,) = [f for f in os.listdir(tmpdir) if f.endswith(".cwl")]
+
+        job = ["sampleNames: [s1, s2]"]
+        for inp, files in [
+            ("flagstats", ["s1.stdout", "s2.stdout"]),
+            ("insertSizeMetrics", ["s1.txt", "s2.txt"]),
+            ("fastqc", ["s1_R1_fastqc.zip", "s2_R1_fastqc.zip"]),
+        ]:
+            job.append(f"{inp}:")
+            for f in files:
+                # flagstat is captured from stdout, so the files have the same name
+                folder = os.path.join(tmpdir, inp, f.split("_")[0].split(".")[0])
+                os.makedirs(folder, exist_ok=True)
+                name = "stdout" if inp == "flagstats" else f
+                with open(os.path.join(folder, name), "w") as fp:
+                    fp.write(f)
+                job.append(f"  - {{class: File, path: {os.path.join(folder, name)}}}")
+        with open(os.path.join(tmpdir, "job.yml"), "w") as f:
+            f.write("\n".join(job) + "\n")
+
+        result = subprocess.run(
+            [
+                "cwltool",
+                "--no-container",
+                "--preserve-environment",
+                "PATH",
+                "--outdir",
+                "out",
+                cwl,
+                "job.yml",
+            ],
+            cwd=tmpdir,
+            capture_output=True,
+            env={**os.environ, "PATH": bindir + os.pathsep + os.environ["PATH"]},
+        )
+        self.assertEqual(0, result.returncode, result.stderr.decode())
+
+        with open(os.path.join(tmpdir, "out", "generated.html")) as f:
+            args, *scanned = f.read().splitlines()
+        self.assertListEqual(
+            [
+                "qc/s1/s1.flagstat",
+                "qc/s1/s1.insert_size_metrics.txt",
+                "qc/s2/s2.flagstat",
+                "qc/s2/s2.insert_size_metrics.txt",
+            ],
+            scanned,
+        )
+        self.assertRegex(args, r"--filename generated.html qc \S+s1_R1_fastqc.zip ")
+        self.assertTrue(
+            os.path.exists(os.path.join(tmpdir, "out", "multiqc_data.json"))
+        )
@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+
+from janis_bioinformatics.tools.common import CollapseStarSpliceJunctions
+from janis_bioinformatics.tools.oshlack import OncopipeStarCohortAligner
+from tests.translation import translate_and_check
+
+# chrom, start, end, strand, motif, annotated, unique reads, multimapping reads, overhang
+SAMPLE_1 = """\
+chr1\t100\t200\t1\t1\t0\t5\t0\t30
+chr1\t300\t400\t2\t2\t0\t10\t0\t30
+chr1\t500\t600\t1\t1\t1\t50\t0\t30
+chr1\t700\t800\t1\t0\t0\t50\t0\t30
+chrM\t10\t20\t1\t1\t0\t50\t0\t30
+chr2\t100\t200\t0\t1\t0\t2\t0\t30
+"""
+
+SAMPLE_2 = """\
+chr1\t100\t200\t1\t1\t0\t8\t0\t30
+chr2\t100\t200\t0\t1\t0\t4\t0\t30
+"""
+
+
+class TestCollapseStarSpliceJunctions(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.sj_files = []
+        for i, sj in enumerate([SAMPLE_1, SAMPLE_2]):
+            self.sj_files.append(os.path.join(self.tmpdir, f"{i}.SJ.out.tab"))
+            with open(self.sj_files[-1], "w") as f:
+                f.write(sj)
+
+    def collapse(self, **kwargs):
+        out = CollapseStarSpliceJunctions.code_block(
+            self.sj_files,
+            output_filename=os.path.join(self.tmpdir, "SJ.collapsed.tab"),
+            **kwargs,
+        )["out"]
+        with open(out) as f:
+            return f.read().splitlines()
+
+    def test_novel_canonical_junctions_are_collapsed(self):
+        # the annotated, non-canonical and mitochondrial junctions are dropped, and
+        # chr2's junction only passes the unique reads in the second sample
+        self.assertListEqual(
+            ["chr1\t100\t200\t+", "chr1\t300\t400\t-", "chr2\t100\t200\t."],
+            self.collapse(),
+        )
+
+    def test_junctions_must_pass_in_enough_samples(self):
+        self.assertListEqual(
+            ["chr1\t100\t200\t+"], self.collapse(minUniqueReads=3, minSamples=2)
+        )
+
+    def test_junctions_must_have_enough_unique_reads(self):
+        self.assertListEqual(["chr1\t300\t400\t-"], self.collapse(minUniqueReads=10))
+
+
+class TestOncopipeStarCohortAligner(unittest.TestCase):
+    def test_first_pass_is_scattered_and_the_genome_is_shared(self):
+        wf = OncopipeStarCohortAligner()
+        self.assertListEqual(
+            ["sampleName", "reads"], wf.step_nodes["first_pass"].scatter.fields
+        )
+        self.assertIsNone(wf.step_nodes["collapse_splice_junctions"].scatter)
+        self.assertIsNone(wf.step_nodes["star_gen2pass"].scatter)
+        self.assertListEqual(
+            ["sampleName", "reads", "lane"], wf.step_nodes["second_pass"].scatter.fields
+        )
+
+    def test_translates(self):
+        translate_and_check(OncopipeStarCohortAligner())
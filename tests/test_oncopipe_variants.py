@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+
+from janis_core import String
+
+from janis_bioinformatics.data_types import Bed
+from janis_bioinformatics.tools.common import GenerateExonIntervalShards
+from janis_bioinformatics.tools.gatk4 import Gatk4SplitNCigarReads_4_1_4
+from janis_bioinformatics.tools.oshlack.oncopipe.variants import (
+    OncopipeVariantCaller,
+    OncopipeVariantCallerSetReadGroup,
+)
+from tests.translation import translate_and_check
+
+GTF = """\
+#!genome-build test
+chr2\tsrc\texon\t11\t20\t.\t+\t.\tgene_id "B";
+chr1\tsrc\tgene\t1\t100\t.\t+\t.\tgene_id "A";
+chr1\tsrc\texon\t51\t60\t.\t+\t.\tgene_id "A";
+chr1\tsrc\texon\t1\t10\t.\t+\t.\tgene_id "A";
+chr1\tsrc\texon\t5\t20\t.\t+\t.\tgene_id "A";
+chrUn\tsrc\texon\t1\t10\t.\t+\t.\tgene_id "C";
+"""
+
+
+class TestGenerateExonIntervalShards(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        os.chdir(tempfile.mkdtemp())
+        with open("ref.fasta.fai", "w") as f:
+            f.write("chr1\t100\t6\t60\t61\nchr2\t50\t200\t60\t61\n")
+        with open("genes.gtf", "w") as f:
+            f.write(GTF)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+
+    def read(self, paths):
+        lines = []
+        for path in paths:
+            with open(path) as f:
+                lines.append(f.read().splitlines())
+        return lines
+
+    def test_merged_exons_in_reference_order(self):
+        result = GenerateExonIntervalShards.code_block(
+            "genes.gtf", "ref.fasta", shards=1
+        )
+        self.assertListEqual(
+            [["chr1\t0\t20", "chr1\t50\t60", "chr2\t10\t20"]],
+            self.read(result["out"]),
+        )
+
+    def test_shards_of_similar_size(self):
+        result = GenerateExonIntervalShards.code_block(
+            "genes.gtf", "ref.fasta", shards=2, padding=5
+        )
+        self.assertListEqual(
+            [["chr1\t0\t25", "chr1\t45\t65"], ["chr2\t5\t25"]],
+            self.read(result["out"]),
+        )
+
+
+class TestSplitNCigarReadsIntervals(unittest.TestCase):
+    def test_intervals_are_still_a_string(self):
+        inputs = {i.id(): i for i in Gatk4SplitNCigarReads_4_1_4().inputs()}
+        self.assertIsInstance(inputs["intervals"].input_type, String)
+        self.assertIsInstance(inputs["intervalsBed"].input_type, Bed)
+        self.assertEqual("--intervals", inputs["intervalsBed"].prefix)
+
+
+class TestOncopipeVariantCaller(unittest.TestCase):
+    def test_read_group_is_kept_from_star(self):
+        w = OncopipeVariantCaller()
+        self.assertTrue(w.input_nodes["platform"].datatype.optional)
+        self.assertNotIn("add_rg", w.step_nodes)
+        bam = w.step_nodes["mark_duplicates"].sources["bam"].source().source
+        self.assertEqual("bam", bam.input_node.id())
+
+    def test_read_group_is_set_when_asked(self):
+        w = OncopipeVariantCallerSetReadGroup()
+        self.assertFalse(w.input_nodes["platform"].datatype.optional)
+        self.assertIn("add_rg", w.step_nodes)
+
+    def test_translates(self):
+        translate_and_check(OncopipeVariantCaller())
+
+    def test_set_read_group_translates(self):
+        translate_and_check(OncopipeVariantCallerSetReadGroup())
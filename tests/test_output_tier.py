@@ -0,0 +1,86 @@
+import unittest
+
+from janis_bioinformatics.tools.gatk4 import (
+    Gatk4HaplotypeCaller_4_1_3,
+    Gatk4HaplotypeCallerGvcf_4_1_3,
+    GatkMutect2_4_1_3,
+)
+from janis_bioinformatics.tools.gatk4.outputtier import (
+    OUTPUT_TIERS,
+    OutputTier,
+    output_tier_argument,
+)
+from janis_bioinformatics.tools.variantcallers.gatk.gatkgermline_variants_4_1_3 import (
+    GatkGermlineVariantCaller_4_1_3,
+)
+from janis_bioinformatics.tools.variantcallers.gatk.gatksomatic_variants_4_1_3 import (
+    GatkSomaticVariantCaller_4_1_3,
+)
+from tests.translation import translate_and_check
+
+FILENAMES = {
+    "outputBamName": "out.bam",
+    "assemblyRegionOut": "regions.igv",
+    "activityProfileOut": "profile.igv",
+}
+
+
+def tier_flags(tier):
+    return output_tier_argument().value.evaluate({"outputTier": tier, **FILENAMES})
+
+
+class TestOutputTierArgument(unittest.TestCase):
+    def test_every_tier_is_different(self):
+        flags = [tier_flags(t) for t in OUTPUT_TIERS]
+        self.assertEqual(len(OUTPUT_TIERS), len(set(flags)))
+
+    def test_minimal(self):
+        self.assertEqual("", tier_flags("minimal"))
+
+    def test_standard_writes_the_md5(self):
+        self.assertEqual("--create-output-variant-md5", tier_flags("standard"))
+
+    def test_debug_writes_the_artefacts(self):
+        flags = tier_flags("debug")
+        self.assertIn("--create-output-variant-md5", flags)
+        self.assertIn("-bamout 'out.bam'", flags)
+        self.assertIn("--assembly-region-out 'regions.igv'", flags)
+        self.assertIn("--activity-profile-out 'profile.igv'", flags)
+
+    def test_unknown_tier_is_an_invalid_option(self):
+        self.assertEqual(
+            "--outputTier-must-be-minimal-standard-or-debug 'full'", tier_flags("full")
+        )
+
+
+class TestOutputTierType(unittest.TestCase):
+    def test_validates_the_tier(self):
+        for tier in OUTPUT_TIERS:
+            self.assertTrue(OutputTier().validate_value(tier, False))
+        self.assertFalse(OutputTier().validate_value("full", False))
+        self.assertIn("'full'", OutputTier().invalid_value_hint("full"))
+
+    def test_optional(self):
+        self.assertTrue(OutputTier(optional=True).validate_value(None, False))
+        self.assertFalse(OutputTier().validate_value(None, False))
+
+
+class TestOutputTierTools(unittest.TestCase):
+    def test_callers_take_the_tier(self):
+        for tool in [
+            Gatk4HaplotypeCaller_4_1_3(),
+            Gatk4HaplotypeCallerGvcf_4_1_3(),
+            GatkMutect2_4_1_3(),
+        ]:
+            with self.subTest(tool.id()):
+                inputs = {i.id(): i for i in tool.inputs()}
+                self.assertIsInstance(inputs["outputTier"].input_type, OutputTier)
+                self.assertEqual("standard", inputs["outputTier"].default)
+                self.assertIn("md5", {o.id() for o in tool.outputs()})
+                translate_and_check(tool)
+
+    def test_workflows_translate(self):
+        for w in [GatkGermlineVariantCaller_4_1_3(), GatkSomaticVariantCaller_4_1_3()]:
+            with self.subTest(w.id()):
+                self.assertIsInstance(w.input_nodes["output_tier"].datatype, OutputTier)
+                translate_and_check(w)
@@ -0,0 +1,31 @@
+import unittest
+
+from janis_bioinformatics.tools.bedtools import (
+    BedToolsSortBedLatest,
+    BedToolsMergeBedLatest,
+)
+from janis_bioinformatics.tools.pmac import PreparePanelBed_0_1_0
+from tests.translation import translate_and_check
+
+
+class TestPanelBedTools(unittest.TestCase):
+    def test_sort_bed(self):
+        translate_and_check(BedToolsSortBedLatest())
+
+    def test_merge_bed(self):
+        translate_and_check(BedToolsMergeBedLatest())
+
+
+class TestPreparePanelBed(unittest.TestCase):
+    def test_outputs_dont_clash_with_inputs(self):
+        wf = PreparePanelBed_0_1_0()
+        self.assertFalse(set(wf.input_nodes) & set(wf.output_nodes))
+
+    def test_beds_are_sorted_by_the_genome_file(self):
+        wf = PreparePanelBed_0_1_0()
+        for step in ("sort_region_bed", "sort_genecoverage_bed"):
+            sources = wf.step_nodes[step].sources
+            self.assertIn("genome", sources)
+
+    def test_translates(self):
+        translate_and_check(PreparePanelBed_0_1_0())
@@ -0,0 +1,135 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+from janis_core import (
+    CommandToolBuilder,
+    File,
+    Stdout,
+    String,
+    ToolInput,
+    ToolOutput,
+)
+
+from janis_bioinformatics.tools.dawson.workflows.freebayessomaticworkflow import (
+    CombineAndSortSomatic,
+    SplitAndSortSomatic,
+    UniqueSomatic,
+)
+from janis_bioinformatics.tools.pipebuilder import (
+    BioinformaticsPipeBuilder,
+    PipeStage,
+)
+from janis_bioinformatics.tools.samtools import SamToolsView_1_9
+from tests.translation import translate_and_check
+from tests.test_threads import references
+
+
+def stdin_tool(name, command, **extra_inputs):
+    return CommandToolBuilder(
+        tool=name,
+        base_command=command,
+        inputs=[
+            ToolInput("inp", File, position=1),
+            *[ToolInput(k, v, position=0) for k, v in extra_inputs.items()],
+        ],
+        outputs=[ToolOutput("out", Stdout)],
+        container="ubuntu:20.04",
+        version="dev",
+    )
+
+
+def count_matches_pipe():
+    return BioinformaticsPipeBuilder(
+        tool="CountMatches",
+        stages=[
+            PipeStage("cat", stdin_tool("cat", "cat")),
+            PipeStage("grep", stdin_tool("grep", "grep", pattern=String), stdin="inp"),
+            PipeStage("count", stdin_tool("wc", ["wc", "-l"]), stdin="inp"),
+        ],
+        version="dev",
+    )
+
+
+class TestPipeBuilder(unittest.TestCase):
+    def test_freebayes_pipes_translate(self):
+        for pipe in [CombineAndSortSomatic, SplitAndSortSomatic, UniqueSomatic]:
+            with self.subTest(pipe.id()):
+                translate_and_check(pipe)
+
+    def test_every_stage_is_checked(self):
+        path = translate_and_check(UniqueSomatic)
+        if path:
+            with open(path) as f:
+                wdl = f.read()
+            for stage in ["uniqalleles", "sort", "uniq"]:
+                self.assertIn(f"|| echo {stage} >> .pipe_failed_stages; }}", wdl)
+            self.assertIn("&& test ! -e .pipe_failed_stages", wdl)
+
+    def test_operator_arguments_are_rewired(self):
+        pipe = BioinformaticsPipeBuilder(
+            tool="CatView",
+            stages=[
+                PipeStage("cat", stdin_tool("cat", "cat")),
+                PipeStage("view", SamToolsView_1_9(), stdin="sam"),
+            ],
+            version="dev",
+            container=SamToolsView_1_9().container(),
+        )
+        (threads,) = [a for a in pipe.arguments() if a.prefix == "-@"]
+        self.assertTrue(references(threads.value, "view_threads"))
+        self.assertFalse(references(threads.value, "threads"))
+        self.assertIn("view_threads", {i.id() for i in pipe.inputs()})
+
+        path = translate_and_check(pipe)
+        if path:
+            with open(path) as f:
+                self.assertIn("if (defined(view_threads)) then view_threads", f.read())
+
+    def test_fixed_value_in_operator(self):
+        pipe = BioinformaticsPipeBuilder(
+            tool="CatView",
+            stages=[
+                PipeStage("cat", stdin_tool("cat", "cat")),
+                PipeStage("view", SamToolsView_1_9(), stdin="sam", threads=2),
+            ],
+            version="dev",
+            container=SamToolsView_1_9().container(),
+        )
+        self.assertNotIn("view_threads", {i.id() for i in pipe.inputs()})
+        translate_and_check(pipe)
+
+
+@unittest.skipUnless(shutil.which("cwltool"), "cwltool is not installed")
+class TestPipeBuilderFailures(unittest.TestCase):
+    def run_pipe(self, pattern):
+        tmpdir = tempfile.mkdtemp(prefix="janis-bioinformatics-test-")
+        count_matches_pipe().translate(
+            "cwl",
+            to_console=False,
+            to_disk=True,
+            export_path=tmpdir,
+            with_docker=False,
+        )
+        (cwl,) = [f for f in os.listdir(tmpdir) if f.endswith(".cwl")]
+        with open(os.path.join(tmpdir, "in.txt"), "w") as f:
+            f.write("a\nb\na\n")
+        with open(os.path.join(tmpdir, "job.yml"), "w") as f:
+            f.write(
+                f"cat_inp:\n  class: File\n  path: in.txt\ngrep_pattern: {pattern}\n"
+            )
+
+        return subprocess.run(
+            ["cwltool", "--no-container", "--outdir", "out", cwl, "job.yml"],
+            cwd=tmpdir,
+            capture_output=True,
+        )
+
+    def test_succeeds(self):
+        self.assertEqual(0, self.run_pipe("a").returncode)
+
+    def test_fails_if_a_stage_in_the_middle_fails(self):
+        # grep exits with 1 when nothing matches, while wc (the last stage) succeeds
+        self.assertNotEqual(0, self.run_pipe("z").returncode)
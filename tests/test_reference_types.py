@@ -0,0 +1,51 @@
+import unittest
+
+from janis_bioinformatics.data_types import (
+    FastaFai,
+    FastaWithDict,
+    FastaWithIndexes,
+)
+from janis_bioinformatics.tools.gatk4.reordersam.versions import (
+    Gatk4ReorderSam_4_1_4,
+)
+from janis_bioinformatics.tools.pmac.molpathGermlineWorkflow import (
+    MolpathGermline_1_0_0,
+)
+from janis_bioinformatics.tools.vcflib import VcfRocLatest
+from tests.translation import translate_and_check
+
+
+class TestReferenceTypes(unittest.TestCase):
+    def test_gatk_reference_is_only_the_fai_and_dict(self):
+        self.assertListEqual([".fai", "^.dict"], FastaWithDict.secondary_files())
+
+    def test_larger_references_can_be_given_to_smaller_ones(self):
+        self.assertTrue(FastaFai().can_receive_from(FastaWithDict()))
+        self.assertTrue(FastaFai().can_receive_from(FastaWithIndexes()))
+        self.assertTrue(FastaWithDict().can_receive_from(FastaWithIndexes()))
+
+    def test_smaller_references_cant_be_given_to_larger_ones(self):
+        self.assertFalse(FastaWithDict().can_receive_from(FastaFai()))
+        self.assertFalse(FastaWithIndexes().can_receive_from(FastaWithDict()))
+        self.assertFalse(FastaWithDict().can_receive_from(FastaWithDict(optional=True)))
+
+
+class TestToolReferences(unittest.TestCase):
+    def test_gatk_tool_doesnt_localise_the_bwa_index(self):
+        path = translate_and_check(Gatk4ReorderSam_4_1_4())
+        if path:
+            with open(path) as f:
+                wdl = f.read()
+            self.assertIn("reference_dict", wdl)
+            self.assertNotIn("reference_bwt", wdl)
+
+    def test_vcfroc_only_localises_the_fai(self):
+        path = translate_and_check(VcfRocLatest())
+        if path:
+            with open(path) as f:
+                wdl = f.read()
+            self.assertIn("reference_fai", wdl)
+            self.assertNotIn("reference_dict", wdl)
+
+    def test_aligning_workflow_translates(self):
+        translate_and_check(MolpathGermline_1_0_0())
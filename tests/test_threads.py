@@ -0,0 +1,106 @@
+import inspect
+import sys
+import unittest
+
+from janis_core import (
+    CommandTool,
+    CommandToolBuilder,
+    CpuSelector,
+    InputSelector,
+    StringFormatter,
+)
+from janis_core.operators.operator import Operator
+
+import janis_bioinformatics.tools
+from janis_bioinformatics.tools.bcftools import BcfToolsView_1_9
+from janis_bioinformatics.tools.samtools import SamToolsView_1_9
+from tests.translation import translate_and_check
+
+# ids of the inputs that set how many threads (or processes) a tool runs
+THREAD_INPUTS = {
+    "threads",
+    "nthreads",
+    "cores",
+    "processes",
+    "runThreadN",
+    "processingThreads",
+    "nativePairHmmThreads",
+    "workerThreads",
+    "localcores",
+    "intraOpThreads",
+}
+# GenomicsDBImport's readerThreads is left unset: GATK only reads with more than one thread
+# when importing a single interval
+
+
+def concrete_command_tools():
+    seen = set()
+    for name, module in list(sys.modules.items()):
+        if not name.startswith(janis_bioinformatics.tools.__name__):
+            continue
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if (
+                cls in seen
+                or not issubclass(cls, CommandTool)
+                or issubclass(cls, CommandToolBuilder)
+                or inspect.isabstract(cls)
+                or not cls.__module__.startswith(janis_bioinformatics.tools.__name__)
+            ):
+                continue
+            seen.add(cls)
+            yield cls()
+
+
+def references(value, input_id: str) -> bool:
+    if isinstance(value, InputSelector):
+        return value.input_to_select == input_id
+    if isinstance(value, StringFormatter):
+        return any(references(v, input_id) for v in value.kwargs.values())
+    if isinstance(value, Operator):
+        return any(references(v, input_id) for v in value.get_leaves())
+    return False
+
+
+class TestThreadInputs(unittest.TestCase):
+    def test_thread_inputs_follow_the_cores_allocated(self):
+        """
+        Every thread input is either bound to CpuSelector, or has no binding of its own
+        and is used by an argument (eg: one that subtracts the main thread)
+        """
+        tools = list(concrete_command_tools())
+        self.assertGreater(len(tools), 100)
+
+        unbound = []
+        for tool in tools:
+            arguments = tool.arguments() or []
+            for inp in tool.inputs():
+                if inp.id() not in THREAD_INPUTS:
+                    continue
+                if isinstance(inp.default, CpuSelector):
+                    continue
+                if (
+                    inp.prefix is None
+                    and inp.position is None
+                    and any(references(a.value, inp.id()) for a in arguments)
+                ):
+                    continue
+                unbound.append(f"{tool.id()}.{inp.id()}")
+
+        self.assertListEqual([], sorted(set(unbound)))
+
+    def test_additional_threads_leave_the_main_thread(self):
+        for tool, flag in [
+            (BcfToolsView_1_9(), "--threads"),
+            (SamToolsView_1_9(), "-@"),
+        ]:
+            (threads,) = [i for i in tool.inputs() if i.id() == "threads"]
+            self.assertIsNone(threads.default)
+            (argument,) = [a for a in tool.arguments() if a.prefix == flag]
+            self.assertTrue(references(argument.value, "threads"))
+
+            path = translate_and_check(tool)
+            if path:
+                with open(path) as f:
+                    self.assertRegex(
+                        f.read(), r"else \(select_first\(\[runtime_cpu, .*\]\) - 1\)"
+                    )
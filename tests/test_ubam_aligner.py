@@ -0,0 +1,41 @@
+import unittest
+
+from janis_bioinformatics.tools.common import (
+    BwaMem_SamToolsView,
+    UbamAligner,
+    UbamLaneAligner,
+)
+from tests.translation import translate_and_check
+
+
+class TestBwaMemReadGroup(unittest.TestCase):
+    def test_read_group_id_defaults_to_the_sample_name(self):
+        path = translate_and_check(BwaMem_SamToolsView())
+        if path:
+            with open(path) as f:
+                wdl = f.read()
+            self.assertIn(
+                "ID:~{if (defined(readGroupId)) then readGroupId else sampleName}", wdl
+            )
+
+
+class TestUbamAligner(unittest.TestCase):
+    def test_translates(self):
+        translate_and_check(UbamLaneAligner())
+        translate_and_check(UbamAligner())
+
+    def test_lane_read_group_id_is_used_by_both_sides_of_the_merge(self):
+        w = UbamLaneAligner()
+        for step, field in [
+            ("fastqtosam", "readGroupName"),
+            ("fastqtosam", "platformUnit"),
+            ("bwamem", "readGroupId"),
+        ]:
+            source = w.step_nodes[step].sources[field].source().source
+            self.assertEqual("read_group_id", source.id())
+
+    def test_lanes_are_scattered_with_their_read_group_ids(self):
+        w = UbamAligner()
+        self.assertListEqual(
+            ["reads", "read_group_id"], w.step_nodes["align_lane"].scatter.fields
+        )
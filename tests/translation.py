@@ -0,0 +1,29 @@
+import os
+import tempfile
+from typing import Optional
+
+from janis_core import Tool
+
+try:
+    import WDL
+except ImportError:
+    WDL = None
+
+
+def translate_and_check(tool: Tool, check_wdl: bool = True) -> Optional[str]:
+    """
+    Translates the tool to WDL and CWL (which builds and type checks it in janis), and if
+    miniwdl is installed, loads (parses and type checks) the generated WDL with it.
+    Returns the path to the WDL, or None if it wasn't written.
+    """
+    tool.translate("cwl", to_console=False)
+    if not check_wdl or WDL is None:
+        tool.translate("wdl", to_console=False)
+        return None
+
+    outdir = tempfile.mkdtemp(prefix="janis-bioinformatics-test-")
+    tool.translate("wdl", to_console=False, to_disk=True, export_path=outdir)
+    (path,) = [f for f in os.listdir(outdir) if f.endswith(".wdl")]
+    path = os.path.join(outdir, path)
+    WDL.load(path)
+    return path